@@ -1042,38 +1042,128 @@ namespace NumpyDotNet
         */
 
 
-        private static double _g_div_gp(double? r, ndarray n, ndarray p, ndarray x, ndarray y, ndarray w)
+        private static double _g_div_gp(double r, double n, double p, double x, double y, double w)
         {
             // Evaluate g(r_n)/g'(r_n), where g =
             // fv + pv*(1+rate)**nper + pmt*(1+rate*when)/rate * ((1+rate)**nper - 1)
 
-            var t1 = np.power(r + 1,n);
-            var t2 = np.power(r + 1, n - 1);
+            var t1 = Math.Pow(r + 1, n);
+            var t2 = Math.Pow(r + 1, n - 1);
             var g = y + t1 * x + p * (t1 - 1) * (r * w + 1) / r;
             var gp = (n * t2 * x
-                 - p * (t1 - 1) * (r * w + 1) / (np.power(r,2))
+                 - p * (t1 - 1) * (r * w + 1) / (Math.Pow(r, 2))
                  + n * p * t2 * (r * w + 1) / r
                  + p * (t1 - 1) * w / r);
 
-            ndarray t3 = (ndarray)(g / gp);
-            return (double)t3;
+            return g / gp;
         }
 
-        private static decimal _g_div_gp(decimal? r, ndarray n, ndarray p, ndarray x, ndarray y, ndarray w)
+        private static decimal _g_div_gp(decimal r, decimal n, decimal p, decimal x, decimal y, decimal w)
         {
             // Evaluate g(r_n)/g'(r_n), where g =
             // fv + pv*(1+rate)**nper + pmt*(1+rate*when)/rate * ((1+rate)**nper - 1)
 
-            var t1 = np.power(r + 1, n);
-            var t2 = np.power(r + 1, n - 1);
+            var t1 = _decimal_power(r + 1, n);
+            var t2 = _decimal_power(r + 1, n - 1);
             var g = y + t1 * x + p * (t1 - 1) * (r * w + 1) / r;
             var gp = (n * t2 * x
-                 - p * (t1 - 1) * (r * w + 1) / (np.power(r, 2))
+                 - p * (t1 - 1) * (r * w + 1) / (_decimal_power(r, 2))
                  + n * p * t2 * (r * w + 1) / r
                  + p * (t1 - 1) * w / r);
 
-            ndarray t3 = (ndarray)(g / gp);
-            return (decimal)t3;
+            return g / gp;
+        }
+
+        private static decimal _decimal_power(decimal a, decimal b)
+        {
+            // same as np.power on decimal arrays
+            return Convert.ToDecimal(Math.Pow(Convert.ToDouble(a), Convert.ToDouble(b)));
+        }
+
+        // a C ordered copy of a in the given type.  astype keeps the zero strides of a broadcast
+        // array that already has the type, so those are copied instead.
+        private static ndarray _typed_copy(ndarray a, dtype type)
+        {
+            return a.TypeNum == type.TypeNum ? a.Copy(NPY_ORDER.NPY_CORDER) : a.astype(type);
+        }
+
+        // rough cost of one element's Newton solve, in simple numeric operations
+        private const int _newton_cost = 64;
+
+        /// <summary>
+        /// Newton iterations for every element of the batch.  Each element stops as soon as it has
+        /// converged; elements that never converge are left as NaN.
+        /// </summary>
+        private static bool _rate_newton(double[] n, double[] p, double[] x, double[] y, double[] w, double[] rn, double guess, double tol, Int32 maxiter)
+        {
+            npy_intp grain = Math.Max(1, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp) / _newton_cost);
+            bool allClose = true;
+
+            Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(rn.Length, grain), NpyParallelScheduler.Options, seg =>
+            {
+                for (npy_intp i = seg.start; i < seg.end; i++)
+                {
+                    double r = guess;
+                    bool close = false;
+                    for (Int32 iterator = 0; iterator < maxiter && !close; iterator++)
+                    {
+                        var rnp1 = r - _g_div_gp(r, n[i], p[i], x[i], y[i], w[i]);
+                        close = Math.Abs(rnp1 - r) < tol;
+                        r = rnp1;
+                    }
+
+                    if (close)
+                    {
+                        rn[i] = r;
+                    }
+                    else
+                    {
+                        rn[i] = double.NaN;
+                        allClose = false;
+                    }
+                }
+            });
+
+            return allClose;
+        }
+
+        private static bool _rate_newton(decimal[] n, decimal[] p, decimal[] x, decimal[] y, decimal[] w, decimal[] rn, decimal guess, decimal tol, Int32 maxiter)
+        {
+            npy_intp grain = Math.Max(1, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp) / _newton_cost);
+            bool allClose = true;
+
+            Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(rn.Length, grain), NpyParallelScheduler.Options, (seg, state) =>
+            {
+                for (npy_intp i = seg.start; i < seg.end && !state.IsStopped; i++)
+                {
+                    decimal r = guess;
+                    bool close = false;
+                    try
+                    {
+                        for (Int32 iterator = 0; iterator < maxiter && !close; iterator++)
+                        {
+                            var rnp1 = r - _g_div_gp(r, n[i], p[i], x[i], y[i], w[i]);
+                            close = Math.Abs(rnp1 - r) < tol;
+                            r = rnp1;
+                        }
+                    }
+                    catch (ArithmeticException)
+                    {
+                        // decimal overflow or a zero derivative: there is no NaN to park the element on
+                        close = false;
+                    }
+
+                    if (!close)
+                    {
+                        allClose = false;
+                        state.Stop();
+                        return;
+                    }
+                    rn[i] = r;
+                }
+            });
+
+            return allClose;
         }
 
         /// <summary>
@@ -1162,89 +1252,53 @@ namespace NumpyDotNet
         {
             when = _convert_when(when);
 
-            ndarray _nper = np.asanyarray(nper);
-            ndarray _pmt = np.asanyarray(pmt);
-            ndarray _pv = np.asanyarray(pv);
-            ndarray _fv = np.asanyarray(fv);
-            ndarray _when = np.asanyarray(when);
+            List<ndarray> inputArrays = new List<ndarray>();
+            inputArrays.Add(np.asanyarray(nper));
+            inputArrays.Add(np.asanyarray(pmt));
+            inputArrays.Add(np.asanyarray(pv));
+            inputArrays.Add(np.asanyarray(fv));
+            inputArrays.Add(np.asanyarray(when));
 
-            if (_pmt.TypeNum == NPY_TYPES.NPY_DECIMAL)
+            var outputArrays = np.broadcast_arrays(true, inputArrays.ToArray());
+            if (outputArrays.Count() != 5)
             {
-                decimal? dguess = null;
-                if (guess.HasValue)
-                    dguess = Convert.ToDecimal(guess);
-
-                decimal? dtol = null;
-                if (tol.HasValue)
-                    dtol = Convert.ToDecimal(tol);
+                throw new Exception("broadcast_arrays did not produced expected result");
+            }
 
-                if (dguess == null)
-                {
-                    dguess = 0.1m;
-                }
-                if (dtol == null)
-                {
-                    dtol = 1e-6m;
-                }
+            ndarray _nper = outputArrays.ElementAt(0);
+            ndarray _pmt = outputArrays.ElementAt(1);
+            ndarray _pv = outputArrays.ElementAt(2);
+            ndarray _fv = outputArrays.ElementAt(3);
+            ndarray _when = outputArrays.ElementAt(4);
 
-                var rn = dguess;
-                Int32 iterator = 0;
-                bool close = false;
+            // every element is solved on its own, so a batch of instruments costs no temporary arrays per iteration
+            if (_pmt.TypeNum == NPY_TYPES.NPY_DECIMAL)
+            {
+                decimal dguess = guess.HasValue ? Convert.ToDecimal(guess) : 0.1m;
+                decimal dtol = tol.HasValue ? Convert.ToDecimal(tol) : 1e-6m;
 
-                while ((iterator < maxiter) && !close)
-                {
-                    var rnp1 = rn - npf._g_div_gp(rn, _nper, _pmt, _pv, _fv, _when);
-                    var diff = Math.Abs(rnp1.Value - rn.Value);
-                    close = np.allb(diff < dtol);
-                    iterator += 1;
-                    rn = rnp1;
-                }
+                var rn = new decimal[_pmt.size];
+                bool close = _rate_newton(_typed_copy(_nper, np.Decimal).AsDecimalArray(), _typed_copy(_pmt, np.Decimal).AsDecimalArray(),
+                                          _typed_copy(_pv, np.Decimal).AsDecimalArray(), _typed_copy(_fv, np.Decimal).AsDecimalArray(),
+                                          _typed_copy(_when, np.Decimal).AsDecimalArray(), rn, dguess, dtol, maxiter);
                 if (!close)
                 {
                     throw new Exception("Decimal numbers don't support NaN values");
                 }
-                else
-                {
-                    return np.array(rn, _pmt.Dtype);
-                }
+
+                return np.array(rn, dtype: np.Decimal, copy: false).reshape(_pmt.shape);
             }
             else
             {
-                _pmt = _pmt.astype(np.Float64);
+                var rn = new double[_pmt.size];
 
-                if (guess == null)
-                {
-                    guess = 0.1;
-                }
-                if (tol == null)
-                {
-                    tol = 1e-6;
-                }
+                // elements that did not converge are NaN
+                _rate_newton(_typed_copy(_nper, np.Float64).AsDoubleArray(), _typed_copy(_pmt, np.Float64).AsDoubleArray(),
+                             _typed_copy(_pv, np.Float64).AsDoubleArray(), _typed_copy(_fv, np.Float64).AsDoubleArray(),
+                             _typed_copy(_when, np.Float64).AsDoubleArray(), rn, guess ?? 0.1, tol ?? 1e-6, maxiter);
 
-                var rn = guess;
-                Int32 iterator = 0;
-                bool close = false;
-
-                while ((iterator < maxiter) && !close)
-                {
-                    var rnp1 = rn - npf._g_div_gp(rn, _nper, _pmt, _pv, _fv, _when);
-                    var diff = Math.Abs(rnp1.Value - rn.Value);
-                    close = np.allb(diff < tol);
-                    iterator += 1;
-                    rn = rnp1;
-                }
-                if (!close)
-                {
-                    // Return nan's in array of the same shape as rn
-                    return np.array(double.NaN + rn, _pmt.Dtype);
-                }
-                else
-                {
-                    return np.array(rn, _pmt.Dtype);
-                }
+                return np.array(rn, dtype: np.Float64, copy: false).reshape(_pmt.shape);
             }
-
-
         }
 
         #endregion
@@ -1319,14 +1373,18 @@ namespace NumpyDotNet
         /// <summary>
         /// Return the Internal Rate of Return (IRR).
         /// </summary>
-        /// <param name="values">Input cash flows per time period.</param>
+        /// <param name="values">Input cash flows per time period.  A 2-d array holds one series per row and returns one rate per row.</param>
         /// <returns></returns>
         public static ndarray irr(object values)
         {
             var _values = np.atleast_1d(values).ElementAt(0);
+            if (_values.ndim == 2)
+            {
+                return _irr_rows(_values);
+            }
             if (_values.ndim != 1)
             {
-                throw new ValueError("Cashflows must be a rank-1 array");
+                throw new ValueError("Cashflows must be a rank-1 or rank-2 array");
             }
 
             // Strip leading and trailing zeros. Since we only care about
@@ -1335,31 +1393,8 @@ namespace NumpyDotNet
 
             _values = _values.A(string.Format("{0}:{1}",(npy_intp)non_zero[0],(npy_intp)non_zero[-1] + 1));
 
-#if HAVE_LINALG_PACKAGE
-            var res = _roots(_values.A("::-1"));
-
-            ndarray mask;
-            if (res.IsComplex)
-            {
-                mask = (res.Imag == 0) & (res.Real > 0);
-            }
-            else
-            {
-                mask = (res > 0);
-            }
-
-            if (!mask.Anyb())
-            {
-                return np.array(double.NaN);
-            }
-
-            res = res.A(mask).Real;
-            // NPV(rate) = 0 can have more than one solution so we return
-            // only the solution closest to zero.
-            var rate = 1 / res - 1;
-            rate = np.array(rate.item((npy_intp)np.argmin(np.absolute(rate))));
-#else
-            // use MKB.FinancialMethods.Financial instead of linear algebra method which we can't support.
+            // numpy finds the rate from the eigenvalues of the companion matrix.  MKB.FinancialMethods.Financial
+            // iterates on the cash flows directly, which also works for decimal cash flows.
             if (_values.IsDecimal)
             {
                 var cashflow = _values.AsDecimalArray();
@@ -1372,36 +1407,77 @@ namespace NumpyDotNet
                 double irr = IRR(cashflow);
                 return np.asanyarray(irr);
             }
-#endif       
         }
 
-        // this function is part of the python IRR function.  It makes use np.linalg (linear algebra) package which 
-        // we have not ported (and probably won't any time soon) so we have abandoned it in favor of another IRR solution
-        // which seems to produce the exact results with a few edge case/error case differences.
-        private static ndarray _roots(ndarray p)
+        /// <summary>
+        /// irr of every row of a 2-d array of cash flows.  The rows are solved in parallel straight
+        /// from the typed data; a double row that has no solution is NaN.
+        /// </summary>
+        private static ndarray _irr_rows(ndarray values)
         {
-            var t1 = np.frexp(p);
-            var e = t1[1];
+            int rows = (int)values.Dim(0);
+            int cols = (int)values.Dim(1);
+            npy_intp grain = Math.Max(1, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp) / Math.Max(1, (npy_intp)cols * _newton_cost));
+
+            if (values.IsDecimal)
+            {
+                var cashflows = _typed_copy(values, np.Decimal).AsDecimalArray();
+                var result = new decimal[rows];
+                bool failed = false;
 
-            // Balance the most extreme exponents e_max and e_min by solving
-            // the equation
-            //
-            // |c + e_max| = |c + e_min|.
-            //
-            //Round the exponent to an integer to avoid rounding errors.
+                Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(rows, grain), NpyParallelScheduler.Options, (seg, state) =>
+                {
+                    for (npy_intp row = seg.start; row < seg.end && !state.IsStopped; row++)
+                    {
+                        int first, last;
+                        if (!_strip_zeros(cashflows, (int)row * cols, cols, out first, out last) ||
+                            !IRR(cashflows, first, last, 0.1m, out result[row]))
+                        {
+                            failed = true;
+                            state.Stop();
+                            return;
+                        }
+                    }
+                });
 
-            var k1 = np.max(e);
-            var k2 = np.min(e);
+                if (failed)
+                {
+                    throw new ArgumentException("Invalid Value");
+                }
+                return np.array(result, dtype: np.Decimal, copy: false);
+            }
+            else
+            {
+                var cashflows = _typed_copy(values, np.Float64).AsDoubleArray();
+                var result = new double[rows];
 
-            var c = (int)(-0.5 * (Convert.ToDouble(np.max(e)) + Convert.ToDouble(np.min(e))));
-            p = np.ldexp(p, c);
+                Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(rows, grain), NpyParallelScheduler.Options, seg =>
+                {
+                    for (npy_intp row = seg.start; row < seg.end; row++)
+                    {
+                        int first, last;
+                        if (!_strip_zeros(cashflows, (int)row * cols, cols, out first, out last) ||
+                            !IRR(cashflows, first, last, 0.1, out result[row]))
+                        {
+                            result[row] = double.NaN;
+                        }
+                    }
+                });
 
-            var A = np.diag(np.full(p.size - 2, p[0]), k : -1);
-            A[0, ":"] = -p.A("1:");
+                return np.array(result, dtype: np.Float64, copy: false);
+            }
+        }
 
-            // todo:  We need to implement np.linalg.eigvals(A) before we can make this work.
-            ndarray eigenvalues = null; // np.linalg.eigvals(A);
-            return eigenvalues / p[0];
+        // first and last non zero cash flow of one row; false if there are not at least two of them
+        private static bool _strip_zeros<T>(T[] cashflows, int start, int count, out int first, out int last) where T : IEquatable<T>
+        {
+            first = start;
+            last = start + count - 1;
+            while (first <= last && cashflows[first].Equals(default(T)))
+                first++;
+            while (last > first && cashflows[last].Equals(default(T)))
+                last--;
+            return last > first;
         }
 
 #region MKB.FinancialMethods.Financial
@@ -1426,11 +1502,20 @@ namespace NumpyDotNet
                 throw new ArgumentException("Argument '{0}' is not a valid value.", nameof(Guess));
             if (num1 <= 1)
                 throw new ArgumentException("Argument '{0}' is not a valid value.", nameof(ValueArray));
-            double num2 = ValueArray[0] <= 0.0 ? -ValueArray[0] : ValueArray[0];
-            int num3 = 0;
-            int num4 = upperBound;
-            int index = num3;
-            while (index <= num4)
+
+            double Result;
+            if (!IRR(ValueArray, 0, upperBound, Guess, out Result))
+                throw new ArgumentException("Invalid Value");
+            return Result;
+        }
+
+        // solves the cash flows ValueArray[first..last] in place, so rows of a batch need no copies
+        private static bool IRR(double[] ValueArray, int first, int last, double Guess, out double Result)
+        {
+            Result = double.NaN;
+            double num2 = ValueArray[first] <= 0.0 ? -ValueArray[first] : ValueArray[first];
+            int index = first;
+            while (index <= last)
             {
                 if (ValueArray[index] > num2)
                     num2 = ValueArray[index];
@@ -1440,11 +1525,11 @@ namespace NumpyDotNet
             }
             double num5 = num2 * 1E-07 * 0.01;
             double Guess1 = Guess;
-            double num6 = OptPV2(ValueArray, Guess1);
+            double num6 = OptPV2(ValueArray, first, last, Guess1);
             double Guess2 = num6 <= 0.0 ? Guess1 - 1E-05 : Guess1 + 1E-05;
             if (Guess2 <= -1.0)
-                throw new ArgumentException("Argument '{0}' is not a valid value.", "Rate");
-            double num7 = OptPV2(ValueArray, Guess2);
+                return false;
+            double num7 = OptPV2(ValueArray, first, last, Guess2);
             int num8 = 0;
             do
             {
@@ -1454,17 +1539,20 @@ namespace NumpyDotNet
                         Guess1 -= 1E-05;
                     else
                         Guess1 += 1E-05;
-                    num6 = OptPV2(ValueArray, Guess1);
+                    num6 = OptPV2(ValueArray, first, last, Guess1);
                     if (num7 == num6)
-                        return double.NaN;
+                        return true;
                 }
                 double Guess3 = Guess2 - (Guess2 - Guess1) * num7 / (num7 - num6);
                 if (Guess3 <= -1.0)
                     Guess3 = (Guess2 - 1.0) * 0.5;
-                double num9 = OptPV2(ValueArray, Guess3);
+                double num9 = OptPV2(ValueArray, first, last, Guess3);
                 double num10 = Guess3 <= Guess2 ? Guess2 - Guess3 : Guess3 - Guess2;
                 if ((num9 <= 0.0 ? -num9 : num9) < num5 && num10 < 1E-07)
-                    return Guess3;
+                {
+                    Result = Guess3;
+                    return true;
+                }
                 double num11 = num9;
                 num6 = num7;
                 num7 = num11;
@@ -1474,7 +1562,7 @@ namespace NumpyDotNet
                 checked { ++num8; }
             }
             while (num8 <= 39);
-            throw new ArgumentException("Invalid Value");
+            return false;
         }
 
         private static decimal IRR(decimal[] ValueArray, decimal Guess = 0.1m)
@@ -1494,11 +1582,20 @@ namespace NumpyDotNet
                 throw new ArgumentException("Argument '{0}' is not a valid value.", nameof(Guess));
             if (num1 <= 1)
                 throw new ArgumentException("Argument '{0}' is not a valid value.", nameof(ValueArray));
-            decimal num2 = ValueArray[0] <= 0.0m ? -ValueArray[0] : ValueArray[0];
-            int num3 = 0;
-            int num4 = upperBound;
-            int index = num3;
-            while (index <= num4)
+
+            decimal Result;
+            if (!IRR(ValueArray, 0, upperBound, Guess, out Result))
+                throw new ArgumentException("Invalid Value");
+            return Result;
+        }
+
+        // solves the cash flows ValueArray[first..last] in place, so rows of a batch need no copies
+        private static bool IRR(decimal[] ValueArray, int first, int last, decimal Guess, out decimal Result)
+        {
+            Result = 0.0m;
+            decimal num2 = ValueArray[first] <= 0.0m ? -ValueArray[first] : ValueArray[first];
+            int index = first;
+            while (index <= last)
             {
                 if (ValueArray[index] > num2)
                     num2 = ValueArray[index];
@@ -1508,11 +1605,11 @@ namespace NumpyDotNet
             }
             decimal num5 = num2 * 1E-07m * 0.01m;
             decimal Guess1 = Guess;
-            decimal num6 = OptPV2(ValueArray, Guess1);
+            decimal num6 = OptPV2(ValueArray, first, last, Guess1);
             decimal Guess2 = num6 <= 0.0m ? Guess1 - 1E-05m : Guess1 + 1E-05m;
             if (Guess2 <= -1.0m)
-                throw new ArgumentException("Argument '{0}' is not a valid value.", "Rate");
-            decimal num7 = OptPV2(ValueArray, Guess2);
+                return false;
+            decimal num7 = OptPV2(ValueArray, first, last, Guess2);
             int num8 = 0;
             do
             {
@@ -1522,17 +1619,20 @@ namespace NumpyDotNet
                         Guess1 -= 1E-05m;
                     else
                         Guess1 += 1E-05m;
-                    num6 = OptPV2(ValueArray, Guess1);
+                    num6 = OptPV2(ValueArray, first, last, Guess1);
                     if (num7 == num6)
-                        throw new ArgumentException("Invalid Value");
+                        return false;
                 }
                 decimal Guess3 = Guess2 - (Guess2 - Guess1) * num7 / (num7 - num6);
                 if (Guess3 <= -1.0m)
                     Guess3 = (Guess2 - 1.0m) * 0.5m;
-                decimal num9 = OptPV2(ValueArray, Guess3);
+                decimal num9 = OptPV2(ValueArray, first, last, Guess3);
                 decimal num10 = Guess3 <= Guess2 ? Guess2 - Guess3 : Guess3 - Guess2;
                 if ((num9 <= 0.0m ? -num9 : num9) < num5 && num10 < 1E-07m)
-                    return Guess3;
+                {
+                    Result = Guess3;
+                    return true;
+                }
                 decimal num11 = num9;
                 num6 = num7;
                 num7 = num11;
@@ -1542,13 +1642,13 @@ namespace NumpyDotNet
                 checked { ++num8; }
             }
             while (num8 <= 39);
-            throw new ArgumentException("Invalid Value");
+            return false;
         }
 
-        private static double OptPV2(double[] ValueArray, double Guess = 0.1)
+        private static double OptPV2(double[] ValueArray, int first, int last, double Guess)
         {
-            int index1 = 0;
-            int upperBound = ValueArray.GetUpperBound(0);
+            int index1 = first;
+            int upperBound = last;
             double num1 = 0.0;
             double num2 = 1.0 + Guess;
             while (index1 <= upperBound && ValueArray[index1] == 0.0)
@@ -1564,10 +1664,10 @@ namespace NumpyDotNet
             return num1;
         }
 
-        private static decimal OptPV2(decimal[] ValueArray, decimal Guess = 0.1m)
+        private static decimal OptPV2(decimal[] ValueArray, int first, int last, decimal Guess)
         {
-            int index1 = 0;
-            int upperBound = ValueArray.GetUpperBound(0);
+            int index1 = first;
+            int upperBound = last;
             decimal num1 = 0.0m;
             decimal num2 = 1.0m + Guess;
             while (index1 <= upperBound && ValueArray[index1] == 0.0m)
@@ -1582,6 +1682,7 @@ namespace NumpyDotNet
             }
             return num1;
         }
+
 #endregion
 
 #endregion
@@ -355,72 +355,19 @@ namespace NumpyDotNet
             {
                 // Fast algorithm for equal bins
                 // We now convert values of a to bin indices, under the assumption of
-                // equal bin widths (which is valid here).
-
-                // Initialize empty histogram
-                n = np.zeros(n_equal_bins, ntype);
-
-                // Pre-compute histogram scaling factor
-                var norm = n_equal_bins / (last_edge - first_edge);
-
-                // We iterate over blocks here for two reasons: the first is that for
-                // large arrays, it is actually faster (for example for a 10^8 array it
-                // is 2x as fast) and it results in a memory footprint 3x lower in the
-                // limit of large arrays.
-                for (int i = 0; i < len(a); i+= BLOCK)
+                // equal bin widths (which is valid here), and count them into private
+                // bins per task that are merged at the end.  Values outside the range
+                // are skipped.
+                var binner = new UniformBinner(a, bin_edges, first_edge, last_edge);
+                if (weights == null)
                 {
-                    ndarray tmp_w;
-
-                    var tmp_a = a.A(string.Format("{0}:{1}", i, i + BLOCK));
-                    if (weights == null)
-                        tmp_w = null;
-                    else
-                        tmp_w = weights.A(string.Format("{0}:{1}", i, i + BLOCK));
-
-
-                    // Only include values in the right range
-                    var keep = (tmp_a >= first_edge);
-                    keep &= (tmp_a <= last_edge);
-                    if ((bool)np.ufunc.reduce(UFuncOperation.logical_and, keep) == false)
-                    {
-                        tmp_a = tmp_a.A(keep);
-                        if (tmp_w != null)
-                            tmp_w = tmp_w.A(keep);
-                    }
-
-                    // This cast ensures no type promotions occur below, which gh-10322
-                    // make unpredictable. Getting it wrong leads to precision errors
-                    // like gh-8123.
-                    tmp_a = tmp_a.astype(bin_edges.Dtype, copy: false);
-
-
-                    // Compute the bin indices, and for values that lie exactly on
-                    // last_edge we need to subtract one
-                    var f_indices = (tmp_a - first_edge) * norm;
-                    var indices = f_indices.astype(np.intp);
-
-                    var mask = np.equal(indices, n_equal_bins);
-                    indices[mask] = indices.A(mask) - 1;
-
-                    // The index computation is not guaranteed to give exactly
-                    // consistent results within ~1 ULP of the bin edges.
-                    var decrement = tmp_a < bin_edges[indices];
-                    indices[decrement] = indices.A(decrement) - 1;
-                    // The last bin includes the right edge. The other bins do not.
-                    var increment = ((tmp_a >= bin_edges[indices + 1])
-                         & (np.not_equal(indices,n_equal_bins - 1)));
-                    indices[increment] = indices.A(increment) + 1;
-
-                    // We now compute the histogram using bincount
-                    //if (ntype.kind == "c")
-                    //{
-                    //    n.Real += np.bincount(indices, weights = tmp_w.Real, minlength: n_equal_bins);
-                    //    n.Imag += np.bincount(indices, weights = tmp_w.Imag, minlength: n_equal_bins);
-                    //}
-                    //else
-                    {
-                        n += np.bincount(indices, weights = tmp_w, minlength: n_equal_bins).astype(ntype);
-                    }
+                    npy_intp[] counts = _histogram_accumulate<npy_intp, UniformBinner, IntpCounter>(binner, new IntpCounter(), a.size, n_equal_bins.Value);
+                    n = np.array(counts, dtype: np.intp, copy: false);
+                }
+                else
+                {
+                    double[] sums = _histogram_accumulate<double, UniformBinner, WeightAccumulator>(binner, new WeightAccumulator(weights), a.size, n_equal_bins.Value);
+                    n = np.array(sums, dtype: np.Float64, copy: false).astype(ntype, copy: false);
                 }
             }
             else
@@ -729,7 +676,11 @@ namespace NumpyDotNet
             List<ndarray> Ncount = new List<ndarray>();
             for (int i = 0; i < D; i++)
             {
-                Ncount.Add(np.digitize(sample[":", i], edges[i]));
+                // equally spaced edges are indexed directly instead of searched
+                if (np.isscalar(bins[i]))
+                    Ncount.Add(_digitize_uniform(sample.A(":", i), edges[i]));
+                else
+                    Ncount.Add(np.digitize(sample[":", i], edges[i]));
             }
 
             // Using digitize, values that fall on an edge are put in the right bin.
@@ -1301,8 +1252,9 @@ namespace NumpyDotNet
         /// <param name="x">Input array.</param>
         /// <param name="weights">Weights, array of the same shape as x.</param>
         /// <param name="minlength">A minimum number of bins for the output array.</param>
+        /// <param name="int32_counts">if true, unweighted counts are returned as Int32, which halves the memory of the bins</param>
         /// <returns></returns>
-        public static ndarray bincount(object x, object weights = null, npy_intp? minlength = null)
+        public static ndarray bincount(object x, object weights = null, npy_intp? minlength = null, bool int32_counts = false)
         {
             ndarray list = np.asanyarray(x).ravel();
             ndarray weight = weights != null ? np.asanyarray(weights).ravel() : null;
@@ -1332,6 +1284,10 @@ namespace NumpyDotNet
                     throw new Exception("minlength must not be a negative value");
                 }
             }
+            if (int32_counts && list.Size > System.Int32.MaxValue)
+            {
+                throw new Exception("int32_counts requires fewer than 2**31 elements");
+            }
       
             switch (list.TypeNum)
             {
@@ -1353,26 +1309,36 @@ namespace NumpyDotNet
             }
             #endregion
 
-            // convert input array to intp if not already
-            ndarray lst = np.asarray(list, np.intp);
-            npy_intp len = lst.Size;
+            npy_intp len = list.Size;
 
             /* handle empty list */
             if (len == 0)
             {
-                ans = np.zeros(new shape(1), dtype: np.intp);
+                ans = np.zeros(new shape(1), dtype: int32_counts ? np.Int32 : np.intp);
                 return ans;
             }
 
+            // Int32 and Int64 are counted in place, other integer types are converted to intp first
+            if (list.TypeNum == NPY_TYPES.NPY_INT32)
+            {
+                return _bincount(new Int32Binner(list), len, weight, minlength, int32_counts);
+            }
+            if (list.TypeNum != NPY_TYPES.NPY_INT64)
+            {
+                list = np.asarray(list, np.intp);
+                if (list.TypeNum == NPY_TYPES.NPY_INT32)
+                {
+                    return _bincount(new Int32Binner(list), len, weight, minlength, int32_counts);
+                }
+            }
+            return _bincount(new Int64Binner(list), len, weight, minlength, int32_counts);
+        }
 
-            // get pointer to raw input data
-            int IntpDivSize = sizeof(npy_intp) == 8 ? 3 : 2;
-            npy_intp[] numbers = lst.core.data.datap as npy_intp[];
-            npy_intp numbersOffset = lst.core.data.data_offset >> IntpDivSize;
-
-            // get min and max values of the input data
-            npy_intp mn = (npy_intp)np.amin(lst).GetItem(0);
-            npy_intp mx = (npy_intp)np.amax(lst).GetItem(0);
+        private static ndarray _bincount<TBinner>(TBinner binner, npy_intp len, ndarray weight, npy_intp? minlength, bool int32_counts) where TBinner : struct, IHistogramBinner
+        {
+            // get min and max values of the input data in a single pass
+            npy_intp mn, mx;
+            _histogram_range(binner, len, out mn, out mx);
             if (mn < 0)
             {
                 throw new Exception("histogram arrays must not contain negative numbers");
@@ -1388,34 +1354,278 @@ namespace NumpyDotNet
                 }
             }
 
-            // if weight is null, we return array of npy_intp, else doubles.
-            if (weight == null)
+            // if weight is null, we return array of npy_intp (or Int32), else doubles.
+            if (weight != null)
             {
-                npy_intp[] ians = new npy_intp[ans_size];
-                for (npy_intp i = 0; i < len; i++)
-                {
-                    ians[numbers[i+numbersOffset]] += 1;
-                }
+                var wts = new WeightAccumulator(np.asarray(weight, dtype: np.Float64));
+                double[] dans = _histogram_accumulate<double, TBinner, WeightAccumulator>(binner, wts, len, ans_size);
+                return np.array(dans, dtype: np.Float64, copy: false);
+            }
 
-                ans = np.array(ians, dtype: np.intp);
-                return ans;
+            if (int32_counts)
+            {
+                Int32[] i32ans = _histogram_accumulate<Int32, TBinner, Int32Counter>(binner, new Int32Counter(), len, ans_size);
+                return np.array(i32ans, dtype: np.Int32, copy: false);
             }
-            else
+
+            npy_intp[] ians = _histogram_accumulate<npy_intp, TBinner, IntpCounter>(binner, new IntpCounter(), len, ans_size);
+            return np.array(ians, dtype: np.intp, copy: false);
+        }
+
+        #endregion
+
+        #region histogram kernels
+
+        /// <summary>
+        /// maps element i of the input to its bin.  A negative bin means the element is not counted.
+        /// </summary>
+        private interface IHistogramBinner
+        {
+            npy_intp Bin(npy_intp i);
+        }
+
+        /// <summary>
+        /// adds element i into a bin and merges the bins filled by different tasks.
+        /// </summary>
+        private interface IHistogramAccumulator<TBin>
+        {
+            void Add(TBin[] hist, npy_intp bin, npy_intp i);
+            void Merge(TBin[] hist, TBin[] partial, npy_intp start, npy_intp end);
+        }
+
+        private struct Int32Binner : IHistogramBinner
+        {
+            private readonly Int32[] data;
+            private readonly npy_intp offset;
+
+            public Int32Binner(ndarray a)
+            {
+                data = (Int32[])a.core.data.datap;
+                offset = a.core.data.data_offset / sizeof(Int32);
+            }
+
+            public npy_intp Bin(npy_intp i) { return data[offset + i]; }
+        }
+
+        private struct Int64Binner : IHistogramBinner
+        {
+            private readonly Int64[] data;
+            private readonly npy_intp offset;
+
+            public Int64Binner(ndarray a)
+            {
+                data = (Int64[])a.core.data.datap;
+                offset = a.core.data.data_offset / sizeof(Int64);
+            }
+
+            public npy_intp Bin(npy_intp i) { return (npy_intp)data[offset + i]; }
+        }
+
+        /// <summary>
+        /// equally spaced bins.  The bin is computed directly from the bin width and then checked
+        /// against the edges, which gives the same answer as searching the edges.
+        /// </summary>
+        private struct UniformBinner : IHistogramBinner
+        {
+            private readonly double[] data;
+            private readonly npy_intp offset;
+            private readonly double[] edges;
+            private readonly double first;
+            private readonly double last;
+            private readonly double norm;
+            private readonly npy_intp nbins;
+
+            public UniformBinner(ndarray a, ndarray bin_edges)
+            {
+                a = np.ascontiguousarray(a, np.Float64);
+                data = (double[])a.core.data.datap;
+                offset = a.core.data.data_offset / sizeof(double);
+                edges = (double[])np.asarray(bin_edges, np.Float64).ToArray();
+                nbins = edges.Length - 1;
+                first = edges[0];
+                last = edges[nbins];
+                norm = nbins / (last - first);
+            }
+
+            public UniformBinner(ndarray a, ndarray bin_edges, double first_edge, double last_edge) : this(a, bin_edges)
+            {
+                first = first_edge;
+                last = last_edge;
+            }
+
+            private npy_intp Index(double x)
+            {
+                npy_intp b = (npy_intp)((x - edges[0]) * norm);
+                if (b < 0)
+                    b = 0;
+                if (b >= nbins)
+                    b = nbins - 1;
+
+                // The index computation is not guaranteed to give exactly
+                // consistent results within ~1 ULP of the bin edges.
+                while (b > 0 && x < edges[b])
+                    b--;
+                // The last bin includes the right edge. The other bins do not.
+                while (b < nbins - 1 && x >= edges[b + 1])
+                    b++;
+                return b;
+            }
+
+            /// <summary>
+            /// histogram bin of element i, or -1 if it is outside the range (NaN included)
+            /// </summary>
+            public npy_intp Bin(npy_intp i)
             {
-                ndarray wts = np.asarray(weight, dtype: np.Float64);
-                double[] _weights = (double[])wts.ToArray();
+                double x = data[offset + i];
+                if (!(x >= first && x <= last))
+                    return -1;
+                return Index(x);
+            }
 
-                double[] dans = new double[ans_size];
+            /// <summary>
+            /// same result as np.digitize(x, bin_edges): 0 below the first edge, nbins+1 at or above the last edge.
+            /// </summary>
+            public npy_intp Digitize(npy_intp i)
+            {
+                double x = data[offset + i];
+                if (x < first)
+                    return 0;
+                // NaN sorts after every edge
+                if (!(x < last))
+                    return nbins + 1;
+                return Index(x) + 1;
+            }
+        }
 
-                for (npy_intp i = 0; i < len; i++)
+        private struct IntpCounter : IHistogramAccumulator<npy_intp>
+        {
+            public void Add(npy_intp[] hist, npy_intp bin, npy_intp i) { hist[bin]++; }
+
+            public void Merge(npy_intp[] hist, npy_intp[] partial, npy_intp start, npy_intp end)
+            {
+                for (npy_intp b = start; b < end; b++)
+                    hist[b] += partial[b];
+            }
+        }
+
+        private struct Int32Counter : IHistogramAccumulator<Int32>
+        {
+            public void Add(Int32[] hist, npy_intp bin, npy_intp i) { hist[bin]++; }
+
+            public void Merge(Int32[] hist, Int32[] partial, npy_intp start, npy_intp end)
+            {
+                for (npy_intp b = start; b < end; b++)
+                    hist[b] += partial[b];
+            }
+        }
+
+        private struct WeightAccumulator : IHistogramAccumulator<double>
+        {
+            private readonly double[] weights;
+            private readonly npy_intp offset;
+
+            public WeightAccumulator(ndarray w)
+            {
+                w = np.ascontiguousarray(w, np.Float64);
+                weights = (double[])w.core.data.datap;
+                offset = w.core.data.data_offset / sizeof(double);
+            }
+
+            public void Add(double[] hist, npy_intp bin, npy_intp i) { hist[bin] += weights[offset + i]; }
+
+            public void Merge(double[] hist, double[] partial, npy_intp start, npy_intp end)
+            {
+                for (npy_intp b = start; b < end; b++)
+                    hist[b] += partial[b];
+            }
+        }
+
+        /// <summary>
+        /// min and max bin of the input, computed in parallel in one pass.
+        /// </summary>
+        private static void _histogram_range<TBinner>(TBinner binner, npy_intp len, out npy_intp min, out npy_intp max) where TBinner : struct, IHistogramBinner
+        {
+            var segments = numpyinternal.NpyArray_SEGMENT_ParallelSplit(len, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp)).ToArray();
+            var mins = new npy_intp[segments.Length];
+            var maxs = new npy_intp[segments.Length];
+
+            Parallel.For(0, segments.Length, NpyParallelScheduler.Options, s =>
+            {
+                npy_intp lo = npy_intp.MaxValue;
+                npy_intp hi = npy_intp.MinValue;
+                for (npy_intp i = segments[s].start; i < segments[s].end; i++)
                 {
-                    dans[numbers[i+numbersOffset]] += _weights[i];
+                    npy_intp v = binner.Bin(i);
+                    if (v < lo)
+                        lo = v;
+                    if (v > hi)
+                        hi = v;
                 }
+                mins[s] = lo;
+                maxs[s] = hi;
+            });
 
-                ans = np.array(dans, dtype: np.Float64);
-                return ans;
+            min = mins.Min();
+            max = maxs.Max();
+        }
+
+        /// <summary>
+        /// fills nbins bins from len elements.  Each task fills its own private bins which are merged
+        /// at the end, in task order so weighted sums do not depend on scheduling.  The input is only
+        /// split when it is large compared to the number of bins.
+        /// </summary>
+        private static TBin[] _histogram_accumulate<TBin, TBinner, TAcc>(TBinner binner, TAcc acc, npy_intp len, npy_intp nbins)
+            where TBinner : struct, IHistogramBinner
+            where TAcc : struct, IHistogramAccumulator<TBin>
+        {
+            npy_intp grain = Math.Max(NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp), nbins * 4);
+            var segments = numpyinternal.NpyArray_SEGMENT_ParallelSplit(len, grain).ToArray();
+
+            var partials = new TBin[segments.Length][];
+            Parallel.For(0, segments.Length, NpyParallelScheduler.Options, s =>
+            {
+                var hist = new TBin[nbins];
+                for (npy_intp i = segments[s].start; i < segments[s].end; i++)
+                {
+                    npy_intp b = binner.Bin(i);
+                    if (b >= 0)
+                        acc.Add(hist, b, i);
+                }
+                partials[s] = hist;
+            });
+
+            TBin[] result = partials[0];
+            if (partials.Length > 1)
+            {
+                Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(nbins, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp)), NpyParallelScheduler.Options, seg =>
+                {
+                    for (int p = 1; p < partials.Length; p++)
+                    {
+                        acc.Merge(result, partials[p], seg.start, seg.end);
+                    }
+                });
             }
+            return result;
+        }
+
+        /// <summary>
+        /// np.digitize(x, bin_edges) for equally spaced edges, without the binary search
+        /// </summary>
+        private static ndarray _digitize_uniform(ndarray x, ndarray bin_edges)
+        {
+            var binner = new UniformBinner(x, bin_edges);
+            npy_intp len = x.size;
+            npy_intp[] indices = new npy_intp[len];
 
+            Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(len, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp)), NpyParallelScheduler.Options, seg =>
+            {
+                for (npy_intp i = seg.start; i < seg.end; i++)
+                {
+                    indices[i] = binner.Digitize(i);
+                }
+            });
+
+            return np.array(indices, dtype: np.intp, copy: false);
         }
         #endregion
 
@@ -1441,16 +1651,15 @@ namespace NumpyDotNet
             ndarray arr_x = np.asanyarray(x).ravel();
             ndarray arr_bins = np.asanyarray(bins).ravel();
 
-            arr_x = np.asarray(arr_x, np.Float64);
-            arr_bins = np.asarray(arr_bins, np.Float64);
-
             var len_bins = arr_bins.Size;
             if (len_bins == 0)
             {
                 throw new Exception("bins must have non-zero length");
             }
 
-            double[] arr_bins_data = (double[])arr_bins.ToArray();
+            // x and bins keep their own types so the search runs on the typed kernels
+            // and large integers such as timestamps are not rounded to doubles.
+            double[] arr_bins_data = (double[])np.asarray(arr_bins, np.Float64).ToArray();
 
             int monotonic = check_array_monotonic(arr_bins_data, len_bins);
 
@@ -1475,15 +1684,7 @@ namespace NumpyDotNet
             /* If bins is decreasing, ret has bins from end, not start */
             if (monotonic == -1)
             {
-                npy_intp len_ret = ret.Size;
-
-                npy_intp index = 0;
-                while (len_ret-- > 0)
-                {
-                    ret[index] = len_bins - (npy_intp)ret[index];
-                    index++;
-                }
-    
+                ret = len_bins - ret;
             }
 
             return ret;
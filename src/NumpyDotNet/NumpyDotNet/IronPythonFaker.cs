@@ -401,6 +401,14 @@ namespace NumpyDotNet
         }
     }
 
+    internal class LinAlgError : ValueError
+    {
+        public LinAlgError(string message) : base(message)
+        {
+
+        }
+    }
+
 
     internal static class PythonFunction
     {
@@ -190,79 +190,364 @@ namespace NumpyDotNet
         }
         #endregion
 
-        #region Templated common functions
- 
-        private static ndarray MathFunction<T>(object x, object where, T NAN, Func<T, T> mathfunc)
+        #region Streaming math kernels
+
+        /// <summary>
+        /// One input of a streaming math function, converted to the kernel type.  Inputs laid out
+        /// like the result are indexed directly, views and broadcast inputs walk an iterator.
+        /// </summary>
+        class MathOperand<T>
         {
-            var ch = new MathFunctionHelper<T>(x);
+            public readonly T[] data;
+            public readonly npy_intp offset;
+            private readonly NpyArrayIterObject iter;
+            private readonly int itemDiv;
 
-            Parallel.For(0, ch.expectedLength, i =>
+            public MathOperand(ndarray a, shape resultShape, dtype target_dtype)
             {
-                ch.results[i] = mathfunc(ch.X1((int)i));
-            });
+                if (a.TypeNum != target_dtype.TypeNum)
+                {
+                    a = a.astype(dtype: target_dtype);
+                }
+
+                data = a.Array.data.datap as T[];
+                itemDiv = a.ItemSizeDiv;
+
+                if (a.IsContiguous && SameShape(a.dims, resultShape.iDims))
+                {
+                    offset = a.Array.data.data_offset >> itemDiv;
+                }
+                else
+                {
+                    iter = NpyCoreApi.BroadcastToShape(a, resultShape.iDims, resultShape.iDims.Length);
+                }
+            }
 
-            var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-            if (where != null)
+            public bool IsDirect
             {
-                ret[np.invert(where)] = NAN;
+                get { return iter == null; }
             }
 
-            return ret;
+            /// <summary>
+            /// a private iterator positioned at element start of the result
+            /// </summary>
+            public NpyArrayIterObject IterAt(npy_intp start)
+            {
+                var it = iter.copy();
+                numpyinternal.NpyArray_ITER_WALK(it, start);
+                return it;
+            }
+
+            public T At(NpyArrayIterObject it)
+            {
+                return data[it.dataptr.data_offset >> itemDiv];
+            }
+
+            /// <summary>
+            /// value for result element index, stepping the iterator when there is one
+            /// </summary>
+            public T Next(NpyArrayIterObject it, npy_intp index)
+            {
+                if (it == null)
+                {
+                    return data[offset + index];
+                }
+
+                T value = At(it);
+                numpyinternal.NpyArray_ITER_NEXT(it);
+                return value;
+            }
+
+            public bool Overlaps(T[] outData, npy_intp outOffset)
+            {
+                // reading and writing the same element in step is safe, anything else is not
+                return ReferenceEquals(data, outData) && !(IsDirect && offset == outOffset);
+            }
         }
-        private static ndarray MathFunction<T>(object x1, object x2, object where, T NAN, Func<T, T, T> mathfunc)
+
+        /// <summary>
+        /// Destination of a streaming math function.  Writes straight into a suitable out= array,
+        /// otherwise into a new contiguous array which is copied to out= when one was given.
+        /// </summary>
+        class MathResult<T>
         {
-            var ch = new MathFunctionHelper<T>(x1, x2);
+            public readonly ndarray result;
+            public readonly T[] data;
+            public readonly npy_intp offset;
+            private readonly ndarray outArray;
 
-            Parallel.For(0, ch.expectedLength, i =>
-            {
-                ch.results[i] = mathfunc(ch.X1(i), ch.X2(i));
-            });
+            /// <summary>
+            /// true when the kernel writes into the caller's out= array, so masked out elements must be left alone
+            /// </summary>
+            public readonly bool IsOut;
 
-            var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-            if (where != null)
+            public MathResult(shape resultShape, dtype target_dtype, ndarray @out, params MathOperand<T>[] inputs)
             {
-                ret[np.invert(where)] = NAN;
+                if (@out != null)
+                {
+                    if (!SameShape(@out.dims, resultShape.iDims))
+                    {
+                        throw new ValueError(string.Format("non-broadcastable output operand with shape ({0}) doesn't match the broadcast shape ({1})", @out.shape.ToString(), resultShape.ToString()));
+                    }
+
+                    if (@out.TypeNum == target_dtype.TypeNum && @out.IsContiguous)
+                    {
+                        T[] outData = @out.Array.data.datap as T[];
+                        npy_intp outOffset = @out.Array.data.data_offset >> @out.ItemSizeDiv;
+                        if (!inputs.Any(op => op.Overlaps(outData, outOffset)))
+                        {
+                            result = @out;
+                            IsOut = true;
+                        }
+                    }
+
+                    if (result == null)
+                    {
+                        outArray = @out;
+                    }
+                }
+
+                if (result == null)
+                {
+                    result = np.empty(resultShape, dtype: target_dtype);
+                }
+
+                data = result.Array.data.datap as T[];
+                offset = result.Array.data.data_offset >> result.ItemSizeDiv;
             }
 
-            return ret;
+            public ndarray Finish(ndarray where)
+            {
+                return MathFunctionCopyOut(result, outArray, where);
+            }
         }
 
-        private static ndarray MathFunction<T, I>(object x1, I n, object where, T NAN, Func<T, I, T> mathfunc)
+        private static bool SameShape(npy_intp[] dims1, npy_intp[] dims2)
         {
-            var ch = new MathFunctionHelper<T>(x1);
+            if (dims1.Length != dims2.Length)
+                return false;
 
-            Parallel.For(0, ch.expectedLength, i =>
+            for (int i = 0; i < dims1.Length; i++)
             {
-                ch.results[i] = mathfunc(ch.X1(i), n);
-            });
+                if (dims1[i] != dims2[i])
+                    return false;
+            }
+            return true;
+        }
+
+        private static dtype MathFunctionDtype<T>()
+        {
+            return NpyCoreApi.DescrFromType(DefaultArrayHandlers.GetArrayType(default(T)));
+        }
 
-            var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-            if (where != null)
+        private static shape MathFunctionShape(ndarray a, ndarray b)
+        {
+            if (!broadcastable(a, b))
             {
-                ret[np.invert(where)] = NAN;
+                throw new Exception(string.Format("operands could not be broadcast together with shapes ({0}),({1})", a.shape.ToString(), b.shape.ToString()));
             }
 
-            return ret;
+            return np.broadcast(a, b).shape;
         }
 
-        private static ndarray MathFunction<T,I>(object x1, object x2, I n, object where, T NAN, Func<T, T, I, T> mathfunc)
+        /// <summary>
+        /// splits the result into chunks that are computed in parallel.  Each chunk walks its
+        /// inputs with its own iterator, so no per element offsets are materialized.
+        /// </summary>
+        private static IEnumerable<numpyinternal.LoopSegment> MathFunctionSegments(ndarray result)
         {
-            var ch = new MathFunctionHelper<T>(x1, x2);
+            return numpyinternal.NpyArray_SEGMENT_ParallelSplit(result.size, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp, result.ItemSize));
+        }
+
+        private static ndarray MathFunctionCopyOut(ndarray result, ndarray @out, ndarray where = null)
+        {
+            if (@out == null)
+                return result;
+
+            np.copyto(@out, result, NPY_CASTING.NPY_UNSAFE_CASTING, where);
+            return @out;
+        }
+
+        /// <summary>
+        /// the where= condition as a bool array, or null when every element is computed
+        /// </summary>
+        private static ndarray MathFunctionWhereMask(object where)
+        {
+            if (where == null)
+                return null;
 
-            Parallel.For(0, ch.expectedLength, i =>
+            var mask = asanyarray(where);
+            if (mask.TypeNum != NPY_TYPES.NPY_BOOL)
             {
-                ch.results[i] = mathfunc(ch.X1(i), ch.X2(i), n);
-            });
+                mask = mask.astype(np.Bool);
+            }
+            return mask;
+        }
 
-            var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-            if (where != null)
+        /// <summary>
+        /// finishes a function that computed every element: copies into out= under the where= mask,
+        /// otherwise sets the masked out elements of the new result to NAN.
+        /// </summary>
+        private static ndarray MathFunctionOut(ndarray ret, object where, object NAN, ndarray @out)
+        {
+            var mask = MathFunctionWhereMask(where);
+            if (@out != null)
             {
-                ret[np.invert(where)] = NAN;
+                if (!broadcastable(ret, @out) || !SameShape(np.broadcast(ret, @out).shape.iDims, @out.dims))
+                {
+                    throw new ValueError(string.Format("non-broadcastable output operand with shape ({0}) doesn't match the broadcast shape ({1})", @out.shape.ToString(), ret.shape.ToString()));
+                }
+                return MathFunctionCopyOut(ret, @out, mask);
             }
 
+            if (mask != null)
+            {
+                ret[np.invert(mask)] = NAN;
+            }
             return ret;
         }
 
+        private static void MathKernel<T>(MathOperand<T> x, MathResult<T> r, MathOperand<bool> w, T NAN, Func<T, T> mathfunc)
+        {
+            Parallel.ForEach(MathFunctionSegments(r.result), NpyParallelScheduler.Options, seg =>
+            {
+                T[] rd = r.data;
+                T[] xd = x.data;
+
+                if (w != null)
+                {
+                    // masked out elements are skipped, so they are never computed and out= keeps its values
+                    var xit = x.IsDirect ? null : x.IterAt(seg.start);
+                    var wit = w.IsDirect ? null : w.IterAt(seg.start);
+                    for (npy_intp i = seg.start; i < seg.end; i++)
+                    {
+                        bool compute = w.Next(wit, i);
+                        if (compute)
+                        {
+                            rd[r.offset + i] = mathfunc(x.Next(xit, i));
+                        }
+                        else
+                        {
+                            if (xit != null)
+                                numpyinternal.NpyArray_ITER_NEXT(xit);
+                            if (!r.IsOut)
+                                rd[r.offset + i] = NAN;
+                        }
+                    }
+                }
+                else
+                if (x.IsDirect)
+                {
+                    npy_intp xo = x.offset - r.offset;
+                    for (npy_intp i = r.offset + seg.start; i < r.offset + seg.end; i++)
+                    {
+                        rd[i] = mathfunc(xd[xo + i]);
+                    }
+                }
+                else
+                {
+                    var xit = x.IterAt(seg.start);
+                    for (npy_intp i = r.offset + seg.start; i < r.offset + seg.end; i++)
+                    {
+                        rd[i] = mathfunc(x.At(xit));
+                        numpyinternal.NpyArray_ITER_NEXT(xit);
+                    }
+                }
+            });
+        }
+
+        private static void MathKernel<T>(MathOperand<T> x1, MathOperand<T> x2, MathResult<T> r, MathOperand<bool> w, T NAN, Func<T, T, T> mathfunc)
+        {
+            Parallel.ForEach(MathFunctionSegments(r.result), NpyParallelScheduler.Options, seg =>
+            {
+                T[] rd = r.data;
+                T[] x1d = x1.data;
+                T[] x2d = x2.data;
+
+                if (w == null && x1.IsDirect && x2.IsDirect)
+                {
+                    npy_intp x1o = x1.offset - r.offset;
+                    npy_intp x2o = x2.offset - r.offset;
+                    for (npy_intp i = r.offset + seg.start; i < r.offset + seg.end; i++)
+                    {
+                        rd[i] = mathfunc(x1d[x1o + i], x2d[x2o + i]);
+                    }
+                }
+                else
+                {
+                    var x1it = x1.IsDirect ? null : x1.IterAt(seg.start);
+                    var x2it = x2.IsDirect ? null : x2.IterAt(seg.start);
+                    var wit = w == null || w.IsDirect ? null : w.IterAt(seg.start);
+
+                    for (npy_intp i = seg.start; i < seg.end; i++)
+                    {
+                        if (w != null && !w.Next(wit, i))
+                        {
+                            if (x1it != null)
+                                numpyinternal.NpyArray_ITER_NEXT(x1it);
+                            if (x2it != null)
+                                numpyinternal.NpyArray_ITER_NEXT(x2it);
+                            if (!r.IsOut)
+                                rd[r.offset + i] = NAN;
+                            continue;
+                        }
+
+                        T v1 = x1.Next(x1it, i);
+                        T v2 = x2.Next(x2it, i);
+                        rd[r.offset + i] = mathfunc(v1, v2);
+                    }
+                }
+            });
+        }
+
+        #endregion
+
+        #region Templated common functions
+ 
+        private static ndarray MathFunction<T>(object x, object where, T NAN, Func<T, T> mathfunc, ndarray @out = null)
+        {
+            var a = asanyarray(x);
+            var target_dtype = MathFunctionDtype<T>();
+
+            var mask = MathFunctionWhereMask(where);
+
+            var x1 = new MathOperand<T>(a, a.shape, target_dtype);
+            var w = mask == null ? null : new MathOperand<bool>(mask, a.shape, mask.Dtype);
+            var r = new MathResult<T>(a.shape, target_dtype, @out, x1);
+
+            MathKernel(x1, r, w, NAN, mathfunc);
+
+            return r.Finish(mask);
+        }
+        private static ndarray MathFunction<T>(object x1, object x2, object where, T NAN, Func<T, T, T> mathfunc, ndarray @out = null)
+        {
+            var a = asanyarray(x1);
+            var b = asanyarray(x2);
+            var target_dtype = MathFunctionDtype<T>();
+            var resultShape = MathFunctionShape(a, b);
+
+            var mask = MathFunctionWhereMask(where);
+
+            var op1 = new MathOperand<T>(a, resultShape, target_dtype);
+            var op2 = new MathOperand<T>(b, resultShape, target_dtype);
+            var w = mask == null ? null : new MathOperand<bool>(mask, resultShape, mask.Dtype);
+            var r = new MathResult<T>(resultShape, target_dtype, @out, op1, op2);
+
+            MathKernel(op1, op2, r, w, NAN, mathfunc);
+
+            return r.Finish(mask);
+        }
+
+        private static ndarray MathFunction<T, I>(object x1, I n, object where, T NAN, Func<T, I, T> mathfunc, ndarray @out = null)
+        {
+            return MathFunction<T>(x1, where, NAN, (value) => mathfunc(value, n), @out);
+        }
+
+        private static ndarray MathFunction<T,I>(object x1, object x2, I n, object where, T NAN, Func<T, T, I, T> mathfunc, ndarray @out = null)
+        {
+            return MathFunction<T>(x1, x2, where, NAN, (value1, value2) => mathfunc(value1, value2, n), @out);
+        }
+
 
         #endregion
 
@@ -273,8 +558,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Angle, in radians (2pi rad equals 360 degrees).</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray sin(object x, object where = null)
+        public static ndarray sin(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -286,18 +572,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Sin(value); };
-                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Sin(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Sin(value);};
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
  
         }
@@ -307,8 +593,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array in radians.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray cos(object x, object where = null)
+        public static ndarray cos(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -320,18 +607,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Cos(value); };
-                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Cos(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Cos(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -341,8 +628,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray tan(object x, object where = null)
+        public static ndarray tan(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -354,18 +642,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Tan(value); };
-                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Tan(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Tan(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
  
         }
@@ -375,8 +663,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">y-coordinate on the unit circle.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray arcsin(object x, object where = null)
+        public static ndarray arcsin(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -388,18 +677,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Asin(value); };
-                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Asin(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Asin(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
  
         }
@@ -408,8 +697,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">x-coordinate on the unit circle.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray arccos(object x, object where = null)
+        public static ndarray arccos(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -421,18 +711,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Acos(value); };
-                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Acos(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Acos(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
         }
         /// <summary>
@@ -440,8 +730,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x"></param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray arctan(object x, object where = null)
+        public static ndarray arctan(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -453,18 +744,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Atan(value); };
-                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Atan(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Atan(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -474,42 +765,54 @@ namespace NumpyDotNet
         /// <param name="x1">Leg of the triangle(s).</param>
         /// <param name="x2">Leg of the triangle(s).</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray hypot(object x1, object x2, object where = null)
+        public static ndarray hypot(object x1, object x2, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x1);
+            var xb = asanyarray(x2);
 
             if (!xa.IsMathFunctionCapable)
             {
                 ArrayTypeNotSupported(xa);
             }
 
-            if (xa.IsComplex)
+            if (!_hypot_is_double(xa) || !_hypot_is_double(xb))
             {
-                MathFunctionHelper<System.Numerics.Complex> ch = new MathFunctionHelper<System.Numerics.Complex>(x1, x2);
-
+                // float32, decimal, complex and bigint keep their own result type
                 var hypot = np.sqrt(np.power(x1, 2) + np.power(x2, 2));
-
-                return hypot;
+                return MathFunctionOut(hypot, where, np.NaN, @out);
             }
             else
-            if (xa.IsBigInt)
             {
-                MathFunctionHelper<System.Numerics.BigInteger> ch = new MathFunctionHelper<System.Numerics.BigInteger>(x1, x2);
+                // scaled so that large legs do not overflow the squares
+                Func<double, double, double> mathfunc = (value1, value2) =>
+                {
+                    if (double.IsInfinity(value1) || double.IsInfinity(value2))
+                        return double.PositiveInfinity;
 
-                var hypot = np.sqrt(np.power(x1, 2) + np.power(x2, 2));
+                    value1 = Math.Abs(value1);
+                    value2 = Math.Abs(value2);
+                    if (value1 < value2)
+                    {
+                        double temp = value1;
+                        value1 = value2;
+                        value2 = temp;
+                    }
+                    if (value1 == 0)
+                        return value1;
 
-                return hypot;
+                    double ratio = value2 / value1;
+                    return value1 * Math.Sqrt(1 + ratio * ratio);
+                };
+                return MathFunction<double>(x1, x2, where, DNAN, mathfunc, @out);
             }
-            else
-            {
-                MathFunctionHelper<double> ch = new MathFunctionHelper<double>(x1, x2);
 
-                var hypot = np.sqrt(np.power(x1, 2) + np.power(x2, 2));
-
-                return hypot;
-            }
+        }
 
+        private static bool _hypot_is_double(ndarray a)
+        {
+            return a.TypeNum == NPY_TYPES.NPY_DOUBLE || (a.IsInteger && !a.IsBigInt) || a.TypeNum == NPY_TYPES.NPY_BOOL;
         }
         /// <summary>
         /// Element-wise arc tangent of x1/x2 choosing the quadrant correctly.
@@ -517,8 +820,9 @@ namespace NumpyDotNet
         /// <param name="x1">y-coordinates.</param>
         /// <param name="x2">x-coordinates.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray arctan2(object x1, object x2, object where = null)
+        public static ndarray arctan2(object x1, object x2, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x1);
 
@@ -530,18 +834,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value1, value2) => { return Math.Atan2(value1.Real, value2.Real); };
-                return MathFunction<System.Numerics.Complex>(x1, x2, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x1, x2, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double, double> mathfunc = (value1, value2) => { return Math.Atan2(value1, value2); };
-                return MathFunction<double>(x1, x2, where, DNAN, mathfunc);
+                return MathFunction<double>(x1, x2, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double, double> mathfunc = (value1, value2) => { return Math.Atan2(value1, value2); };
-                return MathFunction<double>(x1, x2, where, DNAN, mathfunc);
+                return MathFunction<double>(x1, x2, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -550,18 +854,20 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Angle in radians.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray rad2deg(object x, object where = null)
+        public static ndarray rad2deg(object x, object where = null, ndarray @out = null)
         {
-            return degrees(x, where);
+            return degrees(x, where, @out);
         }
         /// <summary>
         /// Convert angles from radians to degrees.
         /// </summary>
         /// <param name="x">Angle in radians.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray degrees(object x, object where = null)
+        public static ndarray degrees(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -573,18 +879,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return value * (180 / Math.PI); };
-                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return value * (180 / Math.PI); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return value * (180 / Math.PI); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
  
         }
@@ -593,18 +899,20 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array in degrees.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray deg2rad(object x, object where = null)
+        public static ndarray deg2rad(object x, object where = null, ndarray @out = null)
         {
-            return radians(x, where);
+            return radians(x, where, @out);
         }
         /// <summary>
         /// Convert angles from degrees to radians.
         /// </summary>
         /// <param name="x">Input array in degrees.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray radians(object x, object where = null)
+        public static ndarray radians(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -616,18 +924,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return Math.PI * value / 180; };
-                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc);
+                return MathFunction<System.Numerics.Complex>(x, where, CNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.PI * value / 180; };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.PI * value / 180; };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             
         }
@@ -640,8 +948,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray sinh(object x, object where = null)
+        public static ndarray sinh(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -653,18 +962,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Sinh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Sinh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Sinh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -673,8 +982,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray cosh(object x, object where = null)
+        public static ndarray cosh(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -686,18 +996,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Cosh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Cosh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Cosh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -706,8 +1016,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray tanh(object x, object where = null)
+        public static ndarray tanh(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -719,18 +1030,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Tanh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Tanh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Tanh(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -739,8 +1050,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray arcsinh(object x, object where = null)
+        public static ndarray arcsinh(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -752,18 +1064,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return MathHelper.HArcsin(value.Real); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return MathHelper.HArcsin(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return MathHelper.HArcsin(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -772,8 +1084,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray arccosh(object x, object where = null)
+        public static ndarray arccosh(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -785,18 +1098,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return MathHelper.HArccos(value.Real); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return MathHelper.HArccos(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return MathHelper.HArccos(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -805,8 +1118,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray arctanh(object x, object where = null)
+        public static ndarray arctanh(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -818,18 +1132,18 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return MathHelper.HArctan(value.Real); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return MathHelper.HArctan(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return MathHelper.HArctan(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -841,8 +1155,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input array.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray rint(object x, object where = null)
+        public static ndarray rint(object x, object where = null, ndarray @out = null)
         {
             var a = asanyarray(x);
 
@@ -853,19 +1168,16 @@ namespace NumpyDotNet
 
             var ret = NpyCoreApi.PerformNumericOp(a, UFuncOperation.rint, 0);
             ret = ret.reshape(new shape(a.dims));
-            if (where != null)
-            {
-                ret[np.invert(where)] = np.NaN;
-            }
-
-            return ret;
+            return MathFunctionOut(ret, where, np.NaN, @out);
         }
         /// <summary>
         /// Round to nearest integer towards zero.
         /// </summary>
         /// <param name="x">An array of floats to be rounded</param>
+        /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray fix(object x)
+        public static ndarray fix(object x, object where = null, ndarray @out = null)
         {
             var a = asanyarray(x);
 
@@ -878,34 +1190,32 @@ namespace NumpyDotNet
             var y2 = np.ceil(a);
 
             y1["..."] = np.where(a >= 0, y1, y2);
-            return y1;
+            return MathFunctionOut(y1, where, np.NaN, @out);
         }
         /// <summary>
         /// Return the ceiling of the input, element-wise.
         /// </summary>
         /// <param name="x">Input data.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray ceil(object x, object where = null)
+        public static ndarray ceil(object x, object where = null, ndarray @out = null)
         {
             var a = asanyarray(x);
 
  
             var ret = NpyCoreApi.PerformNumericOp(a, UFuncOperation.ceil, 0);
             ret = ret.reshape(new shape(a.dims));
-            if (where != null)
-            {
-                ret[np.invert(where)] = np.NaN;
-            }
-
-            return ret;
+            return MathFunctionOut(ret, where, np.NaN, @out);
         }
         /// <summary>
         /// Return the truncated value of the input, element-wise.
         /// </summary>
         /// <param name="x">Input data.</param>
+        /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray trunc(object x)
+        public static ndarray trunc(object x, object where = null, ndarray @out = null)
         {
             var a = asanyarray(x);
  
@@ -914,7 +1224,7 @@ namespace NumpyDotNet
             var y2 = np.ceil(a);
 
             y1["..."] = np.where(a >= 0, y1, y2);
-            return y1;
+            return MathFunctionOut(y1, where, np.NaN, @out);
         }
 
         #endregion
@@ -925,8 +1235,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result. </param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray exp(object x, object where = null)
+        public static ndarray exp(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -938,17 +1249,17 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Exp(value); };
-                return MathFunction(x, where, CNAN, mathfunc);
+                return MathFunction(x, where, CNAN, mathfunc, @out);
             }
             if (xa.IsBigInt)
             {
                 Func<double, double> mathfunc = (value) => { return Math.Exp(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Exp(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
   
         }
@@ -957,8 +1268,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray expm1(object x, object where = null)
+        public static ndarray expm1(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -980,7 +1292,7 @@ namespace NumpyDotNet
                         return System.Numerics.Complex.Exp(value) - 1.0;
                     }
                 };
-                return MathFunction(x, where, CNAN, mathfunc);
+                return MathFunction(x, where, CNAN, mathfunc, @out);
             }
             else
             {
@@ -995,7 +1307,7 @@ namespace NumpyDotNet
                         return Math.Exp(value) - 1.0;
                     }
                 };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1004,8 +1316,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray exp2(object x, object where = null)
+        public static ndarray exp2(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -1017,12 +1330,12 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Pow(2, value); };
-                return MathFunction(x, where, CNAN, mathfunc);
+                return MathFunction(x, where, CNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Pow(2, value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
   
         }
@@ -1031,8 +1344,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input value.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray log(object x, object where = null)
+        public static ndarray log(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -1044,12 +1358,12 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Log(value); };
-                return MathFunction(x, where, CNAN, mathfunc);
+                return MathFunction(x, where, CNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Log(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1058,8 +1372,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray log10(object x, object where = null)
+        public static ndarray log10(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -1071,12 +1386,12 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Log10(value); };
-                return MathFunction(x, where, CNAN, mathfunc);
+                return MathFunction(x, where, CNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Log10(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1085,8 +1400,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result. </param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray log2(object x, object where = null)
+        public static ndarray log2(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -1098,12 +1414,12 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Log(value, 2); };
-                return MathFunction(x, where, CNAN, mathfunc);
+                return MathFunction(x, where, CNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Log(value, 2); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1113,8 +1429,9 @@ namespace NumpyDotNet
         /// <param name="x">The value(s) whose log base n is (are) required.</param>
         /// <param name="n">The integer base(s) in which the log is taken.</param>
         /// <param name="where"></param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray logn(object x, int n, object where = null)
+        public static ndarray logn(object x, int n, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -1126,12 +1443,12 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, int, System.Numerics.Complex> mathfunc = (value, n1) => { return System.Numerics.Complex.Log(value, n1); };
-                return MathFunction(x, n, where, CNAN, mathfunc);
+                return MathFunction(x, n, where, CNAN, mathfunc, @out);
             }
             else
             {
                 Func<double,int,double> mathfunc = (value, n1) => { return Math.Log(value, n1); };
-                return MathFunction(x, n, where, DNAN, mathfunc);
+                return MathFunction(x, n, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1140,8 +1457,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray log1p(object x, object where = null)
+        public static ndarray log1p(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -1153,12 +1471,12 @@ namespace NumpyDotNet
             if (xa.IsComplex)
             {
                 Func<System.Numerics.Complex, System.Numerics.Complex> mathfunc = (value) => { return System.Numerics.Complex.Log(value); };
-                return MathFunction(x, where, CNAN, mathfunc);
+                return MathFunction(x, where, CNAN, mathfunc, @out);
             }
             else
             {
                 Func<double, double> mathfunc = (value) => { return Math.Log(value); };
-                return MathFunction(x, where, DNAN, mathfunc);
+                return MathFunction(x, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1168,8 +1486,9 @@ namespace NumpyDotNet
         /// <param name="x1">Input values.</param>
         /// <param name="x2">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray logaddexp(object x1, object x2, object where = null)
+        public static ndarray logaddexp(object x1, object x2, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x1);
 
@@ -1184,7 +1503,7 @@ namespace NumpyDotNet
                 {
                     return System.Numerics.Complex.Exp(value1) + System.Numerics.Complex.Exp(value2);
                 };
-                return MathFunction(x1, x2, where, CNAN, mathfunc);
+                return MathFunction(x1, x2, where, CNAN, mathfunc, @out);
             }
             else
             {
@@ -1192,7 +1511,7 @@ namespace NumpyDotNet
                 {
                     return Math.Log(Math.Exp(value1) + Math.Exp(value2));
                 };
-                return MathFunction(x1, x2, where, DNAN, mathfunc);
+                return MathFunction(x1, x2, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1202,8 +1521,9 @@ namespace NumpyDotNet
         /// <param name="x1">Input values.</param>
         /// <param name="x2">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray logaddexp2(object x1, object x2, object where = null)
+        public static ndarray logaddexp2(object x1, object x2, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x1);
 
@@ -1218,7 +1538,7 @@ namespace NumpyDotNet
                 {
                     return System.Numerics.Complex.Log(System.Numerics.Complex.Pow(2, value1) + System.Numerics.Complex.Pow(2, value2), 2);
                 };
-                return MathFunction(x1, x2, where, CNAN, mathfunc);
+                return MathFunction(x1, x2, where, CNAN, mathfunc, @out);
             }
             else
             {
@@ -1226,7 +1546,7 @@ namespace NumpyDotNet
                 {
                     return Math.Log(Math.Pow(2, value1) + Math.Pow(2, value2), 2);
                 };
-                return MathFunction(x1, x2, where, DNAN, mathfunc);
+                return MathFunction(x1, x2, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1237,8 +1557,9 @@ namespace NumpyDotNet
         /// <param name="x2">Input values.</param>
         /// <param name="n">The integer base(s) in which the log is taken.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray logaddexpn(object x1, object x2, int n, object where = null)
+        public static ndarray logaddexpn(object x1, object x2, int n, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x1);
 
@@ -1253,7 +1574,7 @@ namespace NumpyDotNet
                 {
                     return System.Numerics.Complex.Log(System.Numerics.Complex.Pow(n1, value1) + System.Numerics.Complex.Pow(n1, value2), 2);
                 };
-                return MathFunction(x1, x2, n, where, CNAN, mathfunc);
+                return MathFunction(x1, x2, n, where, CNAN, mathfunc, @out);
             }
             else
             {
@@ -1261,7 +1582,7 @@ namespace NumpyDotNet
                 {
                     return Math.Log(Math.Pow(n1, value1) + Math.Pow(n1, value2), 2);
                 };
-                return MathFunction(x1, x2, n, where, DNAN, mathfunc);
+                return MathFunction(x1, x2, n, where, DNAN, mathfunc, @out);
             }
 
         }
@@ -1279,8 +1600,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">The input value(s).</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray signbit(object x, object where = null)
+        public static ndarray signbit(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -1303,12 +1625,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(bret).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
             if (xa.IsFloatingPoint)
@@ -1344,12 +1661,7 @@ namespace NumpyDotNet
                     }
 
                     var ret = np.array(bret).reshape(new shape(ch.expectedShape));
-                    if (where != null)
-                    {
-                        ret[np.invert(where)] = np.NaN;
-                    }
-
-                    return ret;
+                    return MathFunctionOut(ret, where, np.NaN, @out);
                 }
                 else
                 {
@@ -1382,12 +1694,7 @@ namespace NumpyDotNet
                     }
 
                     var ret = np.array(bret).reshape(new shape(ch.expectedShape));
-                    if (where != null)
-                    {
-                        ret[np.invert(where)] = np.NaN;
-                    }
-
-                    return ret;
+                    return MathFunctionOut(ret, where, np.NaN, @out);
                 }
             }
             else
@@ -1404,12 +1711,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(bret).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
         }
@@ -1420,8 +1722,9 @@ namespace NumpyDotNet
         /// <param name="x1">Values to change the sign of.</param>
         /// <param name="x2">The sign of x2 is copied to x1</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray copysign(object x1, object x2, object where = null)
+        public static ndarray copysign(object x1, object x2, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x1);
 
@@ -1454,12 +1757,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
             if (xa.IsFloatingPoint)
@@ -1482,12 +1780,7 @@ namespace NumpyDotNet
                     }
 
                     var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                    if (where != null)
-                    {
-                        ret[np.invert(where)] = np.NaN;
-                    }
-
-                    return ret;
+                    return MathFunctionOut(ret, where, np.NaN, @out);
                 }
                 else
                 {
@@ -1507,12 +1800,7 @@ namespace NumpyDotNet
                     }
 
                     var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                    if (where != null)
-                    {
-                        ret[np.invert(where)] = np.NaN;
-                    }
-
-                    return ret;
+                    return MathFunctionOut(ret, where, np.NaN, @out);
                 }
             }
             else
@@ -1533,12 +1821,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret.astype(xa.Dtype);
+                return MathFunctionOut(ret.astype(xa.Dtype), where, np.NaN, @out);
             }
 
 
@@ -1645,8 +1928,9 @@ namespace NumpyDotNet
         /// <param name="x1">Array of multipliers.</param>
         /// <param name="x2">Array of twos exponents.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result. </param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray ldexp(object x1, object x2, object where = null)
+        public static ndarray ldexp(object x1, object x2, object where = null, ndarray @out = null)
         {
             var a1 = asanyarray(x1);
             var a2 = asanyarray(x2);
@@ -1670,12 +1954,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
             if (a1.ItemSize <= sizeof(float) && a2.ItemSize <= sizeof(float))
@@ -1688,12 +1967,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
             else
             {
@@ -1705,12 +1979,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
  
@@ -1721,8 +1990,9 @@ namespace NumpyDotNet
         /// <param name="x1">Values to find the next representable value of.</param>
         /// <param name="x2">The direction where to look for the next representable value of x1.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray nextafter(object x1, object x2, object where = null)
+        public static ndarray nextafter(object x1, object x2, object where = null, ndarray @out = null)
         {
             var a1 = asanyarray(x1);
             var a2 = asanyarray(x2);
@@ -1749,12 +2019,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
             else
             {
@@ -1766,12 +2031,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
 
@@ -1833,8 +2093,9 @@ namespace NumpyDotNet
         /// <param name="x1">Arrays of values</param>
         /// <param name="x2">Arrays of values</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray lcm(object x1, object x2, object where = null)
+        public static ndarray lcm(object x1, object x2, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x1);
 
@@ -1848,18 +2109,18 @@ namespace NumpyDotNet
                 if (xa.IsBigInt)
                 {
                     Func<System.Numerics.BigInteger, System.Numerics.BigInteger, System.Numerics.BigInteger> mathfunc = (value1, value2) => { return _lcmb(value1, value2);};
-                    return MathFunction<System.Numerics.BigInteger>(x1, x2, where, BNAN, mathfunc);
+                    return MathFunction<System.Numerics.BigInteger>(x1, x2, where, BNAN, mathfunc, @out);
                 }
                 else
                 if (xa.ItemSize <= sizeof(Int32))
                 {
                     Func<Int32, Int32, Int32> mathfunc = (value1, value2) => { return _lcmi(value1, value2);};
-                    return MathFunction<Int32>(x1, x2, where, 0, mathfunc);
+                    return MathFunction<Int32>(x1, x2, where, 0, mathfunc, @out);
                 }
                 else
                 {
                     Func<Int64, Int64, Int64> mathfunc = (value1, value2) => { return _lcml(value1, value2);};
-                    return MathFunction<Int64>(x1, x2, where, 0, mathfunc);
+                    return MathFunction<Int64>(x1, x2, where, 0, mathfunc, @out);
                 }
             }
             else
@@ -1874,8 +2135,9 @@ namespace NumpyDotNet
         /// <param name="x1">Arrays of values.</param>
         /// <param name="x2">Arrays of values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray gcd(object x1, object x2, object where = null)
+        public static ndarray gcd(object x1, object x2, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x1);
 
@@ -1889,18 +2151,18 @@ namespace NumpyDotNet
                 if (xa.IsBigInt)
                 {
                     Func<System.Numerics.BigInteger, System.Numerics.BigInteger, System.Numerics.BigInteger> mathfunc = (value1, value2) => { return _gcdb(value1, value2); };
-                    return MathFunction<System.Numerics.BigInteger>(x1, x2, where, BNAN, mathfunc);
+                    return MathFunction<System.Numerics.BigInteger>(x1, x2, where, BNAN, mathfunc, @out);
                 }
                 else
                 if (xa.ItemSize <= sizeof(Int32))
                 {
                     Func<Int32, Int32, Int32> mathfunc = (value1, value2) => { return _gcdi(value1, value2); };
-                    return MathFunction<Int32>(x1, x2, where, 0, mathfunc);
+                    return MathFunction<Int32>(x1, x2, where, 0, mathfunc, @out);
                 }
                 else
                 {
                     Func<Int64, Int64, Int64> mathfunc = (value1, value2) => { return _gcdl(value1, value2); };
-                    return MathFunction<Int64>(x1, x2, where, 0, mathfunc);
+                    return MathFunction<Int64>(x1, x2, where, 0, mathfunc, @out);
                 }
             }
             else
@@ -1930,20 +2192,25 @@ namespace NumpyDotNet
         /// Return the reciprocal of the argument, element-wise.
         /// </summary>
         /// <param name="a">Input array.</param>
+        /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray reciprocal(object a)
+        public static ndarray reciprocal(object a, object where = null, ndarray @out = null)
         {
-            return NpyCoreApi.PerformNumericOp(asanyarray(a), UFuncOperation.reciprocal, 0);
+            var ret = NpyCoreApi.PerformNumericOp(asanyarray(a), UFuncOperation.reciprocal, 0);
+            return MathFunctionOut(ret, where, np.NaN, @out);
         }
         /// <summary>
         /// Numerical positive, element-wise.
         /// </summary>
         /// <param name="x">Input array.</param>
+        /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray positive(object x)
+        public static ndarray positive(object x, object where = null, ndarray @out = null)
         {
             var a = asanyarray(x);
-            return a.Copy();
+            return MathFunctionOut(a.Copy(), where, np.NaN, @out);
         }
         /// <summary>
         /// Numerical negative, element-wise.
@@ -2039,8 +2306,9 @@ namespace NumpyDotNet
         /// <param name="x1">The bases.</param>
         /// <param name="x2">The exponents.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray float_power(object x1, object x2, object where = null)
+        public static ndarray float_power(object x1, object x2, object where = null, ndarray @out = null)
         {
             var x1a = asanyarray(x1);
 
@@ -2063,12 +2331,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
             else
             {
@@ -2080,12 +2343,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
  
@@ -2098,20 +2356,28 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x1">Dividend array.</param>
         /// <param name="x2">Divisor array</param>
+        /// <param name="out">A location into which the result is stored. </param>
+        /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
         /// <returns></returns>
-        public static ndarray mod(object x1, object x2)
+        public static ndarray mod(object x1, object x2, ndarray @out = null, object where = null)
         {
-            return remainder(x1, x2);
+            if (where == null)
+            {
+                return remainder(x1, x2, @out);
+            }
+            return MathFunctionOut(remainder(x1, x2), where, np.NaN, @out);
         }
         /// <summary>
         /// Return element-wise remainder of division.
         /// </summary>
         /// <param name="x1">Dividend array.</param>
         /// <param name="x2">Divisor</param>
+        /// <param name="out">A location into which the result is stored. </param>
+        /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
         /// <returns></returns>
-        public static ndarray mod(object x1, int x2)
+        public static ndarray mod(object x1, int x2, ndarray @out = null, object where = null)
         {
-            return remainder(x1, x2);
+            return mod(x1, (object)x2, @out, where);
         }
         /// <summary>
         /// Return element-wise remainder of division.
@@ -2197,8 +2463,9 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="x">Input values.</param>
         /// <param name="where">This condition is broadcast over the input. At locations where the condition is True, the out array will be set to the ufunc result.</param>
+        /// <param name="out">A location into which the result is stored. It must have the shape that the inputs broadcast to.</param>
         /// <returns></returns>
-        public static ndarray sign(object x, object where = null)
+        public static ndarray sign(object x, object where = null, ndarray @out = null)
         {
             var xa = asanyarray(x);
 
@@ -2241,12 +2508,7 @@ namespace NumpyDotNet
 
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
             if (xa.IsFloatingPoint)
@@ -2289,12 +2551,7 @@ namespace NumpyDotNet
  
 
                     var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                    if (where != null)
-                    {
-                        ret[np.invert(where)] = np.NaN;
-                    }
-
-                    return ret;
+                    return MathFunctionOut(ret, where, np.NaN, @out);
                 }
                 else
                 {
@@ -2334,12 +2591,7 @@ namespace NumpyDotNet
 
 
                     var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                    if (where != null)
-                    {
-                        ret[np.invert(where)] = np.NaN;
-                    }
-
-                    return ret;
+                    return MathFunctionOut(ret, where, np.NaN, @out);
                 }
             }
             else
@@ -2362,12 +2614,7 @@ namespace NumpyDotNet
                 }
 
                 var ret = np.array(ch.results).reshape(new shape(ch.expectedShape));
-                if (where != null)
-                {
-                    ret[np.invert(where)] = np.NaN;
-                }
-
-                return ret;
+                return MathFunctionOut(ret, where, np.NaN, @out);
             }
 
         }
@@ -33,6 +33,8 @@
 using NumpyLib;
 using System;
 using System.Collections.Generic;
+using System.Linq;
+using System.Threading.Tasks;
 #if NPY_INTP_64
 using npy_intp = System.Int64;
 #else
@@ -324,6 +326,11 @@ namespace NumpyDotNet
 
             var arr = asanyarray(a);
 
+            if (_nan_reduce_supported(arr, null, NanReduction.Min))
+            {
+                return _nan_reduce(arr, axis, keepdims, NanReduction.Min);
+            }
+
             if (false) //  type(arr) is np.ndarray and a.dtype != np.object_:
             {
                 // Fast, but not safe for subclasses of ndarray, or object arrays,
@@ -454,6 +461,11 @@ namespace NumpyDotNet
 
             var arr = asanyarray(a);
 
+            if (_nan_reduce_supported(arr, null, NanReduction.Max))
+            {
+                return _nan_reduce(arr, axis, keepdims, NanReduction.Max);
+            }
+
             if (false) //  type(arr) is np.ndarray and a.dtype != np.object_:
             {
                 // Fast, but not safe for subclasses of ndarray, or object arrays,
@@ -696,8 +708,13 @@ namespace NumpyDotNet
             nan
             */
 
+            var arr = asanyarray(a);
+            if (@out == null && _nan_reduce_supported(arr, dtype, NanReduction.Sum))
+            {
+                return _nan_reduce(arr, axis, keepdims, NanReduction.Sum);
+            }
 
-            var replaced = _replace_nan(asanyarray(a), 0);
+            var replaced = _replace_nan(arr, 0);
             return np.sum(replaced.a, axis: axis, dtype: dtype, ret: @out, keepdims: keepdims);
         }
         /// <summary>
@@ -1002,7 +1019,13 @@ namespace NumpyDotNet
             array([ 1.,  3.5])
             */
 
-            var replaced = _replace_nan(asanyarray(a), 0);
+            var arr = asanyarray(a);
+            if (_nan_reduce_supported(arr, dtype, NanReduction.Mean))
+            {
+                return _nan_reduce(arr, axis, keepdims, NanReduction.Mean);
+            }
+
+            var replaced = _replace_nan(arr, 0);
             if (replaced.mask == null)
             {
                 return np.mean(replaced.a, axis: axis, dtype: dtype, keepdims: keepdims);
@@ -1703,7 +1726,13 @@ namespace NumpyDotNet
             bool _keepdims = false;
             ndarray sqr = null;
 
-            var replaced = _replace_nan(asanyarray(a), 0);
+            var input = asanyarray(a);
+            if (_nan_reduce_supported(input, dtype, NanReduction.Var))
+            {
+                return _nan_reduce(input, axis, keepdims, NanReduction.Var, ddof);
+            }
+
+            var replaced = _replace_nan(input, 0);
             var arr = replaced.a;
             var mask = replaced.mask;
 
@@ -1874,12 +1903,405 @@ namespace NumpyDotNet
             array([ 0.,  0.5])             
             */
 
-            var var = nanvar(a, axis: axis, dtype: dtype, ddof: ddof, keepdims: keepdims);
+            var arr = asanyarray(a);
+            if (_nan_reduce_supported(arr, dtype, NanReduction.Std))
+            {
+                return _nan_reduce(arr, axis, keepdims, NanReduction.Std, ddof);
+            }
+
+            var var = nanvar(arr, axis: axis, dtype: dtype, ddof: ddof, keepdims: keepdims);
             var std = np.sqrt(var);
             return std;
 
         }
 
+
+        #region nan reduction kernels
+
+        private enum NanReduction
+        {
+            Sum,
+            Mean,
+            Var,
+            Std,
+            Min,
+            Max,
+        }
+
+        /// <summary>
+        /// running state of one output element.  a/b are the sum and its compensation, the Welford
+        /// mean and sum of squared deviations, or the current min/max.
+        /// </summary>
+        private struct NanState
+        {
+            public npy_intp count;
+            public double a;
+            public double b;
+        }
+
+        private interface INanSource
+        {
+            double this[npy_intp i] { get; }
+        }
+
+        /// <summary>
+        /// adds one non-NaN value into a state and merges the states filled by different tasks.
+        /// </summary>
+        private interface INanAccumulator
+        {
+            void Add(ref NanState s, double x);
+            void Merge(ref NanState s, ref NanState o);
+        }
+
+        private struct DoubleNanSource : INanSource
+        {
+            private readonly double[] data;
+            private readonly npy_intp offset;
+
+            public DoubleNanSource(ndarray a)
+            {
+                data = (double[])a.core.data.datap;
+                offset = a.core.data.data_offset / sizeof(double);
+            }
+
+            public double this[npy_intp i] { get { return data[offset + i]; } }
+        }
+
+        private struct FloatNanSource : INanSource
+        {
+            private readonly float[] data;
+            private readonly npy_intp offset;
+
+            public FloatNanSource(ndarray a)
+            {
+                data = (float[])a.core.data.datap;
+                offset = a.core.data.data_offset / sizeof(float);
+            }
+
+            public double this[npy_intp i] { get { return data[offset + i]; } }
+        }
+
+        /// <summary>
+        /// compensated (Neumaier) sum.  Once an infinity or NaN reaches the sum the compensation is ignored.
+        /// </summary>
+        private struct NanSumAccumulator : INanAccumulator
+        {
+            public void Add(ref NanState s, double x)
+            {
+                double t = s.a + x;
+                if (Math.Abs(s.a) >= Math.Abs(x))
+                    s.b += (s.a - t) + x;
+                else
+                    s.b += (x - t) + s.a;
+                s.a = t;
+                s.count++;
+            }
+
+            public void Merge(ref NanState s, ref NanState o)
+            {
+                npy_intp count = s.count;
+                Add(ref s, o.a);
+                s.b += o.b;
+                s.count = count + o.count;
+            }
+
+            public static double Result(ref NanState s)
+            {
+                return double.IsInfinity(s.a) || double.IsNaN(s.a) ? s.a : s.a + s.b;
+            }
+        }
+
+        /// <summary>
+        /// Welford's running mean and sum of squared deviations, merged with Chan's pairwise formula.
+        /// </summary>
+        private struct NanWelfordAccumulator : INanAccumulator
+        {
+            public void Add(ref NanState s, double x)
+            {
+                s.count++;
+                double d = x - s.a;
+                s.a += d / s.count;
+                s.b += d * (x - s.a);
+            }
+
+            public void Merge(ref NanState s, ref NanState o)
+            {
+                if (o.count == 0)
+                    return;
+                if (s.count == 0)
+                {
+                    s = o;
+                    return;
+                }
+
+                npy_intp count = s.count + o.count;
+                double d = o.a - s.a;
+                s.a += d * o.count / count;
+                s.b += o.b + d * d * ((double)s.count * o.count / count);
+                s.count = count;
+            }
+        }
+
+        private struct NanMinAccumulator : INanAccumulator
+        {
+            public void Add(ref NanState s, double x)
+            {
+                if (s.count == 0 || x < s.a)
+                    s.a = x;
+                s.count++;
+            }
+
+            public void Merge(ref NanState s, ref NanState o)
+            {
+                if (o.count > 0 && (s.count == 0 || o.a < s.a))
+                    s.a = o.a;
+                s.count += o.count;
+            }
+        }
+
+        private struct NanMaxAccumulator : INanAccumulator
+        {
+            public void Add(ref NanState s, double x)
+            {
+                if (s.count == 0 || x > s.a)
+                    s.a = x;
+                s.count++;
+            }
+
+            public void Merge(ref NanState s, ref NanState o)
+            {
+                if (o.count > 0 && (s.count == 0 || o.a > s.a))
+                    s.a = o.a;
+                s.count += o.count;
+            }
+        }
+
+        /// <summary>
+        /// true if the reduction can run on the single pass kernels.  Sums, means and variances are
+        /// only done there for float64, where accumulating in double does not change the result type.
+        /// </summary>
+        private static bool _nan_reduce_supported(ndarray arr, dtype dtype, NanReduction op)
+        {
+            if (arr.IsMatrix)
+                return false;
+
+            // amin/amax report the error for empty arrays
+            if (arr.size == 0 && (op == NanReduction.Min || op == NanReduction.Max))
+                return false;
+
+            if (dtype != null && dtype.TypeNum != arr.TypeNum)
+                return false;
+
+            switch (arr.TypeNum)
+            {
+                case NPY_TYPES.NPY_DOUBLE:
+                    return true;
+                case NPY_TYPES.NPY_FLOAT:
+                    return op == NanReduction.Min || op == NanReduction.Max;
+                default:
+                    return false;
+            }
+        }
+
+        /// <summary>
+        /// NaN skipping reduction over one axis (or all of them) in a single pass, without copying
+        /// the input or building a NaN mask.
+        /// </summary>
+        private static ndarray _nan_reduce(ndarray arr, int? axis, bool keepdims, NanReduction op, int ddof = 0)
+        {
+            arr = np.ascontiguousarray(arr);
+            int nd = arr.ndim;
+
+            // the data is viewed as (outer, n, inner) with n the reduced axis
+            npy_intp outer = 1, n, inner = 1;
+            npy_intp[] outdims;
+            if (axis == null)
+            {
+                n = arr.size;
+                outdims = keepdims ? Enumerable.Repeat((npy_intp)1, nd).ToArray() : new npy_intp[0];
+            }
+            else
+            {
+                int ax = normalize_axis_index(axis.Value, nd);
+                for (int i = 0; i < ax; i++)
+                    outer *= arr.Dim(i);
+                n = arr.Dim(ax);
+                for (int i = ax + 1; i < nd; i++)
+                    inner *= arr.Dim(i);
+
+                var dims = arr.dims.ToList();
+                if (keepdims)
+                    dims[ax] = 1;
+                else
+                    dims.RemoveAt(ax);
+                outdims = dims.ToArray();
+            }
+
+            NanState[] states = arr.TypeNum == NPY_TYPES.NPY_FLOAT ?
+                _nan_reduce_op(new FloatNanSource(arr), op, outer, n, inner) :
+                _nan_reduce_op(new DoubleNanSource(arr), op, outer, n, inner);
+
+            double[] result = new double[states.Length];
+            bool bad = false;
+            for (int i = 0; i < states.Length; i++)
+            {
+                switch (op)
+                {
+                    case NanReduction.Sum:
+                        result[i] = NanSumAccumulator.Result(ref states[i]);
+                        break;
+                    case NanReduction.Mean:
+                        result[i] = NanSumAccumulator.Result(ref states[i]) / states[i].count;
+                        bad |= states[i].count == 0;
+                        break;
+                    case NanReduction.Var:
+                    case NanReduction.Std:
+                        npy_intp dof = states[i].count - ddof;
+                        result[i] = dof > 0 ? states[i].b / dof : double.NaN;
+                        if (op == NanReduction.Std)
+                            result[i] = Math.Sqrt(result[i]);
+                        bad |= dof <= 0;
+                        break;
+                    case NanReduction.Min:
+                    case NanReduction.Max:
+                        result[i] = states[i].count > 0 ? states[i].a : double.NaN;
+                        bad |= states[i].count == 0;
+                        break;
+                }
+            }
+
+            if (bad)
+            {
+                switch (op)
+                {
+                    case NanReduction.Mean:
+                        Console.WriteLine("Mean of empty slice");
+                        break;
+                    case NanReduction.Var:
+                    case NanReduction.Std:
+                        Console.WriteLine("Degrees of freedom <= 0 for slice.");
+                        break;
+                    default:
+                        Console.WriteLine("All-NaN axis encountered");
+                        break;
+                }
+            }
+
+            if (arr.TypeNum == NPY_TYPES.NPY_FLOAT)
+            {
+                float[] fresult = result.Select(r => (float)r).ToArray();
+                // axis=None reshapes to an empty shape, a 0-d array like the rest of the reductions
+                return np.array(fresult).reshape(new shape(outdims, outdims.Length));
+            }
+            return np.array(result).reshape(new shape(outdims, outdims.Length));
+        }
+
+        private static NanState[] _nan_reduce_op<TSrc>(TSrc src, NanReduction op, npy_intp outer, npy_intp n, npy_intp inner) where TSrc : struct, INanSource
+        {
+            switch (op)
+            {
+                case NanReduction.Sum:
+                case NanReduction.Mean:
+                    return _nan_reduce_kernel(src, new NanSumAccumulator(), outer, n, inner);
+                case NanReduction.Var:
+                case NanReduction.Std:
+                    return _nan_reduce_kernel(src, new NanWelfordAccumulator(), outer, n, inner);
+                case NanReduction.Min:
+                    return _nan_reduce_kernel(src, new NanMinAccumulator(), outer, n, inner);
+                default:
+                    return _nan_reduce_kernel(src, new NanMaxAccumulator(), outer, n, inner);
+            }
+        }
+
+        /// <summary>
+        /// Splits the work over the output elements when there are enough of them.  Otherwise each task
+        /// reduces its own part of the axis into private states which are merged in task order, so the
+        /// result does not depend on scheduling.
+        /// </summary>
+        private static NanState[] _nan_reduce_kernel<TSrc, TAcc>(TSrc src, TAcc acc, npy_intp outer, npy_intp n, npy_intp inner)
+            where TSrc : struct, INanSource
+            where TAcc : struct, INanAccumulator
+        {
+            npy_intp outputs = outer * inner;
+            var states = new NanState[outputs];
+            if (outputs == 0 || n == 0)
+                return states;
+
+            npy_intp grain = NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp);
+            var segments = numpyinternal.NpyArray_SEGMENT_ParallelSplit(outputs, Math.Max(1, grain / n)).ToArray();
+
+            if (segments.Length > 1 || outputs * n <= grain)
+            {
+                Parallel.For(0, segments.Length, NpyParallelScheduler.Options, s =>
+                {
+                    _nan_accumulate(src, acc, states, n, inner, segments[s].start, segments[s].end, 0, n);
+                });
+                return states;
+            }
+
+            // few long slices: split the reduced axis instead
+            segments = numpyinternal.NpyArray_SEGMENT_ParallelSplit(n, Math.Max(1, grain / outputs)).ToArray();
+            var partials = new NanState[segments.Length][];
+            Parallel.For(0, segments.Length, NpyParallelScheduler.Options, s =>
+            {
+                partials[s] = new NanState[outputs];
+                _nan_accumulate(src, acc, partials[s], n, inner, 0, outputs, segments[s].start, segments[s].end);
+            });
+
+            for (int p = 0; p < partials.Length; p++)
+            {
+                for (npy_intp i = 0; i < outputs; i++)
+                {
+                    acc.Merge(ref states[i], ref partials[p][i]);
+                }
+            }
+            return states;
+        }
+
+        /// <summary>
+        /// accumulates elements j0..j1 of the reduced axis into the output elements o0..o1.
+        /// </summary>
+        private static void _nan_accumulate<TSrc, TAcc>(TSrc src, TAcc acc, NanState[] states, npy_intp n, npy_intp inner,
+                                                        npy_intp o0, npy_intp o1, npy_intp j0, npy_intp j1)
+            where TSrc : struct, INanSource
+            where TAcc : struct, INanAccumulator
+        {
+            if (inner == 1)
+            {
+                for (npy_intp o = o0; o < o1; o++)
+                {
+                    NanState s = states[o];
+                    npy_intp row = o * n;
+                    for (npy_intp j = j0; j < j1; j++)
+                    {
+                        double x = src[row + j];
+                        if (!double.IsNaN(x))
+                            acc.Add(ref s, x);
+                    }
+                    states[o] = s;
+                }
+                return;
+            }
+
+            // walk the reduced axis in the outer loop so every pass reads a contiguous run of inner elements
+            for (npy_intp o = o0 / inner; o * inner < o1; o++)
+            {
+                npy_intp first = o * inner;
+                npy_intp k0 = Math.Max(o0, first) - first;
+                npy_intp k1 = Math.Min(o1, first + inner) - first;
+                for (npy_intp j = j0; j < j1; j++)
+                {
+                    npy_intp row = (o * n + j) * inner;
+                    for (npy_intp k = k0; k < k1; k++)
+                    {
+                        double x = src[row + k];
+                        if (!double.IsNaN(x))
+                            acc.Add(ref states[first + k], x);
+                    }
+                }
+            }
+        }
+        #endregion
     }
 
 
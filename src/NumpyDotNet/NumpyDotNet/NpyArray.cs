@@ -65,6 +65,74 @@ namespace NumpyDotNet {
                     numpyinternal.enableTryCatchOnCalculations = value;
                 }
             }
+
+            /// <summary>
+            /// maximum number of threads a single operation will use.  Defaults to Environment.ProcessorCount.
+            /// Setting a value &lt;= 0 restores the default.
+            /// </summary>
+            public static int MaxDegreeOfParallelism
+            {
+                get { return NpyParallelScheduler.MaxDegreeOfParallelism; }
+                set { NpyParallelScheduler.MaxDegreeOfParallelism = value; }
+            }
+
+            /// <summary>
+            /// enable/disable calibration of parallel grain sizes on first use.
+            /// When disabled the fixed legacy grain sizes are used.
+            /// </summary>
+            public static bool EnableAutoTuning
+            {
+                get { return NpyParallelScheduler.EnableAutoTuning; }
+                set { NpyParallelScheduler.EnableAutoTuning = value; }
+            }
+
+            /// <summary>
+            /// minimum number of elements per task for element-wise numeric operations.
+            /// Setting a value &lt;= 0 returns control to the scheduler.
+            /// </summary>
+            public static npy_intp NumericOpGrainSize
+            {
+                get { return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp); }
+                set { NpyParallelScheduler.SetGrainSize(NpyParallelOperation.NumericOp, value); }
+            }
+
+            /// <summary>
+            /// minimum number of elements per task for flat array copies.
+            /// Setting a value &lt;= 0 returns control to the scheduler.
+            /// </summary>
+            public static npy_intp FlatCopyGrainSize
+            {
+                get { return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.FlatCopy); }
+                set { NpyParallelScheduler.SetGrainSize(NpyParallelOperation.FlatCopy, value); }
+            }
+
+            /// <summary>
+            /// minimum number of elements per task for strided/field copies.
+            /// Setting a value &lt;= 0 returns control to the scheduler.
+            /// </summary>
+            public static npy_intp CopyFieldGrainSize
+            {
+                get { return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.CopyField); }
+                set { NpyParallelScheduler.SetGrainSize(NpyParallelOperation.CopyField, value); }
+            }
+
+            /// <summary>
+            /// minimum number of rows per task for sort operations.
+            /// Setting a value &lt;= 0 returns control to the scheduler.
+            /// </summary>
+            public static npy_intp SortGrainSize
+            {
+                get { return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.Sort); }
+                set { NpyParallelScheduler.SetGrainSize(NpyParallelOperation.Sort, value); }
+            }
+
+            /// <summary>
+            /// discards calibrated grain sizes so they are measured again on next use.
+            /// </summary>
+            public static void ResetCalibration()
+            {
+                NpyParallelScheduler.ResetCalibration();
+            }
         }
    
   
@@ -1,4 +1,4 @@
-/*
+﻿/*
  * BSD 3-Clause License
  *
  * Copyright (c) 2018-2021
@@ -38,6 +38,8 @@ using System.Text;
 using System.Runtime.InteropServices;
 using NumpyLib;
 using System.IO;
+using System.IO.Compression;
+using System.IO.MemoryMappedFiles;
 #if NPY_INTP_64
 using npy_intp = System.Int64;
 #else
@@ -54,11 +56,83 @@ namespace NumpyDotNet
         static byte[] _ZIP_PREFIX = new byte[] { 0x50, 0x4B, 0x03, 0x04 }; // b'PK\x03\x04';
         static byte[] MAGIC_PREFIX = new byte[] { 0x93, 0x4e, 0x55, 0x4d, 0x50, 0x59 }; // b'\x93NUMPY';
         static int MAGIC_LEN = MAGIC_PREFIX.Length + 2;
+        static int ARRAY_ALIGN = 64;
+        static int IO_BUFFER_SIZE = 1 << 20;
 
-        public static ndarray load(string PathName)
+        #region save/load
+
+        /// <summary>
+        /// Save an array to a binary file in NumPy .npy format.
+        /// </summary>
+        /// <param name="file">File name where the data is to be saved.  If file does not already have a .npy extension, it will be appended.</param>
+        /// <param name="arr">Array data to be saved.</param>
+        public static void save(string file, object arr)
+        {
+            if (string.IsNullOrEmpty(file))
+            {
+                throw new Exception("Pathname null or empty");
+            }
+
+            if (!file.EndsWith(".npy", StringComparison.OrdinalIgnoreCase))
+            {
+                file = file + ".npy";
+            }
+
+            using (var fp = System.IO.File.Open(file, System.IO.FileMode.Create, System.IO.FileAccess.Write))
+            {
+                write_array(fp, asanyarray(arr));
+            }
+        }
+
+        /// <summary>
+        /// Save several arrays into a single file in uncompressed .npz format.
+        /// </summary>
+        /// <param name="file">File name where the data is to be saved.  If file does not already have a .npz extension, it will be appended.</param>
+        /// <param name="args">Arrays to save to the file. They will be saved with the names "arr_0", "arr_1", etc.</param>
+        public static void savez(string file, params object[] args)
+        {
+            _savez(file, _savez_names(args), false);
+        }
+
+        /// <summary>
+        /// Save several arrays into a single file in uncompressed .npz format.
+        /// </summary>
+        /// <param name="file">File name where the data is to be saved.  If file does not already have a .npz extension, it will be appended.</param>
+        /// <param name="kwds">Arrays to save to the file, keyed by the name they will be stored under.</param>
+        public static void savez(string file, IDictionary<string, object> kwds)
+        {
+            _savez(file, kwds, false);
+        }
+
+        /// <summary>
+        /// Save several arrays into a single file in compressed .npz format.
+        /// </summary>
+        /// <param name="file">File name where the data is to be saved.  If file does not already have a .npz extension, it will be appended.</param>
+        /// <param name="args">Arrays to save to the file. They will be saved with the names "arr_0", "arr_1", etc.</param>
+        public static void savez_compressed(string file, params object[] args)
+        {
+            _savez(file, _savez_names(args), true);
+        }
+
+        /// <summary>
+        /// Save several arrays into a single file in compressed .npz format.
+        /// </summary>
+        /// <param name="file">File name where the data is to be saved.  If file does not already have a .npz extension, it will be appended.</param>
+        /// <param name="kwds">Arrays to save to the file, keyed by the name they will be stored under.</param>
+        public static void savez_compressed(string file, IDictionary<string, object> kwds)
         {
-            throw new Exception("This function is under consideration for development");
+            _savez(file, kwds, true);
+        }
 
+        /// <summary>
+        /// Load an array from a .npy file.
+        /// </summary>
+        /// <param name="PathName">The file to read.</param>
+        /// <param name="mmap_mode">(optional) {None, 'r', 'c'}, If not null, the array data is copied in blocks from a read-only memory-mapped view of the file instead of a buffered stream.
+        /// The returned array is still held in managed memory; use np.open_memmap to keep the data in the file.</param>
+        /// <returns>Data stored in the file.</returns>
+        public static ndarray load(string PathName, string mmap_mode = null)
+        {
             if (string.IsNullOrEmpty(PathName))
             {
                 throw new Exception("Pathname null or empty");
@@ -69,62 +143,685 @@ namespace NumpyDotNet
                 throw new Exception("Specified file does not exist!");
             }
 
-            var fp = System.IO.File.Open(PathName, System.IO.FileMode.Open);
+            if (mmap_mode != null && mmap_mode != "r" && mmap_mode != "c")
+            {
+                if (mmap_mode == "r+" || mmap_mode == "w+")
+                {
+                    throw new NotSupportedException(string.Format("mmap_mode '{0}' is not supported. ndarray data is stored in managed memory and can't be written back to the file. Use np.open_memmap for writable file backed storage.", mmap_mode));
+                }
+                throw new ValueError(string.Format("mode must be one of ['r', 'c', 'r+', 'w+'] (got '{0}')", mmap_mode));
+            }
+
+            using (var fp = System.IO.File.Open(PathName, System.IO.FileMode.Open, System.IO.FileAccess.Read, System.IO.FileShare.Read))
+            {
+                int N = MAGIC_PREFIX.Length;
 
+                byte[] magic = new byte[N];
 
-            int N = MAGIC_PREFIX.Length;
+                var magic_read = fp.Read(magic, 0, N);
 
-            byte[] magic = new byte[N + 200];
+                fp.Seek(-Math.Min(N, magic_read), System.IO.SeekOrigin.Current);
 
-            var magic_read = fp.Read(magic, 0, N);
+                if (magic_read >= _ZIP_PREFIX.Length && IsPrefixMatch(magic, _ZIP_PREFIX))
+                {
+                    throw new Exception("Specified file is a zipped .npz archive. Use np.load_npz to read it.");
+                }
+                if (magic_read == N && IsPrefixMatch(magic, MAGIC_PREFIX))
+                {
+                    if (mmap_mode != null)
+                    {
+                        return _read_array_mapped(fp);
+                    }
+                    return read_array(fp);
+                }
+            }
 
-            fp.Seek(-Math.Min(N, magic_read), System.IO.SeekOrigin.Current);
+            throw new Exception("Specified file is not a .npy file");
+        }
 
-            if (IsPrefixMatch(magic, _ZIP_PREFIX))
+        /// <summary>
+        /// Load the arrays from a .npz file.
+        /// </summary>
+        /// <param name="PathName">The file to read.</param>
+        /// <returns>A dictionary-like object which can be queried for its list of arrays and for the arrays themselves.</returns>
+        public static NpzFile load_npz(string PathName)
+        {
+            if (string.IsNullOrEmpty(PathName))
             {
-                throw new Exception("Zipped files are not supported");
+                throw new Exception("Pathname null or empty");
             }
-            if (IsPrefixMatch(magic, MAGIC_PREFIX))
+
+            if (System.IO.File.Exists(PathName) == false)
             {
-                return read_array(fp);
+                throw new Exception("Specified file does not exist!");
             }
-            return null;
+
+            return new NpzFile(System.IO.File.Open(PathName, System.IO.FileMode.Open, System.IO.FileAccess.Read, System.IO.FileShare.Read));
         }
 
-        private static ndarray read_array(FileStream fp)
+        /// <summary>
+        /// Open a .npy file as a memory-mapped array.  The array data stays in the file and is
+        /// accessed through the returned np.memmap, so files larger than memory can be processed.
+        /// </summary>
+        /// <param name="PathName">The file to open.</param>
+        /// <param name="mode">{'r+', 'r', 'w+', 'c'}, The file is opened in this mode: read/write, read only, created or overwritten, or copy-on-write.</param>
+        /// <param name="dtype">The data type of the array if a new file is created with mode 'w+'. Default is Float64.</param>
+        /// <param name="shape">The shape of the array if a new file is created with mode 'w+'.</param>
+        /// <returns>The memory-mapped array.</returns>
+        public static memmap open_memmap(string PathName, string mode = "r+", dtype dtype = null, shape shape = null)
+        {
+            if (string.IsNullOrEmpty(PathName))
+            {
+                throw new Exception("Pathname null or empty");
+            }
+
+            if (mode == "w+")
+            {
+                if (shape == null)
+                {
+                    throw new ValueError("shape must be given if mode == 'w+'");
+                }
+                dtype = dtype ?? np.Float64;
+
+                long data_start;
+                using (var fp = System.IO.File.Open(PathName, System.IO.FileMode.Create, System.IO.FileAccess.Write, System.IO.FileShare.Read))
+                {
+                    _write_array_header(fp, _array_header(dtype, false, shape.iDims));
+                    data_start = fp.Position;
+                }
+
+                // memmap extends the file to hold the data
+                return new memmap(PathName, dtype, "r+", data_start, shape);
+            }
+
+            if (mode != "r" && mode != "r+" && mode != "c")
+            {
+                throw new ValueError(string.Format("mode must be one of ['r', 'c', 'r+', 'w+'] (got '{0}')", mode));
+            }
+
+            if (System.IO.File.Exists(PathName) == false)
+            {
+                throw new Exception("Specified file does not exist!");
+            }
+
+            (dtype dtype, bool fortran_order, npy_intp[] shape, bool swap) array_info;
+            long offset;
+            using (var fp = System.IO.File.Open(PathName, System.IO.FileMode.Open, System.IO.FileAccess.Read, System.IO.FileShare.ReadWrite))
+            {
+                var version = read_magic(fp);
+                _check_version(version);
+
+                array_info = _read_array_header(fp, version);
+                offset = fp.Position;
+            }
+
+            // memmap hands out rows of the first axis in native byte order
+            if (array_info.fortran_order && array_info.shape.Length > 1)
+            {
+                throw new ValueError("fortran ordered arrays can't be memory-mapped. Use np.load to read them.");
+            }
+            if (array_info.swap)
+            {
+                throw new ValueError("arrays in non-native byte order can't be memory-mapped. Use np.load to read them.");
+            }
+
+            return new memmap(PathName, array_info.dtype, mode, offset, new shape(array_info.shape, array_info.shape.Length));
+        }
+
+        #endregion
+
+        #region write_array
+
+        private static Dictionary<string, object> _savez_names(object[] args)
+        {
+            var namedict = new Dictionary<string, object>();
+            for (int i = 0; i < args.Length; i++)
+            {
+                namedict.Add(string.Format("arr_{0}", i), args[i]);
+            }
+            return namedict;
+        }
+
+        private static void _savez(string file, IDictionary<string, object> namedict, bool compress)
+        {
+            if (string.IsNullOrEmpty(file))
+            {
+                throw new Exception("Pathname null or empty");
+            }
+
+            if (!file.EndsWith(".npz", StringComparison.OrdinalIgnoreCase))
+            {
+                file = file + ".npz";
+            }
+
+            var level = compress ? CompressionLevel.Optimal : CompressionLevel.NoCompression;
+
+            using (var fp = System.IO.File.Open(file, System.IO.FileMode.Create, System.IO.FileAccess.ReadWrite))
+            using (var zipf = new ZipArchive(fp, ZipArchiveMode.Create))
+            {
+                foreach (var kv in namedict)
+                {
+                    var entry = zipf.CreateEntry(kv.Key + ".npy", level);
+                    using (var es = entry.Open())
+                    {
+                        write_array(es, asanyarray(kv.Value));
+                    }
+                }
+            }
+        }
+
+        private static void write_array(Stream fp, ndarray array)
+        {
+            bool fortran_order = false;
+
+            if (!array.flags.c_contiguous)
+            {
+                if (array.ndim > 1 && array.flags.f_contiguous)
+                {
+                    fortran_order = true;
+                }
+                else
+                {
+                    array = ascontiguousarray(array);
+                }
+            }
+
+            _write_array_header(fp, _array_header(array.Dtype, fortran_order, array.dims));
+
+            _write_array_data(fp, array);
+        }
+
+        private static string _array_header(dtype dtype, bool fortran_order, npy_intp[] dims)
+        {
+            string descr = _descr_from_dtype(dtype);
+
+            StringBuilder header = new StringBuilder();
+            header.Append("{'descr': '").Append(descr).Append("', 'fortran_order': ");
+            header.Append(fortran_order ? "True" : "False").Append(", 'shape': (");
+            for (int i = 0; i < dims.Length; i++)
+            {
+                header.Append(dims[i]);
+                header.Append(dims.Length == 1 ? "," : (i < dims.Length - 1 ? ", " : ""));
+            }
+            header.Append("), }");
+
+            return header.ToString();
+        }
+
+        private static void _write_array_header(Stream fp, string header)
+        {
+            // the header is padded with spaces and terminated with a newline so that the
+            // total length of magic string + header length + header is a multiple of ARRAY_ALIGN.
+            int hlen = header.Length + 1;
+            int version_major = 1;
+            int struct_calcsize = 2;
+
+            int padlen = ARRAY_ALIGN - ((MAGIC_LEN + struct_calcsize + hlen) % ARRAY_ALIGN);
+            if (hlen + padlen >= 65536)
+            {
+                version_major = 2;
+                struct_calcsize = 4;
+                padlen = ARRAY_ALIGN - ((MAGIC_LEN + struct_calcsize + hlen) % ARRAY_ALIGN);
+            }
+
+            byte[] header_bytes = Encoding.ASCII.GetBytes(header + new string(' ', padlen) + "\n");
+
+            fp.Write(MAGIC_PREFIX, 0, MAGIC_PREFIX.Length);
+            fp.WriteByte((byte)version_major);
+            fp.WriteByte(0);
+
+            byte[] hlength = struct_calcsize == 2 ? BitConverter.GetBytes((UInt16)header_bytes.Length) : BitConverter.GetBytes((UInt32)header_bytes.Length);
+            if (!BitConverter.IsLittleEndian)
+            {
+                Array.Reverse(hlength);
+            }
+            fp.Write(hlength, 0, hlength.Length);
+            fp.Write(header_bytes, 0, header_bytes.Length);
+        }
+
+        private static void _write_array_data(Stream fp, ndarray array)
+        {
+            VoidPtr data = array.DataAddress;
+            npy_intp offset = data.data_offset >> array.ItemSizeDiv;
+            npy_intp count = array.Size;
+
+            if (count == 0)
+                return;
+
+            if (data.datap is System.Numerics.Complex[] cdata)
+            {
+                // real and imaginary parts are interleaved into a double buffer and copied out in bulk
+                double[] parts = null;
+                _copy_chunked(count, 2 * sizeof(double), (start, buffer, n) =>
+                {
+                    parts = parts ?? new double[buffer.Length / sizeof(double)];
+                    for (int i = 0; i < n; i++)
+                    {
+                        var c = cdata[offset + start + i];
+                        parts[2 * i] = c.Real;
+                        parts[2 * i + 1] = c.Imaginary;
+                    }
+                    Buffer.BlockCopy(parts, 0, buffer, 0, n * 2 * sizeof(double));
+                    fp.Write(buffer, 0, n * 2 * sizeof(double));
+                });
+                return;
+            }
+
+            Array src = data.datap as Array;
+            int elsize = array.ItemSize;
+            Array stage = null;
+            _copy_chunked(count, elsize, (start, buffer, n) =>
+            {
+                // Buffer.BlockCopy only takes int offsets, so each chunk is staged through a typed
+                // array first to keep the offsets into large arrays 64 bit.
+                stage = stage ?? Array.CreateInstance(src.GetType().GetElementType(), buffer.Length / elsize);
+                Array.Copy(src, offset + start, stage, 0, n);
+                Buffer.BlockCopy(stage, 0, buffer, 0, n * elsize);
+                fp.Write(buffer, 0, n * elsize);
+            });
+        }
+
+        /// <summary>
+        /// calls copy(start, buffer, n) for consecutive chunks of n elements that fit in buffer.
+        /// </summary>
+        private static void _copy_chunked(npy_intp count, int elsize, Action<npy_intp, byte[], int> copy)
+        {
+            int chunk = (int)Math.Min(count, Math.Max(1, IO_BUFFER_SIZE / elsize));
+            byte[] buffer = new byte[chunk * elsize];
+
+            for (npy_intp done = 0; done < count; done += chunk)
+            {
+                copy(done, buffer, (int)Math.Min(chunk, count - done));
+            }
+        }
+
+        #endregion
+
+        #region read_array
+
+        internal static ndarray read_array(Stream fp)
         {
             var version = read_magic(fp);
             _check_version(version);
 
             var array_info = _read_array_header(fp, version);
 
+            ndarray array = _allocate_array(array_info);
+            _read_array_data(fp, array, array_info.swap);
 
-            throw new NotImplementedException();
+            return _array_in_order(array, array_info);
         }
 
+        private static void _read_array_data(Stream fp, ndarray array, bool swap)
+        {
+            if (array.Size == 0)
+                return;
+
+            VoidPtr data = array.DataAddress;
+            npy_intp count = array.Size;
+
+            if (data.datap is System.Numerics.Complex[] cdata)
+            {
+                double[] parts = null;
+                _copy_chunked(count, 2 * sizeof(double), (start, buffer, n) =>
+                {
+                    int nbytes = n * 2 * sizeof(double);
+                    _read_into(fp, buffer, nbytes);
+                    if (swap)
+                    {
+                        _byteswap(buffer, nbytes, sizeof(double));
+                    }
+                    parts = parts ?? new double[buffer.Length / sizeof(double)];
+                    Buffer.BlockCopy(buffer, 0, parts, 0, nbytes);
+                    for (int i = 0; i < n; i++)
+                    {
+                        cdata[start + i] = new System.Numerics.Complex(parts[2 * i], parts[2 * i + 1]);
+                    }
+                });
+                return;
+            }
 
-        private static object _read_array_header(FileStream fp, (int major, int minor) version)
+            Array dst = data.datap as Array;
+            int elsize = array.ItemSize;
+            Array stage = null;
+            _copy_chunked(count, elsize, (start, buffer, n) =>
+            {
+                int nbytes = n * elsize;
+                _read_into(fp, buffer, nbytes);
+                if (swap)
+                {
+                    _byteswap(buffer, nbytes, elsize);
+                }
+                stage = stage ?? Array.CreateInstance(dst.GetType().GetElementType(), buffer.Length / elsize);
+                Buffer.BlockCopy(buffer, 0, stage, 0, nbytes);
+                Array.Copy(stage, 0, dst, start, n);
+            });
+        }
+
+        private static ndarray _read_array_mapped(FileStream fp)
+        {
+            var version = read_magic(fp);
+            _check_version(version);
+
+            var array_info = _read_array_header(fp, version);
+
+            ndarray array = _allocate_array(array_info);
+            if (array.Size == 0)
+                return _array_in_order(array, array_info);
+
+            if (array_info.swap)
+            {
+                // the mapped view would hand back the file bytes unchanged, so
+                // non-native byte order data goes through the buffered reader.
+                _read_array_data(fp, array, true);
+                return _array_in_order(array, array_info);
+            }
+
+            VoidPtr data = array.DataAddress;
+            long data_start = fp.Position;
+
+            using (var mm = MemoryMappedFile.CreateFromFile(fp, null, 0, MemoryMappedFileAccess.Read, HandleInheritability.None, true))
+            using (var accessor = mm.CreateViewAccessor(data_start, 0, MemoryMappedFileAccess.Read))
+            {
+                npy_intp count = array.Size;
+                int elsize = array.ItemSize;
+
+                switch (data.datap)
+                {
+                    case bool[] a:
+                        _read_mapped<bool>(accessor, a, count, elsize);
+                        break;
+                    case sbyte[] a:
+                        _read_mapped<sbyte>(accessor, a, count, elsize);
+                        break;
+                    case byte[] a:
+                        _read_mapped<byte>(accessor, a, count, elsize);
+                        break;
+                    case Int16[] a:
+                        _read_mapped<Int16>(accessor, a, count, elsize);
+                        break;
+                    case UInt16[] a:
+                        _read_mapped<UInt16>(accessor, a, count, elsize);
+                        break;
+                    case Int32[] a:
+                        _read_mapped<Int32>(accessor, a, count, elsize);
+                        break;
+                    case UInt32[] a:
+                        _read_mapped<UInt32>(accessor, a, count, elsize);
+                        break;
+                    case Int64[] a:
+                        _read_mapped<Int64>(accessor, a, count, elsize);
+                        break;
+                    case UInt64[] a:
+                        _read_mapped<UInt64>(accessor, a, count, elsize);
+                        break;
+                    case float[] a:
+                        _read_mapped<float>(accessor, a, count, elsize);
+                        break;
+                    case double[] a:
+                        _read_mapped<double>(accessor, a, count, elsize);
+                        break;
+                    case System.Numerics.Complex[] a:
+                        _read_mapped<System.Numerics.Complex>(accessor, a, count, elsize);
+                        break;
+                    default:
+                        throw new Exception("Unsupported data type for memory mapped load");
+                }
+            }
+
+            return _array_in_order(array, array_info);
+        }
+
+        private static void _read_mapped<T>(MemoryMappedViewAccessor accessor, T[] dest, npy_intp count, int elsize) where T : struct
+        {
+            // ReadArray takes an int count, so large arrays are read in chunks at 64 bit file positions
+            int chunk = Math.Max(1, IO_BUFFER_SIZE / elsize);
+            for (npy_intp done = 0; done < count; done += chunk)
+            {
+                accessor.ReadArray<T>(done * elsize, dest, (int)done, (int)Math.Min(chunk, count - done));
+            }
+        }
+
+        /// <summary>
+        /// allocates the array the file data is read into.  Fortran ordered data is read into
+        /// the reversed shape in C order, see _array_in_order.
+        /// </summary>
+        private static ndarray _allocate_array((dtype dtype, bool fortran_order, npy_intp[] shape, bool swap) array_info)
+        {
+            npy_intp[] dims = (npy_intp[])array_info.shape.Clone();
+            if (array_info.fortran_order)
+            {
+                Array.Reverse(dims);
+            }
+            return empty(new shape(dims, dims.Length), array_info.dtype);
+        }
+
+        private static ndarray _array_in_order(ndarray array, (dtype dtype, bool fortran_order, npy_intp[] shape, bool swap) array_info)
+        {
+            return array_info.fortran_order ? array.T : array;
+        }
+
+        private static (dtype dtype, bool fortran_order, npy_intp[] shape, bool swap) _read_array_header(Stream fp, (int major, int minor) version)
         {
             int struct_calcsize = -1;
             if (version.major == 1 && version.minor == 0)
             {
                 struct_calcsize = 2;
             }
-            else if (version.major == 2 && version.minor == 0)
+            else if ((version.major == 2 || version.major == 3) && version.minor == 0)
             {
                 struct_calcsize = 4;
             }
             else
             {
-                throw new ValueError(string.Format("Invalid version ({0},{1})" + version.major, version.minor));
+                throw new ValueError(string.Format("Invalid version ({0},{1})", version.major, version.minor));
             }
 
-
             var hlength_str = _read_bytes(fp, struct_calcsize, "array header length");
+            int header_length = 0;
+            for (int i = struct_calcsize - 1; i >= 0; i--)
+            {
+                header_length = (header_length << 8) | hlength_str[i];
+            }
+
+            var header_bytes = _read_bytes(fp, header_length, "array header");
+            string header = version.major == 3 ? Encoding.UTF8.GetString(header_bytes) : Encoding.ASCII.GetString(header_bytes);
+
+            string descr = _header_value(header, "descr");
+            string fortran_order = _header_value(header, "fortran_order");
+            string shape = _header_value(header, "shape");
+
+            if (descr == null || fortran_order == null || shape == null)
+            {
+                throw new ValueError(string.Format("Header does not contain the correct keys: {0}", header));
+            }
+
+            descr = descr.Trim('\'', '"');
+
+            if (fortran_order != "True" && fortran_order != "False")
+            {
+                throw new ValueError(string.Format("fortran_order is not a valid bool: {0}", fortran_order));
+            }
+
+            var dims = new List<npy_intp>();
+            foreach (var dim in shape.Trim('(', ')').Split(new char[] { ',' }, StringSplitOptions.RemoveEmptyEntries))
+            {
+                npy_intp value;
+                if (!npy_intp.TryParse(dim.Trim().TrimEnd('L'), out value) || value < 0)
+                {
+                    throw new ValueError(string.Format("shape is not valid: {0}", shape));
+                }
+                dims.Add(value);
+            }
+
+            bool swap;
+            dtype dtype = _dtype_from_descr(descr, out swap);
+
+            return (dtype, fortran_order == "True", dims.ToArray(), swap);
+        }
+
+        private static string _header_value(string header, string key)
+        {
+            string quoted_key = "'" + key + "'";
+            int index = header.IndexOf(quoted_key);
+            if (index < 0)
+                return null;
+
+            index = header.IndexOf(':', index + quoted_key.Length);
+            if (index < 0)
+                return null;
+            index++;
+
+            while (index < header.Length && header[index] == ' ')
+                index++;
+
+            if (index >= header.Length)
+                return null;
+
+            int end;
+            if (header[index] == '(')
+            {
+                end = header.IndexOf(')', index);
+                if (end < 0)
+                    return null;
+                end++;
+            }
+            else if (header[index] == '\'' || header[index] == '"')
+            {
+                end = header.IndexOf(header[index], index + 1);
+                if (end < 0)
+                    return null;
+                end++;
+            }
+            else
+            {
+                end = header.IndexOfAny(new char[] { ',', '}' }, index);
+                if (end < 0)
+                    return null;
+            }
+
+            return header.Substring(index, end - index).Trim();
+        }
+
+        #endregion
+
+        #region descr conversion
+
+        private static string _descr_from_dtype(dtype dtype)
+        {
+            string byteorder = BitConverter.IsLittleEndian ? "<" : ">";
 
-            var header = _read_bytes(fp, hlength_str[0], "array_header");
+            switch (dtype.TypeNum)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                    return "|b1";
+                case NPY_TYPES.NPY_BYTE:
+                    return "|i1";
+                case NPY_TYPES.NPY_UBYTE:
+                    return "|u1";
+                case NPY_TYPES.NPY_INT16:
+                    return byteorder + "i2";
+                case NPY_TYPES.NPY_UINT16:
+                    return byteorder + "u2";
+                case NPY_TYPES.NPY_INT32:
+                    return byteorder + "i4";
+                case NPY_TYPES.NPY_UINT32:
+                    return byteorder + "u4";
+                case NPY_TYPES.NPY_INT64:
+                    return byteorder + "i8";
+                case NPY_TYPES.NPY_UINT64:
+                    return byteorder + "u8";
+                case NPY_TYPES.NPY_FLOAT:
+                    return byteorder + "f4";
+                case NPY_TYPES.NPY_DOUBLE:
+                    return byteorder + "f8";
+                case NPY_TYPES.NPY_COMPLEX:
+                    return byteorder + "c16";
+                default:
+                    throw new Exception(string.Format("Arrays of type {0} can't be saved in .npy format", dtype.TypeNum.ToString()));
+            }
+        }
+
+        private static dtype _dtype_from_descr(string descr, out bool swap)
+        {
+            swap = false;
 
-            throw new NotImplementedException();
+            if (descr.Length < 2)
+            {
+                throw new ValueError(string.Format("descr is not a valid dtype descriptor: {0}", descr));
+            }
+
+            char byteorder = descr[0];
+            string typestr = descr;
+            if (byteorder == '<' || byteorder == '>' || byteorder == '|' || byteorder == '=')
+            {
+                typestr = descr.Substring(1);
+                swap = byteorder == (BitConverter.IsLittleEndian ? '>' : '<');
+            }
+
+            switch (typestr)
+            {
+                case "b1":
+                case "?":
+                    return np.Bool;
+                case "i1":
+                case "b":
+                    return np.Int8;
+                case "u1":
+                case "B":
+                    return np.UInt8;
+                case "i2":
+                    return np.Int16;
+                case "u2":
+                    return np.UInt16;
+                case "i4":
+                    return np.Int32;
+                case "u4":
+                    return np.UInt32;
+                case "i8":
+                    return np.Int64;
+                case "u8":
+                    return np.UInt64;
+                case "f4":
+                    return np.Float32;
+                case "f8":
+                    return np.Float64;
+                case "c16":
+                    return np.Complex;
+                default:
+                    throw new Exception(string.Format("descr '{0}' is not supported by np.load", descr));
+            }
+        }
+
+        #endregion
+
+        #region byte helpers
+
+        private static void _byteswap(byte[] buffer, int nbytes, int elsize)
+        {
+            if (elsize == 1)
+                return;
+
+            for (int i = 0; i < nbytes; i += elsize)
+            {
+                Array.Reverse(buffer, i, elsize);
+            }
+        }
+
+        private static void _read_into(Stream fp, byte[] buffer, int size)
+        {
+            int data_offset = 0;
+
+            while (data_offset < size)
+            {
+                int r = fp.Read(buffer, data_offset, size - data_offset);
+                if (r <= 0)
+                {
+                    string msg = string.Format("EOF: reading array data, expected {0} bytes got {1}", size, data_offset);
+                    throw new Exception(msg);
+                }
+                data_offset += r;
+            }
         }
 
         private static void _check_version((int major, int minor) version)
@@ -133,11 +830,13 @@ namespace NumpyDotNet
                 return;
             if (version.major == 2 && version.minor == 0)
                 return;
+            if (version.major == 3 && version.minor == 0)
+                return;
 
-            throw new Exception(string.Format("we only support version (1,0) and (2,0), not ({0},{1})", version.major, version.minor));
+            throw new Exception(string.Format("we only support version (1,0), (2,0) and (3,0), not ({0},{1})", version.major, version.minor));
         }
 
-        private static (int major, int minor) read_magic(FileStream fp)
+        private static (int major, int minor) read_magic(Stream fp)
         {
             byte[] magic_str = _read_bytes(fp, MAGIC_LEN, "magic string");
             if (IsPrefixMatch(magic_str, MAGIC_PREFIX) == false)
@@ -151,26 +850,21 @@ namespace NumpyDotNet
             return (major, minor);
         }
 
-        private static byte[] _read_bytes(FileStream fp, int size, string error_template)
+        private static byte[] _read_bytes(Stream fp, int size, string error_template)
         {
 
             byte[] data = new byte[size];
             int data_offset = 0;
 
-            while (true)
+            while (data_offset < size)
             {
-                try
-                {
-                    int r = fp.Read(data, data_offset, size - data_offset);
-                    data_offset += r;
-                    if (data_offset == size)
-                        break;
-                }
-                catch (Exception ex)
+                int r = fp.Read(data, data_offset, size - data_offset);
+                if (r <= 0)
                 {
                     string msg = string.Format("EOF: reading {0}, expected {1} bytes got {2}", error_template, size, data_offset);
                     throw new Exception(msg);
                 }
+                data_offset += r;
             }
 
             return data;
@@ -187,6 +881,67 @@ namespace NumpyDotNet
             return true;
         }
 
+        #endregion
+
     }
-}
 
+    /// <summary>
+    /// A dictionary-like object with lazy-loading of the arrays stored in a .npz file.
+    /// </summary>
+    public class NpzFile : IDisposable
+    {
+        private ZipArchive zip;
+        private Dictionary<string, string> entries = new Dictionary<string, string>();
+
+        internal NpzFile(Stream fp)
+        {
+            zip = new ZipArchive(fp, ZipArchiveMode.Read, false);
+            foreach (var entry in zip.Entries)
+            {
+                string name = entry.FullName;
+                if (name.EndsWith(".npy", StringComparison.OrdinalIgnoreCase))
+                {
+                    name = name.Substring(0, name.Length - 4);
+                }
+                entries.Add(name, entry.FullName);
+            }
+        }
+
+        /// <summary>
+        /// List of all array names stored in the archive
+        /// </summary>
+        public string[] files
+        {
+            get { return entries.Keys.ToArray(); }
+        }
+
+        /// <summary>
+        /// Read the named array from the archive
+        /// </summary>
+        public ndarray this[string key]
+        {
+            get
+            {
+                string entryname;
+                if (!entries.TryGetValue(key, out entryname))
+                {
+                    throw new Exception(string.Format("{0} is not a file in the archive", key));
+                }
+
+                using (var es = zip.GetEntry(entryname).Open())
+                {
+                    return np.read_array(es);
+                }
+            }
+        }
+
+        public void Dispose()
+        {
+            if (zip != null)
+            {
+                zip.Dispose();
+                zip = null;
+            }
+        }
+    }
+}
@@ -50,4 +50,22 @@ namespace NumpyDotNet.RandomAPI
         string ToSerialization();
         void FromSerialization(string SerializedFormat);
     }
+
+    /// <summary>
+    /// A generator that can jump ahead and split off independent streams.  np.random uses
+    /// this to fill large arrays from several threads while staying reproducible for a seed.
+    /// </summary>
+    public interface IRandomStreamGenerator : IRandomGenerator
+    {
+        /// <summary>
+        /// advance the generator as if delta steps of its underlying sequence had been drawn.
+        /// </summary>
+        void Advance(UInt64 delta);
+
+        /// <summary>
+        /// returns a new generator on a stream that does not overlap this one.  Each call
+        /// returns a different stream, and the sequence of streams is fixed by the seed.
+        /// </summary>
+        IRandomStreamGenerator SpawnStream();
+    }
 }
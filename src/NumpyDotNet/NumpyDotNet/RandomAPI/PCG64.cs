@@ -0,0 +1,242 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using NumpyLib;
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Text;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyDotNet.RandomAPI
+{
+    // PCG64 (PCG XSL RR 128/64) permuted congruential generator, as used by numpy.random.PCG64.
+    // 128 bit LCG state with a selectable odd increment; every increment is a separate stream.
+    public class PCG64 : IRandomStreamGenerator
+    {
+        private const ulong MULTIPLIER_HI = 0x2360ED051FC65DA4UL;
+        private const ulong MULTIPLIER_LO = 0x4385DF649FCCF645UL;
+
+        private ulong stateHi, stateLo;
+        private ulong incHi, incLo;
+
+        // getNextUInt64 hands out 32 bits at a time like the Mersenne Twister; the upper
+        // half of each 64 bit draw is kept for the next call.
+        private bool has_uint32;
+        private uint uinteger;
+
+        private ulong spawnCount;
+
+        public void Seed(ulong? inseed, rk_state state)
+        {
+            if (!inseed.HasValue)
+            {
+                inseed = (ulong)DateTime.Now.Ticks;
+            }
+
+            ulong sm = inseed.Value;
+            ulong initStateHi = SplitMix64(ref sm);
+            ulong initStateLo = SplitMix64(ref sm);
+            ulong initSeqHi = SplitMix64(ref sm);
+            ulong initSeqLo = SplitMix64(ref sm);
+
+            SeedState(initStateHi, initStateLo, initSeqHi, initSeqLo);
+            spawnCount = 0;
+
+            state.pos = 0;
+            state.gauss = 0;
+            state.has_gauss = false;
+            state.has_binomial = false;
+        }
+
+        private void SeedState(ulong initStateHi, ulong initStateLo, ulong initSeqHi, ulong initSeqLo)
+        {
+            stateHi = 0;
+            stateLo = 0;
+            incHi = (initSeqHi << 1) | (initSeqLo >> 63);
+            incLo = (initSeqLo << 1) | 1;
+            Step();
+            Add128(stateHi, stateLo, initStateHi, initStateLo, out stateHi, out stateLo);
+            Step();
+
+            has_uint32 = false;
+            uinteger = 0;
+        }
+
+        private void Step()
+        {
+            ulong hi, lo;
+            Multiply128(stateHi, stateLo, MULTIPLIER_HI, MULTIPLIER_LO, out hi, out lo);
+            Add128(hi, lo, incHi, incLo, out stateHi, out stateLo);
+        }
+
+        internal ulong NextUInt64()
+        {
+            Step();
+            ulong x = stateHi ^ stateLo;
+            int rot = (int)(stateHi >> 58);
+            return (x >> rot) | (x << ((-rot) & 63));
+        }
+
+        public ulong getNextUInt64(rk_state state)
+        {
+            if (has_uint32)
+            {
+                has_uint32 = false;
+                return uinteger;
+            }
+
+            ulong next = NextUInt64();
+            has_uint32 = true;
+            uinteger = (uint)(next >> 32);
+            return (uint)next;
+        }
+
+        public double getNextDouble(rk_state state)
+        {
+            return (NextUInt64() >> 11) * (1.0 / 9007199254740992.0);
+        }
+
+        public void Advance(ulong delta)
+        {
+            // Brown, "Random Number Generation with Arbitrary Stride", O(log delta)
+            ulong accMultHi = 0, accMultLo = 1;
+            ulong accPlusHi = 0, accPlusLo = 0;
+            ulong curMultHi = MULTIPLIER_HI, curMultLo = MULTIPLIER_LO;
+            ulong curPlusHi = incHi, curPlusLo = incLo;
+            ulong hi, lo;
+
+            while (delta > 0)
+            {
+                if ((delta & 1) != 0)
+                {
+                    Multiply128(accMultHi, accMultLo, curMultHi, curMultLo, out accMultHi, out accMultLo);
+                    Multiply128(accPlusHi, accPlusLo, curMultHi, curMultLo, out hi, out lo);
+                    Add128(hi, lo, curPlusHi, curPlusLo, out accPlusHi, out accPlusLo);
+                }
+                Add128(curMultHi, curMultLo, 0, 1, out hi, out lo);
+                Multiply128(hi, lo, curPlusHi, curPlusLo, out curPlusHi, out curPlusLo);
+                Multiply128(curMultHi, curMultLo, curMultHi, curMultLo, out curMultHi, out curMultLo);
+                delta >>= 1;
+            }
+
+            Multiply128(accMultHi, accMultLo, stateHi, stateLo, out hi, out lo);
+            Add128(hi, lo, accPlusHi, accPlusLo, out stateHi, out stateLo);
+            has_uint32 = false;
+        }
+
+        public IRandomStreamGenerator SpawnStream()
+        {
+            ulong sm = stateHi ^ SplitMix64Mix(incLo + spawnCount);
+            ulong sm2 = stateLo ^ SplitMix64Mix(incHi ^ ~spawnCount);
+            spawnCount++;
+
+            var child = new PCG64();
+            child.SeedState(SplitMix64(ref sm), SplitMix64(ref sm2), SplitMix64(ref sm), SplitMix64(ref sm2));
+            return child;
+        }
+
+        public string ToSerialization()
+        {
+            return string.Join(",", "PCG64",
+                stateHi.ToString(CultureInfo.InvariantCulture), stateLo.ToString(CultureInfo.InvariantCulture),
+                incHi.ToString(CultureInfo.InvariantCulture), incLo.ToString(CultureInfo.InvariantCulture),
+                has_uint32 ? "1" : "0", uinteger.ToString(CultureInfo.InvariantCulture),
+                spawnCount.ToString(CultureInfo.InvariantCulture));
+        }
+
+        public void FromSerialization(string SerializedFormat)
+        {
+            string[] parts = SerializedFormat.Split(',');
+            if (parts == null || parts.Length != 8 || parts[0] != "PCG64")
+            {
+                throw new Exception("Serialized data is not a PCG64 state");
+            }
+
+            stateHi = UInt64.Parse(parts[1], CultureInfo.InvariantCulture);
+            stateLo = UInt64.Parse(parts[2], CultureInfo.InvariantCulture);
+            incHi = UInt64.Parse(parts[3], CultureInfo.InvariantCulture);
+            incLo = UInt64.Parse(parts[4], CultureInfo.InvariantCulture);
+            has_uint32 = parts[5] == "1";
+            uinteger = UInt32.Parse(parts[6], CultureInfo.InvariantCulture);
+            spawnCount = UInt64.Parse(parts[7], CultureInfo.InvariantCulture);
+        }
+
+        #region 128 bit helpers
+
+        internal static ulong SplitMix64(ref ulong x)
+        {
+            x += 0x9E3779B97F4A7C15UL;
+            return SplitMix64Mix(x);
+        }
+
+        private static ulong SplitMix64Mix(ulong z)
+        {
+            z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9UL;
+            z = (z ^ (z >> 27)) * 0x94D049BB133111EBUL;
+            return z ^ (z >> 31);
+        }
+
+        internal static void Multiply64(ulong a, ulong b, out ulong hi, out ulong lo)
+        {
+            ulong aLo = (uint)a, aHi = a >> 32;
+            ulong bLo = (uint)b, bHi = b >> 32;
+
+            ulong p0 = aLo * bLo;
+            ulong p1 = aLo * bHi;
+            ulong p2 = aHi * bLo;
+            ulong p3 = aHi * bHi;
+
+            ulong mid = (p0 >> 32) + (uint)p1 + (uint)p2;
+            lo = (mid << 32) | (uint)p0;
+            hi = p3 + (p1 >> 32) + (p2 >> 32) + (mid >> 32);
+        }
+
+        private static void Multiply128(ulong aHi, ulong aLo, ulong bHi, ulong bLo, out ulong hi, out ulong lo)
+        {
+            Multiply64(aLo, bLo, out hi, out lo);
+            hi += aHi * bLo + aLo * bHi;
+        }
+
+        private static void Add128(ulong aHi, ulong aLo, ulong bHi, ulong bLo, out ulong hi, out ulong lo)
+        {
+            lo = aLo + bLo;
+            hi = aHi + bHi + (lo < aLo ? 1UL : 0UL);
+        }
+
+        #endregion
+    }
+}
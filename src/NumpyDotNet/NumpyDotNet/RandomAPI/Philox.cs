@@ -0,0 +1,227 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using NumpyLib;
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Text;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyDotNet.RandomAPI
+{
+    // Philox4x64-10 counter based generator (Salmon et al., "Parallel Random Numbers: As Easy as 1, 2, 3").
+    // Each 256 bit counter value is encrypted with the 128 bit key into four 64 bit outputs,
+    // so jumping ahead is just adding to the counter and every key is an independent stream.
+    public class Philox : IRandomStreamGenerator
+    {
+        private const ulong PHILOX_M0 = 0xD2E7470EE14C6C93UL;
+        private const ulong PHILOX_M1 = 0xCA5A826395121157UL;
+        private const ulong PHILOX_W0 = 0x9E3779B97F4A7C15UL;
+        private const ulong PHILOX_W1 = 0xBB67AE8584CAA73BUL;
+        private const int PHILOX_ROUNDS = 10;
+
+        private ulong[] ctr = new ulong[4];
+        private ulong[] key = new ulong[2];
+        private ulong[] buffer = new ulong[4];
+        private int buffer_pos = 4;
+
+        // getNextUInt64 hands out 32 bits at a time like the Mersenne Twister.
+        private bool has_uint32;
+        private uint uinteger;
+
+        private ulong spawnCount;
+
+        public void Seed(ulong? inseed, rk_state state)
+        {
+            if (!inseed.HasValue)
+            {
+                inseed = (ulong)DateTime.Now.Ticks;
+            }
+
+            ulong sm = inseed.Value;
+            SeedKey(PCG64.SplitMix64(ref sm), PCG64.SplitMix64(ref sm));
+            spawnCount = 0;
+
+            state.pos = 0;
+            state.gauss = 0;
+            state.has_gauss = false;
+            state.has_binomial = false;
+        }
+
+        private void SeedKey(ulong key0, ulong key1)
+        {
+            key[0] = key0;
+            key[1] = key1;
+            Array.Clear(ctr, 0, ctr.Length);
+            buffer_pos = 4;
+            has_uint32 = false;
+            uinteger = 0;
+        }
+
+        private void GenerateBlock()
+        {
+            ulong c0 = ctr[0], c1 = ctr[1], c2 = ctr[2], c3 = ctr[3];
+            ulong k0 = key[0], k1 = key[1];
+
+            for (int round = 0; round < PHILOX_ROUNDS; round++)
+            {
+                if (round > 0)
+                {
+                    k0 += PHILOX_W0;
+                    k1 += PHILOX_W1;
+                }
+
+                ulong hi0, lo0, hi1, lo1;
+                PCG64.Multiply64(PHILOX_M0, c0, out hi0, out lo0);
+                PCG64.Multiply64(PHILOX_M1, c2, out hi1, out lo1);
+
+                c0 = hi1 ^ c1 ^ k0;
+                c1 = lo1;
+                c2 = hi0 ^ c3 ^ k1;
+                c3 = lo0;
+            }
+
+            buffer[0] = c0;
+            buffer[1] = c1;
+            buffer[2] = c2;
+            buffer[3] = c3;
+            buffer_pos = 0;
+
+            IncrementCounter(1);
+        }
+
+        private void IncrementCounter(ulong delta)
+        {
+            ulong old = ctr[0];
+            ctr[0] += delta;
+            if (ctr[0] >= old)
+                return;
+            for (int i = 1; i < 4; i++)
+            {
+                if (++ctr[i] != 0)
+                    break;
+            }
+        }
+
+        internal ulong NextUInt64()
+        {
+            if (buffer_pos == 4)
+            {
+                GenerateBlock();
+            }
+            return buffer[buffer_pos++];
+        }
+
+        public ulong getNextUInt64(rk_state state)
+        {
+            if (has_uint32)
+            {
+                has_uint32 = false;
+                return uinteger;
+            }
+
+            ulong next = NextUInt64();
+            has_uint32 = true;
+            uinteger = (uint)(next >> 32);
+            return (uint)next;
+        }
+
+        public double getNextDouble(rk_state state)
+        {
+            return (NextUInt64() >> 11) * (1.0 / 9007199254740992.0);
+        }
+
+        /// <summary>
+        /// moves the counter on by delta blocks of four 64 bit outputs.
+        /// </summary>
+        public void Advance(ulong delta)
+        {
+            IncrementCounter(delta);
+            buffer_pos = 4;
+            has_uint32 = false;
+        }
+
+        public IRandomStreamGenerator SpawnStream()
+        {
+            ulong sm = key[0] ^ (spawnCount * 0xD1B54A32D192ED03UL);
+            ulong sm2 = key[1] + spawnCount;
+            spawnCount++;
+
+            var child = new Philox();
+            child.SeedKey(PCG64.SplitMix64(ref sm) ^ ctr[0], PCG64.SplitMix64(ref sm2) ^ ctr[1]);
+            return child;
+        }
+
+        public string ToSerialization()
+        {
+            var parts = new List<string>() { "Philox" };
+            foreach (var c in ctr)
+                parts.Add(c.ToString(CultureInfo.InvariantCulture));
+            foreach (var k in key)
+                parts.Add(k.ToString(CultureInfo.InvariantCulture));
+            foreach (var b in buffer)
+                parts.Add(b.ToString(CultureInfo.InvariantCulture));
+            parts.Add(buffer_pos.ToString(CultureInfo.InvariantCulture));
+            parts.Add(has_uint32 ? "1" : "0");
+            parts.Add(uinteger.ToString(CultureInfo.InvariantCulture));
+            parts.Add(spawnCount.ToString(CultureInfo.InvariantCulture));
+
+            return string.Join(",", parts);
+        }
+
+        public void FromSerialization(string SerializedFormat)
+        {
+            string[] parts = SerializedFormat.Split(',');
+            if (parts == null || parts.Length != 15 || parts[0] != "Philox")
+            {
+                throw new Exception("Serialized data is not a Philox state");
+            }
+
+            int index = 1;
+            for (int i = 0; i < 4; i++)
+                ctr[i] = UInt64.Parse(parts[index++], CultureInfo.InvariantCulture);
+            for (int i = 0; i < 2; i++)
+                key[i] = UInt64.Parse(parts[index++], CultureInfo.InvariantCulture);
+            for (int i = 0; i < 4; i++)
+                buffer[i] = UInt64.Parse(parts[index++], CultureInfo.InvariantCulture);
+            buffer_pos = Int32.Parse(parts[index++], CultureInfo.InvariantCulture);
+            has_uint32 = parts[index++] == "1";
+            uinteger = UInt32.Parse(parts[index++], CultureInfo.InvariantCulture);
+            spawnCount = UInt64.Parse(parts[index++], CultureInfo.InvariantCulture);
+        }
+    }
+}
@@ -34,6 +34,7 @@ using NumpyDotNet.RandomAPI;
 using NumpyLib;
 using System;
 using System.Collections.Generic;
+using System.Threading.Tasks;
 #if NPY_INTP_64
 using npy_intp = System.Int64;
 #else
@@ -76,6 +77,8 @@ namespace NumpyDotNet
             public double p2;
             public double p3;
             public double p4;
+
+            public bool use_ziggurat;
         }
 
         public class random
@@ -138,6 +141,20 @@ namespace NumpyDotNet
                 internal_state = new rk_state(rndGenerator);
                 seed(null);
                 _rndGenerator = rndGenerator;
+
+                // like numpy's Generator, the new stream generators default to the ziggurat samplers
+                internal_state.use_ziggurat = rndGenerator is IRandomStreamGenerator;
+            }
+
+            /// <summary>
+            /// When true, normal and exponential deviates (and gamma, chisquare, standard_t etc. built on them)
+            /// come from the legacy Box-Muller and -log(1-U) streams, which reproduce earlier results for a given seed.
+            /// When false the faster ziggurat samplers are used.
+            /// </summary>
+            public bool legacy
+            {
+                get { return !internal_state.use_ziggurat; }
+                set { internal_state.use_ziggurat = !value; }
             }
 
             public random_serializable ToSerialization()
@@ -166,6 +183,7 @@ namespace NumpyDotNet
                 serializationData.p2 = internal_state.p2;
                 serializationData.p3 = internal_state.p3;
                 serializationData.p4 = internal_state.p4;
+                serializationData.use_ziggurat = internal_state.use_ziggurat;
 
                 return serializationData;
             }
@@ -193,6 +211,7 @@ namespace NumpyDotNet
                 internal_state.p2 = serializationData.p2;
                 internal_state.p3 = serializationData.p3;
                 internal_state.p4 = serializationData.p4;
+                internal_state.use_ziggurat = serializationData.use_ziggurat;
 
                 _rndGenerator.FromSerialization(serializationData.randomGeneratorSerializationData);
             }
@@ -237,7 +256,7 @@ namespace NumpyDotNet
                 bool[] randomData = new bool[CountTotalElements(newdims)];
 
      
-                RandomDistributions.rk_random_bool(false, true, randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_bool(false, true, chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.Bool).reshape(newdims);
             }
@@ -271,7 +290,7 @@ namespace NumpyDotNet
                 var rng = _high.Value - _low;
                 var off = _low;
 
-                RandomDistributions.rk_random_int8(off, (SByte)(rng-1), randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_int8(off, (SByte)(rng-1), chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.Int8).reshape(newdims);
             }
@@ -305,7 +324,7 @@ namespace NumpyDotNet
                 var rng = _high.Value - _low;
                 var off = _low;
 
-                RandomDistributions.rk_random_uint8(off, (Byte)(rng-1), randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_uint8(off, (Byte)(rng-1), chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.UInt8).reshape(newdims);
             }
@@ -339,7 +358,7 @@ namespace NumpyDotNet
                 var rng = _high.Value - _low;
                 var off = _low;
 
-                RandomDistributions.rk_random_int16(off, (Int16)(rng-1), randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_int16(off, (Int16)(rng-1), chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.Int16).reshape(newdims);
             }
@@ -373,7 +392,7 @@ namespace NumpyDotNet
                 var rng = _high.Value - _low;
                 var off = _low;
 
-                RandomDistributions.rk_random_uint16(off, (UInt16)(rng-1), randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_uint16(off, (UInt16)(rng-1), chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.UInt16).reshape(newdims);
             }
@@ -437,7 +456,7 @@ namespace NumpyDotNet
                 }
                 var rng = _high.Value - _low;
                 var off = _low;
-                RandomDistributions.rk_random_int32(off, rng-1, randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_int32(off, rng-1, chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.Int32).reshape(newdims);
             }
@@ -471,7 +490,7 @@ namespace NumpyDotNet
                 var rng = _high.Value - _low;
                 var off = _low;
 
-                RandomDistributions.rk_random_uint32(off, rng-1, randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_uint32(off, rng-1, chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.UInt32).reshape(newdims);
             }
@@ -505,7 +524,7 @@ namespace NumpyDotNet
                 var rng = _high.Value - _low;
                 var off = _low;
 
-                RandomDistributions.rk_random_int64(off, rng-1, randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_int64(off, rng-1, chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.Int64).reshape(newdims);
             }
@@ -541,7 +560,7 @@ namespace NumpyDotNet
                 var rng = _high.Value - _low;
                 var off = _low;
 
-                RandomDistributions.rk_random_uint64(off, rng-1, randomData.Length, randomData, internal_state);
+                FillRandomData(randomData, (chunk, chunkState) => RandomDistributions.rk_random_uint64(off, rng-1, chunk.Length, chunk, chunkState));
 
                 return np.array(randomData, dtype: np.UInt64).reshape(newdims);
             }
@@ -1769,8 +1788,20 @@ namespace NumpyDotNet
                 if (newdims != null)
                     size = newdims.iDims;
 
-                ndarray rndArray = cont0_array(internal_state, RandomDistributions.rk_standard_exponential, size);
-                return rndArray;
+                if (size == null)
+                    return cont0_array(internal_state, RandomDistributions.rk_standard_exponential, size);
+
+                double[] randomData = new double[CountTotalElements(size)];
+                standard_exponential(randomData);
+                return np.array(randomData).reshape(size);
+            }
+
+            /// <summary>
+            /// fills the array with standard exponential deviates
+            /// </summary>
+            public void standard_exponential(double[] @out)
+            {
+                FillRandomData(@out, (chunk, chunkState) => RandomDistributions.rk_fill_standard_exponential(chunkState, chunk));
             }
 
             #endregion
@@ -1794,6 +1825,12 @@ namespace NumpyDotNet
                     if ((bool)np.signbit(fshape).GetItem(0))
                         throw new ValueError("shape < 0");
 
+                    if (size != null)
+                    {
+                        double[] randomData = new double[CountTotalElements(size)];
+                        standard_gamma(fshape, randomData);
+                        return np.array(randomData).reshape(size);
+                    }
                     return cont1_array_sc(internal_state, RandomDistributions.rk_standard_gamma, size, fshape);
                 }
 
@@ -1805,6 +1842,17 @@ namespace NumpyDotNet
                 return cont1_array(internal_state, RandomDistributions.rk_standard_gamma, size, oshape);
             }
 
+            /// <summary>
+            /// fills the array with standard gamma deviates of the given shape
+            /// </summary>
+            public void standard_gamma(double shape, double[] @out)
+            {
+                if (shape < 0)
+                    throw new ValueError("shape < 0");
+
+                FillRandomData(@out, (chunk, chunkState) => RandomDistributions.rk_fill_standard_gamma(chunkState, shape, chunk));
+            }
+
             #endregion
 
             #region standard_normal
@@ -1821,8 +1869,20 @@ namespace NumpyDotNet
                 if (newdims != null)
                     size = newdims.iDims;
 
-                ndarray rndArray = cont0_array(internal_state, RandomDistributions.rk_gauss, size);
-                return rndArray;
+                if (size == null)
+                    return cont0_array(internal_state, RandomDistributions.rk_gauss, size);
+
+                double[] randomData = new double[CountTotalElements(size)];
+                standard_normal(randomData);
+                return np.array(randomData).reshape(size);
+            }
+
+            /// <summary>
+            /// fills the array with standard normal deviates
+            /// </summary>
+            public void standard_normal(double[] @out)
+            {
+                FillRandomData(@out, (chunk, chunkState) => RandomDistributions.rk_fill_gauss(chunkState, chunk));
             }
 
             #endregion
@@ -2114,6 +2174,56 @@ namespace NumpyDotNet
             }
             #endregion
 
+            #region Parallel stream fill
+
+            // number of elements drawn from each spawned stream.  Fixed so that a seeded
+            // stream generator produces the same array no matter how many threads run.
+            private const int parallelRandomChunkSize = 1 << 16;
+
+            private void FillRandomData<T>(T[] randomData, Action<T[], rk_state> fill)
+            {
+                if (FillParallelStreams(randomData, fill))
+                    return;
+
+                lock (rk_lock)
+                {
+                    fill(randomData, internal_state);
+                }
+            }
+
+            private bool FillParallelStreams<T>(T[] randomData, Action<T[], rk_state> fill)
+            {
+                IRandomStreamGenerator streamGenerator = internal_state.rndGenerator as IRandomStreamGenerator;
+                if (streamGenerator == null || randomData.Length <= parallelRandomChunkSize)
+                    return false;
+
+                int chunkCount = (randomData.Length + parallelRandomChunkSize - 1) / parallelRandomChunkSize;
+                IRandomStreamGenerator[] streams = new IRandomStreamGenerator[chunkCount];
+
+                // spawn sequentially so chunk N always gets the same stream
+                lock (rk_lock)
+                {
+                    for (int i = 0; i < chunkCount; i++)
+                    {
+                        streams[i] = streamGenerator.SpawnStream();
+                    }
+                }
+
+                Parallel.For(0, chunkCount, NpyParallelScheduler.Options, i =>
+                {
+                    int start = i * parallelRandomChunkSize;
+                    int length = Math.Min(parallelRandomChunkSize, randomData.Length - start);
+
+                    T[] chunk = new T[length];
+                    fill(chunk, new rk_state(streams[i]) { use_ziggurat = internal_state.use_ziggurat });
+                    Array.Copy(chunk, 0, randomData, start, length);
+                });
+
+                return true;
+            }
+
+            #endregion
+
             #region Python Version
 
             private ndarray cont0_array(rk_state state, Func<rk_state, double> func, npy_intp []size)
@@ -2133,11 +2243,20 @@ namespace NumpyDotNet
                 else
                 {
                     array_data = new double[CountTotalElements(size)];
-                    lock (rk_lock)
+                    if (!FillParallelStreams(array_data, (chunk, chunkState) =>
+                        {
+                            for (int j = 0; j < chunk.Length; j++)
+                            {
+                                chunk[j] = func(chunkState);
+                            }
+                        }))
                     {
-                        for (i = 0; i < array_data.Length; i++)
+                        lock (rk_lock)
                         {
-                            array_data[i] = func(state);
+                            for (i = 0; i < array_data.Length; i++)
+                            {
+                                array_data[i] = func(state);
+                            }
                         }
                     }
                     array = np.array(array_data);
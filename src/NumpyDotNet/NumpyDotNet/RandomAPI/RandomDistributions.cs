@@ -80,9 +80,11 @@ namespace NumpyDotNet
         public double p3;
         public double p4;
 
+        /* draw normal/exponential deviates with the ziggurat samplers instead of the legacy stream */
+        public bool use_ziggurat;
     }
 
-    internal static class RandomDistributions
+    internal static partial class RandomDistributions
     {
  
 
@@ -140,6 +142,9 @@ namespace NumpyDotNet
 
         internal static double rk_standard_exponential(rk_state state)
         {
+            if (state.use_ziggurat)
+                return rk_standard_exponential_zig(state);
+
             /* We use -log(1-U) since U is [0, 1) */
             return -Math.Log(1.0 - rk_double(state));
         }
@@ -1509,6 +1514,9 @@ namespace NumpyDotNet
 
         internal static double rk_gauss(rk_state state)
         {
+            if (state.use_ziggurat)
+                return rk_gauss_zig(state);
+
             if (state.has_gauss)
             {
                 double tmp = state.gauss;
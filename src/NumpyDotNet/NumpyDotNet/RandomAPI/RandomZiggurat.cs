@@ -0,0 +1,232 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using NumpyDotNet.RandomAPI;
+using NumpyLib;
+using System;
+using System.Collections.Generic;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyDotNet
+{
+    /*
+     * Ziggurat samplers for the standard normal and exponential distributions
+     * (Marsaglia & Tsang, "The Ziggurat Method for Generating Random Variables", 2000),
+     * in the 256 layer, 64 bit form used by numpy's Generator.  Enabled per rk_state
+     * with use_ziggurat; the legacy polar Box-Muller and -log(1-U) streams are kept
+     * as the default for reproducibility.
+     */
+    internal static partial class RandomDistributions
+    {
+        private const int ZIGGURAT_LAYERS = 256;
+
+        private const double ziggurat_nor_r = 3.6541528853610087963519472518;
+        private const double ziggurat_nor_inv_r = 0.27366123732975827203338247596;
+        private const double ziggurat_nor_v = 0.00492867323399;
+
+        private const double ziggurat_exp_r = 7.69711747013104972;
+        private const double ziggurat_exp_v = 0.0039496598225815571993;
+
+        private static readonly UInt64[] ki_double = new UInt64[ZIGGURAT_LAYERS];
+        private static readonly double[] wi_double = new double[ZIGGURAT_LAYERS];
+        private static readonly double[] fi_double = new double[ZIGGURAT_LAYERS];
+
+        private static readonly UInt64[] ke_double = new UInt64[ZIGGURAT_LAYERS];
+        private static readonly double[] we_double = new double[ZIGGURAT_LAYERS];
+        private static readonly double[] fe_double = new double[ZIGGURAT_LAYERS];
+
+        static RandomDistributions()
+        {
+            BuildNormalZigguratTables();
+            BuildExponentialZigguratTables();
+        }
+
+        private static void BuildNormalZigguratTables()
+        {
+            /* 52 bit mantissa after the layer index and sign bits are taken */
+            const double m = 4503599627370496.0;
+            double dn = ziggurat_nor_r, tn = dn;
+            double q = ziggurat_nor_v / Math.Exp(-0.5 * dn * dn);
+
+            ki_double[0] = (UInt64)((dn / q) * m);
+            ki_double[1] = 0;
+            wi_double[0] = q / m;
+            wi_double[ZIGGURAT_LAYERS - 1] = dn / m;
+            fi_double[0] = 1.0;
+            fi_double[ZIGGURAT_LAYERS - 1] = Math.Exp(-0.5 * dn * dn);
+
+            for (int i = ZIGGURAT_LAYERS - 2; i >= 1; i--)
+            {
+                dn = Math.Sqrt(-2.0 * Math.Log(ziggurat_nor_v / dn + Math.Exp(-0.5 * dn * dn)));
+                ki_double[i + 1] = (UInt64)((dn / tn) * m);
+                tn = dn;
+                fi_double[i] = Math.Exp(-0.5 * dn * dn);
+                wi_double[i] = dn / m;
+            }
+        }
+
+        private static void BuildExponentialZigguratTables()
+        {
+            /* 53 bits remain after the layer index is taken */
+            const double m = 9007199254740992.0;
+            double de = ziggurat_exp_r, te = de;
+            double q = ziggurat_exp_v / Math.Exp(-de);
+
+            ke_double[0] = (UInt64)((de / q) * m);
+            ke_double[1] = 0;
+            we_double[0] = q / m;
+            we_double[ZIGGURAT_LAYERS - 1] = de / m;
+            fe_double[0] = 1.0;
+            fe_double[ZIGGURAT_LAYERS - 1] = Math.Exp(-de);
+
+            for (int i = ZIGGURAT_LAYERS - 2; i >= 1; i--)
+            {
+                de = -Math.Log(ziggurat_exp_v / de + Math.Exp(-de));
+                ke_double[i + 1] = (UInt64)((de / te) * m);
+                te = de;
+                fe_double[i] = Math.Exp(-de);
+                we_double[i] = de / m;
+            }
+        }
+
+        internal static double rk_gauss_zig(rk_state state)
+        {
+            for (; ; )
+            {
+                UInt64 r = rk_uint64(state);
+                int idx = (int)(r & 0xff);
+                r >>= 8;
+                bool negative = (r & 0x1) != 0;
+                UInt64 rabs = (r >> 1) & 0x000fffffffffffffUL;
+
+                double x = rabs * wi_double[idx];
+                if (negative)
+                    x = -x;
+                if (rabs < ki_double[idx])
+                    return x;   /* 99.3% of the time we return here */
+
+                if (idx == 0)
+                {
+                    /* tail beyond ziggurat_nor_r */
+                    for (; ; )
+                    {
+                        double xx = -ziggurat_nor_inv_r * Math.Log(1.0 - rk_double(state));
+                        double yy = -Math.Log(1.0 - rk_double(state));
+                        if (yy + yy > xx * xx)
+                        {
+                            return ((rabs >> 8) & 0x1) != 0 ? -(ziggurat_nor_r + xx) : ziggurat_nor_r + xx;
+                        }
+                    }
+                }
+                else
+                {
+                    if (((fi_double[idx - 1] - fi_double[idx]) * rk_double(state) + fi_double[idx]) < Math.Exp(-0.5 * x * x))
+                        return x;
+                }
+            }
+        }
+
+        internal static double rk_standard_exponential_zig(rk_state state)
+        {
+            for (; ; )
+            {
+                UInt64 ri = rk_uint64(state) >> 3;
+                int idx = (int)(ri & 0xff);
+                ri >>= 8;
+
+                double x = ri * we_double[idx];
+                if (ri < ke_double[idx])
+                    return x;   /* 98.9% of the time we return here */
+
+                if (idx == 0)
+                {
+                    return ziggurat_exp_r - Math.Log(1.0 - rk_double(state));
+                }
+                if ((fe_double[idx - 1] - fe_double[idx]) * rk_double(state) + fe_double[idx] < Math.Exp(-x))
+                {
+                    return x;
+                }
+            }
+        }
+
+        /*
+         * Bulk fills.  These skip the per element delegate call of cont0_array.
+         */
+        internal static void rk_fill_gauss(rk_state state, double[] _out)
+        {
+            if (state.use_ziggurat)
+            {
+                for (int i = 0; i < _out.Length; i++)
+                {
+                    _out[i] = rk_gauss_zig(state);
+                }
+            }
+            else
+            {
+                for (int i = 0; i < _out.Length; i++)
+                {
+                    _out[i] = rk_gauss(state);
+                }
+            }
+        }
+
+        internal static void rk_fill_standard_exponential(rk_state state, double[] _out)
+        {
+            if (state.use_ziggurat)
+            {
+                for (int i = 0; i < _out.Length; i++)
+                {
+                    _out[i] = rk_standard_exponential_zig(state);
+                }
+            }
+            else
+            {
+                for (int i = 0; i < _out.Length; i++)
+                {
+                    _out[i] = rk_standard_exponential(state);
+                }
+            }
+        }
+
+        internal static void rk_fill_standard_gamma(rk_state state, double shape, double[] _out)
+        {
+            for (int i = 0; i < _out.Length; i++)
+            {
+                _out[i] = rk_standard_gamma(state, shape);
+            }
+        }
+    }
+}
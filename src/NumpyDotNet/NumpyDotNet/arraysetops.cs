@@ -290,7 +290,15 @@ namespace NumpyDotNet
         {
             //Find the unique elements of an array, ignoring shape.
 
-            var ar = np.asanyarray(ar1).flatten();
+            var ar = np.asanyarray(ar1);
+            if (UseHashSetOps(ar))
+            {
+                var hashed = _unique1d_hash(ar, return_index, return_inverse, return_counts);
+                if (hashed != null)
+                    return hashed;
+            }
+
+            ar = ar.flatten();
 
             bool optional_indices = return_index || return_inverse;
 
@@ -300,13 +308,14 @@ namespace NumpyDotNet
 
             if (optional_indices)
             {
+                // return_index needs the first occurrence of each value, so the sort must be stable.
                 if (return_index)
                 {
-                    perm = ar.ArgSort(kind: NPY_SORTKIND.NPY_QUICKSORT);
+                    perm = ar.ArgSort(kind: NPY_SORTKIND.NPY_MERGESORT);
                 }
                 else
                 {
-                    perm = ar.ArgSort(kind: NPY_SORTKIND.NPY_MERGESORT);
+                    perm = ar.ArgSort(kind: NPY_SORTKIND.NPY_QUICKSORT);
                 }
                 aux = ar.A(perm);
             }
@@ -398,6 +407,13 @@ namespace NumpyDotNet
             array([3])             
             */
 
+            if (UseHashSetOps(ar1, ar2))
+            {
+                ndarray hashed = _intersect1d_hash(ar1, ar2);
+                if (hashed != null)
+                    return hashed;
+            }
+
             if (!assume_unique)
             {
                 //Might be faster than unique( intersect1d( ar1, ar2 ) )?
@@ -558,6 +574,14 @@ namespace NumpyDotNet
             ar1 = np.asarray(ar1).ravel();
             ar2 = np.asarray(ar2).ravel();
 
+            // large integer inputs: one hash set over ar2, one probe per element of ar1
+            if (UseHashSetOps(ar1, ar2))
+            {
+                ndarray hashed = _in1d_hash(ar1, ar2, invert);
+                if (hashed != null)
+                    return hashed;
+            }
+
 
             // This code is run when
             // a) the first condition is true, making the code significantly faster
@@ -847,6 +871,13 @@ namespace NumpyDotNet
             array([1, 2])             
             */
 
+            if (UseHashSetOps(ar1, ar2))
+            {
+                ndarray hashed = _setdiff1d_hash(ar1, ar2);
+                if (hashed != null)
+                    return hashed;
+            }
+
             if (assume_unique)
             {
                 ar1 = ar1.ravel();
@@ -859,5 +890,416 @@ namespace NumpyDotNet
             return ar1.A(in1d(ar1, ar2, assume_unique: true, invert: true));
         }
         #endregion
+    
+
+        #region hash based set operations
+
+        // Inputs at least this large use the hash table paths below instead of sort-then-compare.
+        // Only integer and bool types are hashed, so float NaN/-0.0 handling stays with the sorted code.
+        private const int hashSetOpsThreshold = 1 << 15;
+
+        private static bool IsHashSetType(NPY_TYPES TypeNum)
+        {
+            switch (TypeNum)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                case NPY_TYPES.NPY_BYTE:
+                case NPY_TYPES.NPY_UBYTE:
+                case NPY_TYPES.NPY_INT16:
+                case NPY_TYPES.NPY_UINT16:
+                case NPY_TYPES.NPY_INT32:
+                case NPY_TYPES.NPY_UINT32:
+                case NPY_TYPES.NPY_INT64:
+                case NPY_TYPES.NPY_UINT64:
+                    return true;
+                default:
+                    return false;
+            }
+        }
+
+        private static bool UseHashSetOps(ndarray ar)
+        {
+            return ar.size >= hashSetOpsThreshold && IsHashSetType(ar.TypeNum);
+        }
+
+        private static bool UseHashSetOps(ndarray ar1, ndarray ar2)
+        {
+            return ar1.size + ar2.size >= hashSetOpsThreshold && IsHashSetType(ar1.TypeNum) && IsHashSetType(ar2.TypeNum);
+        }
+
+        /// <summary>
+        /// Converts two hashable arrays to a common element type.  Mixed signed/unsigned 64 bit
+        /// inputs have no common integer type and return false.
+        /// </summary>
+        private static bool PrepareHashOperands(ref ndarray ar1, ref ndarray ar2)
+        {
+            if (ar1.TypeNum == ar2.TypeNum)
+                return true;
+
+            if (ar1.TypeNum == NPY_TYPES.NPY_UINT64 || ar2.TypeNum == NPY_TYPES.NPY_UINT64)
+                return false;
+
+            ar1 = ar1.astype(np.Int64);
+            ar2 = ar2.astype(np.Int64);
+            return true;
+        }
+
+        /// <summary>
+        /// Typed view of the array data.  Contiguous arrays are not copied.
+        /// </summary>
+        private static T[] HashKeys<T>(ndarray ar, out npy_intp offset)
+        {
+            VoidPtr vp = ar.rawdata(0);
+            offset = vp.data_offset >> ar.ItemSizeDiv;
+            return vp.datap as T[];
+        }
+
+        /// <summary>
+        /// Open addressing hash table over typed keys.  Each distinct key is given a dense id
+        /// in order of first appearance and the keys are kept in that order.
+        /// </summary>
+        private sealed class HashIndex<T> where T : struct, IEquatable<T>
+        {
+            private int[] slots;        // dense id + 1, 0 is an empty slot
+            private int shift;
+            public T[] keys;
+            public int count;
+
+            public HashIndex(npy_intp expected)
+            {
+                int bits = 4;
+                while (bits < 30 && (1L << bits) < expected * 2)
+                    bits++;
+
+                slots = new int[1 << bits];
+                shift = 32 - bits;
+                keys = new T[Math.Max(16, (int)Math.Min(expected, 1 << 20))];
+            }
+
+            private int Slot(T key)
+            {
+                // fibonacci hashing spreads sequential ids over the whole table
+                return (int)(((uint)key.GetHashCode() * 0x9E3779B1u) >> shift);
+            }
+
+            /// <summary>
+            /// returns the id of key, adding it if not already present.
+            /// </summary>
+            public int Add(T key)
+            {
+                int mask = slots.Length - 1;
+                int slot = Slot(key);
+                while (true)
+                {
+                    int id = slots[slot];
+                    if (id == 0)
+                    {
+                        if (count == keys.Length)
+                            Array.Resize(ref keys, keys.Length * 2);
+
+                        keys[count++] = key;
+                        slots[slot] = count;
+                        if (count * 2 > slots.Length)
+                            Grow();
+                        return count - 1;
+                    }
+                    if (keys[id - 1].Equals(key))
+                        return id - 1;
+
+                    slot = (slot + 1) & mask;
+                }
+            }
+
+            /// <summary>
+            /// returns the id of key or -1.  Safe to call from several threads once the table is built.
+            /// </summary>
+            public int Find(T key)
+            {
+                int mask = slots.Length - 1;
+                int slot = Slot(key);
+                while (true)
+                {
+                    int id = slots[slot];
+                    if (id == 0)
+                        return -1;
+                    if (keys[id - 1].Equals(key))
+                        return id - 1;
+
+                    slot = (slot + 1) & mask;
+                }
+            }
+
+            private void Grow()
+            {
+                slots = new int[slots.Length * 2];
+                shift--;
+
+                int mask = slots.Length - 1;
+                for (int i = 0; i < count; i++)
+                {
+                    int slot = Slot(keys[i]);
+                    while (slots[slot] != 0)
+                        slot = (slot + 1) & mask;
+                    slots[slot] = i + 1;
+                }
+            }
+
+            public T[] SortedKeys()
+            {
+                T[] sorted = new T[count];
+                Array.Copy(keys, sorted, count);
+                Array.Sort(sorted);
+                return sorted;
+            }
+        }
+
+        private static uniqueData _unique1d_hash(ndarray ar, bool return_index, bool return_inverse, bool return_counts)
+        {
+            switch (ar.TypeNum)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                    return _unique1d_hash<bool>(ar, return_index, return_inverse, return_counts);
+                case NPY_TYPES.NPY_BYTE:
+                    return _unique1d_hash<sbyte>(ar, return_index, return_inverse, return_counts);
+                case NPY_TYPES.NPY_UBYTE:
+                    return _unique1d_hash<byte>(ar, return_index, return_inverse, return_counts);
+                case NPY_TYPES.NPY_INT16:
+                    return _unique1d_hash<Int16>(ar, return_index, return_inverse, return_counts);
+                case NPY_TYPES.NPY_UINT16:
+                    return _unique1d_hash<UInt16>(ar, return_index, return_inverse, return_counts);
+                case NPY_TYPES.NPY_INT32:
+                    return _unique1d_hash<Int32>(ar, return_index, return_inverse, return_counts);
+                case NPY_TYPES.NPY_UINT32:
+                    return _unique1d_hash<UInt32>(ar, return_index, return_inverse, return_counts);
+                case NPY_TYPES.NPY_INT64:
+                    return _unique1d_hash<Int64>(ar, return_index, return_inverse, return_counts);
+                case NPY_TYPES.NPY_UINT64:
+                    return _unique1d_hash<UInt64>(ar, return_index, return_inverse, return_counts);
+            }
+            return null;
+        }
+
+        private static uniqueData _unique1d_hash<T>(ndarray ar, bool return_index, bool return_inverse, bool return_counts) where T : struct, IEquatable<T>
+        {
+            npy_intp offset;
+            T[] data = HashKeys<T>(ar, out offset);
+            if (data == null)
+                return null;
+
+            npy_intp length = ar.size;
+            var index = new HashIndex<T>(Math.Min(length, 1 << 16));
+
+            int[] ids = return_inverse ? new int[length] : null;
+            npy_intp[] first = return_index ? new npy_intp[16] : null;
+            npy_intp[] counts = return_counts ? new npy_intp[16] : null;
+
+            for (npy_intp i = 0; i < length; i++)
+            {
+                int before = index.count;
+                int id = index.Add(data[offset + i]);
+
+                if (id == before)
+                {
+                    if (first != null)
+                    {
+                        if (id == first.Length)
+                            Array.Resize(ref first, first.Length * 2);
+                        first[id] = i;
+                    }
+                    if (counts != null && id == counts.Length)
+                    {
+                        Array.Resize(ref counts, counts.Length * 2);
+                    }
+                }
+                if (counts != null)
+                    counts[id]++;
+                if (ids != null)
+                    ids[i] = id;
+            }
+
+            // only the distinct keys need sorting, not the whole input
+            int k = index.count;
+            T[] uniq = new T[k];
+            int[] order = new int[k];
+            Array.Copy(index.keys, uniq, k);
+            for (int j = 0; j < k; j++)
+                order[j] = j;
+            Array.Sort(uniq, order);
+
+            var ret = new uniqueData();
+            ret.data = np.array(uniq, dtype: ar.Dtype, copy: false);
+
+            if (return_index)
+            {
+                npy_intp[] indices = new npy_intp[k];
+                for (int j = 0; j < k; j++)
+                    indices[j] = first[order[j]];
+                ret.indices = np.array(indices, dtype: np.intp, copy: false);
+            }
+            if (return_inverse)
+            {
+                int[] rank = new int[k];
+                for (int j = 0; j < k; j++)
+                    rank[order[j]] = j;
+
+                npy_intp[] inverse = new npy_intp[length];
+                for (npy_intp i = 0; i < length; i++)
+                    inverse[i] = rank[ids[i]];
+                ret.inverse = np.array(inverse, dtype: np.intp, copy: false);
+            }
+            if (return_counts)
+            {
+                npy_intp[] sortedCounts = new npy_intp[k];
+                for (int j = 0; j < k; j++)
+                    sortedCounts[j] = counts[order[j]];
+                ret.counts = np.array(sortedCounts, dtype: np.intp, copy: false);
+            }
+
+            return ret;
+        }
+
+        private delegate ndarray HashSetOperation(ndarray ar1, ndarray ar2);
+
+        private static ndarray DispatchHashSetOperation(ndarray ar1, ndarray ar2, 
+            HashSetOperation BoolOp, HashSetOperation SByteOp, HashSetOperation ByteOp,
+            HashSetOperation Int16Op, HashSetOperation UInt16Op, HashSetOperation Int32Op,
+            HashSetOperation UInt32Op, HashSetOperation Int64Op, HashSetOperation UInt64Op)
+        {
+            if (!PrepareHashOperands(ref ar1, ref ar2))
+                return null;
+
+            switch (ar1.TypeNum)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                    return BoolOp(ar1, ar2);
+                case NPY_TYPES.NPY_BYTE:
+                    return SByteOp(ar1, ar2);
+                case NPY_TYPES.NPY_UBYTE:
+                    return ByteOp(ar1, ar2);
+                case NPY_TYPES.NPY_INT16:
+                    return Int16Op(ar1, ar2);
+                case NPY_TYPES.NPY_UINT16:
+                    return UInt16Op(ar1, ar2);
+                case NPY_TYPES.NPY_INT32:
+                    return Int32Op(ar1, ar2);
+                case NPY_TYPES.NPY_UINT32:
+                    return UInt32Op(ar1, ar2);
+                case NPY_TYPES.NPY_INT64:
+                    return Int64Op(ar1, ar2);
+                case NPY_TYPES.NPY_UINT64:
+                    return UInt64Op(ar1, ar2);
+            }
+            return null;
+        }
+
+        private static HashIndex<T> BuildHashSet<T>(ndarray ar) where T : struct, IEquatable<T>
+        {
+            npy_intp offset;
+            T[] data = HashKeys<T>(ar, out offset);
+            npy_intp length = ar.size;
+
+            var index = new HashIndex<T>(Math.Min(length, 1 << 16));
+            for (npy_intp i = 0; i < length; i++)
+            {
+                index.Add(data[offset + i]);
+            }
+            return index;
+        }
+
+        private static ndarray _in1d_hash(ndarray ar1, ndarray ar2, bool invert)
+        {
+            return DispatchHashSetOperation(ar1, ar2,
+                (a, b) => _in1d_hash<bool>(a, b, invert), (a, b) => _in1d_hash<sbyte>(a, b, invert),
+                (a, b) => _in1d_hash<byte>(a, b, invert), (a, b) => _in1d_hash<Int16>(a, b, invert),
+                (a, b) => _in1d_hash<UInt16>(a, b, invert), (a, b) => _in1d_hash<Int32>(a, b, invert),
+                (a, b) => _in1d_hash<UInt32>(a, b, invert), (a, b) => _in1d_hash<Int64>(a, b, invert),
+                (a, b) => _in1d_hash<UInt64>(a, b, invert));
+        }
+
+        private static ndarray _in1d_hash<T>(ndarray ar1, ndarray ar2, bool invert) where T : struct, IEquatable<T>
+        {
+            HashIndex<T> index = BuildHashSet<T>(ar2);
+
+            npy_intp offset;
+            T[] data = HashKeys<T>(ar1, out offset);
+            npy_intp length = ar1.size;
+
+            bool[] result = new bool[length];
+
+            // the table is read only now so the probes can run in parallel
+            Parallel.For(0, (length + hashSetOpsThreshold - 1) / hashSetOpsThreshold, NpyParallelScheduler.Options, chunk =>
+            {
+                npy_intp start = chunk * hashSetOpsThreshold;
+                npy_intp end = Math.Min(start + hashSetOpsThreshold, length);
+                for (npy_intp i = start; i < end; i++)
+                {
+                    result[i] = (index.Find(data[offset + i]) >= 0) != invert;
+                }
+            });
+
+            return np.array(result, dtype: np.Bool, copy: false);
+        }
+
+        private static ndarray _intersect1d_hash(ndarray ar1, ndarray ar2)
+        {
+            return DispatchHashSetOperation(ar1, ar2,
+                _intersect1d_hash<bool>, _intersect1d_hash<sbyte>, _intersect1d_hash<byte>,
+                _intersect1d_hash<Int16>, _intersect1d_hash<UInt16>, _intersect1d_hash<Int32>,
+                _intersect1d_hash<UInt32>, _intersect1d_hash<Int64>, _intersect1d_hash<UInt64>);
+        }
+
+        private static ndarray _intersect1d_hash<T>(ndarray ar1, ndarray ar2) where T : struct, IEquatable<T>
+        {
+            HashIndex<T> index = BuildHashSet<T>(ar2);
+
+            npy_intp offset;
+            T[] data = HashKeys<T>(ar1, out offset);
+            npy_intp length = ar1.size;
+
+            var common = new HashIndex<T>(Math.Min(index.count, 1 << 16));
+            for (npy_intp i = 0; i < length; i++)
+            {
+                T key = data[offset + i];
+                if (index.Find(key) >= 0)
+                    common.Add(key);
+            }
+
+            return np.array(common.SortedKeys(), dtype: ar1.Dtype, copy: false);
+        }
+
+        private static ndarray _setdiff1d_hash(ndarray ar1, ndarray ar2)
+        {
+            ndarray result = DispatchHashSetOperation(ar1, ar2,
+                _setdiff1d_hash<bool>, _setdiff1d_hash<sbyte>, _setdiff1d_hash<byte>,
+                _setdiff1d_hash<Int16>, _setdiff1d_hash<UInt16>, _setdiff1d_hash<Int32>,
+                _setdiff1d_hash<UInt32>, _setdiff1d_hash<Int64>, _setdiff1d_hash<UInt64>);
+
+            // the values all come from ar1, so like the sorted path the result keeps ar1's type
+            // even when mixed integer operands were widened to Int64 for hashing.
+            if (result != null && result.TypeNum != ar1.TypeNum)
+                result = result.astype(ar1.Dtype);
+            return result;
+        }
+
+        private static ndarray _setdiff1d_hash<T>(ndarray ar1, ndarray ar2) where T : struct, IEquatable<T>
+        {
+            HashIndex<T> index = BuildHashSet<T>(ar2);
+
+            npy_intp offset;
+            T[] data = HashKeys<T>(ar1, out offset);
+            npy_intp length = ar1.size;
+
+            var difference = new HashIndex<T>(Math.Min(length, 1 << 16));
+            for (npy_intp i = 0; i < length; i++)
+            {
+                T key = data[offset + i];
+                if (index.Find(key) < 0)
+                    difference.Add(key);
+            }
+
+            return np.array(difference.SortedKeys(), dtype: ar1.Dtype, copy: false);
+        }
+
+        #endregion
     }
 }
@@ -32,7 +32,9 @@
 
 using NumpyLib;
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 using System.Text;
 using System.Threading.Tasks;
@@ -47,11 +49,100 @@ namespace NumpyDotNet
 {
     public static partial class np
     {
+        private const string einsum_symbols = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ";
+
+        /// <summary>
+        /// A single step of an einsum contraction path
+        /// </summary>
+        private class EinsumContraction
+        {
+            public int[] contract_inds;
+            public HashSet<char> idx_removed;
+            public string einsum_str;
+            public string[] remaining;
+            public int scale;
+        }
+
+        /// <summary>
+        /// The evaluated contraction path for a (subscripts, shapes, optimize) signature
+        /// </summary>
+        private class EinsumPlan
+        {
+            public List<object> path;
+            public string string_repr;
+            public List<EinsumContraction> contraction_list;
+        }
+
+        private static ConcurrentDictionary<string, EinsumPlan> einsum_path_cache = new ConcurrentDictionary<string, EinsumPlan>();
+        private static int einsum_path_cache_size = 256;
+
+        /// <summary>
+        /// Evaluates the lowest cost contraction order for an einsum expression by considering the creation of intermediate arrays.
+        /// </summary>
+        /// <param name="subscripts">Specifies the subscripts for summation.</param>
+        /// <param name="operands">These are the arrays for the operation.</param>
+        /// <param name="optimize">Choose the type of path. true/"greedy", "optimal", false/"None", ("greedy", memory_limit) or an explicit list starting with "einsum_path".</param>
+        /// <returns>A list representation of the einsum path and a printable representation of the einsum path.</returns>
         public static (IEnumerable<object> path, string string_repr) einsum_path(string subscripts, IEnumerable<object> operands, object optimize)
+        {
+            var parsed = parse_einsum_input(subscripts, operands);
+            var plan = _einsum_plan(parsed.input_string, parsed.output_string, parsed.operands, optimize);
+
+            return (new List<object>(plan.path), plan.string_repr);
+        }
+
+        /// <summary>
+        /// Evaluates the Einstein summation convention on the operands.
+        /// </summary>
+        /// <param name="subscripts">Specifies the subscripts for summation as comma separated list of subscript labels.</param>
+        /// <param name="operands">These are the arrays for the operation.</param>
+        /// <returns>The calculation based on the Einstein summation convention.</returns>
+        public static ndarray einsum(string subscripts, params object[] operands)
+        {
+            return einsum(subscripts, operands, "greedy");
+        }
+
+        /// <summary>
+        /// Evaluates the Einstein summation convention on the operands.
+        /// </summary>
+        /// <param name="subscripts">Specifies the subscripts for summation as comma separated list of subscript labels.</param>
+        /// <param name="operands">These are the arrays for the operation.</param>
+        /// <param name="optimize">Controls if intermediate optimization should occur. See einsum_path.</param>
+        /// <returns>The calculation based on the Einstein summation convention.</returns>
+        public static ndarray einsum(string subscripts, object[] operands, object optimize)
+        {
+            var parsed = parse_einsum_input(subscripts, operands);
+            var plan = _einsum_plan(parsed.input_string, parsed.output_string, parsed.operands, optimize);
+
+            List<ndarray> operand_list = new List<ndarray>(parsed.operands);
+
+            foreach (var contraction in plan.contraction_list)
+            {
+                List<ndarray> tmp_operands = new List<ndarray>();
+                foreach (var x in contraction.contract_inds)
+                {
+                    tmp_operands.Add(operand_list[x]);
+                    operand_list.RemoveAt(x);
+                }
+
+                operand_list.Add(_einsum_contract(contraction.einsum_str, tmp_operands));
+            }
+
+            return operand_list[0];
+        }
+
+        #region einsum_path
+
+        private static (string path_type, npy_intp? memory_limit, List<int[]> explicit_path) _einsum_parse_optimize(object optimize)
         {
             string path_type = null;
-            int? memory_limit = null;
+            npy_intp? memory_limit = null;
+            List<int[]> explicit_path = null;
 
+            if (optimize == null)
+            {
+                path_type = "None";
+            }
             if (optimize is bool)
             {
                 bool boptimize = (bool)optimize;
@@ -65,24 +156,7 @@ namespace NumpyDotNet
                     path_type = "greedy";
                 }
             }
-            if (optimize is IEnumerable<string>)
-            {
-                IEnumerable<string> enumerable_optimize = optimize as IEnumerable<string>;
-                if (enumerable_optimize != null && enumerable_optimize.Count() > 0)
-                {
-                    string FirstString = enumerable_optimize.ElementAt(0);
-                    if (FirstString == "einsum_path")
-                    {
-                        path_type = "einsum_path";
-                    }
-                    else
-                    {
-                        path_type = "None";
-                    }
-                }
-
-            }
-            if (optimize is IEnumerable<object>)
+            if (optimize is IEnumerable<object> && !(optimize is string))
             {
                 IEnumerable<object> enumerable_optimize = optimize as IEnumerable<object>;
                 if (enumerable_optimize != null && enumerable_optimize.Count() > 0)
@@ -91,6 +165,11 @@ namespace NumpyDotNet
                     if (FirstString == "einsum_path")
                     {
                         path_type = "einsum_path";
+                        explicit_path = new List<int[]>();
+                        foreach (var step in enumerable_optimize.Skip(1))
+                        {
+                            explicit_path.Add(_einsum_path_step(step));
+                        }
                     }
                     else
                     {
@@ -119,34 +198,898 @@ namespace NumpyDotNet
             {
                 case "einsum_path":
                 case "None":
-                case "optimize":
+                case "optimal":
                 case "greedy":
                     break;
                 default:
                     throw new ValueError(string.Format("Did not understand the path: {0}", path_type));
             }
 
-            parse_einsum_input(subscripts, operands);
+            return (path_type, memory_limit, explicit_path);
+        }
+
+        private static int[] _einsum_path_step(object step)
+        {
+            if (step is int[])
+                return (int[])step;
+            if (step is ValueTuple<int, int>)
+            {
+                var t = (ValueTuple<int, int>)step;
+                return new int[] { t.Item1, t.Item2 };
+            }
+            if (step is System.Collections.IEnumerable)
+            {
+                List<int> inds = new List<int>();
+                foreach (var i in (System.Collections.IEnumerable)step)
+                {
+                    inds.Add(Convert.ToInt32(i));
+                }
+                return inds.ToArray();
+            }
+
+            throw new ValueError(string.Format("Did not understand the path step: {0}", step));
+        }
+
+        private static EinsumPlan _einsum_plan(string input_subscripts, string output_subscript, ndarray[] operands, object optimize)
+        {
+            var opt = _einsum_parse_optimize(optimize);
 
-            return (null, "123");
+            // paths only depend on the subscripts and operand shapes, so they are computed once per signature.
+            StringBuilder key = new StringBuilder();
+            key.Append(input_subscripts).Append("->").Append(output_subscript).Append('|');
+            foreach (var op in operands)
+            {
+                key.Append('(').Append(string.Join(",", op.dims)).Append(')');
+            }
+            key.Append('|').Append(opt.path_type).Append('|').Append(opt.memory_limit);
+            if (opt.explicit_path != null)
+            {
+                foreach (var step in opt.explicit_path)
+                {
+                    key.Append('(').Append(string.Join(",", step)).Append(')');
+                }
+            }
+
+            string cache_key = key.ToString();
+
+            EinsumPlan plan;
+            if (einsum_path_cache.TryGetValue(cache_key, out plan))
+            {
+                return plan;
+            }
+
+            plan = _einsum_compute_plan(input_subscripts, output_subscript, operands, opt.path_type, opt.memory_limit, opt.explicit_path);
+
+            if (einsum_path_cache.Count >= einsum_path_cache_size)
+            {
+                einsum_path_cache.Clear();
+            }
+            einsum_path_cache.TryAdd(cache_key, plan);
+
+            return plan;
         }
 
-        private static (string input_string, string output_string, IEnumerable<object> operands) parse_einsum_input(string subscripts, IEnumerable<object> operands)
+        private static EinsumPlan _einsum_compute_plan(string input_subscripts, string output_subscript, ndarray[] operands,
+                        string path_type, npy_intp? memory_limit, List<int[]> explicit_path)
+        {
+            List<string> input_list = input_subscripts.Split(',').ToList();
+            List<HashSet<char>> input_sets = input_list.Select(x => new HashSet<char>(x)).ToList();
+            HashSet<char> output_set = new HashSet<char>(output_subscript);
+            HashSet<char> indices = new HashSet<char>(input_subscripts.Replace(",", ""));
+
+            // Get length of each unique dimension and ensure all dimensions are correct
+            Dictionary<char, npy_intp> dimension_dict = new Dictionary<char, npy_intp>();
+            for (int tnum = 0; tnum < input_list.Count; tnum++)
+            {
+                string term = input_list[tnum];
+                npy_intp[] sh = operands[tnum].dims;
+                if (term.Length != sh.Length)
+                {
+                    throw new ValueError(string.Format("Einstein sum subscript {0} does not contain the correct number of indices for operand {1}.", term, tnum));
+                }
+                for (int cnum = 0; cnum < term.Length; cnum++)
+                {
+                    char c = term[cnum];
+                    npy_intp dim = sh[cnum];
+
+                    npy_intp existing;
+                    if (dimension_dict.TryGetValue(c, out existing))
+                    {
+                        // For broadcasting cases we always want the largest dim size
+                        if (existing == 1)
+                        {
+                            dimension_dict[c] = dim;
+                        }
+                        else if (dim != 1 && dim != existing)
+                        {
+                            throw new ValueError(string.Format("Size of label '{0}' for operand {1} ({2}) does not match previous terms ({3}).", c, tnum, existing, dim));
+                        }
+                    }
+                    else
+                    {
+                        dimension_dict[c] = dim;
+                    }
+                }
+            }
+
+            // Compute size of each input array plus the output array
+            List<npy_intp> size_list = new List<npy_intp>();
+            foreach (var term in input_list)
+            {
+                size_list.Add(_compute_size_by_dict(term, dimension_dict));
+            }
+            size_list.Add(_compute_size_by_dict(output_subscript, dimension_dict));
+            npy_intp max_size = size_list.Max();
+
+            npy_intp memory_arg = memory_limit.HasValue ? memory_limit.Value : max_size;
+
+            // Compute naive cost
+            bool inner_product = (input_sets.Sum(x => x.Count) - indices.Count) > 0;
+            npy_intp naive_cost = _flop_count(indices, inner_product, input_list.Count, dimension_dict);
+
+            // Compute the path
+            List<int[]> path;
+            if (path_type == "einsum_path")
+            {
+                path = explicit_path;
+            }
+            else if (path_type == "None" || input_list.Count == 1 || input_list.Count == 2 || indices.SetEquals(output_set))
+            {
+                // Nothing to be optimized, leave it to the pairwise engine
+                path = new List<int[]>() { Enumerable.Range(0, input_list.Count).ToArray() };
+            }
+            else if (path_type == "greedy")
+            {
+                path = _greedy_path(input_sets, output_set, dimension_dict, memory_arg);
+            }
+            else
+            {
+                path = _optimal_path(input_sets, output_set, dimension_dict, memory_arg);
+            }
+
+            List<npy_intp> cost_list = new List<npy_intp>();
+            List<int> scale_list = new List<int>();
+            size_list = new List<npy_intp>();
+            List<EinsumContraction> contraction_list = new List<EinsumContraction>();
+
+            // Build contraction tuple (positions, gemm, einsum_str, remaining)
+            for (int cnum = 0; cnum < path.Count; cnum++)
+            {
+                // Make sure we remove inds from right to left
+                int[] contract_inds = path[cnum].OrderByDescending(x => x).ToArray();
+
+                var contract = _find_contraction(contract_inds, input_sets, output_set);
+                input_sets = contract.remaining;
+
+                npy_intp cost = _flop_count(contract.idx_contract, contract.idx_removed.Count > 0, contract_inds.Length, dimension_dict);
+                cost_list.Add(cost);
+                scale_list.Add(contract.idx_contract.Count);
+                size_list.Add(_compute_size_by_dict(contract.new_result, dimension_dict));
+
+                List<string> tmp_inputs = new List<string>();
+                foreach (var x in contract_inds)
+                {
+                    tmp_inputs.Add(input_list[x]);
+                    input_list.RemoveAt(x);
+                }
+
+                string idx_result;
+                // Last contraction
+                if (cnum == path.Count - 1)
+                {
+                    idx_result = output_subscript;
+                }
+                else
+                {
+                    idx_result = new string(contract.new_result.OrderBy(x => dimension_dict[x]).ThenBy(x => x).ToArray());
+                }
+
+                input_list.Add(idx_result);
+
+                contraction_list.Add(new EinsumContraction()
+                {
+                    contract_inds = contract_inds,
+                    idx_removed = contract.idx_removed,
+                    einsum_str = string.Join(",", tmp_inputs) + "->" + idx_result,
+                    remaining = input_list.ToArray(),
+                    scale = contract.idx_contract.Count,
+                });
+            }
+
+            if (input_list.Count != 1)
+            {
+                throw new ValueError(string.Format("Invalid einsum_path is specified: {0} more operands has to be contracted.", input_list.Count - 1));
+            }
+
+            npy_intp opt_cost = cost_list.Sum() + 1;
+
+            List<object> path_list = new List<object>() { "einsum_path" };
+            path_list.AddRange(path.Cast<object>());
+
+            string overall_contraction = input_subscripts + "->" + output_subscript;
+            double speedup = (double)naive_cost / (double)opt_cost;
+            npy_intp max_i = size_list.Count > 0 ? size_list.Max() : 0;
+
+            StringBuilder path_print = new StringBuilder();
+            path_print.AppendFormat(CultureInfo.InvariantCulture, "  Complete contraction:  {0}\n", overall_contraction);
+            path_print.AppendFormat(CultureInfo.InvariantCulture, "         Naive scaling:  {0}\n", indices.Count);
+            path_print.AppendFormat(CultureInfo.InvariantCulture, "     Optimized scaling:  {0}\n", scale_list.Count > 0 ? scale_list.Max() : 0);
+            path_print.AppendFormat(CultureInfo.InvariantCulture, "      Naive FLOP count:  {0:0.000e+00}\n", (double)naive_cost);
+            path_print.AppendFormat(CultureInfo.InvariantCulture, "  Optimized FLOP count:  {0:0.000e+00}\n", (double)opt_cost);
+            path_print.AppendFormat(CultureInfo.InvariantCulture, "   Theoretical speedup:  {0:0.000}\n", speedup);
+            path_print.AppendFormat(CultureInfo.InvariantCulture, "  Largest intermediate:  {0:0.000e+00} elements\n", (double)max_i);
+            path_print.Append(new string('-', 74)).Append("\n");
+            path_print.AppendFormat("{0,6} {1,24} {2,40}\n", "scaling", "current", "remaining");
+            path_print.Append(new string('-', 74));
+
+            foreach (var contraction in contraction_list)
+            {
+                string remaining_str = string.Join(",", contraction.remaining) + "->" + output_subscript;
+                path_print.AppendFormat("\n{0,4}    {1,24} {2,40}", contraction.scale, contraction.einsum_str, remaining_str);
+            }
+
+            return new EinsumPlan()
+            {
+                path = path_list,
+                string_repr = path_print.ToString(),
+                contraction_list = contraction_list,
+            };
+        }
+
+        private static npy_intp _compute_size_by_dict(IEnumerable<char> indices, Dictionary<char, npy_intp> idx_dict)
+        {
+            npy_intp ret = 1;
+            foreach (var i in indices)
+            {
+                ret *= idx_dict[i];
+            }
+            return ret;
+        }
+
+        private static npy_intp _flop_count(IEnumerable<char> idx_contraction, bool inner, int num_terms, Dictionary<char, npy_intp> size_dictionary)
+        {
+            npy_intp overall_size = _compute_size_by_dict(idx_contraction, size_dictionary);
+            int op_factor = Math.Max(1, num_terms - 1);
+            if (inner)
+            {
+                op_factor += 1;
+            }
+
+            return overall_size * op_factor;
+        }
+
+        private static (HashSet<char> new_result, List<HashSet<char>> remaining, HashSet<char> idx_removed, HashSet<char> idx_contract)
+            _find_contraction(IEnumerable<int> positions, List<HashSet<char>> input_sets, HashSet<char> output_set)
+        {
+            HashSet<char> idx_contract = new HashSet<char>();
+            HashSet<char> idx_remain = new HashSet<char>(output_set);
+            List<HashSet<char>> remaining = new List<HashSet<char>>();
+
+            for (int ind = 0; ind < input_sets.Count; ind++)
+            {
+                var value = input_sets[ind];
+                if (positions.Contains(ind))
+                {
+                    idx_contract.UnionWith(value);
+                }
+                else
+                {
+                    remaining.Add(value);
+                    idx_remain.UnionWith(value);
+                }
+            }
+
+            HashSet<char> new_result = new HashSet<char>(idx_remain);
+            new_result.IntersectWith(idx_contract);
+
+            HashSet<char> idx_removed = new HashSet<char>(idx_contract);
+            idx_removed.ExceptWith(new_result);
+
+            remaining.Add(new_result);
+
+            return (new_result, remaining, idx_removed, idx_contract);
+        }
+
+        private class EinsumCandidate
+        {
+            public npy_intp removed_size;
+            public npy_intp cost;
+            public int[] positions;
+            public List<HashSet<char>> new_input_sets;
+        }
+
+        private static EinsumCandidate _parse_possible_contraction(int[] positions, List<HashSet<char>> input_sets, HashSet<char> output_set,
+                        Dictionary<char, npy_intp> idx_dict, npy_intp memory_limit, npy_intp path_cost, npy_intp naive_cost)
+        {
+            var contract = _find_contraction(positions, input_sets, output_set);
+
+            // Sieve the results based on memory_limit
+            npy_intp new_size = _compute_size_by_dict(contract.new_result, idx_dict);
+            if (new_size > memory_limit)
+                return null;
+
+            // Build sort tuple
+            npy_intp old_sizes = 0;
+            foreach (var p in positions)
+            {
+                old_sizes += _compute_size_by_dict(input_sets[p], idx_dict);
+            }
+            npy_intp removed_size = old_sizes - new_size;
+
+            // NB: removed_size used to be just the size of any removed indices i.e.:
+            //     helpers.compute_size_by_dict(idx_removed, idx_dict)
+            npy_intp cost = _flop_count(contract.idx_contract, contract.idx_removed.Count > 0, positions.Length, idx_dict);
+
+            // Sieve based on total cost as well
+            if ((path_cost + cost) > naive_cost)
+                return null;
+
+            return new EinsumCandidate() { removed_size = removed_size, cost = cost, positions = positions, new_input_sets = contract.remaining };
+        }
+
+        private static List<EinsumCandidate> _update_other_results(List<EinsumCandidate> results, EinsumCandidate best)
+        {
+            int bx = best.positions[0];
+            int by = best.positions[1];
+            List<EinsumCandidate> mod_results = new List<EinsumCandidate>();
+
+            foreach (var result in results)
+            {
+                int x = result.positions[0];
+                int y = result.positions[1];
+
+                // Ignore results involving tensors just contracted
+                if (x == bx || x == by || y == bx || y == by)
+                    continue;
+
+                // Update the input_sets
+                var con_sets = new List<HashSet<char>>(result.new_input_sets);
+                con_sets.RemoveAt(by - (by > x ? 1 : 0) - (by > y ? 1 : 0));
+                con_sets.RemoveAt(bx - (bx > x ? 1 : 0) - (bx > y ? 1 : 0));
+                con_sets.Insert(con_sets.Count - 1, best.new_input_sets[best.new_input_sets.Count - 1]);
+
+                // Update the position indices
+                int[] mod_con = new int[] { x - (x > bx ? 1 : 0) - (x > by ? 1 : 0), y - (y > bx ? 1 : 0) - (y > by ? 1 : 0) };
+                mod_results.Add(new EinsumCandidate() { removed_size = result.removed_size, cost = result.cost, positions = mod_con, new_input_sets = con_sets });
+            }
+
+            return mod_results;
+        }
+
+        private static List<int[]> _greedy_path(List<HashSet<char>> input_sets, HashSet<char> output_set, Dictionary<char, npy_intp> idx_dict, npy_intp memory_limit)
+        {
+            // Handle trivial cases that leaked through
+            if (input_sets.Count == 1)
+            {
+                return new List<int[]>() { new int[] { 0 } };
+            }
+            else if (input_sets.Count == 2)
+            {
+                return new List<int[]>() { new int[] { 0, 1 } };
+            }
+
+            // Build up a naive cost
+            var contract = _find_contraction(Enumerable.Range(0, input_sets.Count), input_sets, output_set);
+            npy_intp naive_cost = _flop_count(contract.idx_contract, contract.idx_removed.Count > 0, input_sets.Count, idx_dict);
+
+            // Initially iterate over all pairs
+            IEnumerable<int[]> comb_iter = _combinations2(input_sets.Count);
+            List<EinsumCandidate> known_contractions = new List<EinsumCandidate>();
+
+            npy_intp path_cost = 0;
+            List<int[]> path = new List<int[]>();
+
+            int iterations = input_sets.Count - 1;
+            for (int iteration = 0; iteration < iterations; iteration++)
+            {
+                // Iterate over all pairs on first step, only previously found pairs on subsequent steps
+                foreach (var positions in comb_iter)
+                {
+                    // Always initially ignore outer products
+                    if (!input_sets[positions[0]].Overlaps(input_sets[positions[1]]))
+                        continue;
+
+                    var result = _parse_possible_contraction(positions, input_sets, output_set, idx_dict, memory_limit, path_cost, naive_cost);
+                    if (result != null)
+                    {
+                        known_contractions.Add(result);
+                    }
+                }
+
+                // If we do not have a inner contraction, rescan pairs including outer products
+                if (known_contractions.Count == 0)
+                {
+                    // Then check the outer products
+                    foreach (var positions in _combinations2(input_sets.Count))
+                    {
+                        var result = _parse_possible_contraction(positions, input_sets, output_set, idx_dict, memory_limit, path_cost, naive_cost);
+                        if (result != null)
+                        {
+                            known_contractions.Add(result);
+                        }
+                    }
+
+                    // If we still did not find any remaining contractions, default back to einsum like behavior
+                    if (known_contractions.Count == 0)
+                    {
+                        path.Add(Enumerable.Range(0, input_sets.Count).ToArray());
+                        break;
+                    }
+                }
+
+                // Sort based on first index
+                EinsumCandidate best = known_contractions[0];
+                foreach (var candidate in known_contractions)
+                {
+                    if (-candidate.removed_size < -best.removed_size ||
+                        (candidate.removed_size == best.removed_size && candidate.cost < best.cost))
+                    {
+                        best = candidate;
+                    }
+                }
+
+                // Now propagate as many unused contractions as possible to next iteration
+                known_contractions = _update_other_results(known_contractions, best);
+
+                // Next iteration only compute contractions with the new tensor
+                // All other contractions have been accounted for
+                input_sets = best.new_input_sets;
+                int new_tensor_pos = input_sets.Count - 1;
+                comb_iter = Enumerable.Range(0, new_tensor_pos).Select(i => new int[] { i, new_tensor_pos }).ToList();
+
+                // Update path and total cost
+                path.Add(best.positions);
+                path_cost += best.cost;
+            }
+
+            return path;
+        }
+
+        private static List<int[]> _optimal_path(List<HashSet<char>> input_sets, HashSet<char> output_set, Dictionary<char, npy_intp> idx_dict, npy_intp memory_limit)
+        {
+            var full_results = new List<(npy_intp cost, List<int[]> positions, List<HashSet<char>> remaining)>()
+            {
+                (0, new List<int[]>(), input_sets)
+            };
+
+            int iterations = input_sets.Count - 1;
+            for (int iteration = 0; iteration < iterations; iteration++)
+            {
+                var iter_results = new List<(npy_intp cost, List<int[]> positions, List<HashSet<char>> remaining)>();
+
+                // Compute all unique pairs
+                foreach (var curr in full_results)
+                {
+                    foreach (var con in _combinations2(input_sets.Count - iteration))
+                    {
+                        // Find the contraction
+                        var cont = _find_contraction(con, curr.remaining, output_set);
+
+                        // Sieve the results based on memory_limit
+                        npy_intp new_size = _compute_size_by_dict(cont.new_result, idx_dict);
+                        if (new_size > memory_limit)
+                            continue;
+
+                        // Build (total_cost, positions, indices_remaining)
+                        npy_intp total_cost = curr.cost + _flop_count(cont.idx_contract, cont.idx_removed.Count > 0, con.Length, idx_dict);
+                        var new_pos = new List<int[]>(curr.positions);
+                        new_pos.Add(con);
+                        iter_results.Add((total_cost, new_pos, cont.remaining));
+                    }
+                }
+
+                // Update combinatorial list, if we did not find anything return best path + remaining contractions
+                if (iter_results.Count > 0)
+                {
+                    full_results = iter_results;
+                }
+                else
+                {
+                    var best = full_results.First(x => x.cost == full_results.Min(y => y.cost));
+                    var path = new List<int[]>(best.positions);
+                    path.Add(Enumerable.Range(0, input_sets.Count - iteration).ToArray());
+                    return path;
+                }
+            }
+
+            // If we have not found anything return single einsum contraction
+            if (full_results.Count == 0)
+            {
+                return new List<int[]>() { Enumerable.Range(0, input_sets.Count).ToArray() };
+            }
+
+            npy_intp min_cost = full_results.Min(y => y.cost);
+            return full_results.First(x => x.cost == min_cost).positions;
+        }
+
+        private static IEnumerable<int[]> _combinations2(int n)
+        {
+            for (int i = 0; i < n; i++)
+            {
+                for (int j = i + 1; j < n; j++)
+                {
+                    yield return new int[] { i, j };
+                }
+            }
+        }
+
+        #endregion
+
+        #region parse_einsum_input
+
+        private static (string input_string, string output_string, ndarray[] operands) parse_einsum_input(string subscripts, IEnumerable<object> operands)
         {
             if (operands == null || operands.Count() == 0)
             {
                 throw new ValueError("No input operands");
             }
 
-            throw new NotImplementedException();
+            if (subscripts == null)
+            {
+                throw new ValueError("No subscripts specified");
+            }
+
+            ndarray[] arrays = operands.Select(x => asanyarray(x)).ToArray();
+
+            subscripts = subscripts.Replace(" ", "");
+
+            // Ensure all characters are valid
+            foreach (var s in subscripts)
+            {
+                if (s == '.' || s == ',' || s == '-' || s == '>')
+                    continue;
+                if (einsum_symbols.IndexOf(s) < 0)
+                {
+                    throw new ValueError(string.Format("Character {0} is not a valid symbol.", s));
+                }
+            }
+
+            // Check for proper "->"
+            if (subscripts.Contains('-') || subscripts.Contains('>'))
+            {
+                bool invalid = subscripts.Count(x => x == '-') > 1 || subscripts.Count(x => x == '>') > 1;
+                if (invalid || !subscripts.Contains("->"))
+                {
+                    throw new ValueError("Subscripts can only contain one '->'.");
+                }
+            }
+
+            // Parse ellipses
+            if (subscripts.Contains('.'))
+            {
+                string used = subscripts.Replace(".", "").Replace(",", "").Replace("->", "");
+                string unused = new string(einsum_symbols.Where(x => used.IndexOf(x) < 0).ToArray());
+                string ellipse_inds = "";
+                int longest = 0;
+
+                string input_tmp;
+                string output_sub = null;
+                bool out_sub;
+                if (subscripts.Contains("->"))
+                {
+                    var parts = subscripts.Split(new string[] { "->" }, StringSplitOptions.None);
+                    input_tmp = parts[0];
+                    output_sub = parts[1];
+                    out_sub = true;
+                }
+                else
+                {
+                    input_tmp = subscripts;
+                    out_sub = false;
+                }
+
+                string[] split_subscripts = input_tmp.Split(',');
+                if (split_subscripts.Length != arrays.Length)
+                {
+                    throw new ValueError(split_subscripts.Length > arrays.Length ? "More subscripts than operands" : "More operands than subscripts");
+                }
+
+                for (int num = 0; num < split_subscripts.Length; num++)
+                {
+                    string sub = split_subscripts[num];
+                    if (sub.Contains('.'))
+                    {
+                        if (sub.Count(x => x == '.') != 3 || !sub.Contains("..."))
+                        {
+                            throw new ValueError("Invalid Ellipses.");
+                        }
+
+                        // Take into account numerical values
+                        int ellipse_count;
+                        if (arrays[num].ndim == 0)
+                        {
+                            ellipse_count = 0;
+                        }
+                        else
+                        {
+                            ellipse_count = Math.Max(arrays[num].ndim, 1);
+                            ellipse_count -= (sub.Length - 3);
+                        }
+
+                        if (ellipse_count > longest)
+                        {
+                            longest = ellipse_count;
+                        }
+
+                        if (ellipse_count < 0)
+                        {
+                            throw new ValueError("Ellipses lengths do not match.");
+                        }
+                        else if (ellipse_count == 0)
+                        {
+                            split_subscripts[num] = sub.Replace("...", "");
+                        }
+                        else
+                        {
+                            string rep_inds = unused.Substring(unused.Length - ellipse_count);
+                            split_subscripts[num] = sub.Replace("...", rep_inds);
+                        }
+                    }
+                }
+
+                subscripts = string.Join(",", split_subscripts);
+                if (longest == 0)
+                {
+                    ellipse_inds = "";
+                }
+                else
+                {
+                    ellipse_inds = unused.Substring(unused.Length - longest);
+                }
+
+                if (out_sub)
+                {
+                    subscripts += "->" + output_sub.Replace("...", ellipse_inds);
+                }
+                else
+                {
+                    // Special care for outputless ellipses
+                    string output_subscript = "";
+                    string tmp_subscripts = subscripts.Replace(",", "");
+                    foreach (var s in tmp_subscripts.Distinct().OrderBy(x => x))
+                    {
+                        if (einsum_symbols.IndexOf(s) < 0)
+                        {
+                            throw new ValueError(string.Format("Character {0} is not a valid symbol.", s));
+                        }
+                        if (tmp_subscripts.Count(x => x == s) == 1 && ellipse_inds.IndexOf(s) < 0)
+                        {
+                            output_subscript += s;
+                        }
+                    }
+                    subscripts += "->" + ellipse_inds + output_subscript;
+                }
+            }
+
+            string input_subscripts;
+            string output_string;
+
+            // Build output string if does not exist
+            if (subscripts.Contains("->"))
+            {
+                var parts = subscripts.Split(new string[] { "->" }, StringSplitOptions.None);
+                input_subscripts = parts[0];
+                output_string = parts[1];
+            }
+            else
+            {
+                input_subscripts = subscripts;
+                // Build output subscripts
+                string tmp_subscripts = subscripts.Replace(",", "");
+                output_string = "";
+                foreach (var s in tmp_subscripts.Distinct().OrderBy(x => x))
+                {
+                    if (tmp_subscripts.Count(x => x == s) == 1)
+                    {
+                        output_string += s;
+                    }
+                }
+            }
+
+            // Make sure output subscripts are in the input
+            foreach (var c in output_string)
+            {
+                if (output_string.Count(x => x == c) != 1)
+                {
+                    throw new ValueError(string.Format("Output character {0} appeared more than once in the output.", c));
+                }
+                if (input_subscripts.IndexOf(c) < 0)
+                {
+                    throw new ValueError(string.Format("Output character {0} did not appear in the input", c));
+                }
+            }
+
+            // Make sure number operands is equivalent to the number of terms
+            if (input_subscripts.Split(',').Length != arrays.Length)
+            {
+                throw new ValueError("Number of einsum subscripts must be equal to the number of operands.");
+            }
+
+            return (input_subscripts, output_string, arrays);
         }
 
-        public static ndarray einsum()
+        #endregion
+
+        #region contraction engine
+
+        /// <summary>
+        /// Evaluates a single step of a contraction path such as "ij,jk->ik".  Operands are folded
+        /// pairwise from left to right and each pairwise contraction is lowered onto a matrix product.
+        /// </summary>
+        private static ndarray _einsum_contract(string einsum_str, List<ndarray> operands)
         {
-            throw new NotImplementedException();
-            return null;
+            var parts = einsum_str.Split(new string[] { "->" }, StringSplitOptions.None);
+            string[] terms = parts[0].Split(',');
+            string output = parts[1];
+
+            ndarray current = operands[0];
+            string current_labels = terms[0];
+
+            for (int i = 1; i < operands.Count; i++)
+            {
+                // labels still needed by the output or by operands not yet folded in
+                HashSet<char> keep = new HashSet<char>(output);
+                for (int j = i + 1; j < terms.Length; j++)
+                {
+                    keep.UnionWith(terms[j]);
+                }
+
+                var result = _einsum_pairwise(current, current_labels, operands[i], terms[i], keep);
+                current = result.array;
+                current_labels = result.labels;
+            }
+
+            var reduced = _einsum_reduce_operand(current, current_labels, new HashSet<char>(output));
+            current = reduced.array;
+            current_labels = reduced.labels;
+
+            if (current_labels != output)
+            {
+                npy_intp[] perm = output.Select(c => (npy_intp)current_labels.IndexOf(c)).ToArray();
+                current = np.transpose(current, perm);
+            }
+
+            return current;
         }
 
+        /// <summary>
+        /// Takes the diagonal of repeated labels and sums out every label of a single operand that isn't in keep.
+        /// </summary>
+        private static (ndarray array, string labels) _einsum_reduce_operand(ndarray a, string labels, HashSet<char> keep)
+        {
+            // repeated labels within one term select a diagonal. np.diagonal appends it as the last axis.
+            bool found = true;
+            while (found)
+            {
+                found = false;
+                for (int i = 0; i < labels.Length && !found; i++)
+                {
+                    int j = labels.IndexOf(labels[i], i + 1);
+                    if (j > 0)
+                    {
+                        char c = labels[i];
+                        a = np.diagonal(a, 0, i, j);
+                        labels = labels.Remove(j, 1).Remove(i, 1) + c;
+                        found = true;
+                    }
+                }
+            }
+
+            for (int axis = labels.Length - 1; axis >= 0; axis--)
+            {
+                if (!keep.Contains(labels[axis]))
+                {
+                    a = np.sum(a, axis);
+                    labels = labels.Remove(axis, 1);
+                }
+            }
+
+            return (a, labels);
+        }
+
+        private static (ndarray array, string labels) _einsum_squeeze_broadcast(ndarray a, string labels, ndarray other, string other_labels)
+        {
+            // a size-1 label that is broadcast against a larger one in the other operand behaves as if the
+            // label were absent, so drop the axis and let the classification below treat it as one-sided.
+            for (int axis = labels.Length - 1; axis >= 0; axis--)
+            {
+                int other_axis = other_labels.IndexOf(labels[axis]);
+                if (other_axis >= 0 && a.dims[axis] == 1 && other.dims[other_axis] != 1)
+                {
+                    a = np.squeeze(a, axis);
+                    labels = labels.Remove(axis, 1);
+                }
+            }
+
+            return (a, labels);
+        }
+
+        private static (ndarray array, string labels) _einsum_pairwise(ndarray a, string a_labels, ndarray b, string b_labels, HashSet<char> keep)
+        {
+            var sa = _einsum_squeeze_broadcast(a, a_labels, b, b_labels);
+            var sb = _einsum_squeeze_broadcast(b, b_labels, a, a_labels);
+
+            // anything that only one side uses and that isn't needed later can be summed away before the product
+            HashSet<char> keep_a = new HashSet<char>(keep);
+            keep_a.UnionWith(sb.labels);
+            HashSet<char> keep_b = new HashSet<char>(keep);
+            keep_b.UnionWith(sa.labels);
+
+            var ra = _einsum_reduce_operand(sa.array, sa.labels, keep_a);
+            var rb = _einsum_reduce_operand(sb.array, sb.labels, keep_b);
+
+            a = ra.array;
+            a_labels = ra.labels;
+            b = rb.array;
+            b_labels = rb.labels;
+
+            string batch = new string(a_labels.Where(c => b_labels.IndexOf(c) >= 0 && keep.Contains(c)).ToArray());
+            string contracted = new string(a_labels.Where(c => b_labels.IndexOf(c) >= 0 && !keep.Contains(c)).ToArray());
+            string left = new string(a_labels.Where(c => b_labels.IndexOf(c) < 0).ToArray());
+            string right = new string(b_labels.Where(c => a_labels.IndexOf(c) < 0).ToArray());
+
+            npy_intp bsize = _einsum_labels_size(a, a_labels, batch);
+            npy_intp lsize = _einsum_labels_size(a, a_labels, left);
+            npy_intp ksize = _einsum_labels_size(a, a_labels, contracted);
+            npy_intp rsize = _einsum_labels_size(b, b_labels, right);
+
+            ndarray a3 = _einsum_permute(a, a_labels, batch + left + contracted).reshape(new shape(bsize, lsize, ksize));
+            ndarray b3 = _einsum_permute(b, b_labels, batch + contracted + right).reshape(new shape(bsize, ksize, rsize));
+
+            ndarray result;
+            if (bsize == 1)
+            {
+                result = np.dot(a3.reshape(new shape(lsize, ksize)), b3.reshape(new shape(ksize, rsize)));
+            }
+            else if (lsize == 1 || rsize == 1)
+            {
+                // batched vector products: the broadcast product is no bigger than the inputs,
+                // so a multiply and a reduction beats one tiny matrix product per batch.
+                result = np.sum(a3.reshape(new shape(bsize, lsize, ksize, 1)) * b3.reshape(new shape(bsize, 1, ksize, rsize)), 2);
+            }
+            else
+            {
+                ndarray[] products = new ndarray[bsize];
+                for (npy_intp i = 0; i < bsize; i++)
+                {
+                    products[i] = np.dot(a3[i] as ndarray, b3[i] as ndarray);
+                }
+                result = np.stack(products);
+            }
+
+            List<npy_intp> newdims = new List<npy_intp>();
+            foreach (var c in batch + left)
+            {
+                newdims.Add(a.dims[a_labels.IndexOf(c)]);
+            }
+            foreach (var c in right)
+            {
+                newdims.Add(b.dims[b_labels.IndexOf(c)]);
+            }
+
+            return (result.reshape(new shape(newdims.ToArray(), newdims.Count)), batch + left + right);
+        }
+
+        private static npy_intp _einsum_labels_size(ndarray a, string labels, string selected)
+        {
+            npy_intp size = 1;
+            foreach (var c in selected)
+            {
+                size *= a.dims[labels.IndexOf(c)];
+            }
+            return size;
+        }
+
+        private static ndarray _einsum_permute(ndarray a, string labels, string order)
+        {
+            if (labels == order)
+                return a;
+
+            npy_intp[] perm = order.Select(c => (npy_intp)labels.IndexOf(c)).ToArray();
+            return np.transpose(a, perm);
+        }
+
+        #endregion
+
     }
 }
-
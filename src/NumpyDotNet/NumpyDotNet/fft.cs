@@ -0,0 +1,298 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using NumpyLib;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Numerics;
+using System.Text;
+using System.Threading.Tasks;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyDotNet
+{
+    public static partial class np
+    {
+        /// <summary>
+        /// Discrete Fourier Transform functions: np.fft.fft, np.fft.rfft, np.fft.fftn ...
+        /// </summary>
+        public static readonly FFT fft = new FFT();
+
+        /// <summary>
+        /// Discrete Fourier Transform functions.  Use them through np.fft.
+        /// </summary>
+        public sealed class FFT
+        {
+            internal FFT()
+            {
+            }
+
+            #region fft/ifft
+            /// <summary>
+            /// Compute the one-dimensional discrete Fourier Transform.
+            /// </summary>
+            /// <param name="a">Input array, can be complex.</param>
+            /// <param name="n">Length of the transformed axis of the output. The input is cropped or zero padded to this length.</param>
+            /// <param name="axis">Axis over which to compute the FFT. If not given, the last axis is used.</param>
+            /// <param name="norm">{"backward", "ortho", "forward"}, optional</param>
+            /// <returns></returns>
+            public ndarray fft(object a, int? n = null, int axis = -1, string norm = null)
+            {
+                return _raw_fft(asanyarray(a), n, axis, false, norm);
+            }
+            /// <summary>
+            /// Compute the one-dimensional inverse discrete Fourier Transform.
+            /// </summary>
+            /// <param name="a">Input array, can be complex.</param>
+            /// <param name="n">Length of the transformed axis of the output. The input is cropped or zero padded to this length.</param>
+            /// <param name="axis">Axis over which to compute the inverse FFT. If not given, the last axis is used.</param>
+            /// <param name="norm">{"backward", "ortho", "forward"}, optional</param>
+            /// <returns></returns>
+            public ndarray ifft(object a, int? n = null, int axis = -1, string norm = null)
+            {
+                return _raw_fft(asanyarray(a), n, axis, true, norm);
+            }
+            #endregion
+
+            #region rfft/irfft
+            /// <summary>
+            /// Compute the one-dimensional discrete Fourier Transform for real input.
+            /// </summary>
+            /// <param name="a">Input array</param>
+            /// <param name="n">Number of points along transformation axis in the input to use. The input is cropped or zero padded to this length.</param>
+            /// <param name="axis">Axis over which to compute the FFT. If not given, the last axis is used.</param>
+            /// <param name="norm">{"backward", "ortho", "forward"}, optional</param>
+            /// <returns>The transformed axis has length n/2+1.</returns>
+            public ndarray rfft(object a, int? n = null, int axis = -1, string norm = null)
+            {
+                ndarray arr = asanyarray(a);
+                axis = normalize_axis_index(axis, arr.ndim);
+                int len = n ?? (int)arr.Dim(axis);
+                _check_fft_length(len);
+
+                ndarray x = _fft_lines(arr, axis, len, np.Float64);
+                ndarray ret = zeros(_fft_line_shape(x, len / 2 + 1), np.Complex);
+
+                NpyFFTKernels.RealForwardRows(
+                    x.core.data.datap as double[], x.core.data.data_offset / sizeof(double),
+                    ret.core.data.datap as Complex[], ret.core.data.data_offset / ret.ItemSize,
+                    x.size / len, len, _fft_scale(norm, len, false));
+
+                return swapaxes(ret, axis, -1);
+            }
+            /// <summary>
+            /// Computes the inverse of rfft.
+            /// </summary>
+            /// <param name="a">The input array.</param>
+            /// <param name="n">Length of the transformed axis of the output. If not given, it is 2*(m-1) where m is the length of the input along axis.</param>
+            /// <param name="axis">Axis over which to compute the inverse FFT. If not given, the last axis is used.</param>
+            /// <param name="norm">{"backward", "ortho", "forward"}, optional</param>
+            /// <returns></returns>
+            public ndarray irfft(object a, int? n = null, int axis = -1, string norm = null)
+            {
+                ndarray arr = asanyarray(a);
+                axis = normalize_axis_index(axis, arr.ndim);
+                int len = n ?? 2 * ((int)arr.Dim(axis) - 1);
+                _check_fft_length(len);
+
+                ndarray x = _fft_lines(arr, axis, len / 2 + 1, np.Complex);
+                ndarray ret = zeros(_fft_line_shape(x, len), np.Float64);
+
+                NpyFFTKernels.RealInverseRows(
+                    x.core.data.datap as Complex[], x.core.data.data_offset / x.ItemSize,
+                    ret.core.data.datap as double[], ret.core.data.data_offset / sizeof(double),
+                    ret.size / len, len, _fft_scale(norm, len, true));
+
+                return swapaxes(ret, axis, -1);
+            }
+            #endregion
+
+            #region fft2/ifft2/fftn/ifftn
+            /// <summary>
+            /// Compute the 2-dimensional discrete Fourier Transform.
+            /// </summary>
+            /// <param name="a">Input array, can be complex</param>
+            /// <param name="s">Shape (length of each transformed axis) of the output</param>
+            /// <param name="axes">Axes over which to compute the FFT. If not given, the last two axes are used.</param>
+            /// <param name="norm">{"backward", "ortho", "forward"}, optional</param>
+            /// <returns></returns>
+            public ndarray fft2(object a, int[] s = null, int[] axes = null, string norm = null)
+            {
+                return _raw_fftnd(asanyarray(a), s, axes ?? new int[] { -2, -1 }, false, norm);
+            }
+            /// <summary>
+            /// Compute the 2-dimensional inverse discrete Fourier Transform.
+            /// </summary>
+            /// <param name="a">Input array, can be complex</param>
+            /// <param name="s">Shape (length of each transformed axis) of the output</param>
+            /// <param name="axes">Axes over which to compute the inverse FFT. If not given, the last two axes are used.</param>
+            /// <param name="norm">{"backward", "ortho", "forward"}, optional</param>
+            /// <returns></returns>
+            public ndarray ifft2(object a, int[] s = null, int[] axes = null, string norm = null)
+            {
+                return _raw_fftnd(asanyarray(a), s, axes ?? new int[] { -2, -1 }, true, norm);
+            }
+            /// <summary>
+            /// Compute the N-dimensional discrete Fourier Transform.
+            /// </summary>
+            /// <param name="a">Input array, can be complex</param>
+            /// <param name="s">Shape (length of each transformed axis) of the output</param>
+            /// <param name="axes">Axes over which to compute the FFT. If not given, the last len(s) axes are used, or all axes if s is also not specified.</param>
+            /// <param name="norm">{"backward", "ortho", "forward"}, optional</param>
+            /// <returns></returns>
+            public ndarray fftn(object a, int[] s = null, int[] axes = null, string norm = null)
+            {
+                return _raw_fftnd(asanyarray(a), s, axes, false, norm);
+            }
+            /// <summary>
+            /// Compute the N-dimensional inverse discrete Fourier Transform.
+            /// </summary>
+            /// <param name="a">Input array, can be complex</param>
+            /// <param name="s">Shape (length of each transformed axis) of the output</param>
+            /// <param name="axes">Axes over which to compute the inverse FFT. If not given, the last len(s) axes are used, or all axes if s is also not specified.</param>
+            /// <param name="norm">{"backward", "ortho", "forward"}, optional</param>
+            /// <returns></returns>
+            public ndarray ifftn(object a, int[] s = null, int[] axes = null, string norm = null)
+            {
+                return _raw_fftnd(asanyarray(a), s, axes, true, norm);
+            }
+            #endregion
+
+            #region helpers
+
+            private static ndarray _raw_fft(ndarray a, int? n, int axis, bool inverse, string norm)
+            {
+                axis = normalize_axis_index(axis, a.ndim);
+                int len = n ?? (int)a.Dim(axis);
+                _check_fft_length(len);
+
+                // every line along axis is transformed in place in a private copy
+                ndarray x = _fft_lines(a, axis, len, np.Complex);
+                NpyFFTKernels.ComplexRows(x.core.data.datap as Complex[], x.core.data.data_offset / x.ItemSize,
+                    x.size / len, len, inverse, _fft_scale(norm, len, inverse));
+
+                return swapaxes(x, axis, -1);
+            }
+
+            private static ndarray _raw_fftnd(ndarray a, int[] s, int[] axes, bool inverse, string norm)
+            {
+                if (s == null)
+                {
+                    if (axes == null)
+                    {
+                        s = a.dims.Select(d => (int)d).ToArray();
+                    }
+                    else
+                    {
+                        s = axes.Select(ax => (int)a.Dim(normalize_axis_index(ax, a.ndim))).ToArray();
+                    }
+                }
+                if (axes == null)
+                {
+                    axes = Enumerable.Range(-s.Length, s.Length).ToArray();
+                }
+                if (s.Length != axes.Length)
+                {
+                    throw new ValueError("Shape and axes have different lengths.");
+                }
+
+                ndarray x = a;
+                for (int i = axes.Length - 1; i >= 0; i--)
+                {
+                    x = _raw_fft(x, s[i], axes[i], inverse, norm);
+                }
+                return x;
+            }
+
+            private static void _check_fft_length(int n)
+            {
+                if (n < 1)
+                {
+                    throw new ValueError(string.Format("Invalid number of FFT data points ({0}) specified.", n));
+                }
+            }
+
+            private static double _fft_scale(string norm, int n, bool inverse)
+            {
+                switch (norm)
+                {
+                    case null:
+                    case "backward":
+                        return inverse ? 1.0 / n : 1.0;
+                    case "ortho":
+                        return 1.0 / Math.Sqrt(n);
+                    case "forward":
+                        return inverse ? 1.0 : 1.0 / n;
+                    default:
+                        throw new ValueError(string.Format("Invalid norm value {0}; should be \"backward\", \"ortho\" or \"forward\".", norm));
+                }
+            }
+
+            /// <summary>
+            /// a C contiguous copy of a with axis moved last and cropped or zero padded to n
+            /// </summary>
+            private static ndarray _fft_lines(ndarray a, int axis, int n, dtype dtype)
+            {
+                ndarray x = swapaxes(a, axis, -1);
+                int last = x.ndim - 1;
+                npy_intp m = x.Dim(last);
+
+                if (m > n)
+                {
+                    object[] slices = BuildSliceArray(new Slice(null), x.ndim);
+                    slices[last] = new Slice(0, n);
+                    x = x.A(slices);
+                }
+                else if (m < n)
+                {
+                    x = concatenate((x, zeros(_fft_line_shape(x, n - m), x.Dtype)), axis: last);
+                }
+
+                return array(x, dtype: dtype, copy: true, order: NPY_ORDER.NPY_CORDER);
+            }
+
+            private static shape _fft_line_shape(ndarray x, npy_intp n)
+            {
+                npy_intp[] dims = (npy_intp[])x.dims.Clone();
+                dims[dims.Length - 1] = n;
+                return new shape(dims, dims.Length);
+            }
+
+            #endregion
+        }
+    }
+}
@@ -905,7 +905,7 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="a">Array to be sorted.</param>
         /// <param name="axis">Axis along which to sort</param>
-        /// <param name="kind">{'quicksort', 'mergesort', 'heapsort'}, optional</param>
+        /// <param name="kind">{'quicksort', 'mergesort', 'heapsort', 'stable'}, optional</param>
         /// <param name="order">str or list of str, optional</param>
         /// <returns></returns>
         public static ndarray sort(object a, int? axis = -1, NPY_SORTKIND kind = NPY_SORTKIND.NPY_QUICKSORT, IEnumerable<string> order= null)
@@ -956,8 +956,13 @@ namespace NumpyDotNet
             'quicksort'    1     O(n^2)            0          no
             'mergesort'    2     O(n*log(n))      ~n/2        yes
             'heapsort'     3     O(n*log(n))       0          no
+            'stable'       2     O(n*k)           ~n          yes
             =========== ======= ============= ============ =======
 
+            In this library 'mergesort' and 'stable' both map to a radix sort for
+            the numeric types, and very large inputs are split across threads
+            with a sample sort before each piece is sorted.
+
             All the sort algorithms make temporary copies of the data when
             sorting along any but the last axis.  Consequently, sorting along
             the last axis is faster and uses less space than sorting along
@@ -1032,6 +1037,42 @@ namespace NumpyDotNet
             return _a;
         }
 
+        /// <summary>
+        /// Return a sorted copy of an array.
+        /// </summary>
+        /// <param name="a">Array to be sorted.</param>
+        /// <param name="axis">Axis along which to sort</param>
+        /// <param name="kind">{'quicksort', 'mergesort', 'heapsort', 'stable'}</param>
+        /// <param name="order">str or list of str, optional</param>
+        /// <returns></returns>
+        public static ndarray sort(object a, int? axis, string kind, IEnumerable<string> order = null)
+        {
+            return sort(a, axis, ConvertSortKind(kind), order);
+        }
+
+        /// <summary>
+        /// Maps the NumPy sort kind names to NPY_SORTKIND.  Like NumPy only the first letter is checked.
+        /// </summary>
+        internal static NPY_SORTKIND ConvertSortKind(string kind)
+        {
+            if (string.IsNullOrEmpty(kind))
+                return NPY_SORTKIND.NPY_QUICKSORT;
+
+            switch (char.ToLower(kind[0]))
+            {
+                case 'q':
+                    return NPY_SORTKIND.NPY_QUICKSORT;
+                case 'h':
+                    return NPY_SORTKIND.NPY_HEAPSORT;
+                case 'm':
+                    return NPY_SORTKIND.NPY_MERGESORT;
+                case 's':
+                    return NPY_SORTKIND.NPY_STABLESORT;
+                default:
+                    throw new ValueError(string.Format("sort kind must be one of 'quick', 'heap', or 'stable' (got '{0}')", kind));
+            }
+        }
+
         #endregion
 
         #region argsort
@@ -1040,7 +1081,7 @@ namespace NumpyDotNet
         /// </summary>
         /// <param name="a">Array to sort.</param>
         /// <param name="axis">Axis along which to sort.</param>
-        /// <param name="kind">{'quicksort', 'mergesort', 'heapsort'}, optional</param>
+        /// <param name="kind">{'quicksort', 'mergesort', 'heapsort', 'stable'}, optional</param>
         /// <param name="order">str or list of str, optional</param>
         /// <returns></returns>
         public static ndarray argsort(ndarray a, int? axis = -1, NPY_SORTKIND kind = NPY_SORTKIND.NPY_QUICKSORT, IEnumerable<string> order = null)
@@ -1143,6 +1184,108 @@ namespace NumpyDotNet
 
         }
 
+        /// <summary>
+        /// Returns the indices that would sort an array.
+        /// </summary>
+        /// <param name="a">Array to sort.</param>
+        /// <param name="axis">Axis along which to sort.</param>
+        /// <param name="kind">{'quicksort', 'mergesort', 'heapsort', 'stable'}</param>
+        /// <param name="order">str or list of str, optional</param>
+        /// <returns></returns>
+        public static ndarray argsort(ndarray a, int? axis, string kind, IEnumerable<string> order = null)
+        {
+            return argsort(a, axis, ConvertSortKind(kind), order);
+        }
+
+        #endregion
+
+        #region lexsort
+
+        /// <summary>
+        /// Perform an indirect stable sort using a sequence of keys.
+        /// </summary>
+        /// <param name="keys">The k different "columns" to be sorted.  The last column is the primary sort key.</param>
+        /// <param name="axis">Axis to be indirectly sorted.  By default, sort over the last axis.</param>
+        /// <returns></returns>
+        public static ndarray lexsort(ndarray[] keys, int axis = -1)
+        {
+            /*
+            Perform an indirect stable sort using a sequence of keys.
+
+            Given multiple sorting keys, which can be interpreted as columns in a
+            spreadsheet, lexsort returns an array of integer indices that describes
+            the sort order by multiple columns. The last key in the sequence is used
+            for the primary sort order, the second-to-last key for the secondary sort
+            order, and so on.
+
+            Parameters
+            ----------
+            keys : (k, N) array or tuple containing k (N,)-shaped sequences
+                The `k` different "columns" to be sorted.  The last column (or row if
+                `keys` is a 2D array) is the primary sort key.
+            axis : int, optional
+                Axis to be indirectly sorted.  By default, sort over the last axis.
+
+            Returns
+            -------
+            indices : (N,) ndarray of ints
+                Array of indices that sort the keys along the specified axis.
+
+            See Also
+            --------
+            argsort : Indirect sort.
+            ndarray.sort : In-place sort.
+            sort : Return a sorted copy of an array.
+
+            Examples
+            --------
+            Sort names: first by surname, then by name.
+
+            >>> surnames =    ('Hertz',    'Galilei', 'Hertz')
+            >>> first_names = ('Heinrich', 'Galileo', 'Gustav')
+            >>> ind = np.lexsort((first_names, surnames))
+            >>> ind
+            array([1, 2, 0])
+
+            Sort two columns of numbers:
+
+            >>> a = [1,5,1,4,3,4,4] # First column
+            >>> b = [9,4,0,4,0,2,1] # Second column
+            >>> ind = np.lexsort((b,a)) # Sort by a, then by b
+            >>> ind
+            array([2, 0, 4, 6, 5, 3, 1])
+            */
+
+            if (keys == null || keys.Length == 0)
+            {
+                throw new TypeError("need sequence of keys with len > 0 in lexsort");
+            }
+
+            return NumpyDotNet.ndarray.LexSort(keys, axis);
+        }
+
+        /// <summary>
+        /// Perform an indirect stable sort using a sequence of keys.
+        /// </summary>
+        /// <param name="keys">(k, N) array.  Each row is a key and the last row is the primary sort key.</param>
+        /// <param name="axis">Axis to be indirectly sorted.  By default, sort over the last axis.</param>
+        /// <returns></returns>
+        public static ndarray lexsort(ndarray keys, int axis = -1)
+        {
+            if (keys.ndim == 0)
+            {
+                throw new TypeError("need sequence of keys with len > 0 in lexsort");
+            }
+
+            var rows = new ndarray[keys.dims[0]];
+            for (int i = 0; i < rows.Length; i++)
+            {
+                rows[i] = keys[i] as ndarray;
+            }
+
+            return lexsort(rows, axis);
+        }
+
         #endregion
 
         #region argmax
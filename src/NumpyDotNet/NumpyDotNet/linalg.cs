@@ -0,0 +1,447 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using NumpyLib;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Numerics;
+using System.Text;
+using System.Threading.Tasks;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyDotNet
+{
+    public static partial class np
+    {
+        /// <summary>
+        /// Linear algebra functions: np.linalg.solve, np.linalg.inv, np.linalg.eig ...
+        /// </summary>
+        public static readonly LinAlg linalg = new LinAlg();
+
+        /// <summary>
+        /// Linear algebra functions.  Use them through np.linalg.
+        /// All functions accept stacks of matrices (..., M, M) and compute in float64.
+        /// </summary>
+        public sealed class LinAlg
+        {
+            internal LinAlg()
+            {
+            }
+
+            #region solve/inv
+            /// <summary>
+            /// Solve a linear matrix equation, or system of linear scalar equations.
+            /// </summary>
+            /// <param name="a">Coefficient matrix, (..., M, M)</param>
+            /// <param name="b">Ordinate or "dependent variable" values, (..., M) or (..., M, K)</param>
+            /// <returns>Solution to the system a x = b. Returned shape is identical to b.</returns>
+            public ndarray solve(object a, object b)
+            {
+                ndarray _a = _square_stack(a);
+                ndarray _b = _real(asanyarray(b));
+                int n = (int)_a.dims[_a.ndim - 1];
+
+                bool vector = _b.ndim == 1 || _b.ndim == _a.ndim - 1;
+                if (vector)
+                {
+                    _b = _b.reshape(_b.dims.Concat(new npy_intp[] { 1 }));
+                }
+                if (_b.ndim < 2 || _b.dims[_b.ndim - 2] != n)
+                {
+                    throw new ValueError(string.Format("solve: b has {0} rows, expected {1}", _b.ndim < 2 ? 0 : _b.dims[_b.ndim - 2], n));
+                }
+                int k = (int)_b.dims[_b.ndim - 1];
+
+                npy_intp[] batch = _broadcast_batch(_batch_dims(_a), _batch_dims(_b));
+                _a = _stack_copy(_a, batch, n, n);
+                _b = _stack_copy(_b, batch, n, k);
+
+                if (!NpyLinAlgKernels.SolveStack(_data(_a), _offset(_a), _data(_b), _offset(_b), _count(batch), n, k))
+                {
+                    throw new LinAlgError("Singular matrix");
+                }
+
+                return vector ? _b.reshape(batch.Concat(new npy_intp[] { n })) : _b;
+            }
+            /// <summary>
+            /// Compute the (multiplicative) inverse of a matrix.
+            /// </summary>
+            /// <param name="a">Matrix to be inverted, (..., M, M)</param>
+            /// <returns>(Multiplicative) inverse of the matrix a.</returns>
+            public ndarray inv(object a)
+            {
+                ndarray _a = _square_stack(a);
+                int n = (int)_a.dims[_a.ndim - 1];
+
+                ndarray ret = empty(_a.shape, np.Float64);
+                if (!NpyLinAlgKernels.InvertStack(_data(_a), _offset(_a), _data(ret), _offset(ret), _count(_batch_dims(_a)), n))
+                {
+                    throw new LinAlgError("Singular matrix");
+                }
+                return ret;
+            }
+            #endregion
+
+            #region det/slogdet
+            /// <summary>
+            /// Compute the determinant of an array.
+            /// </summary>
+            /// <param name="a">Input array to compute determinants for, (..., M, M)</param>
+            /// <returns>Determinant of a.</returns>
+            public ndarray det(object a)
+            {
+                var (sign, logdet) = _slogdet(a, out npy_intp[] batch);
+                double[] det = new double[sign.Length];
+                for (int i = 0; i < det.Length; i++)
+                {
+                    det[i] = sign[i] * Math.Exp(logdet[i]);
+                }
+                return _batch_values(det, batch);
+            }
+            /// <summary>
+            /// Compute the sign and (natural) logarithm of the determinant of an array.
+            /// </summary>
+            /// <param name="a">Input array, (..., M, M)</param>
+            /// <returns>sign is 1, 0 or -1 and logdet is the natural log of the absolute value of the determinant.</returns>
+            public (ndarray sign, ndarray logdet) slogdet(object a)
+            {
+                var (sign, logdet) = _slogdet(a, out npy_intp[] batch);
+                return (_batch_values(sign, batch), _batch_values(logdet, batch));
+            }
+            #endregion
+
+            #region cholesky/qr
+            /// <summary>
+            /// Cholesky decomposition.  Only the lower triangle of a is used.
+            /// </summary>
+            /// <param name="a">Symmetric positive-definite input matrix, (..., M, M)</param>
+            /// <returns>Lower-triangular Cholesky factor of a.</returns>
+            public ndarray cholesky(object a)
+            {
+                ndarray _a = _square_stack(a);
+                int n = (int)_a.dims[_a.ndim - 1];
+
+                if (!NpyLinAlgKernels.CholeskyStack(_data(_a), _offset(_a), _count(_batch_dims(_a)), n))
+                {
+                    throw new LinAlgError("Matrix is not positive definite");
+                }
+                return _a;
+            }
+            /// <summary>
+            /// Compute the qr factorization of a matrix.
+            /// </summary>
+            /// <param name="a">An array, (..., M, N)</param>
+            /// <param name="mode">{"reduced", "complete", "r"}, optional. With "r" only r is computed and q is null.</param>
+            /// <returns>q with orthonormal columns and upper-triangular r.</returns>
+            public (ndarray q, ndarray r) qr(object a, string mode = "reduced")
+            {
+                ndarray _a = _stack(a);
+                int m = (int)_a.dims[_a.ndim - 2];
+                int n = (int)_a.dims[_a.ndim - 1];
+                int k = Math.Min(m, n);
+
+                int qcols, rrows;
+                switch (mode)
+                {
+                    case "reduced":
+                        qcols = k;
+                        rrows = k;
+                        break;
+                    case "complete":
+                        qcols = m;
+                        rrows = m;
+                        break;
+                    case "r":
+                        qcols = 0;
+                        rrows = k;
+                        break;
+                    default:
+                        throw new ValueError(string.Format("Unrecognized mode '{0}'", mode));
+                }
+
+                npy_intp[] batch = _batch_dims(_a);
+                ndarray q = mode == "r" ? null : empty(_batch_shape(batch, m, qcols), np.Float64);
+                ndarray r = empty(_batch_shape(batch, rrows, n), np.Float64);
+
+                NpyLinAlgKernels.QRStack(_data(_a), _offset(_a), _count(batch), m, n,
+                    q == null ? null : _data(q), q == null ? 0 : _offset(q), qcols,
+                    _data(r), _offset(r), rrows);
+
+                return (q, r);
+            }
+            #endregion
+
+            #region eig/eigvals
+            /// <summary>
+            /// Compute the eigenvalues and right eigenvectors of a square array.
+            /// </summary>
+            /// <param name="a">Matrices for which the eigenvalues and right eigenvectors will be computed, (..., M, M)</param>
+            /// <returns>w, the eigenvalues, and v, the normalized eigenvectors as columns.  They are complex unless all eigenvalues are real.</returns>
+            public (ndarray w, ndarray v) eig(object a)
+            {
+                ndarray _a = _square_stack(a);
+                _assert_finite(_a);
+                int n = (int)_a.dims[_a.ndim - 1];
+                npy_intp[] batch = _batch_dims(_a);
+
+                Complex[] w = new Complex[_count(batch) * n];
+                Complex[] v = new Complex[_count(batch) * n * n];
+                if (!NpyLinAlgKernels.GeneralEigenStack(_data(_a), _offset(_a), w, 0, v, 0, _count(batch), n))
+                {
+                    throw new LinAlgError("Eigenvalues did not converge");
+                }
+
+                bool real = w.All(x => x.Imaginary == 0.0);
+                return (_eig_result(w, real, _batch_shape(batch, n)), _eig_result(v, real, _batch_shape(batch, n, n)));
+            }
+            /// <summary>
+            /// Compute the eigenvalues of a general matrix.
+            /// </summary>
+            /// <param name="a">A complex- or real-valued matrix whose eigenvalues will be computed, (..., M, M)</param>
+            /// <returns>The eigenvalues, each repeated according to its multiplicity.  They are complex unless all of them are real.</returns>
+            public ndarray eigvals(object a)
+            {
+                ndarray _a = _square_stack(a);
+                _assert_finite(_a);
+                int n = (int)_a.dims[_a.ndim - 1];
+                npy_intp[] batch = _batch_dims(_a);
+
+                Complex[] w = new Complex[_count(batch) * n];
+                if (!NpyLinAlgKernels.GeneralEigenStack(_data(_a), _offset(_a), w, 0, null, 0, _count(batch), n))
+                {
+                    throw new LinAlgError("Eigenvalues did not converge");
+                }
+
+                return _eig_result(w, w.All(x => x.Imaginary == 0.0), _batch_shape(batch, n));
+            }
+            /// <summary>
+            /// Return the eigenvalues and eigenvectors of a real symmetric matrix.
+            /// </summary>
+            /// <param name="a">Real symmetric matrices, (..., M, M)</param>
+            /// <param name="UPLO">{"L", "U"}, optional. Whether the lower or the upper triangle of a is used.</param>
+            /// <returns>w, the eigenvalues in ascending order, and v, the normalized eigenvectors as columns.</returns>
+            public (ndarray w, ndarray v) eigh(object a, string UPLO = "L")
+            {
+                ndarray _a = _symmetric_stack(a, UPLO);
+                int n = (int)_a.dims[_a.ndim - 1];
+                npy_intp[] batch = _batch_dims(_a);
+
+                ndarray w = empty(_batch_shape(batch, n), np.Float64);
+                if (!NpyLinAlgKernels.SymmetricEigenStack(_data(_a), _offset(_a), _data(w), _offset(w), _count(batch), n, true))
+                {
+                    throw new LinAlgError("Eigenvalues did not converge");
+                }
+                return (w, _a);
+            }
+            /// <summary>
+            /// Compute the eigenvalues of a real symmetric matrix.
+            /// </summary>
+            /// <param name="a">Real symmetric matrices, (..., M, M)</param>
+            /// <param name="UPLO">{"L", "U"}, optional. Whether the lower or the upper triangle of a is used.</param>
+            /// <returns>The eigenvalues in ascending order.</returns>
+            public ndarray eigvalsh(object a, string UPLO = "L")
+            {
+                ndarray _a = _symmetric_stack(a, UPLO);
+                int n = (int)_a.dims[_a.ndim - 1];
+                npy_intp[] batch = _batch_dims(_a);
+
+                ndarray w = empty(_batch_shape(batch, n), np.Float64);
+                if (!NpyLinAlgKernels.SymmetricEigenStack(_data(_a), _offset(_a), _data(w), _offset(w), _count(batch), n, false))
+                {
+                    throw new LinAlgError("Eigenvalues did not converge");
+                }
+                return w;
+            }
+            #endregion
+
+            #region helpers
+
+            private static (double[] sign, double[] logdet) _slogdet(object a, out npy_intp[] batch)
+            {
+                ndarray _a = _square_stack(a);
+                int n = (int)_a.dims[_a.ndim - 1];
+                batch = _batch_dims(_a);
+
+                npy_intp count = _count(batch);
+                double[] sign = new double[count];
+                double[] logdet = new double[count];
+                NpyLinAlgKernels.SlogdetStack(_data(_a), _offset(_a), sign, logdet, 0, count, n);
+                return (sign, logdet);
+            }
+
+            private static ndarray _real(ndarray a)
+            {
+                if (a.IsComplex)
+                {
+                    throw new TypeError("complex arrays are not supported by np.linalg");
+                }
+                return a;
+            }
+
+            /// <summary>
+            /// a private C contiguous float64 copy of a stack of matrices
+            /// </summary>
+            private static ndarray _stack(object a)
+            {
+                ndarray arr = _real(asanyarray(a));
+                if (arr.ndim < 2)
+                {
+                    throw new LinAlgError(string.Format("{0}-dimensional array given. Array must be at least two-dimensional", arr.ndim));
+                }
+                return array(arr, dtype: np.Float64, copy: true, order: NPY_ORDER.NPY_CORDER);
+            }
+
+            private static ndarray _square_stack(object a)
+            {
+                ndarray arr = _stack(a);
+                if (arr.dims[arr.ndim - 1] != arr.dims[arr.ndim - 2])
+                {
+                    throw new LinAlgError("Last 2 dimensions of the array must be square");
+                }
+                return arr;
+            }
+
+            private static ndarray _symmetric_stack(object a, string UPLO)
+            {
+                switch (UPLO)
+                {
+                    case "L":
+                    case "l":
+                        return _square_stack(a);
+                    case "U":
+                    case "u":
+                        // the kernels read the lower triangle, which is the upper triangle of the transpose
+                        ndarray arr = _real(asanyarray(a));
+                        return _square_stack(arr.ndim < 2 ? arr : swapaxes(arr, -1, -2));
+                    default:
+                        throw new ValueError("UPLO argument must be 'L' or 'U'");
+                }
+            }
+
+            private static void _assert_finite(ndarray a)
+            {
+                double[] data = _data(a);
+                npy_intp offset = _offset(a);
+                for (npy_intp i = 0; i < a.size; i++)
+                {
+                    if (double.IsNaN(data[offset + i]) || double.IsInfinity(data[offset + i]))
+                    {
+                        throw new LinAlgError("Array must not contain infs or NaNs");
+                    }
+                }
+            }
+
+            /// <summary>
+            /// a contiguous float64 copy of a with its leading dimensions broadcast to batch
+            /// </summary>
+            private static ndarray _stack_copy(ndarray a, npy_intp[] batch, int rows, int cols)
+            {
+                npy_intp[] dims = batch.Concat(new npy_intp[] { rows, cols }).ToArray();
+                if (!a.dims.SequenceEqual(dims))
+                {
+                    a = broadcast_to(a, new shape(dims, dims.Length));
+                }
+                return array(a, dtype: np.Float64, copy: true, order: NPY_ORDER.NPY_CORDER);
+            }
+
+            private static npy_intp[] _batch_dims(ndarray a)
+            {
+                return a.dims.Take(a.ndim - 2).ToArray();
+            }
+
+            private static npy_intp[] _broadcast_batch(npy_intp[] x, npy_intp[] y)
+            {
+                int nd = Math.Max(x.Length, y.Length);
+                npy_intp[] dims = new npy_intp[nd];
+                for (int i = 0; i < nd; i++)
+                {
+                    npy_intp dx = i < nd - x.Length ? 1 : x[i - (nd - x.Length)];
+                    npy_intp dy = i < nd - y.Length ? 1 : y[i - (nd - y.Length)];
+                    if (dx != dy && dx != 1 && dy != 1)
+                    {
+                        throw new ValueError("operands could not be broadcast together");
+                    }
+                    dims[i] = dx == 1 ? dy : dx;
+                }
+                return dims;
+            }
+
+            private static shape _batch_shape(npy_intp[] batch, params npy_intp[] core)
+            {
+                npy_intp[] dims = batch.Concat(core).ToArray();
+                return new shape(dims, dims.Length);
+            }
+
+            private static npy_intp _count(npy_intp[] batch)
+            {
+                npy_intp count = 1;
+                foreach (var d in batch)
+                {
+                    count *= d;
+                }
+                return count;
+            }
+
+            private static ndarray _batch_values(double[] values, npy_intp[] batch)
+            {
+                // a single matrix has an empty batch shape, which gives a 0-d result
+                return array(values).reshape(new shape(batch, batch.Length));
+            }
+
+            private static ndarray _eig_result(Complex[] values, bool real, shape shape)
+            {
+                if (real)
+                {
+                    return array(values.Select(x => x.Real).ToArray()).reshape(shape.iDims);
+                }
+                return array(values).reshape(shape.iDims);
+            }
+
+            private static double[] _data(ndarray a)
+            {
+                return a.core.data.datap as double[];
+            }
+
+            private static npy_intp _offset(ndarray a)
+            {
+                return a.core.data.data_offset / sizeof(double);
+            }
+
+            #endregion
+        }
+    }
+}
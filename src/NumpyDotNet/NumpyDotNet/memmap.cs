@@ -0,0 +1,529 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Linq;
+using NumpyLib;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyDotNet
+{
+    public static partial class np
+    {
+        /// <summary>
+        /// Array storage that lives outside the managed heap, either in a memory-mapped file or in
+        /// anonymous native memory.  The total size is only limited by the address space, so it can
+        /// hold data sets far beyond the .NET array limits without putting huge buffers on the large
+        /// object heap.  Rows along the first axis are copied in and out as ordinary ndarrays, which
+        /// lets every existing function and ufunc work on the data a chunk at a time.  The memory is
+        /// released deterministically by Dispose.
+        /// </summary>
+        public class memmap : IDisposable
+        {
+            private const long ChunkBytes = 64L << 20;
+
+            private MemoryMappedFile mmf;
+            private MemoryMappedViewAccessor accessor;
+
+            private readonly npy_intp[] dims;
+            private readonly long rowsize;
+            private readonly int elsize;
+
+            /// <summary>
+            /// Name of the mapped file, or null for anonymous native memory.
+            /// </summary>
+            public string filename { get; private set; }
+            /// <summary>
+            /// The file mode used to open the storage.
+            /// </summary>
+            public string mode { get; private set; }
+            /// <summary>
+            /// Offset of the array data in the file, in bytes.
+            /// </summary>
+            public long offset { get; private set; }
+            /// <summary>
+            /// Data type of the stored elements.
+            /// </summary>
+            public dtype Dtype { get; private set; }
+
+            /// <summary>
+            /// Create or open a memory-mapped array stored in a binary file on disk.
+            /// </summary>
+            /// <param name="filename">The file name to be used as the array data buffer.</param>
+            /// <param name="dtype">The data-type used to interpret the file contents. Default is UInt8.</param>
+            /// <param name="mode">{'r+', 'r', 'w+', 'c'}, The file is opened in this mode: read/write, read only, created or overwritten, or copy-on-write.</param>
+            /// <param name="offset">In the file, array data starts at this offset.</param>
+            /// <param name="shape">The desired shape of the array. If null, the returned array is 1-D with as many elements as the file holds after offset.</param>
+            public memmap(string filename, dtype dtype = null, string mode = "r+", long offset = 0, shape shape = null)
+            {
+                if (string.IsNullOrEmpty(filename))
+                {
+                    throw new Exception("Pathname null or empty");
+                }
+                if (mode != "r" && mode != "r+" && mode != "w+" && mode != "c")
+                {
+                    throw new ValueError(string.Format("mode must be one of ['r', 'c', 'r+', 'w+'] (got '{0}')", mode));
+                }
+                if (mode == "w+" && shape == null)
+                {
+                    throw new ValueError("shape must be given if mode == 'w+'");
+                }
+                if (offset < 0)
+                {
+                    throw new ValueError("offset must be non-negative");
+                }
+
+                this.filename = filename;
+                this.mode = mode;
+                this.offset = offset;
+                this.Dtype = dtype ?? np.UInt8;
+                this.elsize = _memmap_elsize(this.Dtype);
+
+                FileStream fp = mode == "w+" ?
+                    File.Open(filename, FileMode.Create, FileAccess.ReadWrite, FileShare.Read) :
+                    File.Open(filename, FileMode.Open, mode == "r+" ? FileAccess.ReadWrite : FileAccess.Read, FileShare.Read);
+
+                try
+                {
+                    long bytes = fp.Length - offset;
+                    if (shape == null)
+                    {
+                        if (bytes % elsize != 0)
+                        {
+                            throw new ValueError("Size of available data is not a multiple of the data-type size.");
+                        }
+                        dims = new npy_intp[] { (npy_intp)(bytes / elsize) };
+                    }
+                    else
+                    {
+                        dims = shape.iDims.ToArray();
+                    }
+                    rowsize = _memmap_rowsize(dims);
+
+                    long nbytes = this.nbytes;
+                    if (nbytes == 0)
+                    {
+                        throw new ValueError("cannot mmap an empty file");
+                    }
+                    if (offset + nbytes > fp.Length)
+                    {
+                        if (mode == "r" || mode == "c")
+                        {
+                            throw new ValueError("mmap length is greater than file size");
+                        }
+                        fp.SetLength(offset + nbytes);
+                    }
+
+                    MemoryMappedFileAccess access = mode == "r" ? MemoryMappedFileAccess.Read :
+                                                    mode == "c" ? MemoryMappedFileAccess.CopyOnWrite : MemoryMappedFileAccess.ReadWrite;
+
+                    mmf = MemoryMappedFile.CreateFromFile(fp, null, 0, access, HandleInheritability.None, false);
+                    accessor = mmf.CreateViewAccessor(offset, nbytes, access);
+                }
+                catch
+                {
+                    Dispose();
+                    fp.Dispose();
+                    throw;
+                }
+            }
+
+            /// <summary>
+            /// Allocate a zero filled array in anonymous native memory.
+            /// </summary>
+            /// <param name="shape">The shape of the array.</param>
+            /// <param name="dtype">The data-type of the array elements. Default is Float64.</param>
+            public memmap(shape shape, dtype dtype = null)
+            {
+                if (shape == null)
+                {
+                    throw new ValueError("shape must be given for native memory");
+                }
+
+                this.filename = null;
+                this.mode = "w+";
+                this.offset = 0;
+                this.Dtype = dtype ?? np.Float64;
+                this.elsize = _memmap_elsize(this.Dtype);
+                this.dims = shape.iDims.ToArray();
+                this.rowsize = _memmap_rowsize(dims);
+
+                long nbytes = this.nbytes;
+                if (nbytes == 0)
+                {
+                    throw new ValueError("cannot mmap an empty file");
+                }
+
+                mmf = MemoryMappedFile.CreateNew(null, nbytes, MemoryMappedFileAccess.ReadWrite);
+                accessor = mmf.CreateViewAccessor(0, nbytes, MemoryMappedFileAccess.ReadWrite);
+            }
+
+            /// <summary>
+            /// Shape of the stored array.
+            /// </summary>
+            public shape shape
+            {
+                get { return new shape(dims, dims.Length); }
+            }
+
+            /// <summary>
+            /// Number of dimensions of the stored array.
+            /// </summary>
+            public int ndim
+            {
+                get { return dims.Length; }
+            }
+
+            /// <summary>
+            /// Number of elements in the stored array.
+            /// </summary>
+            public long size
+            {
+                get { return dims.Length == 0 ? 1 : dims[0] * rowsize; }
+            }
+
+            /// <summary>
+            /// Total bytes consumed by the elements of the stored array.
+            /// </summary>
+            public long nbytes
+            {
+                get { return size * elsize; }
+            }
+
+            /// <summary>
+            /// Number of rows along the first axis.
+            /// </summary>
+            public long rows
+            {
+                get { return dims.Length == 0 ? 1 : dims[0]; }
+            }
+
+            /// <summary>
+            /// Copy the whole stored array into a new ndarray.
+            /// </summary>
+            public ndarray read()
+            {
+                return read(0, rows);
+            }
+
+            /// <summary>
+            /// Copy the rows start:stop along the first axis into a new ndarray.
+            /// </summary>
+            /// <param name="start">First row to read.  Negative values count from the end.</param>
+            /// <param name="stop">One past the last row to read.  Negative values count from the end.</param>
+            public ndarray read(long start, long stop)
+            {
+                _check_open();
+                _check_rows(ref start, ref stop);
+
+                npy_intp[] chunkdims = dims.ToArray();
+                if (chunkdims.Length > 0)
+                {
+                    chunkdims[0] = (npy_intp)(stop - start);
+                }
+
+                ndarray chunk = np.empty(new shape(chunkdims, chunkdims.Length), Dtype);
+                _copy_rows(start, stop - start, chunk, false);
+                return chunk;
+            }
+
+            /// <summary>
+            /// Write values into the rows starting at start.  Values are broadcast to the shape of the rows they cover.
+            /// </summary>
+            /// <param name="start">First row to write.  Negative values count from the end.</param>
+            /// <param name="values">Values to store.  The first axis decides how many rows are written.</param>
+            public void write(long start, object values)
+            {
+                _check_open();
+                _check_writeable();
+
+                ndarray v = asanyarray(values);
+                long count = dims.Length == 0 || v.ndim < dims.Length ? 1 : v.Dim(0);
+                long stop = (start < 0 ? start + rows : start) + count;
+                _check_rows(ref start, ref stop);
+
+                npy_intp[] chunkdims = dims.ToArray();
+                if (chunkdims.Length > 0)
+                {
+                    chunkdims[0] = (npy_intp)count;
+                }
+
+                v = _broadcast_chunk(v, chunkdims);
+                _copy_rows(start, count, v, true);
+            }
+
+            /// <summary>
+            /// Copy the stored array out in consecutive blocks of rows.
+            /// </summary>
+            /// <param name="rows_per_chunk">Rows in each block.  If 0, blocks are sized to roughly 64 MB.</param>
+            public IEnumerable<ndarray> chunks(long rows_per_chunk = 0)
+            {
+                _check_open();
+                long step = _chunk_rows(rows_per_chunk);
+
+                for (long start = 0; start < rows; start += step)
+                {
+                    yield return read(start, Math.Min(start + step, rows));
+                }
+            }
+
+            /// <summary>
+            /// Replace the stored array, block by block, with the result of func applied to each block of rows.
+            /// </summary>
+            /// <param name="func">Called with a copy of each block; the result is broadcast back over the block.</param>
+            /// <param name="rows_per_chunk">Rows in each block.  If 0, blocks are sized to roughly 64 MB.</param>
+            public void update(Func<ndarray, ndarray> func, long rows_per_chunk = 0)
+            {
+                _check_open();
+                _check_writeable();
+                long step = _chunk_rows(rows_per_chunk);
+
+                for (long start = 0; start < rows; start += step)
+                {
+                    long stop = Math.Min(start + step, rows);
+                    ndarray result = func(read(start, stop));
+
+                    npy_intp[] chunkdims = dims.ToArray();
+                    if (chunkdims.Length > 0)
+                    {
+                        chunkdims[0] = (npy_intp)(stop - start);
+                    }
+                    result = _broadcast_chunk(result, chunkdims);
+                    _copy_rows(start, stop - start, result, true);
+                }
+            }
+
+            /// <summary>
+            /// Write any changes in the array to the file on disk.
+            /// </summary>
+            public void flush()
+            {
+                _check_open();
+                if (mode != "r" && mode != "c")
+                {
+                    accessor.Flush();
+                }
+            }
+
+            /// <summary>
+            /// Flush file backed storage and release the mapping.
+            /// </summary>
+            public void Dispose()
+            {
+                if (accessor != null)
+                {
+                    if (filename != null && mode != "r" && mode != "c")
+                    {
+                        accessor.Flush();
+                    }
+                    accessor.Dispose();
+                    accessor = null;
+                }
+                if (mmf != null)
+                {
+                    mmf.Dispose();
+                    mmf = null;
+                }
+            }
+
+            private void _check_open()
+            {
+                if (accessor == null)
+                {
+                    throw new ObjectDisposedException("memmap");
+                }
+            }
+
+            private void _check_writeable()
+            {
+                if (mode == "r")
+                {
+                    throw new ValueError("assignment destination is read-only");
+                }
+            }
+
+            private void _check_rows(ref long start, ref long stop)
+            {
+                long n = rows;
+                if (start < 0)
+                    start += n;
+                if (stop < 0)
+                    stop += n;
+
+                if (start < 0 || stop > n || start > stop)
+                {
+                    throw new Exception(string.Format("rows {0}:{1} are out of bounds for axis 0 with size {2}", start, stop, n));
+                }
+                if ((stop - start) * rowsize > int.MaxValue)
+                {
+                    throw new ValueError(string.Format("{0} rows are too many to copy into a single ndarray. Read the data in smaller blocks.", stop - start));
+                }
+            }
+
+            private long _chunk_rows(long rows_per_chunk)
+            {
+                if (rows_per_chunk < 0)
+                {
+                    throw new ValueError("rows_per_chunk must be non-negative");
+                }
+                if (rows_per_chunk == 0)
+                {
+                    rows_per_chunk = ChunkBytes / Math.Max(1, rowsize * elsize);
+                }
+                return Math.Max(1, Math.Min(rows_per_chunk, int.MaxValue / Math.Max(1, rowsize)));
+            }
+
+            /// <summary>
+            /// broadcasts values over a block of rows and returns them as a C ordered copy of the stored type.
+            /// broadcast_to returns a zero stride view, which ascontiguousarray would hand back uncopied.
+            /// </summary>
+            private ndarray _broadcast_chunk(ndarray values, npy_intp[] chunkdims)
+            {
+                ndarray chunk = broadcast_to(values, new shape(chunkdims, chunkdims.Length)).Copy(NPY_ORDER.NPY_CORDER);
+                return chunk.TypeNum == Dtype.TypeNum ? chunk : chunk.astype(Dtype);
+            }
+
+            private void _copy_rows(long start, long count, ndarray chunk, bool write)
+            {
+                VoidPtr data = chunk.DataAddress;
+                int index = (int)(data.data_offset >> chunk.ItemSizeDiv);
+                int n = (int)(count * rowsize);
+                long position = start * rowsize * elsize;
+
+                if (n == 0)
+                    return;
+
+                switch (data.datap)
+                {
+                    case bool[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case sbyte[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case byte[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case Int16[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case UInt16[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case Int32[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case UInt32[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case Int64[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case UInt64[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case float[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case double[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case decimal[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    case System.Numerics.Complex[] a:
+                        _copy(position, a, index, n, write);
+                        break;
+                    default:
+                        throw new Exception("Unsupported data type for memory mapped storage");
+                }
+            }
+
+            private void _copy<T>(long position, T[] array, int index, int count, bool write) where T : struct
+            {
+                if (write)
+                    accessor.WriteArray<T>(position, array, index, count);
+                else
+                    accessor.ReadArray<T>(position, array, index, count);
+            }
+
+            private static int _memmap_elsize(dtype dtype)
+            {
+                switch (dtype.TypeNum)
+                {
+                    case NPY_TYPES.NPY_BOOL:
+                    case NPY_TYPES.NPY_BYTE:
+                    case NPY_TYPES.NPY_UBYTE:
+                        return 1;
+                    case NPY_TYPES.NPY_INT16:
+                    case NPY_TYPES.NPY_UINT16:
+                        return 2;
+                    case NPY_TYPES.NPY_INT32:
+                    case NPY_TYPES.NPY_UINT32:
+                    case NPY_TYPES.NPY_FLOAT:
+                        return 4;
+                    case NPY_TYPES.NPY_INT64:
+                    case NPY_TYPES.NPY_UINT64:
+                    case NPY_TYPES.NPY_DOUBLE:
+                        return 8;
+                    case NPY_TYPES.NPY_DECIMAL:
+                    case NPY_TYPES.NPY_COMPLEX:
+                        return 16;
+                    default:
+                        throw new ValueError(string.Format("memmap does not support data type {0}. Only fixed size numeric types can be stored outside the managed heap.", dtype.TypeNum));
+                }
+            }
+
+            private static long _memmap_rowsize(npy_intp[] dims)
+            {
+                long rowsize = 1;
+                for (int i = 0; i < dims.Length; i++)
+                {
+                    if (dims[i] < 0)
+                    {
+                        throw new ValueError("negative dimensions are not allowed");
+                    }
+                    if (i > 0)
+                        rowsize *= dims[i];
+                }
+                return rowsize;
+            }
+        }
+    }
+}
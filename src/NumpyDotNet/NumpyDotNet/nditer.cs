@@ -192,6 +192,573 @@ namespace NumpyDotNet
 
     }
 
+    /// <summary>
+    /// Global flags for <see cref="nditer{T}"/>.
+    /// </summary>
+    [Flags]
+    public enum NPY_ITER_FLAGS : int
+    {
+        NPY_ITER_NONE = 0,
+        /// <summary>
+        /// User code does the innermost loop; each step hands out a whole chunk of elements.
+        /// </summary>
+        NPY_ITER_EXTERNAL_LOOP = 0x00000008,
+        /// <summary>
+        /// Chunks are copied through contiguous buffers when the operands are not, and operands
+        /// of another type are cast.
+        /// </summary>
+        NPY_ITER_BUFFERED = 0x00000200,
+    }
+
+    /// <summary>
+    /// Per operand flags for <see cref="nditer{T}"/>.
+    /// </summary>
+    [Flags]
+    public enum NPY_ITER_OPFLAGS : int
+    {
+        /// <summary>
+        /// The operand will be read from and written to.
+        /// </summary>
+        NPY_ITER_READWRITE = 0x00010000,
+        /// <summary>
+        /// The operand will only be read from.
+        /// </summary>
+        NPY_ITER_READONLY = 0x00020000,
+        /// <summary>
+        /// The operand will only be written to.
+        /// </summary>
+        NPY_ITER_WRITEONLY = 0x00040000,
+        /// <summary>
+        /// Allocate the operand if it is null.
+        /// </summary>
+        NPY_ITER_ALLOCATE = 0x01000000,
+    }
+
+    /// <summary>
+    /// Typed multi-dimensional iterator over one or more broadcast arrays.
+    /// Each MoveNext hands out a chunk of Count elements per operand as the underlying
+    /// T[], an offset and a stride, so user kernels can loop over the data directly.
+    /// </summary>
+    /// <typeparam name="T">element type of the operands</typeparam>
+    public class nditer<T> : IDisposable
+    {
+        private const npy_intp defaultBufferSize = 8192;
+
+        private ndarray[] ops;
+        private ndarray[] castFrom;
+        private NPY_ITER_OPFLAGS[] opflags;
+        private T[][] data;
+        private int nop;
+
+        // broadcast shape with the dimensions every operand walks contiguously merged
+        private npy_intp[] dims;
+        private npy_intp[][] strides;
+        private int last;
+
+        private bool external;
+        private bool buffered;
+        private npy_intp buffersize;
+        private T[][] buffers;
+
+        private shape _shape;
+        private npy_intp _itersize;
+        private npy_intp _iterindex;
+        private bool started;
+        private bool finished;
+
+        // position of the next chunk
+        private npy_intp[] coords;
+        private npy_intp[] pos;
+
+        // the current chunk
+        private npy_intp count;
+        private npy_intp[] chunkCoords;
+        private npy_intp[] chunkPos;
+        private T[][] chunkData;
+        private npy_intp[] chunkOffset;
+        private npy_intp[] chunkStride;
+        private bool[] chunkBuffered;
+        private npy_intp[] scratch;
+
+        /// <summary>
+        /// Typed iterator over a single array, one element at a time.
+        /// </summary>
+        /// <param name="a">array to iterate</param>
+        public nditer(ndarray a)
+            : this(new ndarray[] { a }, NPY_ITER_FLAGS.NPY_ITER_NONE, null)
+        {
+        }
+
+        /// <summary>
+        /// Typed iterator over broadcast operands.
+        /// </summary>
+        /// <param name="op">operands; a null operand flagged NPY_ITER_ALLOCATE is allocated with the broadcast shape</param>
+        /// <param name="flags">NPY_ITER_EXTERNAL_LOOP and/or NPY_ITER_BUFFERED</param>
+        /// <param name="op_flags">per operand flags, all NPY_ITER_READONLY when null</param>
+        /// <param name="buffersize">elements per chunk when buffered, 0 for the default</param>
+        public nditer(ndarray[] op, NPY_ITER_FLAGS flags, NPY_ITER_OPFLAGS[] op_flags, npy_intp buffersize = 0)
+        {
+            if (op == null || op.Length == 0)
+            {
+                throw new ValueError("nditer requires at least one operand");
+            }
+            if (op_flags != null && op_flags.Length != op.Length)
+            {
+                throw new ValueError("op_flags must have one entry per operand");
+            }
+
+            nop = op.Length;
+            external = (flags & NPY_ITER_FLAGS.NPY_ITER_EXTERNAL_LOOP) != 0;
+            buffered = (flags & NPY_ITER_FLAGS.NPY_ITER_BUFFERED) != 0;
+            this.buffersize = buffersize > 0 ? buffersize : defaultBufferSize;
+
+            opflags = new NPY_ITER_OPFLAGS[nop];
+            for (int i = 0; i < nop; i++)
+            {
+                opflags[i] = op_flags != null ? op_flags[i] : NPY_ITER_OPFLAGS.NPY_ITER_READONLY;
+            }
+
+            _shape = new shape(BroadcastShape(op));
+            _itersize = 1;
+            foreach (var d in _shape.iDims)
+                _itersize *= d;
+
+            PrepareOperands(op);
+            ComputeLayout();
+
+            coords = new npy_intp[dims.Length];
+            scratch = new npy_intp[dims.Length];
+            chunkCoords = new npy_intp[dims.Length];
+            pos = new npy_intp[nop];
+            chunkPos = new npy_intp[nop];
+            chunkData = new T[nop][];
+            chunkOffset = new npy_intp[nop];
+            chunkStride = new npy_intp[nop];
+            chunkBuffered = new bool[nop];
+            buffers = new T[nop][];
+
+            Reset();
+        }
+
+        /// <summary>
+        /// The operands being iterated, including allocated ones.
+        /// </summary>
+        public ndarray[] operands
+        {
+            get { return ops.Select((a, i) => castFrom[i] ?? a).ToArray(); }
+        }
+        /// <summary>
+        /// broadcast shape of the operands
+        /// </summary>
+        public shape shape
+        {
+            get { return _shape; }
+        }
+        public int ndim
+        {
+            get { return _shape.iDims.Length; }
+        }
+        public int nops
+        {
+            get { return nop; }
+        }
+        /// <summary>
+        /// total number of elements iterated
+        /// </summary>
+        public npy_intp itersize
+        {
+            get { return _itersize; }
+        }
+        /// <summary>
+        /// C order index of the first element of the current chunk
+        /// </summary>
+        public npy_intp iterindex
+        {
+            get { return _iterindex; }
+        }
+        /// <summary>
+        /// number of elements in the current chunk
+        /// </summary>
+        public npy_intp Count
+        {
+            get { return count; }
+        }
+
+        /// <summary>
+        /// array holding the current chunk of operand op
+        /// </summary>
+        public T[] Data(int op)
+        {
+            return chunkData[op];
+        }
+        /// <summary>
+        /// index in Data(op) of the first element of the current chunk
+        /// </summary>
+        public npy_intp Offset(int op)
+        {
+            return chunkOffset[op];
+        }
+        /// <summary>
+        /// distance in elements between consecutive elements of the current chunk
+        /// </summary>
+        public npy_intp Stride(int op)
+        {
+            return chunkStride[op];
+        }
+
+        /// <summary>
+        /// The current chunk of operand op as a contiguous segment.  Always available when
+        /// buffered, otherwise only when the operand is contiguous along the inner loop.
+        /// </summary>
+        public ArraySegment<T> Chunk(int op)
+        {
+            if (chunkStride[op] != 1 && count > 1)
+            {
+                throw new ValueError("operand is not contiguous in the inner loop, use NPY_ITER_BUFFERED");
+            }
+            return new ArraySegment<T>(chunkData[op], (int)chunkOffset[op], (int)count);
+        }
+
+        /// <summary>
+        /// element i of the current chunk of operand op
+        /// </summary>
+        public T this[int op, npy_intp i]
+        {
+            get { return chunkData[op][chunkOffset[op] + i * chunkStride[op]]; }
+            set { chunkData[op][chunkOffset[op] + i * chunkStride[op]] = value; }
+        }
+
+        /// <summary>
+        /// Moves to the next chunk, writing the previous one back to its operands when it was buffered.
+        /// </summary>
+        /// <returns>false once every element has been visited</returns>
+        public bool MoveNext()
+        {
+            if (finished)
+                return false;
+
+            if (started)
+            {
+                FlushChunk();
+                Advance(count);
+                _iterindex += count;
+            }
+            started = true;
+
+            if (_iterindex >= _itersize)
+            {
+                Finish();
+                return false;
+            }
+
+            npy_intp rowLeft = dims[last] - coords[last];
+            if (!external)
+                count = 1;
+            else if (buffered)
+                count = Math.Min(buffersize, _itersize - _iterindex);
+            else
+                count = rowLeft;
+
+            Array.Copy(coords, chunkCoords, coords.Length);
+            Array.Copy(pos, chunkPos, nop);
+
+            for (int i = 0; i < nop; i++)
+            {
+                npy_intp stride = strides[i][last];
+                if (count <= rowLeft && (!buffered || stride == 1 || count == 1))
+                {
+                    chunkBuffered[i] = false;
+                    chunkData[i] = data[i];
+                    chunkOffset[i] = pos[i];
+                    chunkStride[i] = stride;
+                }
+                else
+                {
+                    if (buffers[i] == null)
+                        buffers[i] = new T[buffersize];
+                    chunkBuffered[i] = true;
+                    chunkData[i] = buffers[i];
+                    chunkOffset[i] = 0;
+                    chunkStride[i] = 1;
+                    if ((opflags[i] & NPY_ITER_OPFLAGS.NPY_ITER_WRITEONLY) == 0)
+                    {
+                        CopyChunk(i, true);
+                    }
+                }
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        /// Restarts the iteration at the first element.
+        /// </summary>
+        public void Reset()
+        {
+            if (started && !finished)
+            {
+                FlushChunk();
+            }
+
+            Array.Clear(coords, 0, coords.Length);
+            for (int i = 0; i < nop; i++)
+            {
+                pos[i] = ops[i].Array.data.data_offset >> ops[i].ItemSizeDiv;
+            }
+            _iterindex = 0;
+            count = 0;
+            started = false;
+            finished = false;
+        }
+
+        /// <summary>
+        /// Writes back a pending buffered chunk and any operands that were cast.
+        /// </summary>
+        public void Dispose()
+        {
+            if (started && !finished)
+            {
+                FlushChunk();
+                Finish();
+            }
+        }
+
+        private npy_intp[] BroadcastShape(ndarray[] op)
+        {
+            int nd = 0;
+            foreach (var a in op)
+            {
+                if (a != null)
+                    nd = Math.Max(nd, a.ndim);
+            }
+
+            npy_intp[] result = new npy_intp[nd];
+            for (int i = 0; i < nd; i++)
+                result[i] = 1;
+
+            foreach (var a in op)
+            {
+                if (a == null)
+                    continue;
+                npy_intp[] adims = a.Array.dimensions;
+                for (int i = 0; i < a.ndim; i++)
+                {
+                    int j = nd - a.ndim + i;
+                    if (adims[i] == result[j] || adims[i] == 1)
+                        continue;
+                    if (result[j] != 1)
+                    {
+                        throw new ValueError(string.Format("operands could not be broadcast together with shapes {0}",
+                            string.Join(" ", op.Where(o => o != null).Select(o => o.shape.ToString()))));
+                    }
+                    result[j] = adims[i];
+                }
+            }
+
+            return result;
+        }
+
+        private void PrepareOperands(ndarray[] op)
+        {
+            dtype dt = NpyCoreApi.DescrFromType(DefaultArrayHandlers.GetArrayType(default(T)));
+
+            ops = new ndarray[nop];
+            castFrom = new ndarray[nop];
+            data = new T[nop][];
+
+            for (int i = 0; i < nop; i++)
+            {
+                ndarray a = op[i];
+                bool writeable = (opflags[i] & (NPY_ITER_OPFLAGS.NPY_ITER_WRITEONLY | NPY_ITER_OPFLAGS.NPY_ITER_READWRITE)) != 0;
+
+                if (a == null)
+                {
+                    if ((opflags[i] & NPY_ITER_OPFLAGS.NPY_ITER_ALLOCATE) == 0)
+                    {
+                        throw new ValueError(string.Format("Iterator operand {0} is null, but the allocate flag is not set", i));
+                    }
+                    a = np.zeros(_shape, dt);
+                }
+                else if (writeable)
+                {
+                    if (!a.IsWriteable)
+                    {
+                        throw new ValueError(string.Format("Iterator operand {0} is flagged as writeable, but is a read-only array", i));
+                    }
+                    if (!a.shape.iDims.SequenceEqual(_shape.iDims))
+                    {
+                        throw new ValueError(string.Format("non-broadcastable output operand with shape {0} doesn't match the broadcast shape {1}", a.shape, _shape));
+                    }
+                }
+
+                if (!(a.Array.data.datap is T[]))
+                {
+                    if (!buffered)
+                    {
+                        throw new TypeError(string.Format("Iterator operand {0} is {1}, not {2}, and buffering was not enabled", i, a.Dtype, dt));
+                    }
+
+                    // casting happens once for the whole operand, writeable ones are cast back when the iteration finishes
+                    ndarray typed = a.astype(dt);
+                    if (writeable)
+                        castFrom[i] = a;
+                    a = typed;
+                }
+
+                ops[i] = a;
+                data[i] = (T[])a.Array.data.datap;
+            }
+        }
+
+        private void ComputeLayout()
+        {
+            int nd = _shape.iDims.Length;
+
+            // element strides of every operand against the broadcast shape, 0 where it is broadcast
+            List<npy_intp> d = new List<npy_intp>();
+            List<npy_intp[]> s = new List<npy_intp[]>();
+            for (int j = 0; j < nd; j++)
+            {
+                if (_shape.iDims[j] == 1)
+                    continue;
+
+                npy_intp[] js = new npy_intp[nop];
+                for (int i = 0; i < nop; i++)
+                {
+                    int k = ops[i].ndim - nd + j;
+                    if (k >= 0 && ops[i].Array.dimensions[k] != 1)
+                        js[i] = ops[i].Array.strides[k] >> ops[i].ItemSizeDiv;
+                }
+
+                // merge with the previous dimension when every operand walks straight across both
+                int prev = d.Count - 1;
+                bool merge = prev >= 0;
+                for (int i = 0; merge && i < nop; i++)
+                {
+                    merge = s[prev][i] == js[i] * _shape.iDims[j];
+                }
+
+                if (merge)
+                {
+                    d[prev] *= _shape.iDims[j];
+                    s[prev] = js;
+                }
+                else
+                {
+                    d.Add(_shape.iDims[j]);
+                    s.Add(js);
+                }
+            }
+
+            if (d.Count == 0)
+            {
+                d.Add(_itersize);
+                s.Add(new npy_intp[nop]);
+            }
+
+            dims = d.ToArray();
+            last = dims.Length - 1;
+            strides = new npy_intp[nop][];
+            for (int i = 0; i < nop; i++)
+            {
+                strides[i] = new npy_intp[dims.Length];
+                for (int j = 0; j < dims.Length; j++)
+                    strides[i][j] = s[j][i];
+            }
+        }
+
+        private void Advance(npy_intp n)
+        {
+            while (n > 0)
+            {
+                npy_intp run = Math.Min(n, dims[last] - coords[last]);
+                coords[last] += run;
+                for (int i = 0; i < nop; i++)
+                    pos[i] += run * strides[i][last];
+                n -= run;
+
+                for (int j = last; j > 0 && coords[j] == dims[j]; j--)
+                {
+                    for (int i = 0; i < nop; i++)
+                        pos[i] += strides[i][j - 1] - coords[j] * strides[i][j];
+                    coords[j] = 0;
+                    coords[j - 1]++;
+                }
+            }
+        }
+
+        /// <summary>
+        /// copies the current chunk of operand i between the operand and its buffer, row by row.
+        /// </summary>
+        private void CopyChunk(int i, bool gather)
+        {
+            T[] src = data[i];
+            T[] buf = buffers[i];
+            npy_intp[] s = strides[i];
+            npy_intp inner = s[last];
+            npy_intp p = chunkPos[i];
+            Array.Copy(chunkCoords, scratch, scratch.Length);
+
+            npy_intp done = 0;
+            while (done < count)
+            {
+                npy_intp run = Math.Min(count - done, dims[last] - scratch[last]);
+                if (inner == 1)
+                {
+                    if (gather)
+                        Array.Copy(src, p, buf, done, run);
+                    else
+                        Array.Copy(buf, done, src, p, run);
+                }
+                else if (gather)
+                {
+                    for (npy_intp k = 0; k < run; k++)
+                        buf[done + k] = src[p + k * inner];
+                }
+                else
+                {
+                    for (npy_intp k = 0; k < run; k++)
+                        src[p + k * inner] = buf[done + k];
+                }
+
+                done += run;
+                p += run * inner;
+                scratch[last] += run;
+
+                for (int j = last; j > 0 && scratch[j] == dims[j]; j--)
+                {
+                    p += s[j - 1] - scratch[j] * s[j];
+                    scratch[j] = 0;
+                    scratch[j - 1]++;
+                }
+            }
+        }
+
+        private void FlushChunk()
+        {
+            for (int i = 0; i < nop; i++)
+            {
+                if (chunkBuffered[i] && (opflags[i] & (NPY_ITER_OPFLAGS.NPY_ITER_WRITEONLY | NPY_ITER_OPFLAGS.NPY_ITER_READWRITE)) != 0)
+                {
+                    CopyChunk(i, false);
+                }
+                chunkBuffered[i] = false;
+            }
+        }
+
+        private void Finish()
+        {
+            finished = true;
+            for (int i = 0; i < nop; i++)
+            {
+                if (castFrom[i] != null)
+                {
+                    NpyCoreApi.CopyAnyInto(castFrom[i], ops[i]);
+                }
+            }
+        }
+    }
+
     /// <summary>
     /// An N-dimensional iterator object to index arrays.
     /// </summary>
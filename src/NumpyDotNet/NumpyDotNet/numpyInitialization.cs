@@ -83,7 +83,13 @@ namespace NumpyDotNet
             public string error;
         }
 
+        /// <summary>
+        /// Most recent errors reported by the core library, oldest first.  Kept to a bounded size
+        /// so long running services do not accumulate them; lock the list before enumerating it
+        /// while other threads may be running array operations.
+        /// </summary>
         public static List<NumpyExceptionInfo> NumpyErrors = new List<NumpyExceptionInfo>();
+        private const int MaxRecordedNumpyErrors = 1000;
 
         static void ErrorSet_handler(string FunctionName, npyexc_type et, string error)
         {
@@ -91,30 +97,22 @@ namespace NumpyDotNet
             {
                 throw new Exception("Got an unexpected .NET exception");
             }
-            NumpyErrors.Add(new NumpyExceptionInfo() { FunctionName = FunctionName, exctype = et, error = error });
 
-            switch (et)
-            {
-                case npyexc_type.NpyExc_MemoryError:
-                case npyexc_type.NpyExc_IOError:
-                case npyexc_type.NpyExc_ValueError:
-                case npyexc_type.NpyExc_TypeError:
-                case npyexc_type.NpyExc_IndexError:
-                case npyexc_type.NpyExc_RuntimeError:
-                case npyexc_type.NpyExc_AttributeError:
-                case npyexc_type.NpyExc_NotImplementedError:
-                case npyexc_type.NpyExc_DotNetException:
-                case npyexc_type.NpyExc_OverflowError:
-                case npyexc_type.NpyExc_FloatingPointError:
-                    throw new Exception(string.Format("({0}) {1}: {2}", et, FunctionName, error));
-
-                case npyexc_type.NpyExc_ComplexWarning:
-                case npyexc_type.NpyExc_NoError:
-                    break;
+            var context = new NpyCoreApi.NpyErrorContext(FunctionName, et, error);
 
+            lock (NumpyErrors)
+            {
+                if (NumpyErrors.Count >= MaxRecordedNumpyErrors)
+                {
+                    NumpyErrors.RemoveAt(0);
+                }
+                NumpyErrors.Add(new NumpyExceptionInfo() { FunctionName = FunctionName, exctype = et, error = error });
             }
 
-            return;
+            if (context.IsError)
+            {
+                throw context.ToException();
+            }
         }
 
         static bool ErrorOccurred_handler(string FunctionName)
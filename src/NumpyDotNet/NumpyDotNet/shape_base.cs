@@ -2,6 +2,9 @@
 using System.Collections.Generic;
 using System.Text;
 using System.Linq;
+using System.Runtime.ExceptionServices;
+using System.Threading.Tasks;
+using NumpyLib;
 #if NPY_INTP_64
 using npy_intp = System.Int64;
 using npy_ucs4 = System.Int64;
@@ -319,11 +322,31 @@ namespace NumpyDotNet
         /// <summary>
         /// Apply a function to 1-D slices along the given axis.
         /// </summary>
-        /// <param name="fn">This function should accept 1-D arrays. It is applied to 1-D slices of arr along the specified axis.</param>
+        /// <param name="func1d">This function should accept 1-D arrays. It is applied to 1-D slices of arr along the specified axis.</param>
         /// <param name="axis">Axis along which arr is sliced.</param>
         /// <param name="arr">Input array.</param>
+        /// <param name="args">Additional arguments to func1d.</param>
         /// <returns></returns>
         public static ndarray apply_along_axis(apply_along_axis_fn func1d, int axis, ndarray arr, params object[] args)
+        {
+            return _apply_along_axis(func1d, axis, arr, false, args);
+        }
+
+        /// <summary>
+        /// Apply a function to 1-D slices along the given axis, evaluating the slices in parallel.
+        /// </summary>
+        /// <param name="func1d">This function should accept 1-D arrays. It must be pure: it is called concurrently from several threads,
+        /// in no particular order, and the 1-D slice it receives is only valid for the duration of the call.</param>
+        /// <param name="axis">Axis along which arr is sliced.</param>
+        /// <param name="arr">Input array.</param>
+        /// <param name="args">Additional arguments to func1d.</param>
+        /// <returns></returns>
+        public static ndarray apply_along_axis_parallel(apply_along_axis_fn func1d, int axis, ndarray arr, params object[] args)
+        {
+            return _apply_along_axis(func1d, axis, arr, true, args);
+        }
+
+        private static ndarray _apply_along_axis(apply_along_axis_fn func1d, int axis, ndarray arr, bool parallel, object[] args)
         {
             if (func1d == null)
             {
@@ -347,35 +370,18 @@ namespace NumpyDotNet
 
             var inarr_view = transpose(arr, in_dims);
 
-            // compute indices for the iteration axes, and append a trailing ellipsis to
-            // prevent 0d arrays decaying to scalars, which fixes gh-8642
-
-            npy_intp[] newshape = new npy_intp[inarr_view.shape.iDims.Length - 1];
-            Array.Copy(inarr_view.shape.iDims, 0, newshape, 0, inarr_view.shape.iDims.Length - 1);
-            var indices = new ndindex(new shape(newshape));
-
-            List<object> inds = new List<object>();
-            foreach (var _ind in indices)
-            {
-                npy_intp[] ind = _ind as npy_intp[];
-                inds.Add(new object[] { ind[0], new Ellipsis() });
-            }
-
-            object ind0 = null;
-            ndarray res = null;
-            int res_dimadjust = 0;
-            foreach (var _ind0 in inds)
+            // every 1-D slice of inarr_view is its data offset plus the stride of the last axis,
+            // so the slices are located up front instead of indexing the view once per slice.
+            npy_intp[] lane_offsets = _apply_along_axis_offsets(inarr_view);
+            if (lane_offsets.Length == 0)
             {
-                ind0 = _ind0;
-                var f1 = func1d(inarr_view.A(ind0), args);
-                if (np.IsNumericType(f1))
-                {
-                    res_dimadjust = 1;
-                }
-                res = asanyarray(f1);
-                break;
+                throw new ValueError("Cannot apply_along_axis when any iteration dimensions are 0");
             }
 
+            var lane0 = new apply_along_axis_lane(inarr_view);
+            var f1 = func1d(lane0.Seek(lane_offsets[0]), args);
+            int res_dimadjust = np.IsNumericType(f1) ? 1 : 0;
+            ndarray res = asanyarray(f1);
 
             // build a buffer for storing evaluations of func1d.
             // remove the requested axis, and add the new ones on the end.
@@ -389,7 +395,6 @@ namespace NumpyDotNet
                 buffShape.Add(res.shape.iDims[i]);
             var buff = zeros(new shape(buffShape), dtype: res.Dtype);
 
-
             // permutation of axes such that out = buff.transpose(buff_permute)
             var buff_dims = PythonFunction.range(0, buff.ndim);
             List<npy_intp> buff_permute = new List<npy_intp>();
@@ -400,14 +405,42 @@ namespace NumpyDotNet
             for (int i = axis; i < buff.ndim - (res.ndim-res_dimadjust); i++)
                 buff_permute.Add(buff_dims[i]);
 
-            // matrices have a nasty __array_prepare__ and __array_wrap__
-            //if not isinstance(res, matrix):
-            //    buff = res.__array_prepare__(buff)
+            // each evaluation is written straight into its block of buff.
+            npy_intp[] res_dims = buffShape.Skip(nd - 1).ToArray();
+            lane0.SetOutput(buff, res_dims);
+            lane0.Store(0, res);
 
-            buff[ind0] =  res;
-            foreach (var ind in inds)
+            npy_intp lanes = lane_offsets.Length;
+            if (parallel && lanes > 2)
             {
-                buff[ind] = asanyarray(func1d(inarr_view.A(ind), args));
+                npy_intp grain = Math.Max(1, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp) / Math.Max(1, lane0.Length));
+
+                try
+                {
+                    Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(lanes - 1, grain), NpyParallelScheduler.Options,
+                        () => new apply_along_axis_lane(inarr_view).SetOutput(buff, res_dims),
+                        (seg, state, lane) =>
+                        {
+                            for (npy_intp i = seg.start + 1; i < seg.end + 1; i++)
+                            {
+                                lane.Store(i, func1d(lane.Seek(lane_offsets[i]), args));
+                            }
+                            return lane;
+                        },
+                        lane => { });
+                }
+                catch (AggregateException ex)
+                {
+                    // surface the user function's exception as the serial path would
+                    ExceptionDispatchInfo.Capture(ex.Flatten().InnerExceptions[0]).Throw();
+                }
+            }
+            else
+            {
+                for (npy_intp i = 1; i < lanes; i++)
+                {
+                    lane0.Store(i, func1d(lane0.Seek(lane_offsets[i]), args));
+                }
             }
 
             if (!res.IsMatrix)
@@ -427,6 +460,120 @@ namespace NumpyDotNet
 
         }
 
+        /// <summary>
+        /// byte offsets of every 1-D slice along the last axis of arr, in C order of the remaining axes.
+        /// </summary>
+        private static npy_intp[] _apply_along_axis_offsets(ndarray arr)
+        {
+            npy_intp[] dims = arr.Array.dimensions;
+            npy_intp[] strides = arr.Array.strides;
+            int outer = arr.ndim - 1;
+
+            npy_intp count = 1;
+            for (int i = 0; i < outer; i++)
+                count *= dims[i];
+
+            npy_intp[] offsets = new npy_intp[count];
+            npy_intp[] index = new npy_intp[outer];
+            npy_intp offset = 0;
+
+            for (npy_intp lane = 0; lane < count; lane++)
+            {
+                offsets[lane] = offset;
+                for (int i = outer - 1; i >= 0; i--)
+                {
+                    offset += strides[i];
+                    if (++index[i] < dims[i])
+                        break;
+                    offset -= strides[i] * dims[i];
+                    index[i] = 0;
+                }
+            }
+
+            return offsets;
+        }
+
+        /// <summary>
+        /// One 1-D view onto the input and one onto the output block of a lane.  Both are
+        /// moved from lane to lane by pointing them at a new offset, so a worker allocates
+        /// its views once no matter how many lanes it evaluates.
+        /// </summary>
+        private class apply_along_axis_lane
+        {
+            private ndarray in_view;
+            private VoidPtr in_data;
+
+            private ndarray buff;
+            private ndarray out_view;
+            private VoidPtr out_data;
+            private npy_intp out_size;
+            private npy_intp out_step;
+
+            public apply_along_axis_lane(ndarray inarr_view)
+            {
+                int nd = inarr_view.ndim;
+                in_data = inarr_view.Array.data;
+                in_view = NpyCoreApi.NewView(inarr_view.Dtype, 1,
+                    new npy_intp[] { inarr_view.Array.dimensions[nd - 1] },
+                    new npy_intp[] { inarr_view.Array.strides[nd - 1] },
+                    inarr_view, 0, false);
+            }
+
+            public npy_intp Length
+            {
+                get { return in_view.Array.dimensions[0]; }
+            }
+
+            public apply_along_axis_lane SetOutput(ndarray buff, npy_intp[] res_dims)
+            {
+                if (res_dims.Length == 0)
+                {
+                    res_dims = new npy_intp[] { 1 };
+                }
+
+                npy_intp[] res_strides = new npy_intp[res_dims.Length];
+                out_size = 1;
+                for (int i = res_dims.Length - 1; i >= 0; i--)
+                {
+                    res_strides[i] = out_size * buff.ItemSize;
+                    out_size *= res_dims[i];
+                }
+
+                this.buff = buff;
+                out_data = buff.Array.data;
+                out_step = out_size * buff.ItemSize;
+                out_view = NpyCoreApi.NewView(buff.Dtype, res_dims.Length, res_dims, res_strides, buff, 0, false);
+                return this;
+            }
+
+            public ndarray Seek(npy_intp offset)
+            {
+                in_view.Array.data = new VoidPtr(in_data, offset);
+                return in_view;
+            }
+
+            public void Store(npy_intp lane, object result)
+            {
+                npy_intp offset = lane * out_step;
+                if (out_size == 1 && np.IsNumericType(result))
+                {
+                    buff.Array.descr.f.setitem(offset, result, buff.Array);
+                    return;
+                }
+
+                ndarray r = asanyarray(result);
+                out_view.Array.data = new VoidPtr(out_data, offset);
+                if (r.size == out_size)
+                {
+                    NpyCoreApi.CopyAnyInto(out_view, r);
+                }
+                else
+                {
+                    out_view[new Ellipsis()] = r;
+                }
+            }
+        }
+
         #endregion
 
         #region apply_over_axis
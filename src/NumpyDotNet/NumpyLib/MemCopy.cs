@@ -4821,7 +4821,7 @@ namespace NumpyLib
         {
             if (true)
             {
-                Parallel.For(0, n_left, i =>
+                Parallel.For(0, n_left, numpyinternal.parallelOptions, i =>
                 //for (int i = 0; i < n_left; i++)
                 {
                     npy_intp nn = n + i;
@@ -4842,7 +4842,7 @@ namespace NumpyLib
 
 
                 npy_intp loop_cnt = n1 - n2 + 1;
-                Parallel.For(0, loop_cnt, i =>
+                Parallel.For(0, loop_cnt, numpyinternal.parallelOptions, i =>
                 //for (int i = 0; i < loop_cnt; i++)
                 {
                     VoidPtr nip1 = new VoidPtr(ip1);
@@ -4858,7 +4858,7 @@ namespace NumpyLib
                 op.data_offset += os * loop_cnt;
 
 
-                Parallel.For(0, n_right, i =>
+                Parallel.For(0, n_right, numpyinternal.parallelOptions, i =>
                 //for (int i = 0; i < n_right; i++)
                 {
                     npy_intp nn = n;
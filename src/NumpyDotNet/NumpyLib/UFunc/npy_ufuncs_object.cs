@@ -33,7 +33,6 @@
 #define BUFFER_UFUNCLOOP // doesn't seem to be used.  May only be useful if we have unaligned data which is not possible in .NET I think
 
 using System;
-using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.Linq;
@@ -209,34 +208,44 @@ namespace NumpyLib
 
     }
 
-    internal class UFUNCLoopWorkerParams
+    /// <summary>
+    /// private state of one block of rows in a parallel reduction.  Each block owns its own copies of
+    /// the loop pointers and iterators so that no two threads ever write to the same object.
+    /// </summary>
+    internal class UFUNCReductionBlock
     {
-        public UFUNCLoopWorkerParams(GenericReductionOp op, VoidPtr[] bufptr, npy_intp mm, npy_intp[] steps, UFuncOperation ops)
+        public UFUNCReductionBlock(NpyUFuncReduceObject loop, npy_intp start)
         {
-            npy_intp i = 0;
+            bufptr = new VoidPtr[3];
+            bufptr[0] = new VoidPtr(loop.bufptr[0]);
+            bufptr[1] = new VoidPtr(loop.it.dataptr);
+            bufptr[2] = new VoidPtr(loop.bufptr[0]);
 
-            this.op = op;
-
-            this.bufptr = new VoidPtr[bufptr.Length];
-            foreach (var vp in bufptr)
+            it = loop.it.copy();
+            numpyinternal.NpyArray_ITER_WALK(it, start);
+            if (loop.rit != null)
             {
-                this.bufptr[i] = new VoidPtr(vp);
-                i++;
+                rit = loop.rit.copy();
+                numpyinternal.NpyArray_ITER_WALK(rit, start);
             }
 
-            this.N = mm;
-
-            this.steps = new npy_intp[steps.Length];
-            Array.Copy(steps, this.steps, steps.Length);
+            helper = MemCopy.GetMemcopyHelper(bufptr[0]);
+            helper.memmove_init(bufptr[0], it.dataptr);
+        }
 
-            this.ops = ops;
+        public void Next()
+        {
+            numpyinternal.NpyArray_ITER_NEXT(it);
+            if (rit != null)
+            {
+                numpyinternal.NpyArray_ITER_NEXT(rit);
+            }
         }
 
-        public GenericReductionOp op;
         public VoidPtr[] bufptr;
-        public npy_intp N;
-        public npy_intp[] steps;
-        public UFuncOperation ops;
+        public NpyArrayIterObject it;
+        public NpyArrayIterObject rit;
+        public ICopyHelper helper;
     }
 
     /* A linked-list of function information for
@@ -1160,7 +1169,7 @@ namespace NumpyLib
                     var UFuncHandler = GetGeneralReductionUFuncHandler(operation, loop.bufptr);
 
                     var loopcnt = loop.size - loop.index;
-                    if (loopcnt <= 1 || UFuncHandler == null)
+                    if (loopcnt < 1 || UFuncHandler == null || (loopcnt == 1 && !NpyUFunc_CanSplitRow(loop, self.ops)))
                     {
                         while (loop.index < loop.size)
                         {
@@ -1179,62 +1188,31 @@ namespace NumpyLib
                         }
                     }
                     else
+                    if (loopcnt == 1)
                     {
-                        ConcurrentQueue<UFUNCLoopWorkerParams> workToDo = new ConcurrentQueue<UFUNCLoopWorkerParams>();
-
-                        bool HasError = false;
-                        Task workerThread = null;
-                        bool IsCompleted = false;
+                        // a single long row, e.g. a full reduction: reduce blocks of the row in parallel and combine the partial results
+                        bool ok = NpyUFunc_ReduceSplitRow(loop, UFuncHandler, self.ops);
+                        loop.index = loop.size;
+                        if (!ok)
+                            goto fail;
+                    }
+                    else
+                    {
+                        npy_intp outStart = loop.bufptr[0].data_offset;
 
-                        while (loop.index < loop.size)
+                        bool ok = NpyUFunc_ReduceRows(loop, loop.N + 1, (block, row) =>
                         {
-                            helper.memmove(loop.bufptr[0].data_offset, loop.it.dataptr.data_offset, loop.outsize);
-                            /* Adjust input pointer */
-                            loop.bufptr[1] = loop.it.dataptr + loop.steps[1];
-
-                            // put on queue for worker task to process
-                            workToDo.Enqueue(new UFUNCLoopWorkerParams(operation, loop.bufptr, loop.N, loop.steps, self.ops));
-
-                            if (workerThread == null)
-                            {
-                                // start worker thread to process the queued up work
-                                workerThread = Task.Factory.StartNew(() =>
-                                {
-                                    while (true)
-                                    {
-                                        Parallel.For(0, workToDo.Count(), xxx =>
-                                        {
-                                            UFUNCLoopWorkerParams work = null;
-                                            if (workToDo.TryDequeue(out work))
-                                            {
-                                                UFuncHandler(work.bufptr, work.steps, work.ops, work.N);
-                                                if (!NPY_UFUNC_CHECK_ERROR(loop))
-                                                {
-                                                    HasError = true;
-                                                }
-                                            }
-
-                                        });
-
-                                        if (workToDo.Count() == 0 && IsCompleted)
-                                            break;
-                                    }
-
-                                });
-                            }
-
-
-                            NpyArray_ITER_NEXT(loop.it);
-                            loop.bufptr[0] += loop.outsize;
-                            loop.bufptr[2] = loop.bufptr[0];
-                            loop.index++;
-                        }
-
-                        IsCompleted = true;
+                            VoidPtr[] bufptr = block.bufptr;
 
-                        workerThread.Wait();
+                            bufptr[0].data_offset = outStart + row * loop.outsize;
+                            bufptr[2].data_offset = bufptr[0].data_offset;
+                            block.helper.memmove(bufptr[0].data_offset, block.it.dataptr.data_offset, loop.outsize);
+                            /* Adjust input pointer */
+                            bufptr[1].data_offset = block.it.dataptr.data_offset + loop.steps[1];
 
-                        if (HasError)
+                            UFuncHandler(bufptr, loop.steps, self.ops, loop.N);
+                        });
+                        if (!ok)
                             goto fail;
                     }
 
@@ -1404,68 +1382,20 @@ namespace NumpyLib
                     }
                     else
                     {
-                        ConcurrentQueue<UFUNCLoopWorkerParams> workToDo = new ConcurrentQueue<UFUNCLoopWorkerParams>();
-
-                        bool HasError = false;
-                        Task workerThread = null;
-                        bool IsCompleted = false;
-
-                        while (loop.index < loop.size)
+                        bool ok = NpyUFunc_ReduceRows(loop, loop.N + 1, (block, row) =>
                         {
-                            helper.memmove(loop.bufptr[0].data_offset, loop.it.dataptr.data_offset, loop.outsize);
-                            /* Adjust input pointer */
-                            loop.bufptr[1] = loop.it.dataptr + loop.steps[1];
-
-                            workToDo.Enqueue(new UFUNCLoopWorkerParams(operation, loop.bufptr, loop.N, loop.steps, self.ops));
-
-                            if (workerThread == null)
-                            {
-                                // start worker thread to process the queued up work
-                                workerThread = Task.Factory.StartNew(() =>
-                                {
-                                    while (true)
-                                    {
-                                        Parallel.For(0, workToDo.Count(), xxx =>
-                                        {
-                                            UFUNCLoopWorkerParams work = null;
-                                            if (workToDo.TryDequeue(out work))
-                                            {
-                                                UFuncHandler(work.bufptr, work.steps, work.ops, work.N);
-                                                if (!NPY_UFUNC_CHECK_ERROR(loop))
-                                                {
-                                                    HasError = true;
-                                                }
-                                            }
-
-                                        });
-
-                                        if (workToDo.Count() == 0)
-                                        {
-                                            if (IsCompleted)
-                                                break;
+                            VoidPtr[] bufptr = block.bufptr;
 
-                                            //System.Threading.Thread.Sleep(100);
-                                        }
-                                    
-                                    }
-
-                                });
-                            }
-
-                            NpyArray_ITER_NEXT(loop.it);
-                            NpyArray_ITER_NEXT(loop.rit);
-                            loop.bufptr[0] = loop.rit.dataptr;
-                            loop.bufptr[2] = loop.bufptr[0] + loop.steps[0];
-                            loop.index++;
-                        }
-
-                        IsCompleted = true;
-
-                        workerThread.Wait();
+                            bufptr[0].data_offset = block.rit.dataptr.data_offset;
+                            bufptr[2].data_offset = bufptr[0].data_offset + loop.steps[0];
+                            block.helper.memmove(bufptr[0].data_offset, block.it.dataptr.data_offset, loop.outsize);
+                            /* Adjust input pointer */
+                            bufptr[1].data_offset = block.it.dataptr.data_offset + loop.steps[1];
 
-                        if (HasError)
+                            UFuncHandler(bufptr, loop.steps, self.ops, loop.N);
+                        });
+                        if (!ok)
                             goto fail;
-
                     }
 
 
@@ -1654,89 +1584,39 @@ namespace NumpyLib
                     }
                     else
                     {
-                        ConcurrentQueue<UFUNCLoopWorkerParams> workToDo = new ConcurrentQueue<UFUNCLoopWorkerParams>();
+                        npy_intp[] indices = (npy_intp[])NpyArray_BYTES(ind).datap;
+                        npy_intp axisLength = NpyArray_DIM(arr, axis);
+                        npy_intp outStride = NpyArray_STRIDE(loop.ret, axis);
 
-                        bool HasError = false;
-                        Task workerThread = null;
-                        bool IsCompleted = false;
-
-                        while (loop.index < loop.size)
+                        bool ok = NpyUFunc_ReduceRows(loop, axisLength, (block, row) =>
                         {
-                            ptr = (npy_intp[])NpyArray_BYTES(ind).datap;
-                            for (i = 0; i < nn; i++)
-                            {
-                                loop.bufptr[1] = loop.it.dataptr + ptr[i] * loop.steps[1];
+                            VoidPtr[] bufptr = block.bufptr;
 
-                                helper.memmove_init(loop.bufptr[0], loop.bufptr[1]);
-                                helper.memcpy(loop.bufptr[0].data_offset, loop.bufptr[1].data_offset, loop.outsize);
+                            bufptr[0].data_offset = block.rit.dataptr.data_offset;
+                            for (npy_intp k = 0; k < nn; k++)
+                            {
+                                bufptr[1].data_offset = block.it.dataptr.data_offset + indices[k] * loop.steps[1];
+                                block.helper.memcpy(bufptr[0].data_offset, bufptr[1].data_offset, loop.outsize);
 
-                                mm = (i == nn - 1 ? NpyArray_DIM(arr, axis) - ptr[i] : ptr[i + 1] - ptr[i]) - 1;
-                                if (mm > 0)
+                                npy_intp count = (k == nn - 1 ? axisLength - indices[k] : indices[k + 1] - indices[k]) - 1;
+                                if (count > 0)
                                 {
-                                    loop.bufptr[1] += loop.steps[1];
-                                    loop.bufptr[2] = loop.bufptr[0];
-
-                                    workToDo.Enqueue(new UFUNCLoopWorkerParams(operation, loop.bufptr, mm, loop.steps, self.ops));
+                                    bufptr[1].data_offset += loop.steps[1];
+                                    bufptr[2].data_offset = bufptr[0].data_offset;
 
-                                    if (workerThread == null)
+                                    if (UFuncHandler != null)
                                     {
-                                        // start worker thread to process the queued up work
-                                        workerThread = Task.Factory.StartNew(() =>
-                                        {
-                                            while (true)
-                                            {
-                                                Parallel.For(0, workToDo.Count(), xxx =>
-                                                {
-                                                    UFUNCLoopWorkerParams work = null;
-                                                    if (workToDo.TryDequeue(out work))
-                                                    {
-                                                        if (UFuncHandler != null)
-                                                        {
-                                                            UFuncHandler(work.bufptr, work.steps, work.ops, work.N);
-                                                        }
-                                                        else
-                                                        {
-                                                            loop.function(work.op, work.bufptr, work.N, work.steps, work.ops);
-                                                        }
-
-                                                        if (!NPY_UFUNC_CHECK_ERROR(loop))
-                                                        {
-                                                            HasError = true;
-                                                        }
-                                                    }
-
-                                                });
-
-                                                if (workToDo.Count() == 0)
-                                                {
-                                                    if (IsCompleted)
-                                                        break;
-
-                                                    //System.Threading.Thread.Sleep(10);
-                                                }
-
-                                            }
-
-                                        });
+                                        UFuncHandler(bufptr, loop.steps, self.ops, count);
+                                    }
+                                    else
+                                    {
+                                        loop.function(operation, bufptr, count, loop.steps, self.ops);
                                     }
-
                                 }
-                                loop.bufptr[0] += NpyArray_STRIDE(loop.ret, axis);
+                                bufptr[0].data_offset += outStride;
                             }
-                            NpyArray_ITER_NEXT(loop.it);
-                            NpyArray_ITER_NEXT(loop.rit);
-                            loop.bufptr[0] = loop.rit.dataptr;
-                            loop.index++;
-                        }
-
-                        IsCompleted = true;
-
-                        if (workerThread != null)
-                        {
-                            workerThread.Wait();
-                        }
-
-                        if (HasError)
+                        });
+                        if (!ok)
                             goto fail;
                     }
 
@@ -3472,6 +3352,144 @@ namespace NumpyLib
             NpyUFunc_getfperr();
         }
 
+        #region Parallel reduction loops
+
+        /// <summary>
+        /// number of elements of a single row that one task reduces before the partial results are combined.
+        /// This is fixed rather than tuned so that a floating point sum always adds its values in the same order.
+        /// </summary>
+        private const int ReduceSplitRowBlockSize = 65536;
+
+        /// <summary>
+        /// runs the rows of a reduce/accumulate/reduceat loop in parallel.  The rows are partitioned
+        /// up front into contiguous blocks and every block walks its own copy of the iterators,
+        /// so there is no producer/consumer hand off between the calling thread and the workers.
+        /// Returns false if the loop's error state was set while reducing a row.
+        /// </summary>
+        private static bool NpyUFunc_ReduceRows(NpyUFuncReduceObject loop, npy_intp rowLength, Action<UFUNCReductionBlock, npy_intp> row)
+        {
+            npy_intp rowCount = loop.size - loop.index;
+            npy_intp rowsPerBlock = NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp, loop.outsize) / Math.Max(1, rowLength);
+
+            var segments = NpyArray_SEGMENT_ParallelSplit(rowCount, Math.Max(1, rowsPerBlock));
+
+            bool HasError = false;
+
+            Parallel.ForEach(segments, NpyParallelScheduler.Options, (segment, state) =>
+            {
+                var block = new UFUNCReductionBlock(loop, segment.start);
+
+                for (npy_intp r = segment.start; r < segment.end; r++)
+                {
+                    row(block, r);
+                    if (!NPY_UFUNC_CHECK_ERROR(loop))
+                    {
+                        HasError = true;
+                        state.Stop();
+                        return;
+                    }
+                    block.Next();
+                }
+            });
+
+            loop.index = loop.size;
+            return !HasError;
+        }
+
+        /// <summary>
+        /// true if the single row of a reduction can be split into blocks whose partial results are combined afterwards.
+        /// </summary>
+        private static bool NpyUFunc_CanSplitRow(NpyUFuncReduceObject loop, UFuncOperation ops)
+        {
+            if (loop.N + 1 < 2 * ReduceSplitRowBlockSize)
+                return false;
+
+            switch (ops)
+            {
+                case UFuncOperation.add:
+                case UFuncOperation.multiply:
+                case UFuncOperation.maximum:
+                case UFuncOperation.minimum:
+                case UFuncOperation.fmax:
+                case UFuncOperation.fmin:
+                case UFuncOperation.logical_or:
+                case UFuncOperation.logical_and:
+                case UFuncOperation.bitwise_and:
+                case UFuncOperation.bitwise_or:
+                case UFuncOperation.bitwise_xor:
+                    break;
+                default:
+                    return false;
+            }
+
+            switch (loop.bufptr[0].type_num)
+            {
+                case NPY_TYPES.NPY_OBJECT:
+                case NPY_TYPES.NPY_STRING:
+                case NPY_TYPES.NPY_DECIMAL:
+                    return false;
+                default:
+                    return true;
+            }
+        }
+
+        /// <summary>
+        /// reduces one long row by reducing fixed size blocks of it in parallel into a buffer of partial
+        /// results, then combining the partial results in order into the output element.
+        /// Returns false if the loop's error state was set while reducing a block.
+        /// </summary>
+        private static bool NpyUFunc_ReduceSplitRow(NpyUFuncReduceObject loop, UFuncGeneralReductionHandler UFuncHandler, UFuncOperation ops)
+        {
+            npy_intp rowLength = loop.N + 1;
+            npy_intp blockCount = (rowLength + ReduceSplitRowBlockSize - 1) / ReduceSplitRowBlockSize;
+            npy_intp[] blockSteps = new npy_intp[] { loop.outsize, loop.steps[1], loop.outsize };
+
+            VoidPtr partials = NpyDataMem_NEW(loop.bufptr[0].type_num, (ulong)blockCount, false);
+            VoidPtr rowStart = loop.it.dataptr;
+
+            bool HasError = false;
+
+            Parallel.For(0, blockCount, NpyParallelScheduler.Options, (blockIndex, state) =>
+            {
+                npy_intp start = blockIndex * ReduceSplitRowBlockSize;
+                npy_intp end = Math.Min(start + ReduceSplitRowBlockSize, rowLength);
+
+                VoidPtr[] bufptr = new VoidPtr[3];
+                bufptr[0] = new VoidPtr(partials, blockIndex * loop.outsize);
+                bufptr[1] = new VoidPtr(rowStart, start * loop.steps[1]);
+                bufptr[2] = bufptr[0];
+
+                ICopyHelper blockHelper = MemCopy.GetMemcopyHelper(bufptr[0]);
+                blockHelper.memmove_init(bufptr[0], bufptr[1]);
+                blockHelper.memmove(bufptr[0].data_offset, bufptr[1].data_offset, loop.outsize);
+
+                bufptr[1].data_offset += loop.steps[1];
+                UFuncHandler(bufptr, blockSteps, ops, end - start - 1);
+                if (!NPY_UFUNC_CHECK_ERROR(loop))
+                {
+                    HasError = true;
+                    state.Stop();
+                }
+            });
+
+            if (HasError)
+                return false;
+
+            VoidPtr[] combine = new VoidPtr[3];
+            combine[0] = loop.bufptr[0];
+            combine[1] = new VoidPtr(partials, loop.outsize);
+            combine[2] = loop.bufptr[0];
+
+            ICopyHelper helper = MemCopy.GetMemcopyHelper(combine[0]);
+            helper.memmove_init(combine[0], partials);
+            helper.memmove(combine[0].data_offset, partials.data_offset, loop.outsize);
+
+            UFuncHandler(combine, new npy_intp[] { loop.outsize, loop.outsize, loop.outsize }, ops, blockCount - 1);
+            return NPY_UFUNC_CHECK_ERROR(loop);
+        }
+
+        #endregion
+
         private static bool NPY_UFUNC_CHECK_ERROR(NpyUFuncLoopObject loop)
         {
             do
@@ -370,6 +370,9 @@ namespace NumpyLib
 
         protected override opFunctionScalarIterContiguousNoIter GetUFuncScalarIterContiguousNoIterHandler(UFuncOperation ops)
         {
+            if (UFuncSIMD<Int16>.IsAccelerated(ops))
+                return SIMDScalerIterContigNoIter;
+
             switch (ops)
             {
                 case UFuncOperation.add:
@@ -750,6 +753,9 @@ namespace NumpyLib
 
         protected override opFunctionScalarIterContiguousNoIter GetUFuncScalarIterContiguousNoIterHandler(UFuncOperation ops)
         {
+            if (UFuncSIMD<UInt16>.IsAccelerated(ops))
+                return SIMDScalerIterContigNoIter;
+
             switch (ops)
             {
                 case UFuncOperation.add:
@@ -1131,6 +1137,9 @@ namespace NumpyLib
 
         protected override opFunctionScalarIterContiguousNoIter GetUFuncScalarIterContiguousNoIterHandler(UFuncOperation ops)
         {
+            if (UFuncSIMD<Int32>.IsAccelerated(ops))
+                return SIMDScalerIterContigNoIter;
+
             switch (ops)
             {
                 case UFuncOperation.add:
@@ -1513,6 +1522,9 @@ namespace NumpyLib
 
         protected override opFunctionScalarIterContiguousNoIter GetUFuncScalarIterContiguousNoIterHandler(UFuncOperation ops)
         {
+            if (UFuncSIMD<UInt32>.IsAccelerated(ops))
+                return SIMDScalerIterContigNoIter;
+
             switch (ops)
             {
                 case UFuncOperation.add:
@@ -1895,6 +1907,9 @@ namespace NumpyLib
 
         protected override opFunctionScalarIterContiguousNoIter GetUFuncScalarIterContiguousNoIterHandler(UFuncOperation ops)
         {
+            if (UFuncSIMD<Int64>.IsAccelerated(ops))
+                return SIMDScalerIterContigNoIter;
+
             switch (ops)
             {
                 case UFuncOperation.add:
@@ -2276,6 +2291,9 @@ namespace NumpyLib
 
         protected override opFunctionScalarIterContiguousNoIter GetUFuncScalarIterContiguousNoIterHandler(UFuncOperation ops)
         {
+            if (UFuncSIMD<UInt64>.IsAccelerated(ops))
+                return SIMDScalerIterContigNoIter;
+
             switch (ops)
             {
                 case UFuncOperation.add:
@@ -2659,6 +2677,9 @@ namespace NumpyLib
 
         protected override opFunctionScalarIterContiguousNoIter GetUFuncScalarIterContiguousNoIterHandler(UFuncOperation ops)
         {
+            if (UFuncSIMD<float>.IsAccelerated(ops))
+                return SIMDScalerIterContigNoIter;
+
             switch (ops)
             {
                 case UFuncOperation.add:
@@ -2691,12 +2712,64 @@ namespace NumpyLib
         #region Reduce accelerators
         protected float AddReduce(float result, float[] OperandArray, npy_intp OperIndex, npy_intp OperStep, npy_intp N)
         {
-            while (N-- > 0)
+            return result + PairwiseSum(OperandArray, OperIndex, OperStep, N);
+        }
+        /// <summary>
+        /// pairwise summation as done by numpy: the rounding error grows with log(N) instead of N.
+        /// </summary>
+        private static float PairwiseSum(float[] OperandArray, npy_intp OperIndex, npy_intp OperStep, npy_intp N)
+        {
+            if (N < 8)
             {
-                result = result + OperandArray[OperIndex];
-                OperIndex += OperStep;
+                float sum = -0.0f;
+                for (npy_intp i = 0; i < N; i++)
+                {
+                    sum += OperandArray[OperIndex + i * OperStep];
+                }
+                return sum;
+            }
+            else if (N <= PairwiseBlockSize)
+            {
+                float r0 = OperandArray[OperIndex + 0 * OperStep];
+                float r1 = OperandArray[OperIndex + 1 * OperStep];
+                float r2 = OperandArray[OperIndex + 2 * OperStep];
+                float r3 = OperandArray[OperIndex + 3 * OperStep];
+                float r4 = OperandArray[OperIndex + 4 * OperStep];
+                float r5 = OperandArray[OperIndex + 5 * OperStep];
+                float r6 = OperandArray[OperIndex + 6 * OperStep];
+                float r7 = OperandArray[OperIndex + 7 * OperStep];
+
+                npy_intp i;
+                for (i = 8; i < N - (N % 8); i += 8)
+                {
+                    npy_intp index = OperIndex + i * OperStep;
+                    r0 += OperandArray[index + 0 * OperStep];
+                    r1 += OperandArray[index + 1 * OperStep];
+                    r2 += OperandArray[index + 2 * OperStep];
+                    r3 += OperandArray[index + 3 * OperStep];
+                    r4 += OperandArray[index + 4 * OperStep];
+                    r5 += OperandArray[index + 5 * OperStep];
+                    r6 += OperandArray[index + 6 * OperStep];
+                    r7 += OperandArray[index + 7 * OperStep];
+                }
+
+                float sum = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7));
+
+                /* do non multiple of 8 rest */
+                for (; i < N; i++)
+                {
+                    sum += OperandArray[OperIndex + i * OperStep];
+                }
+                return sum;
+            }
+            else
+            {
+                /* divide by two but avoid non-multiples of unroll factor */
+                npy_intp n2 = N / 2;
+                n2 -= n2 % 8;
+                return PairwiseSum(OperandArray, OperIndex, OperStep, n2) +
+                       PairwiseSum(OperandArray, OperIndex + n2 * OperStep, OperStep, N - n2);
             }
-            return result;
         }
         protected float SubtractReduce(float result, float[] OperandArray, npy_intp OperIndex, npy_intp OperStep, npy_intp N)
         {
@@ -3048,6 +3121,9 @@ namespace NumpyLib
 
         protected override opFunctionScalarIterContiguousNoIter GetUFuncScalarIterContiguousNoIterHandler(UFuncOperation ops)
         {
+            if (UFuncSIMD<double>.IsAccelerated(ops))
+                return SIMDScalerIterContigNoIter;
+
             switch (ops)
             {
                 case UFuncOperation.add:
@@ -3080,12 +3156,64 @@ namespace NumpyLib
         #region Reduce accelerators
         protected double AddReduce(double result, double[] OperandArray, npy_intp OperIndex, npy_intp OperStep, npy_intp N)
         {
-            while (N-- > 0)
+            return result + PairwiseSum(OperandArray, OperIndex, OperStep, N);
+        }
+        /// <summary>
+        /// pairwise summation as done by numpy: the rounding error grows with log(N) instead of N.
+        /// </summary>
+        private static double PairwiseSum(double[] OperandArray, npy_intp OperIndex, npy_intp OperStep, npy_intp N)
+        {
+            if (N < 8)
             {
-                result = result + OperandArray[OperIndex];
-                OperIndex += OperStep;
+                double sum = -0.0;
+                for (npy_intp i = 0; i < N; i++)
+                {
+                    sum += OperandArray[OperIndex + i * OperStep];
+                }
+                return sum;
+            }
+            else if (N <= PairwiseBlockSize)
+            {
+                double r0 = OperandArray[OperIndex + 0 * OperStep];
+                double r1 = OperandArray[OperIndex + 1 * OperStep];
+                double r2 = OperandArray[OperIndex + 2 * OperStep];
+                double r3 = OperandArray[OperIndex + 3 * OperStep];
+                double r4 = OperandArray[OperIndex + 4 * OperStep];
+                double r5 = OperandArray[OperIndex + 5 * OperStep];
+                double r6 = OperandArray[OperIndex + 6 * OperStep];
+                double r7 = OperandArray[OperIndex + 7 * OperStep];
+
+                npy_intp i;
+                for (i = 8; i < N - (N % 8); i += 8)
+                {
+                    npy_intp index = OperIndex + i * OperStep;
+                    r0 += OperandArray[index + 0 * OperStep];
+                    r1 += OperandArray[index + 1 * OperStep];
+                    r2 += OperandArray[index + 2 * OperStep];
+                    r3 += OperandArray[index + 3 * OperStep];
+                    r4 += OperandArray[index + 4 * OperStep];
+                    r5 += OperandArray[index + 5 * OperStep];
+                    r6 += OperandArray[index + 6 * OperStep];
+                    r7 += OperandArray[index + 7 * OperStep];
+                }
+
+                double sum = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7));
+
+                /* do non multiple of 8 rest */
+                for (; i < N; i++)
+                {
+                    sum += OperandArray[OperIndex + i * OperStep];
+                }
+                return sum;
+            }
+            else
+            {
+                /* divide by two but avoid non-multiples of unroll factor */
+                npy_intp n2 = N / 2;
+                n2 -= n2 % 8;
+                return PairwiseSum(OperandArray, OperIndex, OperStep, n2) +
+                       PairwiseSum(OperandArray, OperIndex + n2 * OperStep, OperStep, N - n2);
             }
-            return result;
         }
         protected double SubtractReduce(double result, double[] OperandArray, npy_intp OperIndex, npy_intp OperStep, npy_intp N)
         {
@@ -888,6 +888,11 @@ namespace NumpyLib
             protected int ItemSize;
             protected int ItemDiv;
 
+            /// <summary>
+            /// number of elements below which a pairwise sum stops splitting and adds with 8 accumulators.
+            /// </summary>
+            protected const int PairwiseBlockSize = 128;
+
 
             #region SCALAR CALCULATIONS
             public void PerformScalarOpArrayIter(NpyArray destArray, NpyArray srcArray, NpyArray operArray, UFuncOperation op)
@@ -938,12 +943,13 @@ namespace NumpyLib
                 {
                     if (destIter.contiguous)
                     {
-                        var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, numpyinternal.maxNumericOpParallelSize);
-                        var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize);
+                        npy_intp grainSize = numpyinternal.maxNumericOpParallelSize;
+                        var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+                        var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
 
                         T operValue = oper[operIter.dataptr.data_offset];
 
-                        Parallel.For(0, destParallelIters.Count(), index =>
+                        Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
                         //for (int index = 0; index < destParallelIters.Count(); index++) // 
                         {
                             var ldestIter = destParallelIters.ElementAt(index);
@@ -967,12 +973,13 @@ namespace NumpyLib
                     }
                     else
                     {
-                        var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, numpyinternal.maxNumericOpParallelSize);
-                        var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize);
+                        npy_intp grainSize = numpyinternal.maxNumericOpParallelSize;
+                        var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+                        var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
 
                         T operValue = oper[operIter.dataptr.data_offset];
 
-                        Parallel.For(0, destParallelIters.Count(), index =>
+                        Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
                         //for (int index = 0; index < destParallelIters.Count(); index++) // 
                         {
                             var ldestIter = destParallelIters.ElementAt(index);
@@ -998,9 +1005,10 @@ namespace NumpyLib
                 {
                     if (destIter.contiguous)
                     {
-                        var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, numpyinternal.maxNumericOpParallelSize);
-                        var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize);
-                        var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, numpyinternal.maxNumericOpParallelSize);
+                        npy_intp grainSize = numpyinternal.maxNumericOpParallelSize;
+                        var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+                        var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
+                        var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, grainSize);
 
 
                         //Parallel.For(0, destParallelIters.Count(), index =>
@@ -1030,12 +1038,13 @@ namespace NumpyLib
                     }
                     else
                     {
-                        var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, numpyinternal.maxNumericOpParallelSize);
-                        var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize);
-                        var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, numpyinternal.maxNumericOpParallelSize);
+                        npy_intp grainSize = numpyinternal.maxNumericOpParallelSize;
+                        var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+                        var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
+                        var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, grainSize);
 
 
-                        Parallel.For(0, destParallelIters.Count(), index =>
+                        Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
                         //for (int index = 0; index < destParallelIters.Count(); index++) // 
                         {
                             var ldestIter = destParallelIters.ElementAt(index);
@@ -1309,7 +1318,7 @@ namespace NumpyLib
 
                     if (numpyinternal.getEnableTryCatchOnCalculations)
                     {
-                        Parallel.For(0, segments.Count(), seg_index =>
+                        Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, seg_index =>
                         //for (npy_intp index = 0; index < loopCount; index++)
                         {
                             var segment = segments.ElementAt(seg_index);
@@ -1341,7 +1350,7 @@ namespace NumpyLib
                     {
                         try
                         {
-                            Parallel.For(0, segments.Count(), seg_index =>
+                            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, seg_index =>
                             //for (npy_intp index = 0; index < loopCount; index++)
                             {
                                 var segment = segments.ElementAt(seg_index);
@@ -1370,6 +1379,73 @@ namespace NumpyLib
 
                 }
                 else
+                if (!operIter.requiresIteration && NpyArray_Size(operArray) == loopCount && GetUFuncArrayIterContiguousNoIter(op) != null)
+                {
+                    // both operands are contiguous and the same size, so no iterator is needed for either one.
+                    var ArrayIterContiguousNoIterAccelerator = GetUFuncArrayIterContiguousNoIter(op);
+
+                    int operAdjustment = (int)operArray.data.data_offset >> operArray.ItemDiv;
+
+                    var segments = NpyArray_SEGMENT_ParallelSplit(loopCount, numpyinternal.maxNumericOpParallelSize);
+
+                    if (numpyinternal.getEnableTryCatchOnCalculations)
+                    {
+                        // a segment that throws is redone one element at a time so that only the
+                        // failing elements get the default value.  That reads the inputs again, so
+                        // it is only possible when the destination does not overwrite an input.
+                        bool canRetrySegment = !ReferenceEquals(dest, src) && !ReferenceEquals(dest, oper);
+
+                        Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, seg_index =>
+                        {
+                            var segment = segments.ElementAt(seg_index);
+
+                            try
+                            {
+                                if (canRetrySegment)
+                                {
+                                    try
+                                    {
+                                        ArrayIterContiguousNoIterAccelerator(src, oper, dest,
+                                                segment.start, segment.end, srcAdjustment, operAdjustment, destAdjustment,
+                                                op);
+                                        return;
+                                    }
+                                    catch (System.OverflowException)
+                                    {
+                                    }
+                                }
+
+                                PerformNumericOpArrayIterContiguousNoIter(src, oper, dest,
+                                        segment.start, segment.end, srcAdjustment, operAdjustment, destAdjustment,
+                                        UFuncOperation);
+                            }
+                            catch (Exception ex)
+                            {
+                                exceptions.Enqueue(ex);
+                            }
+                        });
+                    }
+                    else
+                    {
+                        try
+                        {
+                            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, seg_index =>
+                            {
+                                var segment = segments.ElementAt(seg_index);
+
+                                ArrayIterContiguousNoIterAccelerator(src, oper, dest,
+                                        segment.start, segment.end, srcAdjustment, operAdjustment, destAdjustment,
+                                        op);
+                            });
+                        }
+                        catch (Exception ex)
+                        {
+                            string Message = numpyinternal.GenerateTryCatchExceptionMessage(ex.Message);
+                            throw new Exception(Message);
+                        }
+                    }
+                }
+                else
                 {
                     var ScalarIterContiguousIterAccelerator = GetUFuncScalarIterContiguousIter(op);
 
@@ -1378,7 +1454,7 @@ namespace NumpyLib
 
                     if (numpyinternal.getEnableTryCatchOnCalculations)
                     {
-                        Parallel.For(0, ParallelIters.Count(), index =>
+                        Parallel.For(0, ParallelIters.Count(), numpyinternal.parallelOptions, index =>
                         {
                             var Iter = ParallelIters.ElementAt(index);
 
@@ -1404,7 +1480,7 @@ namespace NumpyLib
                     {
                         try
                         {
-                            Parallel.For(0, ParallelIters.Count(), index =>
+                            Parallel.For(0, ParallelIters.Count(), numpyinternal.parallelOptions, index =>
                             {
                                 var Iter = ParallelIters.ElementAt(index);
 
@@ -1483,6 +1559,29 @@ namespace NumpyLib
  
             }
 
+            private void PerformNumericOpArrayIterContiguousNoIter(T[] src, T[] oper, T[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, opFunction UFuncOperation)
+            {
+                npy_intp srcIndex = start - srcAdjustment;
+                npy_intp operIndex = start - operAdjustment;
+                npy_intp destIndex = start - destAdjustment;
+
+                for (npy_intp index = start; index < end; index++)
+                {
+                    try
+                    {
+                        dest[destIndex] = UFuncOperation(src[srcIndex], oper[operIndex]);
+                    }
+                    catch (System.OverflowException of)
+                    {
+                        dest[destIndex] = default(T);
+                    }
+
+                    srcIndex++;
+                    operIndex++;
+                    destIndex++;
+                }
+            }
+
             private void PerformNumericOpScalarIterContiguousNoIter(T []src, T []dest, T operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, opFunction UFuncOperation)
             {
                 npy_intp srcIndex = start - srcAdjustment;
@@ -1576,7 +1675,7 @@ namespace NumpyLib
 
                     var UFuncOuterContigAccelerator = GetUFuncOuterContigOperation(op);
 
-                    Parallel.For(0, aSize, i =>
+                    Parallel.For(0, aSize, numpyinternal.parallelOptions, i =>
                     {
                         try
                         {
@@ -2082,6 +2181,19 @@ namespace NumpyLib
                 return GetUFuncScalarIterContiguousIterHandler(ops);
             }
 
+            protected opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIter(UFuncOperation ops)
+            {
+                // data types that have SIMD kernels return a delegate here
+                // if the operation is supported, else null.
+
+                return GetUFuncArrayIterContiguousNoIterHandler(ops);
+            }
+
+            protected virtual opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+            {
+                return null;
+            }
+
             protected delegate T opFunction(T o1, T o2);
             protected delegate T opFunctionReduce(T Op1Value, T[] Op2Values, npy_intp O2_Index, npy_intp O2_Step, npy_intp N);
             protected delegate void opFunctionAccumulate(T[] Op1Array, npy_intp O1_Index, npy_intp O1_Step,
@@ -2095,6 +2207,7 @@ namespace NumpyLib
             protected delegate void opFunctionOuterOpIter(NumericOperations operations, T aValue, T[] bValues, npy_intp bSize, T[] dp, NpyArrayIterObject DestIter, NpyArray destArray, UFuncOperation ops);
             protected delegate void opFunctionScalarIterContiguousNoIter(T[] src, T[] dest, T operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops);
             protected delegate void opFunctionScalarIterContiguousIter(NpyArrayIterObject Iter, T[] src, T[] dest, T[] oper, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops);
+            protected delegate void opFunctionArrayIterContiguousNoIter(T[] src, T[] oper, T[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops);
 
             protected abstract opFunctionReduce GetUFuncReduceHandler(UFuncOperation ops);
             protected abstract opFunctionAccumulate GetUFuncAccumulateHandler(UFuncOperation ops);
@@ -0,0 +1,580 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Numerics;
+using System.Text;
+using static NumpyLib.numpyinternal;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyLib
+{
+    #region SIMD kernels
+
+    /// <summary>
+    /// System.Numerics.Vector based kernels for the common binary ufunc operations.
+    /// Each kernel processes the largest multiple of Vector&lt;T&gt;.Count elements
+    /// and returns that count.  The caller is responsible for the remaining tail elements.
+    /// </summary>
+    internal static class UFuncSIMD<T> where T : struct
+    {
+        private static readonly bool IsFloatingPoint = typeof(T) == typeof(double) || typeof(T) == typeof(float);
+
+        internal static bool IsAccelerated(UFuncOperation ops)
+        {
+            if (!Vector.IsHardwareAccelerated)
+                return false;
+
+            switch (ops)
+            {
+                case UFuncOperation.add:
+                case UFuncOperation.subtract:
+                case UFuncOperation.multiply:
+                case UFuncOperation.maximum:
+                case UFuncOperation.minimum:
+                case UFuncOperation.less:
+                case UFuncOperation.less_equal:
+                case UFuncOperation.equal:
+                case UFuncOperation.not_equal:
+                case UFuncOperation.greater:
+                case UFuncOperation.greater_equal:
+                    return true;
+
+                // integer division has different divide by zero rules and no hardware support.
+                case UFuncOperation.divide:
+                case UFuncOperation.true_divide:
+                    return IsFloatingPoint;
+            }
+
+            return false;
+        }
+
+        internal static npy_intp ArrayArray(T[] src, npy_intp srcIndex, T[] oper, npy_intp operIndex, T[] dest, npy_intp destIndex, npy_intp count, UFuncOperation ops, T divideByZeroValue)
+        {
+            switch (ops)
+            {
+                case UFuncOperation.add:
+                    return Run(new AddOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.subtract:
+                    return Run(new SubtractOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.multiply:
+                    return Run(new MultiplyOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.divide:
+                case UFuncOperation.true_divide:
+                    return Run(new DivideOp(divideByZeroValue), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.maximum:
+                    return Run(new MaximumOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.minimum:
+                    return Run(new MinimumOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.less:
+                    return Run(new LessOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.less_equal:
+                    return Run(new LessEqualOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.equal:
+                    return Run(new EqualOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.not_equal:
+                    return Run(new NotEqualOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.greater:
+                    return Run(new GreaterOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+                case UFuncOperation.greater_equal:
+                    return Run(new GreaterEqualOp(), src, srcIndex, oper, operIndex, dest, destIndex, count);
+            }
+
+            return 0;
+        }
+
+        internal static npy_intp ArrayScalar(T[] src, npy_intp srcIndex, T operand, T[] dest, npy_intp destIndex, npy_intp count, UFuncOperation ops, T divideByZeroValue)
+        {
+            switch (ops)
+            {
+                case UFuncOperation.add:
+                    return Run(new AddOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.subtract:
+                    return Run(new SubtractOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.multiply:
+                    return Run(new MultiplyOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.divide:
+                case UFuncOperation.true_divide:
+                    return Run(new DivideOp(divideByZeroValue), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.maximum:
+                    return Run(new MaximumOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.minimum:
+                    return Run(new MinimumOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.less:
+                    return Run(new LessOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.less_equal:
+                    return Run(new LessEqualOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.equal:
+                    return Run(new EqualOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.not_equal:
+                    return Run(new NotEqualOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.greater:
+                    return Run(new GreaterOp(), src, srcIndex, operand, dest, destIndex, count);
+                case UFuncOperation.greater_equal:
+                    return Run(new GreaterEqualOp(), src, srcIndex, operand, dest, destIndex, count);
+            }
+
+            return 0;
+        }
+
+        // The operation is passed as a struct so the JIT generates a specialized,
+        // fully inlined loop for every operation instead of calling through a delegate.
+        private static npy_intp Run<TOp>(TOp op, T[] src, npy_intp srcIndex, T[] oper, npy_intp operIndex, T[] dest, npy_intp destIndex, npy_intp count) where TOp : struct, IVectorOp
+        {
+            int width = Vector<T>.Count;
+            npy_intp vectorCount = count - (count % width);
+
+            for (npy_intp i = 0; i < vectorCount; i += width)
+            {
+                var a = new Vector<T>(src, (int)(srcIndex + i));
+                var b = new Vector<T>(oper, (int)(operIndex + i));
+                op.Invoke(a, b).CopyTo(dest, (int)(destIndex + i));
+            }
+
+            return vectorCount;
+        }
+
+        private static npy_intp Run<TOp>(TOp op, T[] src, npy_intp srcIndex, T operand, T[] dest, npy_intp destIndex, npy_intp count) where TOp : struct, IVectorOp
+        {
+            int width = Vector<T>.Count;
+            npy_intp vectorCount = count - (count % width);
+
+            var b = new Vector<T>(operand);
+            for (npy_intp i = 0; i < vectorCount; i += width)
+            {
+                var a = new Vector<T>(src, (int)(srcIndex + i));
+                op.Invoke(a, b).CopyTo(dest, (int)(destIndex + i));
+            }
+
+            return vectorCount;
+        }
+
+        // comparisons produce 1 or 0 of the operand type, same as the scalar handlers.
+        private static Vector<T> BoolResult(Vector<T> mask)
+        {
+            return Vector.ConditionalSelect(mask, Vector<T>.One, Vector<T>.Zero);
+        }
+
+        #region operations
+        private interface IVectorOp
+        {
+            Vector<T> Invoke(Vector<T> a, Vector<T> b);
+        }
+
+        private struct AddOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return a + b; }
+        }
+        private struct SubtractOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return a - b; }
+        }
+        private struct MultiplyOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return a * b; }
+        }
+        private struct DivideOp : IVectorOp
+        {
+            private Vector<T> divideByZeroValue;
+
+            public DivideOp(T divideByZeroValue)
+            {
+                this.divideByZeroValue = new Vector<T>(divideByZeroValue);
+            }
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b)
+            {
+                return Vector.ConditionalSelect(Vector.Equals(b, Vector<T>.Zero), divideByZeroValue, a / b);
+            }
+        }
+        private struct MaximumOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b)
+            {
+                var result = Vector.Max(a, b);
+                if (IsFloatingPoint)
+                {
+                    // Math.Max propagates NaN from either operand
+                    result = Vector.ConditionalSelect(Vector.Equals(b, b), result, b);
+                    result = Vector.ConditionalSelect(Vector.Equals(a, a), result, a);
+                }
+                return result;
+            }
+        }
+        private struct MinimumOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b)
+            {
+                var result = Vector.Min(a, b);
+                if (IsFloatingPoint)
+                {
+                    // Math.Min propagates NaN from either operand
+                    result = Vector.ConditionalSelect(Vector.Equals(b, b), result, b);
+                    result = Vector.ConditionalSelect(Vector.Equals(a, a), result, a);
+                }
+                return result;
+            }
+        }
+        private struct LessOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return BoolResult(Vector.LessThan(a, b)); }
+        }
+        private struct LessEqualOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return BoolResult(Vector.LessThanOrEqual(a, b)); }
+        }
+        private struct EqualOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return BoolResult(Vector.Equals(a, b)); }
+        }
+        private struct NotEqualOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return BoolResult(Vector.OnesComplement(Vector.Equals(a, b))); }
+        }
+        private struct GreaterOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return BoolResult(Vector.GreaterThan(a, b)); }
+        }
+        private struct GreaterEqualOp : IVectorOp
+        {
+            public Vector<T> Invoke(Vector<T> a, Vector<T> b) { return BoolResult(Vector.GreaterThanOrEqual(a, b)); }
+        }
+        #endregion
+    }
+
+    #endregion
+
+    #region SIMD accelerator handlers
+
+    internal partial class UFUNC_Int16 : UFUNC_BASE<Int16>, IUFUNC_Operations
+    {
+        private void SIMDScalerIterContigNoIter(Int16[] src, Int16[] dest, Int16 operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<Int16>.ArrayScalar(src, srcIndex, operand, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], operand);
+            }
+        }
+
+        private void SIMDArrayIterContigNoIter(Int16[] src, Int16[] oper, Int16[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp operIndex = start - operAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<Int16>.ArrayArray(src, srcIndex, oper, operIndex, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], oper[operIndex + i]);
+            }
+        }
+
+        protected override opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+        {
+            if (UFuncSIMD<Int16>.IsAccelerated(ops))
+                return SIMDArrayIterContigNoIter;
+            return null;
+        }
+    }
+
+    internal partial class UFUNC_UInt16 : UFUNC_BASE<UInt16>, IUFUNC_Operations
+    {
+        private void SIMDScalerIterContigNoIter(UInt16[] src, UInt16[] dest, UInt16 operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<UInt16>.ArrayScalar(src, srcIndex, operand, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], operand);
+            }
+        }
+
+        private void SIMDArrayIterContigNoIter(UInt16[] src, UInt16[] oper, UInt16[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp operIndex = start - operAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<UInt16>.ArrayArray(src, srcIndex, oper, operIndex, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], oper[operIndex + i]);
+            }
+        }
+
+        protected override opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+        {
+            if (UFuncSIMD<UInt16>.IsAccelerated(ops))
+                return SIMDArrayIterContigNoIter;
+            return null;
+        }
+    }
+
+    internal partial class UFUNC_Int32 : UFUNC_BASE<Int32>, IUFUNC_Operations
+    {
+        private void SIMDScalerIterContigNoIter(Int32[] src, Int32[] dest, Int32 operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<Int32>.ArrayScalar(src, srcIndex, operand, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], operand);
+            }
+        }
+
+        private void SIMDArrayIterContigNoIter(Int32[] src, Int32[] oper, Int32[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp operIndex = start - operAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<Int32>.ArrayArray(src, srcIndex, oper, operIndex, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], oper[operIndex + i]);
+            }
+        }
+
+        protected override opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+        {
+            if (UFuncSIMD<Int32>.IsAccelerated(ops))
+                return SIMDArrayIterContigNoIter;
+            return null;
+        }
+    }
+
+    internal partial class UFUNC_UInt32 : UFUNC_BASE<UInt32>, IUFUNC_Operations
+    {
+        private void SIMDScalerIterContigNoIter(UInt32[] src, UInt32[] dest, UInt32 operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<UInt32>.ArrayScalar(src, srcIndex, operand, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], operand);
+            }
+        }
+
+        private void SIMDArrayIterContigNoIter(UInt32[] src, UInt32[] oper, UInt32[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp operIndex = start - operAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<UInt32>.ArrayArray(src, srcIndex, oper, operIndex, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], oper[operIndex + i]);
+            }
+        }
+
+        protected override opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+        {
+            if (UFuncSIMD<UInt32>.IsAccelerated(ops))
+                return SIMDArrayIterContigNoIter;
+            return null;
+        }
+    }
+
+    internal partial class UFUNC_Int64 : UFUNC_BASE<Int64>, IUFUNC_Operations
+    {
+        private void SIMDScalerIterContigNoIter(Int64[] src, Int64[] dest, Int64 operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<Int64>.ArrayScalar(src, srcIndex, operand, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], operand);
+            }
+        }
+
+        private void SIMDArrayIterContigNoIter(Int64[] src, Int64[] oper, Int64[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp operIndex = start - operAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<Int64>.ArrayArray(src, srcIndex, oper, operIndex, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], oper[operIndex + i]);
+            }
+        }
+
+        protected override opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+        {
+            if (UFuncSIMD<Int64>.IsAccelerated(ops))
+                return SIMDArrayIterContigNoIter;
+            return null;
+        }
+    }
+
+    internal partial class UFUNC_UInt64 : UFUNC_BASE<UInt64>, IUFUNC_Operations
+    {
+        private void SIMDScalerIterContigNoIter(UInt64[] src, UInt64[] dest, UInt64 operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<UInt64>.ArrayScalar(src, srcIndex, operand, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], operand);
+            }
+        }
+
+        private void SIMDArrayIterContigNoIter(UInt64[] src, UInt64[] oper, UInt64[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp operIndex = start - operAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<UInt64>.ArrayArray(src, srcIndex, oper, operIndex, dest, destIndex, count, ops, 0);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], oper[operIndex + i]);
+            }
+        }
+
+        protected override opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+        {
+            if (UFuncSIMD<UInt64>.IsAccelerated(ops))
+                return SIMDArrayIterContigNoIter;
+            return null;
+        }
+    }
+
+    internal partial class UFUNC_Float : UFUNC_BASE<float>, IUFUNC_Operations
+    {
+        private void SIMDScalerIterContigNoIter(float[] src, float[] dest, float operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<float>.ArrayScalar(src, srcIndex, operand, dest, destIndex, count, ops, float.PositiveInfinity);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], operand);
+            }
+        }
+
+        private void SIMDArrayIterContigNoIter(float[] src, float[] oper, float[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp operIndex = start - operAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<float>.ArrayArray(src, srcIndex, oper, operIndex, dest, destIndex, count, ops, float.PositiveInfinity);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], oper[operIndex + i]);
+            }
+        }
+
+        protected override opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+        {
+            if (UFuncSIMD<float>.IsAccelerated(ops))
+                return SIMDArrayIterContigNoIter;
+            return null;
+        }
+    }
+
+    internal partial class UFUNC_Double : UFUNC_BASE<double>, IUFUNC_Operations
+    {
+        private void SIMDScalerIterContigNoIter(double[] src, double[] dest, double operand, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<double>.ArrayScalar(src, srcIndex, operand, dest, destIndex, count, ops, double.PositiveInfinity);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], operand);
+            }
+        }
+
+        private void SIMDArrayIterContigNoIter(double[] src, double[] oper, double[] dest, npy_intp start, npy_intp end, npy_intp srcAdjustment, npy_intp operAdjustment, npy_intp destAdjustment, UFuncOperation ops)
+        {
+            npy_intp srcIndex = start - srcAdjustment;
+            npy_intp operIndex = start - operAdjustment;
+            npy_intp destIndex = start - destAdjustment;
+            npy_intp count = end - start;
+
+            npy_intp i = UFuncSIMD<double>.ArrayArray(src, srcIndex, oper, operIndex, dest, destIndex, count, ops, double.PositiveInfinity);
+            for (; i < count; i++)
+            {
+                dest[destIndex + i] = PerformUFuncOperation(ops, src[srcIndex + i], oper[operIndex + i]);
+            }
+        }
+
+        protected override opFunctionArrayIterContiguousNoIter GetUFuncArrayIterContiguousNoIterHandler(UFuncOperation ops)
+        {
+            if (UFuncSIMD<double>.IsAccelerated(ops))
+                return SIMDArrayIterContigNoIter;
+            return null;
+        }
+    }
+
+    #endregion
+}
@@ -1005,7 +1005,12 @@ namespace NumpyLib
         internal static int NpyArray_SortFunc(object o1, npy_intp length, NpyArray NOTUSED, NPY_SORTKIND kind)
         {
             VoidPtr arr = o1 as VoidPtr;
-            return NpyArray_SortFuncTypeNum(arr, (int)(arr.data_offset >> GetDivSize(GetTypeSize(arr.type_num))), (int)length);
+            npy_intp offset = arr.data_offset >> GetDivSize(GetTypeSize(arr.type_num));
+            if (NpySortKernels.Sort(arr, offset, length, kind))
+            {
+                return 0;
+            }
+            return NpyArray_SortFuncTypeNum(arr, (int)offset, (int)length);
         }
 
         private static int NpyArray_SortFuncTypeNum(VoidPtr data, int offset, int length)
@@ -1018,14 +1023,7 @@ namespace NumpyLib
         internal static int NpyArray_ArgSortFunc(object o1, VoidPtr indices, npy_intp m, NpyArray a, NPY_SORTKIND kind)
         {
             VoidPtr sortData = o1 as VoidPtr;
-            if (kind == NPY_SORTKIND.NPY_MERGESORT)
-            {
-                ArgSortIndexes(indices, m, new VoidPtr(sortData), 0, kind);
-            }
-            else
-            {
-                ArgSortIndexes(indices, m, new VoidPtr(sortData), 0, kind);
-            }
+            ArgSortIndexes(indices, m, new VoidPtr(sortData), 0, kind);
             return 0;
         }
 
@@ -48,9 +48,6 @@ namespace NumpyLib
 
     public class VoidPtr
     {
-        // todo: take this out when done with performance
-        public static int VoidPtrPlusOperatorCount = 0;
-
         public static VoidPtr operator +(VoidPtr v1, int i1)
         {
             return new VoidPtr(v1, i1);
@@ -92,8 +89,6 @@ namespace NumpyLib
         }
         public VoidPtr(VoidPtr vp, Int32 offset)
         {
-            VoidPtrPlusOperatorCount++;
-
             datap = vp.datap;
             type_num = vp.type_num;
             data_offset = (npy_intp)vp.data_offset + offset;
@@ -101,8 +96,6 @@ namespace NumpyLib
         }
         public VoidPtr(VoidPtr vp, Int64 offset)
         {
-            VoidPtrPlusOperatorCount++;
-
             datap = vp.datap;
             type_num = vp.type_num;
             data_offset = (npy_intp)(vp.data_offset + offset);
@@ -630,12 +630,13 @@ namespace NumpyLib
         {
             List<Exception> caughtExceptions = new List<Exception>();
 
-            var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, numpyinternal.maxNumericOpParallelSize);
-            var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize);
-            var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, numpyinternal.maxNumericOpParallelSize);
+            npy_intp grainSize = numpyinternal.NumericOpParallelSize(destArray);
+            var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+            var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
+            var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, grainSize);
 
 
-            Parallel.For(0, destParallelIters.Count(), index =>
+            Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
             //for (int index = 0; index < destParallelIters.Count(); index++) // 
             {
                 var ldestIter = destParallelIters.ElementAt(index);
@@ -695,13 +696,14 @@ namespace NumpyLib
             destIter = numpyinternal.NpyArray_ITER_ConvertToIndex(destIter, destArray.ItemDiv);
             operIter = numpyinternal.NpyArray_ITER_ConvertToIndex(operIter, operArray.ItemDiv);
 
-            var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, numpyinternal.maxNumericOpParallelSize * 1000);
-            var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize * 1000);
-            var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, numpyinternal.maxNumericOpParallelSize * 1000);
+            npy_intp grainSize = numpyinternal.NumericOpParallelSize(destArray) * 1000;
+            var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+            var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
+            var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, grainSize);
 
             bool retValue = false;
 
-            Parallel.For(0, destParallelIters.Count(), index =>
+            Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
             //for (int index = 0; index < destParallelIters.Count(); index++) 
             {
                 var ldestIter = destParallelIters.ElementAt(index);
@@ -1662,9 +1664,9 @@ namespace NumpyLib
                     return;
                 }
 
-                var segments = NpyArray_SEGMENT_ParallelSplit(loopCount, numpyinternal.maxNumericOpParallelSize);
+                var segments = NpyArray_SEGMENT_ParallelSplit(loopCount, numpyinternal.NumericOpParallelSize(destArray));
 
-                Parallel.For(0, segments.Count(), segment_index =>
+                Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
                 {
                     var segment = segments.ElementAt(segment_index);
 
@@ -1700,10 +1702,11 @@ namespace NumpyLib
                         return;
                 }
 
-                var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize);
-                var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, numpyinternal.maxNumericOpParallelSize);
+                npy_intp grainSize = numpyinternal.NumericOpParallelSize(destArray);
+                var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
+                var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, grainSize);
 
-                Parallel.For(0, destParallelIters.Count(), index =>
+                Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
                 //for (int index = 0; index < destParallelIters.Count(); index++) // 
                 {
                     var ldestIter = destParallelIters.ElementAt(index);
@@ -1747,7 +1750,7 @@ namespace NumpyLib
             bool[] src = _src as bool[];
             bool[] dest = _dest as bool[];
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -1864,7 +1867,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             bool operand = (bool)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -1907,7 +1910,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             byte operand = (byte)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -1949,7 +1952,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             sbyte operand = (sbyte)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -1991,7 +1994,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             Int16 operand = (Int16)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2032,7 +2035,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             UInt16 operand = (UInt16)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2073,7 +2076,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             Int32 operand = (Int32)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2115,7 +2118,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             UInt32 operand = (UInt32)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2156,7 +2159,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             Int64 operand = (Int64)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2198,7 +2201,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             UInt64 operand = (UInt64)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2239,7 +2242,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             double operand = (double)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2280,7 +2283,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             double operand = (double)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2322,7 +2325,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             decimal operand = (decimal)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2363,7 +2366,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             System.Numerics.Complex operand = (System.Numerics.Complex)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2421,7 +2424,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             System.Numerics.BigInteger operand = (System.Numerics.BigInteger)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2463,7 +2466,7 @@ namespace NumpyLib
             bool[] dest = _dest as bool[];
             dynamic operand = (dynamic)_operand;
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2520,7 +2523,7 @@ namespace NumpyLib
             }
 
 
-            Parallel.For(0, segments.Count(), segment_index =>
+            Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
             {
                 var segment = segments.ElementAt(segment_index);
 
@@ -2602,10 +2605,11 @@ namespace NumpyLib
 
                 object operand = operations.ConvertOperand(oper[0]);
 
-                var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, numpyinternal.maxNumericOpParallelSize);
-                var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize);
+                npy_intp grainSize = numpyinternal.NumericOpParallelSize(destArray);
+                var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+                var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
 
-                Parallel.For(0, destParallelIters.Count(), index =>
+                Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
                 {
                     var ldestIter = destParallelIters.ElementAt(index);
                     var lsrcIter = srcParallelIters.ElementAt(index);
@@ -2646,11 +2650,12 @@ namespace NumpyLib
 
                 srcIter = NpyArray_ITER_ConvertToIndex(srcIter, srcArray.ItemDiv);
 
-                var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, numpyinternal.maxNumericOpParallelSize);
-                var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, numpyinternal.maxNumericOpParallelSize);
-                var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, numpyinternal.maxNumericOpParallelSize);
+                npy_intp grainSize = numpyinternal.NumericOpParallelSize(destArray);
+                var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+                var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
+                var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, grainSize);
 
-                Parallel.For(0, destParallelIters.Count(), index =>
+                Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
                 {
                     var ldestIter = destParallelIters.ElementAt(index);
                     var lsrcIter = srcParallelIters.ElementAt(index);
@@ -2730,6 +2735,11 @@ namespace NumpyLib
             var DestIter = NpyArray_BroadcastToShape(destArray, destArray.dimensions, destArray.nd);
             var OperIter = NpyArray_BroadcastToShape(operArray, destArray.dimensions, destArray.nd);
 
+            if (PerformNumericOpKernel(srcArray, destArray, operArray, operations, SrcIter, DestIter, OperIter))
+            {
+                return;
+            }
+
             if (!SrcIter.requiresIteration && !DestIter.requiresIteration && !operArray.IsASlice)
             {
                 PerformNumericOpScalarIterContiguousSD(srcArray, destArray, operArray, operations, SrcIter, DestIter, OperIter);
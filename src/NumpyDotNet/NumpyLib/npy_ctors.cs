@@ -1324,7 +1324,7 @@ namespace NumpyLib
                 npy_intp SingleIterSize = N > numpyinternal.flatCopyParallelSize ? -1 : numpyinternal.maxCopyFieldParallelSize;
                 var ParallelIters = NpyArray_ITER_ParallelSplit(srcIter, SingleIterSize);
 
-                Parallel.For(0, ParallelIters.Count(), index =>
+                Parallel.For(0, ParallelIters.Count(), numpyinternal.parallelOptions, index =>
                 //for (int index = 0; index < ParallelIters.Count(); index++)
                 {
                     var ParallelDest = new VoidPtr(dest);
@@ -1420,13 +1420,14 @@ namespace NumpyLib
             elsize = NpyArray_ITEMSIZE(dest);
             eldiv = GetDivSize(elsize);
 
-            var srcParallelIters = NpyArray_ITER_ParallelSplit(sit, numpyinternal.maxCopyFieldParallelSize);
-            var destParallelIters = NpyArray_ITER_ParallelSplit(dit, numpyinternal.maxCopyFieldParallelSize);
+            npy_intp grainSize = numpyinternal.maxCopyFieldParallelSize;
+            var srcParallelIters = NpyArray_ITER_ParallelSplit(sit, grainSize);
+            var destParallelIters = NpyArray_ITER_ParallelSplit(dit, grainSize);
 
             var helper = MemCopy.GetMemcopyHelper(dest.data);
             helper.strided_byte_copy_init(dest.data, dest.strides[maxaxis], src.data, src.strides[maxaxis], elsize, eldiv);
 
-            Parallel.For(0, destParallelIters.Count(), index =>
+            Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
             //for (int index = 0; index < destParallelIters.Count(); index++) // 
             {
                 var ldestIter = destParallelIters.ElementAt(index);
@@ -1511,7 +1512,7 @@ namespace NumpyLib
             {
                 var parallelIters = NpyArray_ITER_ParallelSplit(destIter, srcIter);
 
-                Parallel.For(0, parallelIters.Item1.Count(), i =>
+                Parallel.For(0, parallelIters.Item1.Count(), numpyinternal.parallelOptions, i =>
                 {
                     var _destIter = parallelIters.Item1.ElementAt(i);
                     var _srcIter = parallelIters.Item2.ElementAt(i);
@@ -1539,6 +1540,7 @@ namespace NumpyLib
                 {
                     helper.strided_single_element_copy(destIter.dataptr.data_offset, srcIter.dataptr.data_offset, maxdim);
                     NpyArray_ITER_NEXT(destIter);
+                    NpyArray_ITER_NEXT(srcIter);
                 }
             }
             else
@@ -136,7 +136,8 @@ namespace NumpyLib
     {
         NPY_QUICKSORT = 0,
         NPY_HEAPSORT = 1,
-        NPY_MERGESORT = 2
+        NPY_MERGESORT = 2,
+        NPY_STABLESORT = 2,
     };
 
     public enum NPY_SEARCHSIDE : int
@@ -0,0 +1,817 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+using System.Numerics;
+using System.Text;
+using System.Threading.Tasks;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyLib
+{
+    /// <summary>
+    /// Fast Fourier transform kernels.  Lengths whose prime factors are all small use a
+    /// recursive mixed radix transform, other lengths use Bluestein's algorithm on top of the
+    /// iterative radix-2 transform.  Plans (factors, roots and chirps) are cached by length.
+    /// Long correlations and convolutions use the transforms through overlap-add when the
+    /// cost model says it is cheaper than the direct sums.
+    /// </summary>
+    internal static class NpyFFTKernels
+    {
+        /// <summary>
+        /// kernels shorter than this are always correlated directly
+        /// </summary>
+        internal static npy_intp CorrelateMinKernel = 32;
+
+        // cost of one radix-2 butterfly relative to one multiply-add of the direct sums
+        private const double ButterflyCost = 3.0;
+
+        // largest block transform used by overlap-add
+        private const int MaxBlockSize = 1 << 20;
+
+        private static readonly ConcurrentDictionary<int, Complex[]> twiddleCache = new ConcurrentDictionary<int, Complex[]>();
+
+        #region transforms
+
+        internal static bool IsPowerOfTwo(npy_intp n)
+        {
+            return n > 0 && (n & (n - 1)) == 0;
+        }
+
+        internal static int NextPowerOfTwo(npy_intp n)
+        {
+            int p = 1;
+            while (p < n && p < (1 << 30))
+                p <<= 1;
+            return p;
+        }
+
+        private static int Log2(int n)
+        {
+            int log = 0;
+            while ((1 << log) < n)
+                log++;
+            return log;
+        }
+
+        /// <summary>
+        /// exp(-2*pi*i*k/n) for k in [0, n/2)
+        /// </summary>
+        private static Complex[] Twiddles(int n)
+        {
+            return twiddleCache.GetOrAdd(n, size =>
+            {
+                var w = new Complex[Math.Max(1, size / 2)];
+                for (int k = 0; k < w.Length; k++)
+                {
+                    double angle = -2.0 * Math.PI * k / size;
+                    w[k] = new Complex(Math.Cos(angle), Math.Sin(angle));
+                }
+                return w;
+            });
+        }
+
+        /// <summary>
+        /// in place transform of a power of two length.  The inverse is not scaled by 1/n.
+        /// </summary>
+        internal static void Transform(Complex[] x, bool inverse)
+        {
+            int n = x.Length;
+            if (n < 2)
+                return;
+
+            // bit reversal permutation
+            for (int i = 1, j = 0; i < n; i++)
+            {
+                int bit = n >> 1;
+                for (; (j & bit) != 0; bit >>= 1)
+                    j ^= bit;
+                j ^= bit;
+                if (i < j)
+                {
+                    Complex t = x[i];
+                    x[i] = x[j];
+                    x[j] = t;
+                }
+            }
+
+            Complex[] w = Twiddles(n);
+            for (int len = 2; len <= n; len <<= 1)
+            {
+                int half = len >> 1;
+                int step = n / len;
+                for (int i = 0; i < n; i += len)
+                {
+                    for (int k = 0; k < half; k++)
+                    {
+                        Complex t = w[k * step];
+                        if (inverse)
+                            t = Complex.Conjugate(t);
+
+                        Complex u = x[i + k];
+                        Complex v = x[i + k + half] * t;
+                        x[i + k] = u + v;
+                        x[i + k + half] = u - v;
+                    }
+                }
+            }
+        }
+
+        #endregion
+
+        #region plans
+
+        // largest prime factor handled by the mixed radix butterflies, longer ones use Bluestein
+        private const int MaxRadix = 13;
+
+        // transforms at least this long split their sub transforms and butterflies across threads
+        internal static int ParallelTransformSize = 1 << 15;
+
+        private static readonly ConcurrentDictionary<int, FFTPlan> planCache = new ConcurrentDictionary<int, FFTPlan>();
+
+        private sealed class FFTPlan
+        {
+            public int n;
+
+            /// <summary>
+            /// mixed radix factors, null when Bluestein is used
+            /// </summary>
+            public int[] factors;
+
+            /// <summary>
+            /// exp(-2*pi*i*k/n) for k in [0, n)
+            /// </summary>
+            public Complex[] roots;
+
+            /// <summary>
+            /// Bluestein: power of two convolution length, exp(i*pi*k^2/n) and the transformed chirp filter
+            /// </summary>
+            public int m;
+            public Complex[] chirp;
+            public Complex[] chirpTransform;
+
+            private Complex[] realRoots;
+
+            /// <summary>
+            /// exp(-2*pi*i*k/(2n)) for k in [0, n], used to split a real transform of length 2n
+            /// </summary>
+            public Complex[] RealRoots
+            {
+                get
+                {
+                    if (realRoots == null)
+                    {
+                        var w = new Complex[n + 1];
+                        for (int k = 0; k <= n; k++)
+                        {
+                            double angle = -Math.PI * k / n;
+                            w[k] = new Complex(Math.Cos(angle), Math.Sin(angle));
+                        }
+                        realRoots = w;
+                    }
+                    return realRoots;
+                }
+            }
+        }
+
+        private static FFTPlan GetPlan(int n)
+        {
+            return planCache.GetOrAdd(n, CreatePlan);
+        }
+
+        private static FFTPlan CreatePlan(int n)
+        {
+            var plan = new FFTPlan() { n = n, factors = Factor(n) };
+
+            if (plan.factors != null)
+            {
+                plan.roots = new Complex[n];
+                for (int k = 0; k < n; k++)
+                {
+                    double angle = -2.0 * Math.PI * k / n;
+                    plan.roots[k] = new Complex(Math.Cos(angle), Math.Sin(angle));
+                }
+                return plan;
+            }
+
+            // X[k] = conj(c[k]) * sum_j (x[j] * conj(c[j])) * c[k-j] with c[j] = exp(i*pi*j^2/n),
+            // a convolution computed with power of two transforms
+            plan.m = NextPowerOfTwo(2 * (npy_intp)n - 1);
+            plan.chirp = new Complex[n];
+            for (int k = 0; k < n; k++)
+            {
+                // k^2 mod 2n keeps the angle small and exact
+                double angle = Math.PI * (double)(((long)k * k) % (2L * n)) / n;
+                plan.chirp[k] = new Complex(Math.Cos(angle), Math.Sin(angle));
+            }
+
+            plan.chirpTransform = new Complex[plan.m];
+            plan.chirpTransform[0] = plan.chirp[0];
+            for (int j = 1; j < n; j++)
+            {
+                plan.chirpTransform[j] = plan.chirp[j];
+                plan.chirpTransform[plan.m - j] = plan.chirp[j];
+            }
+            Transform(plan.chirpTransform, false);
+            return plan;
+        }
+
+        private static int[] Factor(int n)
+        {
+            var factors = new List<int>();
+            for (int p = 2; p <= MaxRadix && n > 1; p++)
+            {
+                while (n % p == 0)
+                {
+                    factors.Add(p);
+                    n /= p;
+                }
+            }
+            return n == 1 ? factors.ToArray() : null;
+        }
+
+        #endregion
+
+        #region mixed radix and Bluestein
+
+        private sealed class FFTScratch
+        {
+            public Complex[] input;
+            public Complex[] work;
+            public Complex[] line;
+        }
+
+        [ThreadStatic]
+        private static FFTScratch threadScratch;
+
+        private static FFTScratch Scratch()
+        {
+            if (threadScratch == null)
+                threadScratch = new FFTScratch();
+            return threadScratch;
+        }
+
+        private static Complex[] Buffer(ref Complex[] buffer, npy_intp n)
+        {
+            if (buffer == null || buffer.Length < n)
+                buffer = new Complex[n];
+            return buffer;
+        }
+
+        /// <summary>
+        /// unscaled transform of x[offset, offset + n) in place
+        /// </summary>
+        private static void TransformLine(Complex[] x, npy_intp offset, int n, bool inverse, bool parallel)
+        {
+            if (n < 2)
+                return;
+
+            FFTPlan plan = GetPlan(n);
+            FFTScratch scratch = Scratch();
+            Complex[] input = Buffer(ref scratch.input, n);
+            Array.Copy(x, offset, input, 0, n);
+
+            if (plan.factors != null)
+            {
+                MixedRadix(plan, input, 0, 1, x, offset, n, 0, inverse, parallel && n >= ParallelTransformSize);
+            }
+            else
+            {
+                Bluestein(plan, input, x, offset, inverse, scratch);
+            }
+        }
+
+        /// <summary>
+        /// decimation in time: the p decimated sub sequences of input are transformed into
+        /// consecutive blocks of output, then combined with radix-p butterflies.
+        /// </summary>
+        private static void MixedRadix(FFTPlan plan, Complex[] input, npy_intp inOffset, npy_intp inStride, Complex[] output, npy_intp outOffset, int n, int factor, bool inverse, bool parallel)
+        {
+            if (n == 1)
+            {
+                output[outOffset] = input[inOffset];
+                return;
+            }
+
+            int p = plan.factors[factor];
+            int m = n / p;
+
+            if (parallel && m >= ParallelTransformSize / 4)
+            {
+                Parallel.For(0, p, numpyinternal.parallelOptions, q =>
+                {
+                    MixedRadix(plan, input, inOffset + q * inStride, inStride * p, output, outOffset + q * m, m, factor + 1, inverse, true);
+                });
+            }
+            else
+            {
+                for (int q = 0; q < p; q++)
+                {
+                    MixedRadix(plan, input, inOffset + q * inStride, inStride * p, output, outOffset + q * m, m, factor + 1, inverse, false);
+                }
+            }
+
+            if (parallel)
+            {
+                Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(m, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp, 16)), numpyinternal.parallelOptions, seg =>
+                {
+                    Butterflies(plan, output, outOffset, n, p, (int)seg.start, (int)seg.end, inverse);
+                });
+            }
+            else
+            {
+                Butterflies(plan, output, outOffset, n, p, 0, m, inverse);
+            }
+        }
+
+        private static void Butterflies(FFTPlan plan, Complex[] output, npy_intp offset, int n, int p, int kstart, int kend, bool inverse)
+        {
+            Complex[] roots = plan.roots;
+            int m = n / p;
+            int rootStep = plan.n / n;
+
+            if (p == 2)
+            {
+                for (int k = kstart; k < kend; k++)
+                {
+                    Complex w = roots[k * rootStep];
+                    if (inverse)
+                        w = Complex.Conjugate(w);
+
+                    Complex a = output[offset + k];
+                    Complex b = output[offset + m + k] * w;
+                    output[offset + k] = a + b;
+                    output[offset + m + k] = a - b;
+                }
+                return;
+            }
+
+            int pStep = plan.n / p;
+            var t = new Complex[p];
+            for (int k = kstart; k < kend; k++)
+            {
+                for (int q = 0; q < p; q++)
+                {
+                    Complex w = roots[q * k * rootStep];
+                    if (inverse)
+                        w = Complex.Conjugate(w);
+                    t[q] = output[offset + q * m + k] * w;
+                }
+
+                for (int s = 0; s < p; s++)
+                {
+                    Complex sum = t[0];
+                    for (int q = 1; q < p; q++)
+                    {
+                        Complex w = roots[((q * s) % p) * pStep];
+                        if (inverse)
+                            w = Complex.Conjugate(w);
+                        sum += t[q] * w;
+                    }
+                    output[offset + s * m + k] = sum;
+                }
+            }
+        }
+
+        private static void Bluestein(FFTPlan plan, Complex[] input, Complex[] output, npy_intp offset, bool inverse, FFTScratch scratch)
+        {
+            int n = plan.n;
+            int m = plan.m;
+            Complex[] chirp = plan.chirp;
+            // the radix-2 transform works on the whole array
+            if (scratch.work == null || scratch.work.Length != m)
+                scratch.work = new Complex[m];
+            Complex[] work = scratch.work;
+
+            // the inverse is conj(forward(conj(x)))
+            for (int j = 0; j < n; j++)
+            {
+                Complex x = inverse ? Complex.Conjugate(input[j]) : input[j];
+                work[j] = x * Complex.Conjugate(chirp[j]);
+            }
+            Array.Clear(work, n, m - n);
+
+            Transform(work, false);
+            Complex[] filter = plan.chirpTransform;
+            for (int i = 0; i < m; i++)
+            {
+                work[i] *= filter[i];
+            }
+            Transform(work, true);
+
+            double scale = 1.0 / m;
+            for (int k = 0; k < n; k++)
+            {
+                Complex X = Complex.Conjugate(chirp[k]) * work[k] * scale;
+                output[offset + k] = inverse ? Complex.Conjugate(X) : X;
+            }
+        }
+
+        #endregion
+
+        #region batched transforms
+
+        private static IEnumerable<numpyinternal.LoopSegment> RowSegments(npy_intp rows, int n)
+        {
+            // about one grain of elements per task
+            npy_intp grain = Math.Max(1, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp, 16) / Math.Max(1, n));
+            return numpyinternal.NpyArray_SEGMENT_ParallelSplit(rows, grain);
+        }
+
+        /// <summary>
+        /// transforms rows consecutive lines of n complex values in place and multiplies them by scale.
+        /// Rows run in parallel, a single long line is split inside the transform.
+        /// </summary>
+        internal static void ComplexRows(Complex[] data, npy_intp offset, npy_intp rows, int n, bool inverse, double scale)
+        {
+            bool parallelLine = rows == 1;
+            Parallel.ForEach(RowSegments(rows, n), numpyinternal.parallelOptions, seg =>
+            {
+                for (npy_intp r = seg.start; r < seg.end; r++)
+                {
+                    npy_intp line = offset + r * n;
+                    TransformLine(data, line, n, inverse, parallelLine);
+                    if (scale != 1.0)
+                    {
+                        for (npy_intp i = line; i < line + n; i++)
+                            data[i] *= scale;
+                    }
+                }
+            });
+        }
+
+        /// <summary>
+        /// transforms rows lines of n real values into rows lines of n/2+1 complex values.
+        /// Even lengths are packed into a complex transform of half the length.
+        /// </summary>
+        internal static void RealForwardRows(double[] src, npy_intp srcOffset, Complex[] dst, npy_intp dstOffset, npy_intp rows, int n, double scale)
+        {
+            int h = n / 2;
+            bool parallelLine = rows == 1;
+            Parallel.ForEach(RowSegments(rows, n), numpyinternal.parallelOptions, seg =>
+            {
+                FFTScratch scratch = Scratch();
+                for (npy_intp r = seg.start; r < seg.end; r++)
+                {
+                    npy_intp si = srcOffset + r * n;
+                    npy_intp di = dstOffset + r * (h + 1);
+
+                    if ((n & 1) == 1)
+                    {
+                        Complex[] line = Buffer(ref scratch.line, n);
+                        for (int j = 0; j < n; j++)
+                            line[j] = src[si + j];
+                        TransformLine(line, 0, n, false, parallelLine);
+                        for (int k = 0; k <= h; k++)
+                            dst[di + k] = line[k] * scale;
+                        continue;
+                    }
+
+                    // z[j] = x[2j] + i*x[2j+1], Z = E + i*O with E, O the transforms of the even and odd samples
+                    Complex[] z = Buffer(ref scratch.line, h);
+                    for (int j = 0; j < h; j++)
+                        z[j] = new Complex(src[si + 2 * j], src[si + 2 * j + 1]);
+                    TransformLine(z, 0, h, false, parallelLine);
+
+                    Complex[] w = GetPlan(h).RealRoots;
+                    for (int k = 0; k <= h; k++)
+                    {
+                        Complex zk = z[k % h];
+                        Complex zc = Complex.Conjugate(z[(h - k) % h]);
+                        Complex E = (zk + zc) * 0.5;
+                        Complex O = (zk - zc) * new Complex(0, -0.5);
+                        dst[di + k] = (E + w[k] * O) * scale;
+                    }
+                }
+            });
+        }
+
+        /// <summary>
+        /// inverse of RealForwardRows: rows lines of n/2+1 complex values into rows lines of n real values.
+        /// The imaginary parts of the first and (for even n) last value are ignored.
+        /// </summary>
+        internal static void RealInverseRows(Complex[] src, npy_intp srcOffset, double[] dst, npy_intp dstOffset, npy_intp rows, int n, double scale)
+        {
+            int h = n / 2;
+            bool parallelLine = rows == 1;
+            Parallel.ForEach(RowSegments(rows, n), numpyinternal.parallelOptions, seg =>
+            {
+                FFTScratch scratch = Scratch();
+                for (npy_intp r = seg.start; r < seg.end; r++)
+                {
+                    npy_intp si = srcOffset + r * (h + 1);
+                    npy_intp di = dstOffset + r * n;
+
+                    if ((n & 1) == 1)
+                    {
+                        // rebuild the hermitian spectrum
+                        Complex[] line = Buffer(ref scratch.line, n);
+                        line[0] = src[si].Real;
+                        for (int k = 1; k <= h; k++)
+                        {
+                            line[k] = src[si + k];
+                            line[n - k] = Complex.Conjugate(src[si + k]);
+                        }
+                        TransformLine(line, 0, n, true, parallelLine);
+                        for (int j = 0; j < n; j++)
+                            dst[di + j] = line[j].Real * scale;
+                        continue;
+                    }
+
+                    Complex[] z = Buffer(ref scratch.line, h);
+                    Complex[] w = GetPlan(h).RealRoots;
+                    for (int k = 0; k < h; k++)
+                    {
+                        Complex xk = k == 0 ? src[si].Real : src[si + k];
+                        Complex xc = k == 0 ? src[si + h].Real : Complex.Conjugate(src[si + h - k]);
+                        Complex E = (xk + xc) * 0.5;
+                        Complex O = (xk - xc) * 0.5 * Complex.Conjugate(w[k]);
+                        z[k] = E + Complex.ImaginaryOne * O;
+                    }
+                    TransformLine(z, 0, h, true, parallelLine);
+
+                    // the half length inverse returns h * (x[2j] + i*x[2j+1]), the full one would be n * x
+                    for (int j = 0; j < h; j++)
+                    {
+                        dst[di + 2 * j] = z[j].Real * 2 * scale;
+                        dst[di + 2 * j + 1] = z[j].Imaginary * 2 * scale;
+                    }
+                }
+            });
+        }
+
+        #endregion
+
+        #region correlate
+
+        /// <summary>
+        /// Computes the correlation of _npyarray_correlate with FFTs when that is cheaper than the
+        /// direct sums:  ret[i] = sum_j ap1[i - n_left + j] * ap2[j], with ap1 zero padded.
+        /// Only NPY_DOUBLE and NPY_COMPLEX are handled, and inputs with NaN or Inf are left to the
+        /// direct sums so the non finite values stay local like they do there.  Returns false if
+        /// nothing was computed.
+        /// </summary>
+        internal static bool Correlate(NpyArray ap1, NpyArray ap2, NpyArray ret, npy_intp n_left)
+        {
+            NPY_TYPES typenum = ret.descr.type_num;
+            if (typenum != NPY_TYPES.NPY_DOUBLE && typenum != NPY_TYPES.NPY_COMPLEX)
+                return false;
+            if (ap1.descr.type_num != typenum || ap2.descr.type_num != typenum)
+                return false;
+
+            npy_intp n1 = numpyinternal.NpyArray_DIM(ap1, 0);
+            npy_intp n2 = numpyinternal.NpyArray_DIM(ap2, 0);
+            npy_intp length = numpyinternal.NpyArray_DIM(ret, 0);
+            if (n2 < CorrelateMinKernel || n1 < n2)
+                return false;
+
+            // outputs of the full correlation that this mode leaves off at each end
+            npy_intp skip_left = n2 - 1 - n_left;
+            npy_intp skip_right = (n1 + n2 - 1) - length - skip_left;
+
+            bool real = typenum == NPY_TYPES.NPY_DOUBLE;
+            int blockSize = CorrelateBlockSize(n1, n2, skip_left, skip_right, real);
+            if (blockSize == 0)
+                return false;
+
+            Complex[] a = ReadVector(ap1);
+            Complex[] v = ReadVector(ap2);
+            if (a == null || v == null)
+                return false;
+
+            Complex[] full = OverlapAdd(a, v, blockSize, real, skip_left, length);
+
+            npy_intp offset = ret.data.data_offset / ret.descr.elsize;
+            if (real)
+            {
+                double[] dest = ret.data.datap as double[];
+                for (npy_intp i = 0; i < length; i++)
+                {
+                    dest[offset + i] = full[i].Real;
+                }
+            }
+            else
+            {
+                Complex[] dest = ret.data.datap as Complex[];
+                Array.Copy(full, 0, dest, offset, length);
+            }
+            return true;
+        }
+
+        private static double Triangle(npy_intp n)
+        {
+            return (double)n * (n + 1) / 2;
+        }
+
+        /// <summary>
+        /// picks the overlap-add block size with the lowest estimated cost, or 0 when the
+        /// direct sums are cheaper.
+        /// </summary>
+        private static int CorrelateBlockSize(npy_intp n1, npy_intp n2, npy_intp skip_left, npy_intp skip_right, bool real)
+        {
+            // one multiply-add per overlapping pair of elements
+            double direct = (double)n1 * n2 - Triangle(skip_left) - Triangle(skip_right);
+
+            double best = double.MaxValue;
+            int bestSize = 0;
+            for (int N = NextPowerOfTwo(2 * n2); N <= MaxBlockSize; N <<= 1)
+            {
+                npy_intp L = N - n2 + 1;
+                npy_intp blocks = (n1 + L - 1) / L;
+
+                // real signals pack two blocks into one complex transform
+                npy_intp transforms = 1 + 2 * (real ? (blocks + 1) / 2 : blocks);
+                double cost = transforms * ((N / 2.0) * Log2(N) * ButterflyCost + N);
+                if (cost < best)
+                {
+                    best = cost;
+                    bestSize = N;
+                }
+
+                // one block already holds the whole signal
+                if (blocks == 1)
+                    break;
+            }
+
+            return best < direct ? bestSize : 0;
+        }
+
+        /// <summary>
+        /// copies a 1-d double or complex array out of its strides, or null if it holds NaN or Inf
+        /// </summary>
+        private static Complex[] ReadVector(NpyArray ap)
+        {
+            npy_intp n = numpyinternal.NpyArray_DIM(ap, 0);
+            npy_intp offset = ap.data.data_offset / ap.descr.elsize;
+            npy_intp stride = numpyinternal.NpyArray_STRIDE(ap, 0) / ap.descr.elsize;
+
+            var x = new Complex[n];
+            if (ap.descr.type_num == NPY_TYPES.NPY_DOUBLE)
+            {
+                double[] src = ap.data.datap as double[];
+                for (npy_intp i = 0; i < n; i++)
+                {
+                    double d = src[offset + i * stride];
+                    if (double.IsNaN(d) || double.IsInfinity(d))
+                        return null;
+                    x[i] = d;
+                }
+            }
+            else
+            {
+                Complex[] src = ap.data.datap as Complex[];
+                for (npy_intp i = 0; i < n; i++)
+                {
+                    Complex c = src[offset + i * stride];
+                    if (double.IsNaN(c.Real) || double.IsInfinity(c.Real) || double.IsNaN(c.Imaginary) || double.IsInfinity(c.Imaginary))
+                        return null;
+                    x[i] = c;
+                }
+            }
+            return x;
+        }
+
+        /// <summary>
+        /// full[i] = sum_j a[i + skip - (m-1) + j] * v[j] for i in [0, length), m = v.Length.
+        /// That is the convolution of a with v reversed, computed block by block with transforms
+        /// of size N.  Each block's output overlaps only the next one, so even blocks are added
+        /// in parallel first and odd blocks second.
+        /// </summary>
+        private static Complex[] OverlapAdd(Complex[] a, Complex[] v, int N, bool real, npy_intp skip, npy_intp length)
+        {
+            npy_intp n1 = a.Length;
+            npy_intp n2 = v.Length;
+            npy_intp L = N - n2 + 1;
+            npy_intp blocks = (n1 + L - 1) / L;
+
+            // transform of the reversed kernel
+            var H = new Complex[N];
+            for (npy_intp j = 0; j < n2; j++)
+            {
+                H[j] = v[n2 - 1 - j];
+            }
+            Transform(H, false);
+
+            var result = new Complex[length];
+            int perUnit = real ? 2 : 1;
+            npy_intp units = (blocks + perUnit - 1) / perUnit;
+
+            for (int pass = 0; pass < 2; pass++)
+            {
+                npy_intp passUnits = (units - pass + 1) / 2;
+                Parallel.For(0, passUnits, numpyinternal.parallelOptions, () => new Complex[N], (k, state, buf) =>
+                {
+                    npy_intp unit = 2 * k + pass;
+                    npy_intp b0 = unit * perUnit;
+                    npy_intp b1 = b0 + 1;
+
+                    Array.Clear(buf, 0, N);
+                    for (npy_intp t = 0; t < L && b0 * L + t < n1; t++)
+                    {
+                        buf[t] = a[b0 * L + t];
+                    }
+                    if (real && b1 < blocks)
+                    {
+                        for (npy_intp t = 0; t < L && b1 * L + t < n1; t++)
+                        {
+                            buf[t] = new Complex(buf[t].Real, a[b1 * L + t].Real);
+                        }
+                    }
+
+                    Transform(buf, false);
+                    for (int t = 0; t < N; t++)
+                    {
+                        buf[t] *= H[t];
+                    }
+                    Transform(buf, true);
+
+                    // a block of L inputs produces L + n2 - 1 outputs
+                    npy_intp outLength = L + n2 - 1;
+                    double scale = 1.0 / N;
+                    if (real)
+                    {
+                        AddBlock(result, buf, b0 * L - skip, outLength, length, scale, BlockPart.Real);
+                        if (b1 < blocks)
+                            AddBlock(result, buf, b1 * L - skip, outLength, length, scale, BlockPart.Imaginary);
+                    }
+                    else
+                    {
+                        AddBlock(result, buf, b0 * L - skip, outLength, length, scale, BlockPart.Complex);
+                    }
+                    return buf;
+                }, buf => { });
+            }
+
+            return result;
+        }
+
+        private enum BlockPart
+        {
+            Real,
+            Imaginary,
+            Complex,
+        }
+
+        /// <summary>
+        /// adds the part of an inverse transformed block that lands inside result, starting at result[start]
+        /// </summary>
+        private static void AddBlock(Complex[] result, Complex[] buf, npy_intp start, npy_intp outLength, npy_intp length, double scale, BlockPart part)
+        {
+            npy_intp t0 = Math.Max(0, -start);
+            npy_intp t1 = Math.Min(outLength, length - start);
+            switch (part)
+            {
+                case BlockPart.Real:
+                    for (npy_intp t = t0; t < t1; t++)
+                        result[start + t] += buf[t].Real * scale;
+                    break;
+                case BlockPart.Imaginary:
+                    for (npy_intp t = t0; t < t1; t++)
+                        result[start + t] += buf[t].Imaginary * scale;
+                    break;
+                default:
+                    for (npy_intp t = t0; t < t1; t++)
+                        result[start + t] += buf[t] * scale;
+                    break;
+            }
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,326 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Numerics;
+using System.Text;
+using System.Threading.Tasks;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyLib
+{
+    internal partial class numpyinternal
+    {
+        /// <summary>
+        /// Computes C = A * B for 2 dimensional operands using the blocked GEMM engine.
+        /// The strides are passed in explicitly so that callers can present transposed
+        /// views (i.e. inner product) without copying.  Returns false if the data type
+        /// or problem size is not handled, in which case the caller should use the
+        /// iterator based dot product.
+        /// </summary>
+        internal static bool NpyArray_GemmProduct(
+            NpyArray A, npy_intp aRowStride, npy_intp aColStride,
+            NpyArray B, npy_intp bRowStride, npy_intp bColStride,
+            NpyArray C, npy_intp m, npy_intp n, npy_intp k)
+        {
+            if (!Vector.IsHardwareAccelerated)
+                return false;
+
+            if (A.ItemType != C.ItemType || B.ItemType != C.ItemType)
+                return false;
+
+            if (m * n * k < gemmMinimumSize || m > int.MaxValue || n > int.MaxValue || k > int.MaxValue)
+                return false;
+
+            int div = C.ItemDiv;
+            npy_intp aOffset = A.data.data_offset >> div;
+            npy_intp bOffset = B.data.data_offset >> div;
+            npy_intp cOffset = C.data.data_offset >> div;
+            npy_intp cRowStride = C.strides[0] >> div;
+            npy_intp cColStride = C.strides[1] >> div;
+
+            aRowStride >>= div; aColStride >>= div;
+            bRowStride >>= div; bColStride >>= div;
+
+            switch (C.ItemType)
+            {
+                case NPY_TYPES.NPY_DOUBLE:
+                    GemmEngine<double>.Multiply(
+                        A.data.datap as double[], aOffset, aRowStride, aColStride,
+                        B.data.datap as double[], bOffset, bRowStride, bColStride,
+                        C.data.datap as double[], cOffset, cRowStride, cColStride,
+                        (int)m, (int)n, (int)k);
+                    return true;
+
+                case NPY_TYPES.NPY_FLOAT:
+                    GemmEngine<float>.Multiply(
+                        A.data.datap as float[], aOffset, aRowStride, aColStride,
+                        B.data.datap as float[], bOffset, bRowStride, bColStride,
+                        C.data.datap as float[], cOffset, cRowStride, cColStride,
+                        (int)m, (int)n, (int)k);
+                    return true;
+
+                case NPY_TYPES.NPY_INT32:
+                    GemmEngine<Int32>.Multiply(
+                        A.data.datap as Int32[], aOffset, aRowStride, aColStride,
+                        B.data.datap as Int32[], bOffset, bRowStride, bColStride,
+                        C.data.datap as Int32[], cOffset, cRowStride, cColStride,
+                        (int)m, (int)n, (int)k);
+                    return true;
+
+                case NPY_TYPES.NPY_INT64:
+                    GemmEngine<Int64>.Multiply(
+                        A.data.datap as Int64[], aOffset, aRowStride, aColStride,
+                        B.data.datap as Int64[], bOffset, bRowStride, bColStride,
+                        C.data.datap as Int64[], cOffset, cRowStride, cColStride,
+                        (int)m, (int)n, (int)k);
+                    return true;
+            }
+
+            return false;
+        }
+    }
+
+    /// <summary>
+    /// Cache blocked matrix multiply.  B is packed into KC x NC panels that stay in L2,
+    /// A is packed per thread into MC x KC panels that stay in L1/L2, and a register
+    /// blocked MR x NR micro-kernel (NR == Vector&lt;T&gt;.Count) accumulates into C.
+    /// Row blocks of C are distributed across the processors.
+    /// </summary>
+    internal static class GemmEngine<T> where T : struct
+    {
+        private const int MR = 4;
+        private const int KC = 256;
+        private const int NC = 4096;
+        private const int MC = 128;
+
+        private static readonly int NR = Vector<T>.Count;
+
+        private class Workspace
+        {
+            public T[] packedA;
+            public T[] tile;
+        }
+
+        internal static void Multiply(
+            T[] a, npy_intp aOffset, npy_intp aRowStride, npy_intp aColStride,
+            T[] b, npy_intp bOffset, npy_intp bRowStride, npy_intp bColStride,
+            T[] c, npy_intp cOffset, npy_intp cRowStride, npy_intp cColStride,
+            int m, int n, int k)
+        {
+            int nr = NR;
+            int maxDegree = NpyParallelScheduler.MaxDegreeOfParallelism;
+
+            // make sure every processor gets at least one block of rows when possible.
+            int mc = Math.Min(MC, RoundUp((m + maxDegree - 1) / maxDegree, MR));
+            int rowBlocks = (m + mc - 1) / mc;
+
+            ParallelOptions options = NpyParallelScheduler.Options;
+
+            for (int jc = 0; jc < n; jc += NC)
+            {
+                int nc = Math.Min(NC, n - jc);
+
+                for (int pc = 0; pc < k; pc += KC)
+                {
+                    int kc = Math.Min(KC, k - pc);
+
+                    T[] packedB = new T[RoundUp(nc, nr) * kc];
+                    PackB(b, bOffset + pc * bRowStride + jc * bColStride, bRowStride, bColStride, kc, nc, packedB);
+
+                    Parallel.For(0, rowBlocks, options,
+                        () => new Workspace() { packedA = new T[RoundUp(mc, MR) * kc], tile = new T[nr] },
+                        (block, loopState, ws) =>
+                        {
+                            int ic = block * mc;
+                            int mcb = Math.Min(mc, m - ic);
+
+                            PackA(a, aOffset + ic * aRowStride + pc * aColStride, aRowStride, aColStride, mcb, kc, ws.packedA);
+
+                            for (int jr = 0; jr < nc; jr += nr)
+                            {
+                                int cols = Math.Min(nr, nc - jr);
+                                int bIndex = (jr / nr) * kc * nr;
+
+                                for (int ir = 0; ir < mcb; ir += MR)
+                                {
+                                    int rows = Math.Min(MR, mcb - ir);
+                                    int aIndex = (ir / MR) * kc * MR;
+                                    npy_intp cIndex = cOffset + (ic + ir) * cRowStride + (jc + jr) * cColStride;
+
+                                    MicroKernel(ws.packedA, aIndex, packedB, bIndex, kc, c, cIndex, cRowStride, cColStride, rows, cols, ws.tile);
+                                }
+                            }
+
+                            return ws;
+                        },
+                        ws => { });
+                }
+            }
+        }
+
+        private static int RoundUp(int value, int multiple)
+        {
+            return ((value + multiple - 1) / multiple) * multiple;
+        }
+
+        // packs rows of A into MR high strips: for every k, MR consecutive row values.
+        private static void PackA(T[] a, npy_intp aIndex, npy_intp rowStride, npy_intp colStride, int rows, int kc, T[] packed)
+        {
+            int dst = 0;
+            for (int ir = 0; ir < rows; ir += MR)
+            {
+                int mr = Math.Min(MR, rows - ir);
+                npy_intp rowBase = aIndex + ir * rowStride;
+
+                for (int p = 0; p < kc; p++)
+                {
+                    npy_intp src = rowBase + p * colStride;
+                    int r = 0;
+                    for (; r < mr; r++)
+                    {
+                        packed[dst++] = a[src];
+                        src += rowStride;
+                    }
+                    for (; r < MR; r++)
+                    {
+                        packed[dst++] = default(T);
+                    }
+                }
+            }
+        }
+
+        // packs columns of B into NR wide strips: for every k, NR consecutive column values.
+        private static void PackB(T[] b, npy_intp bIndex, npy_intp rowStride, npy_intp colStride, int kc, int cols, T[] packed)
+        {
+            int nr = NR;
+            int dst = 0;
+            for (int jr = 0; jr < cols; jr += nr)
+            {
+                int w = Math.Min(nr, cols - jr);
+                npy_intp colBase = bIndex + jr * colStride;
+
+                for (int p = 0; p < kc; p++)
+                {
+                    npy_intp src = colBase + p * rowStride;
+                    int j = 0;
+                    if (colStride == 1)
+                    {
+                        Array.Copy(b, src, packed, dst, w);
+                        dst += w;
+                        j = w;
+                    }
+                    else
+                    {
+                        for (; j < w; j++)
+                        {
+                            packed[dst++] = b[src];
+                            src += colStride;
+                        }
+                    }
+                    for (; j < nr; j++)
+                    {
+                        packed[dst++] = default(T);
+                    }
+                }
+            }
+        }
+
+        private static void MicroKernel(T[] packedA, int aIndex, T[] packedB, int bIndex, int kc,
+            T[] c, npy_intp cIndex, npy_intp cRowStride, npy_intp cColStride, int rows, int cols, T[] tile)
+        {
+            int nr = NR;
+
+            Vector<T> c0 = Vector<T>.Zero;
+            Vector<T> c1 = Vector<T>.Zero;
+            Vector<T> c2 = Vector<T>.Zero;
+            Vector<T> c3 = Vector<T>.Zero;
+
+            for (int p = 0; p < kc; p++)
+            {
+                var bv = new Vector<T>(packedB, bIndex);
+
+                c0 += new Vector<T>(packedA[aIndex]) * bv;
+                c1 += new Vector<T>(packedA[aIndex + 1]) * bv;
+                c2 += new Vector<T>(packedA[aIndex + 2]) * bv;
+                c3 += new Vector<T>(packedA[aIndex + 3]) * bv;
+
+                aIndex += MR;
+                bIndex += nr;
+            }
+
+            StoreRow(c0, c, cIndex, cColStride, cols, tile);
+            if (rows > 1)
+                StoreRow(c1, c, cIndex + cRowStride, cColStride, cols, tile);
+            if (rows > 2)
+                StoreRow(c2, c, cIndex + 2 * cRowStride, cColStride, cols, tile);
+            if (rows > 3)
+                StoreRow(c3, c, cIndex + 3 * cRowStride, cColStride, cols, tile);
+        }
+
+        private static void StoreRow(Vector<T> acc, T[] c, npy_intp cIndex, npy_intp cColStride, int cols, T[] tile)
+        {
+            if (cColStride == 1 && cols == NR)
+            {
+                (new Vector<T>(c, (int)cIndex) + acc).CopyTo(c, (int)cIndex);
+                return;
+            }
+
+            // partial tile or strided output: gather, add, scatter.
+            npy_intp index = cIndex;
+            for (int j = 0; j < cols; j++)
+            {
+                tile[j] = c[index];
+                index += cColStride;
+            }
+            for (int j = cols; j < tile.Length; j++)
+            {
+                tile[j] = default(T);
+            }
+
+            (new Vector<T>(tile) + acc).CopyTo(tile);
+
+            index = cIndex;
+            for (int j = 0; j < cols; j++)
+            {
+                c[index] = tile[j];
+                index += cColStride;
+            }
+        }
+    }
+}
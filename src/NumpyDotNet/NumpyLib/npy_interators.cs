@@ -777,35 +777,9 @@ namespace NumpyLib
             NpyArrayIterObject[] DestIters = null;
             NpyArrayIterObject[] SrcIters = null;
 
-            if (TotalSize < 2 || maxParallelIterators == 1)
-            {
-                DestIters = new NpyArrayIterObject[1];
-                SrcIters = new NpyArrayIterObject[1];
-            }
-            else
-            if (TotalSize < 4 || maxParallelIterators == 2)
-            {
-                DestIters = new NpyArrayIterObject[2];
-                SrcIters = new NpyArrayIterObject[2];
-            }
-            else
-            if (TotalSize < 8 || maxParallelIterators == 4)
-            {
-                DestIters = new NpyArrayIterObject[4];
-                SrcIters = new NpyArrayIterObject[4];
-            }
-            else
-            if (TotalSize < 16 || maxParallelIterators == 8)
-            {
-                DestIters = new NpyArrayIterObject[8];
-                SrcIters = new NpyArrayIterObject[8];
-            }
-            else
-            {
-                DestIters = new NpyArrayIterObject[16];
-                SrcIters = new NpyArrayIterObject[16];
-            }
-
+            int chunkCount = NpyParallelScheduler.GetChunkCount(TotalSize, -1);
+            DestIters = new NpyArrayIterObject[chunkCount];
+            SrcIters = new NpyArrayIterObject[chunkCount];
 
             var taskSize = destIter.size / DestIters.Length;
             DestIters[0] = destIter.copy();
@@ -833,30 +807,7 @@ namespace NumpyLib
             NpyArrayIterObject[] DestIters = null;
    
 
-            if (TotalSize <= SingleIterSize || maxParallelIterators == 1)
-            {
-                DestIters = new NpyArrayIterObject[1];
-            }
-            else
-            if (TotalSize <= (SingleIterSize * 2) || maxParallelIterators == 2)
-            {
-                DestIters = new NpyArrayIterObject[2];
-            }
-            else
-            if (TotalSize <= (SingleIterSize * 4) || maxParallelIterators == 4)
-            {
-                DestIters = new NpyArrayIterObject[4];
-            }
-            else
-            if (TotalSize <= (SingleIterSize * 8) || maxParallelIterators == 8)
-            {
-                DestIters = new NpyArrayIterObject[8];
-            }
-            else
-            {
-                DestIters = new NpyArrayIterObject[16];
-            }
-
+            DestIters = new NpyArrayIterObject[NpyParallelScheduler.GetChunkCount(TotalSize, SingleIterSize)];
 
             var taskSize = TotalSize / DestIters.Length;
             if (taskSize == 0)
@@ -891,29 +842,7 @@ namespace NumpyLib
             npy_intp TotalSize = loopCount;
             LoopSegment[] segments = null;
 
-            if (TotalSize <= SingleIterSize || maxParallelIterators == 1)
-            {
-                segments = new LoopSegment[1];
-            }
-            else
-            if (TotalSize <= (SingleIterSize * 2) || maxParallelIterators == 2)
-            {
-                segments = new LoopSegment[2];
-            }
-            else
-            if (TotalSize <= (SingleIterSize * 4) || maxParallelIterators == 4)
-            {
-                segments = new LoopSegment[4];
-            }
-            else
-            if (TotalSize <= (SingleIterSize * 8) || maxParallelIterators == 8)
-            {
-                segments = new LoopSegment[8];
-            }
-            else
-            {
-                segments = new LoopSegment[16];
-            }
+            segments = new LoopSegment[NpyParallelScheduler.GetChunkCount(TotalSize, SingleIterSize)];
 
             for (int i = 0; i < segments.Length; i++)
             {
@@ -165,7 +165,7 @@ namespace NumpyLib
                     for (int i = 0; i < n; i++)
                     {
                         bool out_of_range = false;
-                        Parallel.For(0, m, j =>
+                        Parallel.For(0, m, numpyinternal.parallelOptions, j =>
                         {
                             var tmp = indicesData[j];
                             if (tmp < 0)
@@ -193,7 +193,7 @@ namespace NumpyLib
                 case NPY_CLIPMODE.NPY_WRAP:
                     for (int i = 0; i < n; i++)
                     {
-                        Parallel.For(0, m, j =>
+                        Parallel.For(0, m, numpyinternal.parallelOptions, j =>
                         {
                             var tmp = indicesData[j];
                             if (tmp < 0)
@@ -221,7 +221,7 @@ namespace NumpyLib
                 case NPY_CLIPMODE.NPY_CLIP:
                     for (int i = 0; i < n; i++)
                     {
-                        Parallel.For(0, m, j =>
+                        Parallel.For(0, m, numpyinternal.parallelOptions, j =>
                         {
                             var tmp = indicesData[j];
                             if (tmp < 0)
@@ -796,7 +796,7 @@ namespace NumpyLib
 
             var itParallelIters = NpyArray_ITER_ParallelSplit(it);
 
-            Parallel.For(0, itParallelIters.Count(), index =>
+            Parallel.For(0, itParallelIters.Count(), numpyinternal.parallelOptions, index =>
             {
                 var litIter = itParallelIters.ElementAt(index);
 
@@ -927,7 +927,7 @@ namespace NumpyLib
             var itParallelIters = NpyArray_ITER_ParallelSplit(it);
             var ritParallelIters = NpyArray_ITER_ParallelSplit(rit);
 
-            Parallel.For(0, ritParallelIters.Count(), index =>
+            Parallel.For(0, ritParallelIters.Count(), numpyinternal.parallelOptions, index =>
             {
                 var lritIter = ritParallelIters.ElementAt(index);
                 var litIter = itParallelIters.ElementAt(index);
@@ -1487,9 +1487,114 @@ namespace NumpyLib
 
         }
 
+        /*
+         * Indirect stable sort on n keys of the same shape.  The last key is the
+         * primary sort key.  Returns an intp array of the keys' shape holding the
+         * sorted indices along axis.
+         */
         internal static NpyArray NpyArray_LexSort(NpyArray []mps, int n, int axis)
         {
-            throw new NotImplementedException();
+            NpyArray[] keys = null;
+            NpyArray ret = null, swapped = null, result = null;
+            npy_intp length, rows;
+            int i, nd;
+
+            if (n < 1)
+            {
+                NpyErr_SetString(npyexc_type.NpyExc_TypeError, "need sequence of keys with len > 0 in lexsort");
+                return null;
+            }
+
+            nd = mps[0].nd;
+            for (i = 1; i < n; i++)
+            {
+                if (!NpyArray_SAMESHAPE(mps[0], mps[i]))
+                {
+                    NpyErr_SetString(npyexc_type.NpyExc_ValueError, "all keys need to be the same shape");
+                    return null;
+                }
+            }
+
+            if (nd == 0)
+            {
+                ret = NpyArray_New(null, 0, mps[0].dimensions, NPY_TYPES.NPY_INTP,
+                                   null, null, 0, 0, Npy_INTERFACE(mps[0]));
+                return ret;
+            }
+
+            if (!check_and_adjust_axis(ref axis, nd))
+            {
+                return null;
+            }
+
+            /* every key becomes a C contiguous copy with the sort axis last so each row is one run */
+            keys = new NpyArray[n];
+            for (i = 0; i < n; i++)
+            {
+                swapped = NpyArray_SwapAxes(mps[i], axis, nd - 1);
+                if (swapped == null)
+                {
+                    goto fail;
+                }
+                keys[i] = NpyArray_NewCopy(swapped, NPY_ORDER.NPY_CORDER);
+                Npy_DECREF(swapped);
+                if (keys[i] == null)
+                {
+                    goto fail;
+                }
+            }
+
+            ret = NpyArray_New(null, nd, keys[0].dimensions, NPY_TYPES.NPY_INTP,
+                               null, null, 0, 0, Npy_INTERFACE(mps[0]));
+            if (ret == null)
+            {
+                goto fail;
+            }
+
+            length = keys[0].dimensions[nd - 1];
+            rows = length == 0 ? 0 : NpyArray_SIZE(keys[0]) / length;
+            if (length > int.MaxValue)
+            {
+                NpyErr_SetString(npyexc_type.NpyExc_ValueError, "lexsort axis is too long");
+                goto fail;
+            }
+
+            VoidPtr[] keyData = keys.Select(k => k.data).ToArray();
+            npy_intp[] pret = ret.data.datap as npy_intp[];
+
+            /* rows are independent, sort them in parallel */
+            npy_intp rowsPerTask = Math.Max(1, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.Sort) / Math.Max(1, length));
+            var segments = NpyArray_SEGMENT_ParallelSplit(rows, rowsPerTask);
+
+            Parallel.ForEach(segments, parallelOptions, segment =>
+            {
+                npy_intp[] idx = new npy_intp[length];
+                for (npy_intp r = segment.start; r < segment.end; r++)
+                {
+                    NpySortKernels.LexSort(keyData, r * length, (int)length, idx);
+                    Array.Copy(idx, 0, pret, r * length, length);
+                }
+            });
+
+            /* back to the axis order of the keys */
+            swapped = NpyArray_SwapAxes(ret, axis, nd - 1);
+            if (swapped == null)
+            {
+                goto fail;
+            }
+            result = NpyArray_NewCopy(swapped, NPY_ORDER.NPY_CORDER);
+            Npy_DECREF(swapped);
+
+            fail:
+            if (keys != null)
+            {
+                foreach (var key in keys)
+                {
+                    Npy_XDECREF(key);
+                }
+            }
+            Npy_XDECREF(ret);
+            return result;
         }
 
         internal static NpyArray NpyArray_SearchSorted(NpyArray op1, NpyArray op2, NPY_SEARCHSIDE side)
@@ -1530,13 +1635,17 @@ namespace NumpyLib
                 goto fail;
             }
 
-            if (side == NPY_SEARCHSIDE.NPY_SEARCHLEFT)
-            {
-                local_search_left(ap1, ap2, ret);
-            }
-            else if (side == NPY_SEARCHSIDE.NPY_SEARCHRIGHT)
+            /* typed kernels for the numeric types, compare function for the rest */
+            if (!NpySortKernels.SearchSorted(ap1, ap2, ret, side))
             {
-                local_search_right(ap1, ap2, ret);
+                if (side == NPY_SEARCHSIDE.NPY_SEARCHLEFT)
+                {
+                    local_search_left(ap1, ap2, ret);
+                }
+                else if (side == NPY_SEARCHSIDE.NPY_SEARCHRIGHT)
+                {
+                    local_search_right(ap1, ap2, ret);
+                }
             }
             Npy_DECREF(ap1);
             Npy_DECREF(ap2);
@@ -1967,7 +2076,7 @@ namespace NumpyLib
             {
                 var parallelIters = NpyArray_ITER_ParallelSplit(it, numpyinternal.maxSortOperationParallelSize);
 
-                Parallel.For(0, parallelIters.Count(), index =>
+                Parallel.For(0, parallelIters.Count(), numpyinternal.parallelOptions, index =>
                 //for (int index = 0; index < parallelIters.Count(); index++) // 
                 {
                     var paraIter = parallelIters.ElementAt(index);
@@ -2119,7 +2228,7 @@ namespace NumpyLib
                     var itParallelIters = NpyArray_ITER_ParallelSplit(it);
                     var ritParallelIters = NpyArray_ITER_ParallelSplit(rit);
 
-                    Parallel.For(0, itParallelIters.Count(), index =>
+                    Parallel.For(0, itParallelIters.Count(), numpyinternal.parallelOptions, index =>
                     {
                         var litIter = itParallelIters.ElementAt(index);
                         var lritIter = ritParallelIters.ElementAt(index);
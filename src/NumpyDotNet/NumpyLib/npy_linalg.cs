@@ -0,0 +1,1757 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Numerics;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyLib
+{
+    /// <summary>
+    /// Dense linear algebra kernels for C ordered float64 matrices.  Every matrix of a stack is
+    /// n x n (or m x n) elements at offset + index * matrix size in the backing array.
+    /// LU with partial pivoting and Cholesky are right looking blocked factorizations: a panel
+    /// of BlockSize columns is factored with vectorized row operations and the trailing matrix
+    /// is updated through the GEMM engine.  QR applies Householder reflectors to column chunks
+    /// in parallel.  The eigensolvers are the EISPACK algorithms tred2/tql2 (symmetric) and
+    /// orthes/hqr2 (general).  Stacks are processed one matrix per task.
+    /// </summary>
+    internal static class NpyLinAlgKernels
+    {
+        /// <summary>
+        /// number of columns factored in a panel before the trailing matrix is updated
+        /// </summary>
+        internal static int BlockSize = 64;
+
+        // trailing updates smaller than this (in both dimensions) use row operations instead of GEMM
+        private const int GemmThreshold = 128;
+
+        // EISPACK iteration limits
+        private const int MaxQLIterations = 30;
+        private const int MaxQRIterationsPerRow = 30;
+
+        private const double Eps = 2.220446049250313e-16;
+
+        #region stacks
+
+        /// <summary>
+        /// runs body for each of count matrices of order n.  A single matrix runs on the calling
+        /// thread (the kernels parallelize internally), stacks are split across the processors.
+        /// Returns false if body returned false for any matrix.
+        /// </summary>
+        internal static bool ForEachMatrix(npy_intp count, int n, Func<npy_intp, bool> body)
+        {
+            if (count == 1)
+            {
+                return body(0);
+            }
+
+            int failed = 0;
+            ForEachSegment(count, (npy_intp)n * n * n + 1, (start, end) =>
+            {
+                for (npy_intp i = start; i < end; i++)
+                {
+                    if (!body(i))
+                    {
+                        Interlocked.Exchange(ref failed, 1);
+                    }
+                }
+            });
+            return failed == 0;
+        }
+
+        /// <summary>
+        /// solves A X = B for a stack of n x n matrices A and n x k right hand sides B.
+        /// A is overwritten by its LU factors and B by the solution.  Returns false if any A is singular.
+        /// </summary>
+        internal static bool SolveStack(double[] a, npy_intp aOffset, double[] b, npy_intp bOffset, npy_intp count, int n, int k)
+        {
+            return ForEachMatrix(count, n, i =>
+            {
+                int[] pivots = new int[n];
+                npy_intp ai = aOffset + i * n * n;
+                if (!LUFactor(a, ai, n, pivots))
+                {
+                    return false;
+                }
+                LUSolve(a, ai, n, pivots, b, bOffset + i * n * k, k);
+                return true;
+            });
+        }
+
+        /// <summary>
+        /// inverts a stack of n x n matrices into inv.  Returns false if any matrix is singular.
+        /// </summary>
+        internal static bool InvertStack(double[] a, npy_intp aOffset, double[] inv, npy_intp invOffset, npy_intp count, int n)
+        {
+            return ForEachMatrix(count, n, i =>
+            {
+                npy_intp ii = invOffset + i * n * n;
+                SetIdentity(inv, ii, n, n);
+
+                int[] pivots = new int[n];
+                npy_intp ai = aOffset + i * n * n;
+                if (!LUFactor(a, ai, n, pivots))
+                {
+                    return false;
+                }
+                LUSolve(a, ai, n, pivots, inv, ii, n);
+                return true;
+            });
+        }
+
+        /// <summary>
+        /// sign and natural log of the absolute value of the determinant of a stack of n x n matrices.
+        /// A is overwritten by its LU factors.
+        /// </summary>
+        internal static void SlogdetStack(double[] a, npy_intp aOffset, double[] sign, double[] logdet, npy_intp outOffset, npy_intp count, int n)
+        {
+            ForEachMatrix(count, n, i =>
+            {
+                int[] pivots = new int[n];
+                npy_intp ai = aOffset + i * n * n;
+                LUFactor(a, ai, n, pivots);
+
+                double s = 1.0;
+                double l = 0.0;
+                for (int j = 0; j < n; j++)
+                {
+                    double d = a[ai + (npy_intp)j * n + j];
+                    if (pivots[j] != j)
+                    {
+                        s = -s;
+                    }
+                    if (d < 0.0)
+                    {
+                        s = -s;
+                        d = -d;
+                    }
+                    else if (d == 0.0)
+                    {
+                        s = 0.0;
+                        l = double.NegativeInfinity;
+                        break;
+                    }
+                    l += Math.Log(d);
+                }
+                sign[outOffset + i] = s;
+                logdet[outOffset + i] = l;
+                return true;
+            });
+        }
+
+        /// <summary>
+        /// Cholesky factors of a stack of n x n matrices, in place.  Returns false if any matrix
+        /// is not positive definite.
+        /// </summary>
+        internal static bool CholeskyStack(double[] a, npy_intp aOffset, npy_intp count, int n)
+        {
+            return ForEachMatrix(count, n, i => Cholesky(a, aOffset + i * n * n, n));
+        }
+
+        /// <summary>
+        /// QR decomposition of a stack of m x n matrices.  q (may be null) receives the first qcols
+        /// columns of Q as m x qcols matrices, r receives the first rrows rows of R as rrows x n matrices.
+        /// A is overwritten by the reflectors.
+        /// </summary>
+        internal static void QRStack(double[] a, npy_intp aOffset, npy_intp count, int m, int n,
+            double[] q, npy_intp qOffset, int qcols, double[] r, npy_intp rOffset, int rrows)
+        {
+            ForEachMatrix(count, Math.Max(m, n), i =>
+            {
+                npy_intp ai = aOffset + i * m * n;
+                double[] tau = new double[Math.Min(m, n)];
+                QR(a, ai, m, n, tau);
+
+                npy_intp ri = rOffset + i * rrows * n;
+                for (int row = 0; row < rrows; row++)
+                {
+                    for (int col = 0; col < n; col++)
+                    {
+                        r[ri + (npy_intp)row * n + col] = col >= row ? a[ai + (npy_intp)row * n + col] : 0.0;
+                    }
+                }
+
+                if (q != null)
+                {
+                    FormQ(a, ai, m, n, tau, q, qOffset + i * m * qcols, qcols);
+                }
+                return true;
+            });
+        }
+
+        /// <summary>
+        /// eigenvalues (ascending) and optionally eigenvectors of a stack of symmetric n x n matrices,
+        /// read from their lower triangles.  With vectors, each matrix is overwritten by its
+        /// eigenvectors as columns.  Returns false if any iteration did not converge.
+        /// </summary>
+        internal static bool SymmetricEigenStack(double[] a, npy_intp aOffset, double[] w, npy_intp wOffset, npy_intp count, int n, bool vectors)
+        {
+            return ForEachMatrix(count, n, i => SymmetricEigen(a, aOffset + i * n * n, n, w, wOffset + i * n, vectors));
+        }
+
+        /// <summary>
+        /// eigenvalues and optionally (v != null) normalized eigenvectors, as columns, of a stack of
+        /// general n x n matrices.  A is destroyed.  Returns false if any iteration did not converge.
+        /// </summary>
+        internal static bool GeneralEigenStack(double[] a, npy_intp aOffset, Complex[] w, npy_intp wOffset, Complex[] v, npy_intp vOffset, npy_intp count, int n)
+        {
+            return ForEachMatrix(count, n, i => GeneralEigen(a, aOffset + i * n * n, n, w, wOffset + i * n, v, vOffset + i * n * n));
+        }
+
+        #endregion
+
+        #region LU
+
+        /// <summary>
+        /// factors the n x n matrix at a[offset] in place into P A = L U with a unit lower L.
+        /// pivots[j] is the row that was swapped with row j at step j.  Returns false if U has a
+        /// zero on its diagonal; the factorization is completed anyway.
+        /// </summary>
+        internal static bool LUFactor(double[] a, npy_intp offset, int n, int[] pivots)
+        {
+            bool nonsingular = true;
+
+            for (int k0 = 0; k0 < n; k0 += BlockSize)
+            {
+                int k1 = Math.Min(k0 + BlockSize, n);
+
+                // factor the panel of columns k0..k1, swapping whole rows
+                for (int j = k0; j < k1; j++)
+                {
+                    int p = j;
+                    double max = Math.Abs(a[offset + (npy_intp)j * n + j]);
+                    for (int i = j + 1; i < n; i++)
+                    {
+                        double v = Math.Abs(a[offset + (npy_intp)i * n + j]);
+                        if (v > max)
+                        {
+                            max = v;
+                            p = i;
+                        }
+                    }
+
+                    pivots[j] = p;
+                    if (p != j)
+                    {
+                        SwapRows(a, offset + (npy_intp)j * n, offset + (npy_intp)p * n, n);
+                    }
+
+                    npy_intp rj = offset + (npy_intp)j * n;
+                    double pivot = a[rj + j];
+                    if (pivot == 0.0)
+                    {
+                        nonsingular = false;
+                        continue;
+                    }
+
+                    for (int i = j + 1; i < n; i++)
+                    {
+                        npy_intp ri = offset + (npy_intp)i * n;
+                        double l = a[ri + j] /= pivot;
+                        if (l != 0.0)
+                        {
+                            Axpy(-l, a, rj + j + 1, a, ri + j + 1, k1 - j - 1);
+                        }
+                    }
+                }
+
+                int rest = n - k1;
+                if (rest == 0)
+                {
+                    break;
+                }
+
+                // U12 = inv(L11) A12
+                for (int i = k0 + 1; i < k1; i++)
+                {
+                    npy_intp ri = offset + (npy_intp)i * n;
+                    for (int p = k0; p < i; p++)
+                    {
+                        double l = a[ri + p];
+                        if (l != 0.0)
+                        {
+                            Axpy(-l, a, offset + (npy_intp)p * n + k1, a, ri + k1, rest);
+                        }
+                    }
+                }
+
+                // A22 -= L21 U12
+                SubtractProduct(a, offset + (npy_intp)k1 * n + k0, n,
+                    a, offset + (npy_intp)k0 * n + k1, n, 1,
+                    a, offset + (npy_intp)k1 * n + k1, n,
+                    rest, rest, k1 - k0);
+            }
+
+            return nonsingular;
+        }
+
+        /// <summary>
+        /// solves A X = B in place of the n x k matrix B from the factors of LUFactor.
+        /// The triangular solves run on blocks of BlockSize rows; the rows below (above) a solved
+        /// block are updated with one matrix product.
+        /// </summary>
+        internal static void LUSolve(double[] lu, npy_intp offset, int n, int[] pivots, double[] b, npy_intp bOffset, int k)
+        {
+            for (int j = 0; j < n; j++)
+            {
+                if (pivots[j] != j)
+                {
+                    SwapRows(b, bOffset + (npy_intp)j * k, bOffset + (npy_intp)pivots[j] * k, k);
+                }
+            }
+
+            // L Y = P B
+            for (int i0 = 0; i0 < n; i0 += BlockSize)
+            {
+                int i1 = Math.Min(i0 + BlockSize, n);
+                for (int i = i0 + 1; i < i1; i++)
+                {
+                    npy_intp ri = offset + (npy_intp)i * n;
+                    for (int p = i0; p < i; p++)
+                    {
+                        double l = lu[ri + p];
+                        if (l != 0.0)
+                        {
+                            Axpy(-l, b, bOffset + (npy_intp)p * k, b, bOffset + (npy_intp)i * k, k);
+                        }
+                    }
+                }
+                if (i1 < n)
+                {
+                    SubtractProduct(lu, offset + (npy_intp)i1 * n + i0, n,
+                        b, bOffset + (npy_intp)i0 * k, k, 1,
+                        b, bOffset + (npy_intp)i1 * k, k,
+                        n - i1, k, i1 - i0);
+                }
+            }
+
+            // U X = Y
+            for (int i1 = n; i1 > 0; i1 -= BlockSize)
+            {
+                int i0 = Math.Max(i1 - BlockSize, 0);
+                for (int i = i1 - 1; i >= i0; i--)
+                {
+                    npy_intp ri = offset + (npy_intp)i * n;
+                    npy_intp bi = bOffset + (npy_intp)i * k;
+                    for (int p = i + 1; p < i1; p++)
+                    {
+                        double u = lu[ri + p];
+                        if (u != 0.0)
+                        {
+                            Axpy(-u, b, bOffset + (npy_intp)p * k, b, bi, k);
+                        }
+                    }
+
+                    double d = lu[ri + i];
+                    for (int c = 0; c < k; c++)
+                    {
+                        b[bi + c] /= d;
+                    }
+                }
+                if (i0 > 0)
+                {
+                    SubtractProduct(lu, offset + i0, n,
+                        b, bOffset + (npy_intp)i0 * k, k, 1,
+                        b, bOffset, k,
+                        i0, k, i1 - i0);
+                }
+            }
+        }
+
+        #endregion
+
+        #region Cholesky
+
+        /// <summary>
+        /// factors the symmetric positive definite n x n matrix at a[offset] into L L^T, reading
+        /// only its lower triangle.  L is left in the lower triangle and the upper triangle is
+        /// zeroed.  Returns false if the matrix is not positive definite.
+        /// </summary>
+        internal static bool Cholesky(double[] a, npy_intp offset, int n)
+        {
+            for (int k0 = 0; k0 < n; k0 += BlockSize)
+            {
+                int k1 = Math.Min(k0 + BlockSize, n);
+
+                // L11
+                for (int j = k0; j < k1; j++)
+                {
+                    npy_intp rj = offset + (npy_intp)j * n;
+                    double d = a[rj + j] - Dot(a, rj + k0, a, rj + k0, j - k0);
+                    if (!(d > 0.0))
+                    {
+                        return false;
+                    }
+                    d = Math.Sqrt(d);
+                    a[rj + j] = d;
+
+                    for (int i = j + 1; i < k1; i++)
+                    {
+                        npy_intp ri = offset + (npy_intp)i * n;
+                        a[ri + j] = (a[ri + j] - Dot(a, ri + k0, a, rj + k0, j - k0)) / d;
+                    }
+                }
+
+                int rest = n - k1;
+                if (rest == 0)
+                {
+                    break;
+                }
+
+                // L21 = A21 inv(L11)^T, rows are independent
+                ForEachSegment(rest, (npy_intp)(k1 - k0) * (k1 - k0), (start, end) =>
+                {
+                    for (npy_intp r = start; r < end; r++)
+                    {
+                        npy_intp ri = offset + (k1 + r) * n;
+                        for (int j = k0; j < k1; j++)
+                        {
+                            npy_intp rj = offset + (npy_intp)j * n;
+                            a[ri + j] = (a[ri + j] - Dot(a, ri + k0, a, rj + k0, j - k0)) / a[rj + j];
+                        }
+                    }
+                });
+
+                // A22 -= L21 L21^T.  Only the lower triangle is used later, so the whole block is
+                // updated and the upper triangle is cleared at the end.
+                npy_intp l21 = offset + (npy_intp)k1 * n + k0;
+                SubtractProduct(a, l21, n,
+                    a, l21, 1, n,
+                    a, offset + (npy_intp)k1 * n + k1, n,
+                    rest, rest, k1 - k0);
+            }
+
+            for (int i = 0; i < n; i++)
+            {
+                npy_intp ri = offset + (npy_intp)i * n;
+                for (int j = i + 1; j < n; j++)
+                {
+                    a[ri + j] = 0.0;
+                }
+            }
+            return true;
+        }
+
+        #endregion
+
+        #region QR
+
+        /// <summary>
+        /// Householder QR of the m x n matrix at a[offset].  R is left on and above the diagonal,
+        /// the reflectors H(j) = I - tau[j] v v^T below it, with an implicit unit leading element.
+        /// </summary>
+        internal static void QR(double[] a, npy_intp offset, int m, int n, double[] tau)
+        {
+            int k = Math.Min(m, n);
+            for (int j = 0; j < k; j++)
+            {
+                npy_intp rj = offset + (npy_intp)j * n;
+                double alpha = a[rj + j];
+
+                double scale = 0.0;
+                for (int i = j + 1; i < m; i++)
+                {
+                    scale = Math.Max(scale, Math.Abs(a[offset + (npy_intp)i * n + j]));
+                }
+                double xnorm = 0.0;
+                if (scale > 0.0)
+                {
+                    double ssq = 0.0;
+                    for (int i = j + 1; i < m; i++)
+                    {
+                        double x = a[offset + (npy_intp)i * n + j] / scale;
+                        ssq += x * x;
+                    }
+                    xnorm = scale * Math.Sqrt(ssq);
+                }
+
+                if (xnorm == 0.0)
+                {
+                    tau[j] = 0.0;
+                    continue;
+                }
+
+                double h = Hypot(alpha, xnorm);
+                double beta = alpha < 0.0 ? h : -h;
+                tau[j] = (beta - alpha) / beta;
+
+                double s = 1.0 / (alpha - beta);
+                for (int i = j + 1; i < m; i++)
+                {
+                    a[offset + (npy_intp)i * n + j] *= s;
+                }
+                a[rj + j] = beta;
+
+                ApplyReflector(a, offset, n, j, m, tau[j], a, offset, n, j + 1, n - j - 1);
+            }
+        }
+
+        /// <summary>
+        /// forms the first cols columns of Q = H(0) H(1) ... H(k-1) from the reflectors left by QR
+        /// in the m x cols matrix at q[qOffset]
+        /// </summary>
+        internal static void FormQ(double[] a, npy_intp offset, int m, int n, double[] tau, double[] q, npy_intp qOffset, int cols)
+        {
+            SetIdentity(q, qOffset, m, cols);
+
+            // columns before j are still unit vectors above row j, H(j) leaves them alone
+            for (int j = Math.Min(m, n) - 1; j >= 0; j--)
+            {
+                ApplyReflector(a, offset, n, j, m, tau[j], q, qOffset, cols, j, cols - j);
+            }
+        }
+
+        /// <summary>
+        /// applies H = I - tau v v^T to rows j..m of columns c0..c0+cols of the matrix at c[cOffset].
+        /// v is column j of the reflector matrix below row j with an implicit 1 at row j.
+        /// Chunks of columns are updated in parallel.
+        /// </summary>
+        private static void ApplyReflector(double[] v, npy_intp vOffset, int ldv, int j, int m, double tau,
+            double[] c, npy_intp cOffset, int ldc, int c0, int cols)
+        {
+            if (tau == 0.0 || cols <= 0)
+            {
+                return;
+            }
+
+            ForEachSegment(cols, 2 * (m - j), (start, end) =>
+            {
+                int first = c0 + (int)start;
+                int width = (int)(end - start);
+
+                // w = v^T C
+                double[] w = new double[width];
+                npy_intp cj = cOffset + (npy_intp)j * ldc + first;
+                Array.Copy(c, cj, w, 0, width);
+                for (int i = j + 1; i < m; i++)
+                {
+                    double vi = v[vOffset + (npy_intp)i * ldv + j];
+                    if (vi != 0.0)
+                    {
+                        Axpy(vi, c, cOffset + (npy_intp)i * ldc + first, w, 0, width);
+                    }
+                }
+
+                // C -= tau v w
+                Axpy(-tau, w, 0, c, cj, width);
+                for (int i = j + 1; i < m; i++)
+                {
+                    double vi = v[vOffset + (npy_intp)i * ldv + j];
+                    if (vi != 0.0)
+                    {
+                        Axpy(-tau * vi, w, 0, c, cOffset + (npy_intp)i * ldc + first, width);
+                    }
+                }
+            });
+        }
+
+        #endregion
+
+        #region symmetric eigensolver
+
+        /// <summary>
+        /// eigenvalues, in ascending order, and optionally eigenvectors of the symmetric n x n
+        /// matrix at a[offset], read from its lower triangle.  With vectors, a is overwritten by
+        /// the eigenvectors as columns.  Returns false if the QL iteration did not converge.
+        /// </summary>
+        internal static bool SymmetricEigen(double[] a, npy_intp offset, int n, double[] w, npy_intp wOffset, bool vectors)
+        {
+            if (n == 0)
+            {
+                return true;
+            }
+
+            double[] d = new double[n];
+            double[] e = new double[n];
+
+            Tred2(a, offset, n, d, e, vectors);
+
+            // the rotations of tql2 combine pairs of columns of V, run them on rows of V^T
+            if (vectors)
+            {
+                Transpose(a, offset, n);
+            }
+            bool converged = Tql2(d, e, vectors ? a : null, offset, n);
+            if (vectors)
+            {
+                Transpose(a, offset, n);
+            }
+
+            Array.Copy(d, 0, w, wOffset, n);
+            return converged;
+        }
+
+        /// <summary>
+        /// Householder reduction of the symmetric matrix V to tridiagonal form (d diagonal, e
+        /// subdiagonal), accumulating the orthogonal transformation in V when vectors is set.
+        /// </summary>
+        private static void Tred2(double[] v, npy_intp offset, int n, double[] d, double[] e, bool vectors)
+        {
+            ref double V(int i, int j) => ref v[offset + (npy_intp)i * n + j];
+
+            for (int j = 0; j < n; j++)
+            {
+                d[j] = V(n - 1, j);
+            }
+
+            for (int i = n - 1; i > 0; i--)
+            {
+                // scale to avoid under/overflow
+                double scale = 0.0;
+                double h = 0.0;
+                for (int k = 0; k < i; k++)
+                {
+                    scale += Math.Abs(d[k]);
+                }
+
+                if (scale == 0.0)
+                {
+                    e[i] = d[i - 1];
+                    for (int j = 0; j < i; j++)
+                    {
+                        d[j] = V(i - 1, j);
+                        V(i, j) = 0.0;
+                        V(j, i) = 0.0;
+                    }
+                }
+                else
+                {
+                    // generate the Householder vector
+                    for (int k = 0; k < i; k++)
+                    {
+                        d[k] /= scale;
+                        h += d[k] * d[k];
+                    }
+                    double f = d[i - 1];
+                    double g = Math.Sqrt(h);
+                    if (f > 0)
+                    {
+                        g = -g;
+                    }
+                    e[i] = scale * g;
+                    h -= f * g;
+                    d[i - 1] = f - g;
+                    for (int j = 0; j < i; j++)
+                    {
+                        e[j] = 0.0;
+                    }
+
+                    // apply the similarity transformation to the remaining columns
+                    for (int j = 0; j < i; j++)
+                    {
+                        f = d[j];
+                        V(j, i) = f;
+                        g = e[j] + V(j, j) * f;
+                        for (int k = j + 1; k <= i - 1; k++)
+                        {
+                            g += V(k, j) * d[k];
+                            e[k] += V(k, j) * f;
+                        }
+                        e[j] = g;
+                    }
+                    f = 0.0;
+                    for (int j = 0; j < i; j++)
+                    {
+                        e[j] /= h;
+                        f += e[j] * d[j];
+                    }
+                    double hh = f / (h + h);
+                    for (int j = 0; j < i; j++)
+                    {
+                        e[j] -= hh * d[j];
+                    }
+                    for (int j = 0; j < i; j++)
+                    {
+                        f = d[j];
+                        g = e[j];
+                        for (int k = j; k <= i - 1; k++)
+                        {
+                            V(k, j) -= (f * e[k] + g * d[k]);
+                        }
+                        d[j] = V(i - 1, j);
+                        V(i, j) = 0.0;
+                    }
+                }
+                d[i] = h;
+            }
+
+            if (!vectors)
+            {
+                // the accumulation below only moves the diagonal into d
+                for (int j = 0; j < n; j++)
+                {
+                    d[j] = V(j, j);
+                }
+                e[0] = 0.0;
+                return;
+            }
+
+            // accumulate transformations
+            for (int i = 0; i < n - 1; i++)
+            {
+                V(n - 1, i) = V(i, i);
+                V(i, i) = 1.0;
+                double h = d[i + 1];
+                if (h != 0.0)
+                {
+                    for (int k = 0; k <= i; k++)
+                    {
+                        d[k] = V(k, i + 1) / h;
+                    }
+                    for (int j = 0; j <= i; j++)
+                    {
+                        double g = 0.0;
+                        for (int k = 0; k <= i; k++)
+                        {
+                            g += V(k, i + 1) * V(k, j);
+                        }
+                        for (int k = 0; k <= i; k++)
+                        {
+                            V(k, j) -= g * d[k];
+                        }
+                    }
+                }
+                for (int k = 0; k <= i; k++)
+                {
+                    V(k, i + 1) = 0.0;
+                }
+            }
+            for (int j = 0; j < n; j++)
+            {
+                d[j] = V(n - 1, j);
+                V(n - 1, j) = 0.0;
+            }
+            V(n - 1, n - 1) = 1.0;
+            e[0] = 0.0;
+        }
+
+        /// <summary>
+        /// implicit QL iteration on the tridiagonal matrix (d, e).  vt (may be null) holds the
+        /// transposed eigenvector matrix and is rotated and sorted along with the eigenvalues.
+        /// </summary>
+        private static bool Tql2(double[] d, double[] e, double[] vt, npy_intp offset, int n)
+        {
+            for (int i = 1; i < n; i++)
+            {
+                e[i - 1] = e[i];
+            }
+            e[n - 1] = 0.0;
+
+            double f = 0.0;
+            double tst1 = 0.0;
+            for (int l = 0; l < n; l++)
+            {
+                // find a small subdiagonal element
+                tst1 = Math.Max(tst1, Math.Abs(d[l]) + Math.Abs(e[l]));
+                int m = l;
+                while (m < n)
+                {
+                    if (Math.Abs(e[m]) <= Eps * tst1)
+                    {
+                        break;
+                    }
+                    m++;
+                }
+
+                // if m == l, d[l] is an eigenvalue, otherwise iterate
+                if (m > l)
+                {
+                    int iter = 0;
+                    do
+                    {
+                        if (++iter > MaxQLIterations)
+                        {
+                            return false;
+                        }
+
+                        // implicit shift
+                        double g = d[l];
+                        double p = (d[l + 1] - g) / (2.0 * e[l]);
+                        double r = Hypot(p, 1.0);
+                        if (p < 0)
+                        {
+                            r = -r;
+                        }
+                        d[l] = e[l] / (p + r);
+                        d[l + 1] = e[l] * (p + r);
+                        double dl1 = d[l + 1];
+                        double h = g - d[l];
+                        for (int i = l + 2; i < n; i++)
+                        {
+                            d[i] -= h;
+                        }
+                        f += h;
+
+                        // implicit QL transformation
+                        p = d[m];
+                        double c = 1.0;
+                        double c2 = c;
+                        double c3 = c;
+                        double el1 = e[l + 1];
+                        double s = 0.0;
+                        double s2 = 0.0;
+                        for (int i = m - 1; i >= l; i--)
+                        {
+                            c3 = c2;
+                            c2 = c;
+                            s2 = s;
+                            g = c * e[i];
+                            h = c * p;
+                            r = Hypot(p, e[i]);
+                            e[i + 1] = s * r;
+                            s = e[i] / r;
+                            c = p / r;
+                            p = c * d[i] - s * g;
+                            d[i + 1] = h + s * (c * g + s * d[i]);
+
+                            if (vt != null)
+                            {
+                                npy_intp ri = offset + (npy_intp)i * n;
+                                npy_intp ri1 = ri + n;
+                                for (int k = 0; k < n; k++)
+                                {
+                                    h = vt[ri1 + k];
+                                    vt[ri1 + k] = s * vt[ri + k] + c * h;
+                                    vt[ri + k] = c * vt[ri + k] - s * h;
+                                }
+                            }
+                        }
+                        p = -s * s2 * c3 * el1 * e[l] / dl1;
+                        e[l] = s * p;
+                        d[l] = c * p;
+
+                    } while (Math.Abs(e[l]) > Eps * tst1);
+                }
+                d[l] += f;
+                e[l] = 0.0;
+            }
+
+            // sort eigenvalues and vectors in ascending order
+            for (int i = 0; i < n - 1; i++)
+            {
+                int k = i;
+                double p = d[i];
+                for (int j = i + 1; j < n; j++)
+                {
+                    if (d[j] < p)
+                    {
+                        k = j;
+                        p = d[j];
+                    }
+                }
+                if (k != i)
+                {
+                    d[k] = d[i];
+                    d[i] = p;
+                    if (vt != null)
+                    {
+                        SwapRows(vt, offset + (npy_intp)i * n, offset + (npy_intp)k * n, n);
+                    }
+                }
+            }
+            return true;
+        }
+
+        #endregion
+
+        #region general eigensolver
+
+        /// <summary>
+        /// eigenvalues and optionally (v != null) eigenvectors of the general n x n matrix at
+        /// a[offset], which is destroyed.  The eigenvectors are the columns of the n x n matrix at
+        /// v[vOffset], normalized to unit length with their largest component real, and complex
+        /// conjugate pairs are stored next to each other.  Returns false if the QR iteration did not converge.
+        /// </summary>
+        internal static bool GeneralEigen(double[] a, npy_intp offset, int n, Complex[] w, npy_intp wOffset, Complex[] v, npy_intp vOffset)
+        {
+            if (n == 0)
+            {
+                return true;
+            }
+
+            bool vectors = v != null;
+            double[] schur = vectors ? new double[(npy_intp)n * n] : null;
+            double[] d = new double[n];
+            double[] e = new double[n];
+
+            Orthes(a, offset, n, schur);
+            if (!Hqr2(a, offset, n, d, e, schur))
+            {
+                return false;
+            }
+
+            for (int j = 0; j < n; j++)
+            {
+                w[wOffset + j] = new Complex(d[j], e[j]);
+            }
+
+            if (vectors)
+            {
+                for (int j = 0; j < n; j++)
+                {
+                    if (e[j] == 0.0)
+                    {
+                        double norm = 0.0;
+                        for (int i = 0; i < n; i++)
+                        {
+                            double x = schur[(npy_intp)i * n + j];
+                            norm += x * x;
+                        }
+                        norm = norm > 0.0 ? 1.0 / Math.Sqrt(norm) : 1.0;
+                        for (int i = 0; i < n; i++)
+                        {
+                            v[vOffset + (npy_intp)i * n + j] = schur[(npy_intp)i * n + j] * norm;
+                        }
+                    }
+                    else
+                    {
+                        // columns j and j+1 hold the real and imaginary parts of the vector of d[j] + i e[j]
+                        double norm = 0.0;
+                        double big = -1.0;
+                        Complex rotate = Complex.One;
+                        for (int i = 0; i < n; i++)
+                        {
+                            double re = schur[(npy_intp)i * n + j];
+                            double im = schur[(npy_intp)i * n + j + 1];
+                            double mag = re * re + im * im;
+                            norm += mag;
+                            if (mag > big)
+                            {
+                                big = mag;
+                                rotate = new Complex(re, -im);
+                            }
+                        }
+                        double len = Math.Sqrt(norm) * Math.Sqrt(big);
+                        rotate = len > 0.0 ? rotate / len : Complex.One;
+                        for (int i = 0; i < n; i++)
+                        {
+                            Complex x = new Complex(schur[(npy_intp)i * n + j], schur[(npy_intp)i * n + j + 1]) * rotate;
+                            v[vOffset + (npy_intp)i * n + j] = x;
+                            v[vOffset + (npy_intp)i * n + j + 1] = Complex.Conjugate(x);
+                        }
+                        j++;
+                    }
+                }
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// reduction of H to upper Hessenberg form by orthogonal similarity transformations, which
+        /// are accumulated in the n x n matrix V when it is not null
+        /// </summary>
+        private static void Orthes(double[] h, npy_intp offset, int n, double[] v)
+        {
+            ref double H(int i, int j) => ref h[offset + (npy_intp)i * n + j];
+
+            int low = 0;
+            int high = n - 1;
+            double[] ort = new double[n];
+
+            for (int m = low + 1; m <= high - 1; m++)
+            {
+                // scale column
+                double scale = 0.0;
+                for (int i = m; i <= high; i++)
+                {
+                    scale += Math.Abs(H(i, m - 1));
+                }
+
+                if (scale != 0.0)
+                {
+                    // compute the Householder transformation
+                    double hh = 0.0;
+                    for (int i = high; i >= m; i--)
+                    {
+                        ort[i] = H(i, m - 1) / scale;
+                        hh += ort[i] * ort[i];
+                    }
+                    double g = Math.Sqrt(hh);
+                    if (ort[m] > 0)
+                    {
+                        g = -g;
+                    }
+                    hh -= ort[m] * g;
+                    ort[m] -= g;
+
+                    // H = (I - u u^T / h) H (I - u u^T / h)
+                    for (int j = m; j < n; j++)
+                    {
+                        double f = 0.0;
+                        for (int i = high; i >= m; i--)
+                        {
+                            f += ort[i] * H(i, j);
+                        }
+                        f /= hh;
+                        for (int i = m; i <= high; i++)
+                        {
+                            H(i, j) -= f * ort[i];
+                        }
+                    }
+
+                    for (int i = 0; i <= high; i++)
+                    {
+                        double f = 0.0;
+                        for (int j = high; j >= m; j--)
+                        {
+                            f += ort[j] * H(i, j);
+                        }
+                        f /= hh;
+                        for (int j = m; j <= high; j++)
+                        {
+                            H(i, j) -= f * ort[j];
+                        }
+                    }
+                    ort[m] = scale * ort[m];
+                    H(m, m - 1) = scale * g;
+                }
+            }
+
+            if (v == null)
+            {
+                return;
+            }
+
+            // accumulate transformations
+            SetIdentity(v, 0, n, n);
+            for (int m = high - 1; m >= low + 1; m--)
+            {
+                if (H(m, m - 1) != 0.0)
+                {
+                    for (int i = m + 1; i <= high; i++)
+                    {
+                        ort[i] = H(i, m - 1);
+                    }
+                    for (int j = m; j <= high; j++)
+                    {
+                        double g = 0.0;
+                        for (int i = m; i <= high; i++)
+                        {
+                            g += ort[i] * v[(npy_intp)i * n + j];
+                        }
+                        // double division avoids possible underflow
+                        g = (g / ort[m]) / H(m, m - 1);
+                        for (int i = m; i <= high; i++)
+                        {
+                            v[(npy_intp)i * n + j] += g * ort[i];
+                        }
+                    }
+                }
+            }
+        }
+
+        /// <summary>
+        /// reduction of the Hessenberg matrix H to real Schur form by the shifted double QR
+        /// iteration.  d and e receive the real and imaginary parts of the eigenvalues.  When V is
+        /// not null it holds the transformations of orthes on entry and the eigenvectors on exit.
+        /// </summary>
+        private static bool Hqr2(double[] hm, npy_intp offset, int nn, double[] d, double[] e, double[] vm)
+        {
+            ref double H(int i, int j) => ref hm[offset + (npy_intp)i * nn + j];
+            ref double V(int i, int j) => ref vm[(npy_intp)i * nn + j];
+
+            bool vectors = vm != null;
+            int n = nn - 1;
+            int low = 0;
+            int high = nn - 1;
+            double exshift = 0.0;
+            double p = 0, q = 0, r = 0, s = 0, z = 0, t, w, x, y;
+
+            // matrix norm
+            double norm = 0.0;
+            for (int i = 0; i < nn; i++)
+            {
+                for (int j = Math.Max(i - 1, 0); j < nn; j++)
+                {
+                    norm += Math.Abs(H(i, j));
+                }
+            }
+
+            int iter = 0;
+            int budget = MaxQRIterationsPerRow * nn;
+            while (n >= low)
+            {
+                // look for a single small subdiagonal element
+                int l = n;
+                while (l > low)
+                {
+                    s = Math.Abs(H(l - 1, l - 1)) + Math.Abs(H(l, l));
+                    if (s == 0.0)
+                    {
+                        s = norm;
+                    }
+                    if (Math.Abs(H(l, l - 1)) < Eps * s)
+                    {
+                        break;
+                    }
+                    l--;
+                }
+
+                if (l == n)
+                {
+                    // one root found
+                    H(n, n) = H(n, n) + exshift;
+                    d[n] = H(n, n);
+                    e[n] = 0.0;
+                    n--;
+                    iter = 0;
+                }
+                else if (l == n - 1)
+                {
+                    // two roots found
+                    w = H(n, n - 1) * H(n - 1, n);
+                    p = (H(n - 1, n - 1) - H(n, n)) / 2.0;
+                    q = p * p + w;
+                    z = Math.Sqrt(Math.Abs(q));
+                    H(n, n) = H(n, n) + exshift;
+                    H(n - 1, n - 1) = H(n - 1, n - 1) + exshift;
+                    x = H(n, n);
+
+                    if (q >= 0)
+                    {
+                        // real pair
+                        z = p >= 0 ? p + z : p - z;
+                        d[n - 1] = x + z;
+                        d[n] = d[n - 1];
+                        if (z != 0.0)
+                        {
+                            d[n] = x - w / z;
+                        }
+                        e[n - 1] = 0.0;
+                        e[n] = 0.0;
+                        x = H(n, n - 1);
+                        s = Math.Abs(x) + Math.Abs(z);
+                        p = x / s;
+                        q = z / s;
+                        r = Math.Sqrt(p * p + q * q);
+                        p /= r;
+                        q /= r;
+
+                        // row modification
+                        for (int j = n - 1; j < nn; j++)
+                        {
+                            z = H(n - 1, j);
+                            H(n - 1, j) = q * z + p * H(n, j);
+                            H(n, j) = q * H(n, j) - p * z;
+                        }
+
+                        // column modification
+                        for (int i = 0; i <= n; i++)
+                        {
+                            z = H(i, n - 1);
+                            H(i, n - 1) = q * z + p * H(i, n);
+                            H(i, n) = q * H(i, n) - p * z;
+                        }
+
+                        // accumulate transformations
+                        if (vectors)
+                        {
+                            for (int i = low; i <= high; i++)
+                            {
+                                z = V(i, n - 1);
+                                V(i, n - 1) = q * z + p * V(i, n);
+                                V(i, n) = q * V(i, n) - p * z;
+                            }
+                        }
+                    }
+                    else
+                    {
+                        // complex pair
+                        d[n - 1] = x + p;
+                        d[n] = x + p;
+                        e[n - 1] = z;
+                        e[n] = -z;
+                    }
+                    n -= 2;
+                    iter = 0;
+                }
+                else
+                {
+                    // no convergence yet
+                    if (--budget < 0)
+                    {
+                        return false;
+                    }
+
+                    // form the shift
+                    x = H(n, n);
+                    y = 0.0;
+                    w = 0.0;
+                    if (l < n)
+                    {
+                        y = H(n - 1, n - 1);
+                        w = H(n, n - 1) * H(n - 1, n);
+                    }
+
+                    // Wilkinson's original ad hoc shift
+                    if (iter == 10)
+                    {
+                        exshift += x;
+                        for (int i = low; i <= n; i++)
+                        {
+                            H(i, i) -= x;
+                        }
+                        s = Math.Abs(H(n, n - 1)) + Math.Abs(H(n - 1, n - 2));
+                        x = y = 0.75 * s;
+                        w = -0.4375 * s * s;
+                    }
+
+                    // MATLAB's ad hoc shift
+                    if (iter == 30)
+                    {
+                        s = (y - x) / 2.0;
+                        s = s * s + w;
+                        if (s > 0)
+                        {
+                            s = Math.Sqrt(s);
+                            if (y < x)
+                            {
+                                s = -s;
+                            }
+                            s = x - w / ((y - x) / 2.0 + s);
+                            for (int i = low; i <= n; i++)
+                            {
+                                H(i, i) -= s;
+                            }
+                            exshift += s;
+                            x = y = w = 0.964;
+                        }
+                    }
+
+                    iter++;
+
+                    // look for two consecutive small subdiagonal elements
+                    int m = n - 2;
+                    while (m >= l)
+                    {
+                        z = H(m, m);
+                        r = x - z;
+                        s = y - z;
+                        p = (r * s - w) / H(m + 1, m) + H(m, m + 1);
+                        q = H(m + 1, m + 1) - z - r - s;
+                        r = H(m + 2, m + 1);
+                        s = Math.Abs(p) + Math.Abs(q) + Math.Abs(r);
+                        p /= s;
+                        q /= s;
+                        r /= s;
+                        if (m == l)
+                        {
+                            break;
+                        }
+                        if (Math.Abs(H(m, m - 1)) * (Math.Abs(q) + Math.Abs(r)) <
+                            Eps * (Math.Abs(p) * (Math.Abs(H(m - 1, m - 1)) + Math.Abs(z) + Math.Abs(H(m + 1, m + 1)))))
+                        {
+                            break;
+                        }
+                        m--;
+                    }
+
+                    for (int i = m + 2; i <= n; i++)
+                    {
+                        H(i, i - 2) = 0.0;
+                        if (i > m + 2)
+                        {
+                            H(i, i - 3) = 0.0;
+                        }
+                    }
+
+                    // double QR step involving rows l:n and columns m:n
+                    for (int k = m; k <= n - 1; k++)
+                    {
+                        bool notlast = k != n - 1;
+                        if (k != m)
+                        {
+                            p = H(k, k - 1);
+                            q = H(k + 1, k - 1);
+                            r = notlast ? H(k + 2, k - 1) : 0.0;
+                            x = Math.Abs(p) + Math.Abs(q) + Math.Abs(r);
+                            if (x == 0.0)
+                            {
+                                continue;
+                            }
+                            p /= x;
+                            q /= x;
+                            r /= x;
+                        }
+
+                        s = Math.Sqrt(p * p + q * q + r * r);
+                        if (p < 0)
+                        {
+                            s = -s;
+                        }
+                        if (s != 0)
+                        {
+                            if (k != m)
+                            {
+                                H(k, k - 1) = -s * x;
+                            }
+                            else if (l != m)
+                            {
+                                H(k, k - 1) = -H(k, k - 1);
+                            }
+                            p += s;
+                            x = p / s;
+                            y = q / s;
+                            z = r / s;
+                            q /= p;
+                            r /= p;
+
+                            // row modification
+                            for (int j = k; j < nn; j++)
+                            {
+                                p = H(k, j) + q * H(k + 1, j);
+                                if (notlast)
+                                {
+                                    p += r * H(k + 2, j);
+                                    H(k + 2, j) = H(k + 2, j) - p * z;
+                                }
+                                H(k, j) = H(k, j) - p * x;
+                                H(k + 1, j) = H(k + 1, j) - p * y;
+                            }
+
+                            // column modification
+                            for (int i = 0; i <= Math.Min(n, k + 3); i++)
+                            {
+                                p = x * H(i, k) + y * H(i, k + 1);
+                                if (notlast)
+                                {
+                                    p += z * H(i, k + 2);
+                                    H(i, k + 2) = H(i, k + 2) - p * r;
+                                }
+                                H(i, k) = H(i, k) - p;
+                                H(i, k + 1) = H(i, k + 1) - p * q;
+                            }
+
+                            // accumulate transformations
+                            if (vectors)
+                            {
+                                for (int i = low; i <= high; i++)
+                                {
+                                    p = x * V(i, k) + y * V(i, k + 1);
+                                    if (notlast)
+                                    {
+                                        p += z * V(i, k + 2);
+                                        V(i, k + 2) = V(i, k + 2) - p * r;
+                                    }
+                                    V(i, k) = V(i, k) - p;
+                                    V(i, k + 1) = V(i, k + 1) - p * q;
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+
+            if (!vectors || norm == 0.0)
+            {
+                return true;
+            }
+
+            // back substitute to find the vectors of the upper triangular form
+            for (n = nn - 1; n >= 0; n--)
+            {
+                p = d[n];
+                q = e[n];
+
+                if (q == 0)
+                {
+                    // real vector
+                    int l = n;
+                    H(n, n) = 1.0;
+                    for (int i = n - 1; i >= 0; i--)
+                    {
+                        w = H(i, i) - p;
+                        r = 0.0;
+                        for (int j = l; j <= n; j++)
+                        {
+                            r += H(i, j) * H(j, n);
+                        }
+                        if (e[i] < 0.0)
+                        {
+                            z = w;
+                            s = r;
+                        }
+                        else
+                        {
+                            l = i;
+                            if (e[i] == 0.0)
+                            {
+                                H(i, n) = w != 0.0 ? -r / w : -r / (Eps * norm);
+                            }
+                            else
+                            {
+                                // solve real equations
+                                x = H(i, i + 1);
+                                y = H(i + 1, i);
+                                q = (d[i] - p) * (d[i] - p) + e[i] * e[i];
+                                t = (x * s - z * r) / q;
+                                H(i, n) = t;
+                                H(i + 1, n) = Math.Abs(x) > Math.Abs(z) ? (-r - w * t) / x : (-s - y * t) / z;
+                            }
+
+                            // overflow control
+                            t = Math.Abs(H(i, n));
+                            if ((Eps * t) * t > 1)
+                            {
+                                for (int j = i; j <= n; j++)
+                                {
+                                    H(j, n) = H(j, n) / t;
+                                }
+                            }
+                        }
+                    }
+                }
+                else if (q < 0)
+                {
+                    // complex vector
+                    int l = n - 1;
+
+                    // last vector component imaginary so matrix is triangular
+                    if (Math.Abs(H(n, n - 1)) > Math.Abs(H(n - 1, n)))
+                    {
+                        H(n - 1, n - 1) = q / H(n, n - 1);
+                        H(n - 1, n) = -(H(n, n) - p) / H(n, n - 1);
+                    }
+                    else
+                    {
+                        Complex c = Cdiv(0.0, -H(n - 1, n), H(n - 1, n - 1) - p, q);
+                        H(n - 1, n - 1) = c.Real;
+                        H(n - 1, n) = c.Imaginary;
+                    }
+                    H(n, n - 1) = 0.0;
+                    H(n, n) = 1.0;
+                    for (int i = n - 2; i >= 0; i--)
+                    {
+                        double ra = 0.0;
+                        double sa = 0.0;
+                        for (int j = l; j <= n; j++)
+                        {
+                            ra += H(i, j) * H(j, n - 1);
+                            sa += H(i, j) * H(j, n);
+                        }
+                        w = H(i, i) - p;
+
+                        if (e[i] < 0.0)
+                        {
+                            z = w;
+                            r = ra;
+                            s = sa;
+                        }
+                        else
+                        {
+                            l = i;
+                            if (e[i] == 0)
+                            {
+                                Complex c = Cdiv(-ra, -sa, w, q);
+                                H(i, n - 1) = c.Real;
+                                H(i, n) = c.Imaginary;
+                            }
+                            else
+                            {
+                                // solve complex equations
+                                x = H(i, i + 1);
+                                y = H(i + 1, i);
+                                double vr = (d[i] - p) * (d[i] - p) + e[i] * e[i] - q * q;
+                                double vi = (d[i] - p) * 2.0 * q;
+                                if (vr == 0.0 && vi == 0.0)
+                                {
+                                    vr = Eps * norm * (Math.Abs(w) + Math.Abs(q) + Math.Abs(x) + Math.Abs(y) + Math.Abs(z));
+                                }
+                                Complex c = Cdiv(x * r - z * ra + q * sa, x * s - z * sa - q * ra, vr, vi);
+                                H(i, n - 1) = c.Real;
+                                H(i, n) = c.Imaginary;
+                                if (Math.Abs(x) > (Math.Abs(z) + Math.Abs(q)))
+                                {
+                                    H(i + 1, n - 1) = (-ra - w * H(i, n - 1) + q * H(i, n)) / x;
+                                    H(i + 1, n) = (-sa - w * H(i, n) - q * H(i, n - 1)) / x;
+                                }
+                                else
+                                {
+                                    c = Cdiv(-r - y * H(i, n - 1), -s - y * H(i, n), z, q);
+                                    H(i + 1, n - 1) = c.Real;
+                                    H(i + 1, n) = c.Imaginary;
+                                }
+                            }
+
+                            // overflow control
+                            t = Math.Max(Math.Abs(H(i, n - 1)), Math.Abs(H(i, n)));
+                            if ((Eps * t) * t > 1)
+                            {
+                                for (int j = i; j <= n; j++)
+                                {
+                                    H(j, n - 1) = H(j, n - 1) / t;
+                                    H(j, n) = H(j, n) / t;
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+
+            // back transformation to the eigenvectors of the original matrix
+            for (int j = nn - 1; j >= low; j--)
+            {
+                for (int i = low; i <= high; i++)
+                {
+                    z = 0.0;
+                    for (int k = low; k <= Math.Min(j, high); k++)
+                    {
+                        z += V(i, k) * H(k, j);
+                    }
+                    V(i, j) = z;
+                }
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// complex division (xr + i xi) / (yr + i yi) without intermediate overflow
+        /// </summary>
+        private static Complex Cdiv(double xr, double xi, double yr, double yi)
+        {
+            double r, d;
+            if (Math.Abs(yr) > Math.Abs(yi))
+            {
+                r = yi / yr;
+                d = yr + r * yi;
+                return new Complex((xr + r * xi) / d, (xi - r * xr) / d);
+            }
+            r = yr / yi;
+            d = yi + r * yr;
+            return new Complex((r * xr + xi) / d, (r * xi - xr) / d);
+        }
+
+        #endregion
+
+        #region helpers
+
+        /// <summary>
+        /// C -= A B for an m x k block A (row stride lda), a k x n block B (any strides) and an
+        /// m x n block C (row stride ldc).  Large blocks go through the GEMM engine, small ones
+        /// are done with vectorized row operations, rows of C in parallel.
+        /// </summary>
+        private static void SubtractProduct(double[] a, npy_intp aOffset, npy_intp lda,
+            double[] b, npy_intp bOffset, npy_intp bRowStride, npy_intp bColStride,
+            double[] c, npy_intp cOffset, npy_intp ldc, int m, int n, int k)
+        {
+            if (m >= GemmThreshold && n >= GemmThreshold)
+            {
+                // the engine accumulates C += A B, so multiply with -A
+                double[] negA = new double[(npy_intp)m * k];
+                for (int i = 0; i < m; i++)
+                {
+                    npy_intp ai = aOffset + i * lda;
+                    for (int p = 0; p < k; p++)
+                    {
+                        negA[(npy_intp)i * k + p] = -a[ai + p];
+                    }
+                }
+                GemmEngine<double>.Multiply(negA, 0, k, 1, b, bOffset, bRowStride, bColStride, c, cOffset, ldc, 1, m, n, k);
+                return;
+            }
+
+            ForEachSegment(m, (npy_intp)n * k, (start, end) =>
+            {
+                for (npy_intp i = start; i < end; i++)
+                {
+                    npy_intp ai = aOffset + i * lda;
+                    npy_intp ci = cOffset + i * ldc;
+                    if (bColStride == 1)
+                    {
+                        for (int p = 0; p < k; p++)
+                        {
+                            double l = a[ai + p];
+                            if (l != 0.0)
+                            {
+                                Axpy(-l, b, bOffset + p * bRowStride, c, ci, n);
+                            }
+                        }
+                    }
+                    else if (bRowStride == 1)
+                    {
+                        for (int j = 0; j < n; j++)
+                        {
+                            c[ci + j] -= Dot(a, ai, b, bOffset + j * bColStride, k);
+                        }
+                    }
+                    else
+                    {
+                        for (int j = 0; j < n; j++)
+                        {
+                            double sum = 0.0;
+                            for (int p = 0; p < k; p++)
+                            {
+                                sum += a[ai + p] * b[bOffset + p * bRowStride + j * bColStride];
+                            }
+                            c[ci + j] -= sum;
+                        }
+                    }
+                }
+            });
+        }
+
+        /// <summary>
+        /// calls body over segments of 0..count, in parallel when the work (count * costPerItem)
+        /// is larger than one grain, otherwise on the calling thread
+        /// </summary>
+        private static void ForEachSegment(npy_intp count, npy_intp costPerItem, Action<npy_intp, npy_intp> body)
+        {
+            if (count <= 0)
+            {
+                return;
+            }
+
+            npy_intp grain = Math.Max(1, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp) / Math.Max(1, costPerItem));
+            if (count <= grain)
+            {
+                body(0, count);
+                return;
+            }
+
+            Parallel.ForEach(numpyinternal.NpyArray_SEGMENT_ParallelSplit(count, grain), NpyParallelScheduler.Options, seg =>
+            {
+                body(seg.start, seg.end);
+            });
+        }
+
+        // y[yi..yi+len] += alpha * x[xi..xi+len]
+        private static void Axpy(double alpha, double[] x, npy_intp xi, double[] y, npy_intp yi, int len)
+        {
+            int i = 0;
+            int width = Vector<double>.Count;
+            if (Vector.IsHardwareAccelerated && len >= width)
+            {
+                var va = new Vector<double>(alpha);
+                for (; i <= len - width; i += width)
+                {
+                    int xo = (int)(xi + i);
+                    int yo = (int)(yi + i);
+                    (new Vector<double>(y, yo) + va * new Vector<double>(x, xo)).CopyTo(y, yo);
+                }
+            }
+            for (; i < len; i++)
+            {
+                y[yi + i] += alpha * x[xi + i];
+            }
+        }
+
+        // sum of x[xi..xi+len] * y[yi..yi+len]
+        private static double Dot(double[] x, npy_intp xi, double[] y, npy_intp yi, int len)
+        {
+            int i = 0;
+            double sum = 0.0;
+            int width = Vector<double>.Count;
+            if (Vector.IsHardwareAccelerated && len >= width)
+            {
+                var acc = Vector<double>.Zero;
+                for (; i <= len - width; i += width)
+                {
+                    acc += new Vector<double>(x, (int)(xi + i)) * new Vector<double>(y, (int)(yi + i));
+                }
+                sum = Vector.Dot(acc, Vector<double>.One);
+            }
+            for (; i < len; i++)
+            {
+                sum += x[xi + i] * y[yi + i];
+            }
+            return sum;
+        }
+
+        private static void SwapRows(double[] a, npy_intp r1, npy_intp r2, int len)
+        {
+            for (int i = 0; i < len; i++)
+            {
+                double t = a[r1 + i];
+                a[r1 + i] = a[r2 + i];
+                a[r2 + i] = t;
+            }
+        }
+
+        private static void Transpose(double[] a, npy_intp offset, int n)
+        {
+            for (int i = 0; i < n; i++)
+            {
+                for (int j = i + 1; j < n; j++)
+                {
+                    npy_intp ij = offset + (npy_intp)i * n + j;
+                    npy_intp ji = offset + (npy_intp)j * n + i;
+                    double t = a[ij];
+                    a[ij] = a[ji];
+                    a[ji] = t;
+                }
+            }
+        }
+
+        private static void SetIdentity(double[] a, npy_intp offset, int rows, int cols)
+        {
+            for (int i = 0; i < rows; i++)
+            {
+                npy_intp ri = offset + (npy_intp)i * cols;
+                for (int j = 0; j < cols; j++)
+                {
+                    a[ri + j] = i == j ? 1.0 : 0.0;
+                }
+            }
+        }
+
+        // sqrt(a*a + b*b) without intermediate overflow
+        private static double Hypot(double a, double b)
+        {
+            a = Math.Abs(a);
+            b = Math.Abs(b);
+            if (a < b)
+            {
+                double t = a;
+                a = b;
+                b = t;
+            }
+            if (a == 0.0)
+            {
+                return 0.0;
+            }
+            double r = b / a;
+            return a * Math.Sqrt(1.0 + r * r);
+        }
+
+        #endregion
+    }
+}
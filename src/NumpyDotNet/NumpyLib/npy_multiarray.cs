@@ -754,6 +754,17 @@ namespace NumpyLib
                 return null;
             }
   
+            if (ap1.nd == 2 && ap2.nd == 2)
+            {
+                // inner(a, b) == dot(a, b.T), so present b to the GEMM engine transposed.
+                if (NpyArray_GemmProduct(ap1, ap1.strides[0], ap1.strides[1],
+                                         ap2, ap2.strides[1], ap2.strides[0],
+                                         ret, ap1.dimensions[0], ap2.dimensions[0], l))
+                {
+                    return ret;
+                }
+            }
+
             npy_intp is1 = ap1.strides[ap1.nd - 1];
             npy_intp is2 = ap2.strides[ap2.nd - 1];
             VoidPtr op = new VoidPtr(ret);
@@ -841,6 +852,16 @@ namespace NumpyLib
             }
 
 
+            if (ap1.nd == 2 && ap2.nd == 2)
+            {
+                if (NpyArray_GemmProduct(ap1, ap1.strides[0], ap1.strides[1],
+                                         ap2, ap2.strides[0], ap2.strides[1],
+                                         ret, ap1.dimensions[0], ap2.dimensions[1], l))
+                {
+                    return ret;
+                }
+            }
+
             op = new VoidPtr(ret);
             os = NpyArray_ITEMSIZE(ret);
             axis = ap1.nd - 1;
@@ -997,6 +1018,12 @@ namespace NumpyLib
             {
                 return null;
             }
+
+            // long kernels are cheaper through FFT overlap-add
+            if (NpyFFTKernels.Correlate(ap1, ap2, ret, n_left))
+            {
+                return ret;
+            }
   
             npy_intp is1 = NpyArray_STRIDE(ap1, 0);
             npy_intp is2 = NpyArray_STRIDE(ap2, 0);
@@ -1123,15 +1150,16 @@ namespace NumpyLib
 
      
 
-            IEnumerable<NpyArrayIterObject> srcParallelIters = NpyArray_ITER_ParallelSplit(SrcIter, numpyinternal.maxCopyFieldParallelSize);
-            IEnumerable<NpyArrayIterObject> destParallelIters = NpyArray_ITER_ParallelSplit(DestIter, numpyinternal.maxCopyFieldParallelSize);
+            npy_intp grainSize = numpyinternal.maxCopyFieldParallelSize;
+            IEnumerable<NpyArrayIterObject> srcParallelIters = NpyArray_ITER_ParallelSplit(SrcIter, grainSize);
+            IEnumerable<NpyArrayIterObject> destParallelIters = NpyArray_ITER_ParallelSplit(DestIter, grainSize);
             IEnumerable<NpyArrayIterObject> whereParalleIters = null;
             if (WhereIter != null)
             {
-                whereParalleIters = NpyArray_ITER_ParallelSplit(WhereIter, numpyinternal.maxCopyFieldParallelSize);
+                whereParalleIters = NpyArray_ITER_ParallelSplit(WhereIter, grainSize);
             }
 
-            Parallel.For(0, destParallelIters.Count(), index =>
+            Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
             //for (int index = 0; index < destParallelIters.Count(); index++) // 
             {
                 NpyArrayIterObject ldestIter = destParallelIters.ElementAt(index);
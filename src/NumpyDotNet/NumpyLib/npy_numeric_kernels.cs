@@ -0,0 +1,538 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Text;
+using System.Threading.Tasks;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyLib
+{
+    #region numeric kernels
+
+    /// <summary>
+    /// Strongly typed replacement for the boxed NumericOperation delegates.  Mixed type
+    /// arithmetic in the array handlers is evaluated in double, so the kernels work on
+    /// double and the loops convert in and out of the array element types.
+    /// </summary>
+    internal interface INumericKernel
+    {
+        double Operate(double bValue, double operand);
+    }
+
+    internal struct AddKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue + operand; }
+    }
+    internal struct SubtractKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue - operand; }
+    }
+    internal struct MultiplyKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue * operand; }
+    }
+    internal struct IntegerDivideKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return operand == 0 ? 0 : bValue / operand; }
+    }
+    internal struct FloatingDivideKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return operand == 0 ? double.PositiveInfinity : bValue / operand; }
+    }
+    internal struct TrueDivideKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue / operand; }
+    }
+    internal struct MaximumKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return Math.Max(bValue, operand); }
+    }
+    internal struct MinimumKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return Math.Min(bValue, operand); }
+    }
+    internal struct LessKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue < operand ? 1 : 0; }
+    }
+    internal struct LessEqualKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue <= operand ? 1 : 0; }
+    }
+    internal struct EqualKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue == operand ? 1 : 0; }
+    }
+    internal struct NotEqualKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue != operand ? 1 : 0; }
+    }
+    internal struct GreaterKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue > operand ? 1 : 0; }
+    }
+    internal struct GreaterEqualKernel : INumericKernel
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double Operate(double bValue, double operand) { return bValue >= operand ? 1 : 0; }
+    }
+
+    /// <summary>
+    /// Unboxed conversions between the primitive element types and double.  Like the kernels,
+    /// the converters are structs passed as generic arguments so the JIT inlines the conversion
+    /// for each element type instead of casting through object.
+    /// </summary>
+    internal interface INumericConverter<T>
+    {
+        double ToDouble(T value);
+        T FromDouble(double value);
+    }
+
+    internal struct BoolConverter : INumericConverter<bool>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(bool value) { return value ? 1 : 0; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public bool FromDouble(double value) { return value != 0; }
+    }
+    internal struct SByteConverter : INumericConverter<sbyte>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(sbyte value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public sbyte FromDouble(double value) { return (sbyte)value; }
+    }
+    internal struct ByteConverter : INumericConverter<byte>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(byte value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public byte FromDouble(double value) { return (byte)value; }
+    }
+    internal struct Int16Converter : INumericConverter<Int16>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(Int16 value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public Int16 FromDouble(double value) { return (Int16)value; }
+    }
+    internal struct UInt16Converter : INumericConverter<UInt16>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(UInt16 value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public UInt16 FromDouble(double value) { return (UInt16)value; }
+    }
+    internal struct Int32Converter : INumericConverter<Int32>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(Int32 value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public Int32 FromDouble(double value) { return (Int32)value; }
+    }
+    internal struct UInt32Converter : INumericConverter<UInt32>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(UInt32 value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public UInt32 FromDouble(double value) { return (UInt32)value; }
+    }
+    internal struct Int64Converter : INumericConverter<Int64>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(Int64 value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public Int64 FromDouble(double value) { return (Int64)value; }
+    }
+    internal struct UInt64Converter : INumericConverter<UInt64>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(UInt64 value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public UInt64 FromDouble(double value) { return (UInt64)value; }
+    }
+    internal struct FloatConverter : INumericConverter<float>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(float value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public float FromDouble(double value) { return (float)value; }
+    }
+    internal struct DoubleConverter : INumericConverter<double>
+    {
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double ToDouble(double value) { return value; }
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        public double FromDouble(double value) { return value; }
+    }
+
+    #endregion
+
+    internal partial class numpyinternal
+    {
+        private static bool IsNumericKernelType(NpyArray arr)
+        {
+            switch (arr.ItemType)
+            {
+                case NPY_TYPES.NPY_BYTE:
+                case NPY_TYPES.NPY_UBYTE:
+                case NPY_TYPES.NPY_INT16:
+                case NPY_TYPES.NPY_UINT16:
+                case NPY_TYPES.NPY_INT32:
+                case NPY_TYPES.NPY_UINT32:
+                case NPY_TYPES.NPY_INT64:
+                case NPY_TYPES.NPY_UINT64:
+                case NPY_TYPES.NPY_FLOAT:
+                case NPY_TYPES.NPY_DOUBLE:
+                    return arr.ItemType == arr.data.type_num;
+                default:
+                    return false;
+            }
+        }
+
+        /// <summary>
+        /// Mixed type binary operations whose handler semantics are "convert both sides to
+        /// double and apply the operator" run through typed kernels instead of boxing every
+        /// element through the NumericOperation delegates.
+        /// </summary>
+        private static bool PerformNumericOpKernel(NpyArray srcArray, NpyArray destArray, NpyArray operArray, NumericOperations operations,
+                        NpyArrayIterObject srcIter, NpyArrayIterObject destIter, NpyArrayIterObject operIter)
+        {
+            if (!IsNumericKernelType(srcArray) || !IsNumericKernelType(operArray))
+                return false;
+
+            // same typed integer operands are not converted to double by the handlers
+            if (!operations.destTypeIsFloat && srcArray.ItemType == operArray.ItemType)
+                return false;
+
+            if (IsBoolReturn(operations.operationType))
+            {
+                switch (operations.operationType)
+                {
+                    case UFuncOperation.less:
+                    case UFuncOperation.less_equal:
+                    case UFuncOperation.equal:
+                    case UFuncOperation.not_equal:
+                    case UFuncOperation.greater:
+                    case UFuncOperation.greater_equal:
+                        break;
+                    default:
+                        return false;
+                }
+
+                if (destArray.ItemType != NPY_TYPES.NPY_BOOL || destArray.data.type_num != NPY_TYPES.NPY_BOOL)
+                    return false;
+
+                PerformNumericOpKernel_S(srcArray, destArray, operArray, operations.operationType, srcIter, destIter, operIter);
+                return true;
+            }
+
+            switch (operations.operationType)
+            {
+                case UFuncOperation.add:
+                case UFuncOperation.subtract:
+                case UFuncOperation.multiply:
+                case UFuncOperation.divide:
+                case UFuncOperation.true_divide:
+                case UFuncOperation.maximum:
+                case UFuncOperation.minimum:
+                    break;
+                default:
+                    return false;
+            }
+
+            if (!IsNumericKernelType(destArray))
+                return false;
+
+            PerformNumericOpKernel_S(srcArray, destArray, operArray, operations.operationType, srcIter, destIter, operIter);
+            return true;
+        }
+
+        private static void PerformNumericOpKernel_S(NpyArray srcArray, NpyArray destArray, NpyArray operArray, UFuncOperation operationType, NpyArrayIterObject srcIter, NpyArrayIterObject destIter, NpyArrayIterObject operIter)
+        {
+            switch (srcArray.ItemType)
+            {
+                case NPY_TYPES.NPY_BYTE:
+                    PerformNumericOpKernel_SO<sbyte, SByteConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UBYTE:
+                    PerformNumericOpKernel_SO<byte, ByteConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT16:
+                    PerformNumericOpKernel_SO<Int16, Int16Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT16:
+                    PerformNumericOpKernel_SO<UInt16, UInt16Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT32:
+                    PerformNumericOpKernel_SO<Int32, Int32Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT32:
+                    PerformNumericOpKernel_SO<UInt32, UInt32Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT64:
+                    PerformNumericOpKernel_SO<Int64, Int64Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT64:
+                    PerformNumericOpKernel_SO<UInt64, UInt64Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_FLOAT:
+                    PerformNumericOpKernel_SO<float, FloatConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_DOUBLE:
+                    PerformNumericOpKernel_SO<double, DoubleConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+            }
+        }
+
+        private static void PerformNumericOpKernel_SO<S, SC>(NpyArray srcArray, NpyArray destArray, NpyArray operArray, UFuncOperation operationType, NpyArrayIterObject srcIter, NpyArrayIterObject destIter, NpyArrayIterObject operIter)
+            where SC : struct, INumericConverter<S>
+        {
+            switch (operArray.ItemType)
+            {
+                case NPY_TYPES.NPY_BYTE:
+                    PerformNumericOpKernel_SOD<S, SC, sbyte, SByteConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UBYTE:
+                    PerformNumericOpKernel_SOD<S, SC, byte, ByteConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT16:
+                    PerformNumericOpKernel_SOD<S, SC, Int16, Int16Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT16:
+                    PerformNumericOpKernel_SOD<S, SC, UInt16, UInt16Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT32:
+                    PerformNumericOpKernel_SOD<S, SC, Int32, Int32Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT32:
+                    PerformNumericOpKernel_SOD<S, SC, UInt32, UInt32Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT64:
+                    PerformNumericOpKernel_SOD<S, SC, Int64, Int64Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT64:
+                    PerformNumericOpKernel_SOD<S, SC, UInt64, UInt64Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_FLOAT:
+                    PerformNumericOpKernel_SOD<S, SC, float, FloatConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_DOUBLE:
+                    PerformNumericOpKernel_SOD<S, SC, double, DoubleConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+            }
+        }
+
+        private static void PerformNumericOpKernel_SOD<S, SC, O, OC>(NpyArray srcArray, NpyArray destArray, NpyArray operArray, UFuncOperation operationType, NpyArrayIterObject srcIter, NpyArrayIterObject destIter, NpyArrayIterObject operIter)
+            where SC : struct, INumericConverter<S> where OC : struct, INumericConverter<O>
+        {
+            if (destArray.ItemType == NPY_TYPES.NPY_BOOL)
+            {
+                PerformNumericOpKernel_OP<S, SC, O, OC, bool, BoolConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                return;
+            }
+
+            switch (destArray.ItemType)
+            {
+                case NPY_TYPES.NPY_BYTE:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, sbyte, SByteConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UBYTE:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, byte, ByteConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT16:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, Int16, Int16Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT16:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, UInt16, UInt16Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT32:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, Int32, Int32Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT32:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, UInt32, UInt32Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_INT64:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, Int64, Int64Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_UINT64:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, UInt64, UInt64Converter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_FLOAT:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, float, FloatConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+                case NPY_TYPES.NPY_DOUBLE:
+                    PerformNumericOpKernel_OP<S, SC, O, OC, double, DoubleConverter>(srcArray, destArray, operArray, operationType, srcIter, destIter, operIter);
+                    return;
+            }
+        }
+
+        private static void PerformNumericOpKernel_OP<S, SC, O, OC, D, DC>(NpyArray srcArray, NpyArray destArray, NpyArray operArray, UFuncOperation operationType, NpyArrayIterObject srcIter, NpyArrayIterObject destIter, NpyArrayIterObject operIter)
+            where SC : struct, INumericConverter<S> where OC : struct, INumericConverter<O> where DC : struct, INumericConverter<D>
+        {
+            bool srcIsFloat = NpyTypeNum_ISFLOAT(srcArray.ItemType);
+
+            switch (operationType)
+            {
+                case UFuncOperation.add:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, AddKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.subtract:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, SubtractKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.multiply:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, MultiplyKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.divide:
+                    if (srcIsFloat)
+                        PerformNumericOpKernel<S, SC, O, OC, D, DC, FloatingDivideKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    else
+                        PerformNumericOpKernel<S, SC, O, OC, D, DC, IntegerDivideKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.true_divide:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, TrueDivideKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.maximum:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, MaximumKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.minimum:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, MinimumKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.less:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, LessKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.less_equal:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, LessEqualKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.equal:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, EqualKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.not_equal:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, NotEqualKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.greater:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, GreaterKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+                case UFuncOperation.greater_equal:
+                    PerformNumericOpKernel<S, SC, O, OC, D, DC, GreaterEqualKernel>(srcArray, destArray, operArray, srcIter, destIter, operIter);
+                    break;
+            }
+        }
+
+        private static void PerformNumericOpKernel<S, SC, O, OC, D, DC, K>(NpyArray srcArray, NpyArray destArray, NpyArray operArray,
+                        NpyArrayIterObject srcIter, NpyArrayIterObject destIter, NpyArrayIterObject operIter)
+            where SC : struct, INumericConverter<S> where OC : struct, INumericConverter<O> where DC : struct, INumericConverter<D> where K : struct, INumericKernel
+        {
+            S[] src = srcArray.data.datap as S[];
+            O[] oper = operArray.data.datap as O[];
+            D[] dest = destArray.data.datap as D[];
+
+            K kernel = default(K);
+            SC srcConverter = default(SC);
+            OC operConverter = default(OC);
+            DC destConverter = default(DC);
+
+            var loopCount = NpyArray_Size(destArray);
+
+            if (NpyArray_Size(operArray) == 1 && !srcIter.requiresIteration && !destIter.requiresIteration && NpyArray_Size(srcArray) == loopCount)
+            {
+                double operand = operConverter.ToDouble(oper[operArray.data.data_offset >> operArray.ItemDiv]);
+
+                npy_intp srcAdjustment = srcArray.data.data_offset >> srcArray.ItemDiv;
+                npy_intp destAdjustment = destArray.data.data_offset >> destArray.ItemDiv;
+
+                var segments = NpyArray_SEGMENT_ParallelSplit(loopCount, numpyinternal.NumericOpParallelSize(destArray));
+
+                Parallel.For(0, segments.Count(), numpyinternal.parallelOptions, segment_index =>
+                {
+                    var segment = segments.ElementAt(segment_index);
+
+                    for (npy_intp index = segment.start; index < segment.end; index++)
+                    {
+                        double bValue = srcConverter.ToDouble(src[index + srcAdjustment]);
+                        dest[index + destAdjustment] = destConverter.FromDouble(kernel.Operate(bValue, operand));
+                    }
+                });
+
+                return;
+            }
+
+            srcIter = NpyArray_ITER_ConvertToIndex(srcIter, srcArray.ItemDiv);
+            destIter = NpyArray_ITER_ConvertToIndex(destIter, destArray.ItemDiv);
+            operIter = NpyArray_ITER_ConvertToIndex(operIter, operArray.ItemDiv);
+
+            npy_intp grainSize = numpyinternal.NumericOpParallelSize(destArray);
+            var srcParallelIters = NpyArray_ITER_ParallelSplit(srcIter, grainSize);
+            var destParallelIters = NpyArray_ITER_ParallelSplit(destIter, grainSize);
+            var operParallelIters = NpyArray_ITER_ParallelSplit(operIter, grainSize);
+
+            Parallel.For(0, destParallelIters.Count(), numpyinternal.parallelOptions, index =>
+            {
+                var ldestIter = destParallelIters.ElementAt(index);
+                var lsrcIter = srcParallelIters.ElementAt(index);
+                var loperIter = operParallelIters.ElementAt(index);
+
+                while (ldestIter.index < ldestIter.size)
+                {
+                    double bValue = srcConverter.ToDouble(src[lsrcIter.dataptr.data_offset]);
+                    double operand = operConverter.ToDouble(oper[loperIter.dataptr.data_offset]);
+                    dest[ldestIter.dataptr.data_offset] = destConverter.FromDouble(kernel.Operate(bValue, operand));
+
+                    NpyArray_ITER_NEXT(ldestIter);
+                    NpyArray_ITER_NEXT(lsrcIter);
+                    NpyArray_ITER_NEXT(loperIter);
+                }
+            });
+        }
+    }
+}
@@ -178,45 +178,12 @@ namespace NumpyLib
     }
     internal class Sort_COMPLEX
     {
-        class ArgSortData_COMPLEX : IComparable
-        {
-            System.Numerics.Complex dvalue;
-            public npy_intp index;
-
-            public ArgSortData_COMPLEX(npy_intp index, System.Numerics.Complex d)
-            {
-                this.index = index;
-                this.dvalue = d;
-            }
-
-            public int CompareTo(object obj)
-            {
-                ArgSortData_COMPLEX cv = obj as ArgSortData_COMPLEX;
-                return this.dvalue.Real.CompareTo(cv.dvalue.Real);
-            }
-        }
-
         public void argSortIndexes(VoidPtr ip, npy_intp m, VoidPtr sortData, npy_intp startingIndex, NPY_SORTKIND kind, int DivSize, int IntpDivSize)
         {
-            var data = sortData.datap as System.Numerics.Complex[];
-
-            var argSortDouble = new ArgSortData_COMPLEX[m];
-
-            var adjustedIndex = startingIndex + (sortData.data_offset >> DivSize);
-
-            for (int i = 0; i < m; i++)
+            // sorted lexicographically on (Real, Imaginary) by two stable key passes
+            if (!NpySortKernels.ArgSort(ip, m, sortData, startingIndex, kind, DivSize, IntpDivSize))
             {
-                argSortDouble[i] = new ArgSortData_COMPLEX(i, data[i + adjustedIndex]);
-            }
-
-            //Array.Sort(argSortDouble);
-            argSortDouble = argSortDouble.AsParallel().OrderBy(t => t).ToArray();
-
-            npy_intp[] _ip = (npy_intp[])ip.datap;
-
-            for (int i = 0; i < m; i++)
-            {
-                _ip[i + (ip.data_offset >> IntpDivSize)] = argSortDouble[i].index - startingIndex;
+                throw new Exception("ArgSortIndexes does not support this many elements");
             }
         }
     }
@@ -233,45 +200,33 @@ namespace NumpyLib
     }
     internal class Sort_OBJECT
     {
-        class ArgSortData_OBJECT : IComparable
-        {
-            dynamic dvalue;
-            public npy_intp index;
-
-            public ArgSortData_OBJECT(npy_intp index, System.Object d)
-            {
-                this.index = index;
-                this.dvalue = d;
-            }
-
-            public int CompareTo(object obj)
-            {
-                ArgSortData_OBJECT cv = obj as ArgSortData_OBJECT;
-                return this.dvalue.CompareTo(cv.dvalue);
-            }
-        }
-
         public void argSortIndexes(VoidPtr ip, npy_intp m, VoidPtr sortData, npy_intp startingIndex, NPY_SORTKIND kind, int DivSize, int IntpDivSize)
         {
             var data = sortData.datap as System.Object[];
 
-            var argSortDouble = new ArgSortData_OBJECT[m];
-
             var adjustedIndex = startingIndex + (sortData.data_offset >> DivSize);
 
+            var values = new System.Object[m];
+            var indexes = new npy_intp[m];
+
             for (int i = 0; i < m; i++)
             {
-                argSortDouble[i] = new ArgSortData_OBJECT(i, data[i + adjustedIndex]);
+                values[i] = data[i + adjustedIndex];
+                indexes[i] = i;
             }
 
-            //Array.Sort(argSortDouble);
-            argSortDouble = argSortDouble.AsParallel().OrderBy(t => t).ToArray();
+            // ties are broken on the original position so every kind is stable
+            Array.Sort(indexes, (i1, i2) =>
+            {
+                int c = ((dynamic)values[i1]).CompareTo(values[i2]);
+                return c != 0 ? c : i1.CompareTo(i2);
+            });
 
             npy_intp[] _ip = (npy_intp[])ip.datap;
 
             for (int i = 0; i < m; i++)
             {
-                _ip[i + (ip.data_offset >> IntpDivSize)] = argSortDouble[i].index - startingIndex;
+                _ip[i + (ip.data_offset >> IntpDivSize)] = indexes[i] - startingIndex;
             }
         }
     }
@@ -294,29 +249,16 @@ namespace NumpyLib
             public npy_intp index;
         }
 
-        // use class for quick sort.  It is faster.
-        class CArgSortData : IComparable
-        {
-            T dvalue;
-            public npy_intp index;
-
-            public CArgSortData(npy_intp index, T d)
-            {
-                this.index = index;
-                this.dvalue = d;
-            }
-
-            public int CompareTo(object obj)
-            {
-                CArgSortData cv = obj as CArgSortData;
-                return this.dvalue.CompareTo(cv.dvalue);
-            }
-        }
-
         public abstract int CompareTo(T d1, T d2);
 
         public void argSortIndexes(VoidPtr ip, npy_intp m, VoidPtr sortData, npy_intp startingIndex, NPY_SORTKIND kind, int DivSize, int IntpDivSize)
         {
+            // primitive types use the comparison free key sorts
+            if (NpySortKernels.ArgSort(ip, m, sortData, startingIndex, kind, DivSize, IntpDivSize))
+            {
+                return;
+            }
+
             if (kind == NPY_SORTKIND.NPY_MERGESORT)
             {
                 argMergeSortIndexes(ip, m, sortData, startingIndex, DivSize, IntpDivSize);
@@ -327,13 +269,13 @@ namespace NumpyLib
             {
                 // use merge sort until we can get a faster quick sort.
                 argMergeSortIndexes(ip, m, sortData, startingIndex, DivSize, IntpDivSize);
-                //argQuickSortIndexes(ip, m, sortData, startingIndex, DivSize, IntpDivSize);
                 return;
             }
 
             if (kind == NPY_SORTKIND.NPY_HEAPSORT)
             {
-                throw new Exception("HEAPSORT not supported");
+                argHeapSortIndexes(ip, m, sortData, startingIndex, DivSize, IntpDivSize);
+                return;
             }
 
             throw new Exception("Unrecognized sort type");
@@ -341,22 +283,32 @@ namespace NumpyLib
     
         }
 
-        #region QuickSort
-        private void argQuickSortIndexes(VoidPtr ip, npy_intp m, VoidPtr sortData, npy_intp startingIndex, int DivSize, int IntpDivSize)
+        #region HeapSort
+        private void argHeapSortIndexes(VoidPtr ip, npy_intp m, VoidPtr sortData, npy_intp startingIndex, int DivSize, int IntpDivSize)
         {
             T[] data = sortData.datap as T[];
 
-            var argSortData = new CArgSortData[m];
+            var argSortData = new ArgSortData[m];
 
             var adjustedIndex = startingIndex + (sortData.data_offset >> DivSize);
 
             for (npy_intp i = 0; i < m; i++)
             {
-                argSortData[i] = new CArgSortData(i, data[adjustedIndex++]);
+                argSortData[i].index = i;
+                argSortData[i].dvalue = data[adjustedIndex++];
             }
 
-            //Array.Sort(argSortData);
-            argSortData = argSortData.AsParallel().OrderBy(t => t).ToArray();
+            for (npy_intp i = m / 2 - 1; i >= 0; i--)
+            {
+                _ArgSiftDown(argSortData, i, m);
+            }
+            for (npy_intp end = m - 1; end > 0; end--)
+            {
+                var tmp = argSortData[0];
+                argSortData[0] = argSortData[end];
+                argSortData[end] = tmp;
+                _ArgSiftDown(argSortData, 0, end);
+            }
 
             npy_intp[] _ip = (npy_intp[])ip.datap;
 
@@ -366,6 +318,25 @@ namespace NumpyLib
                 _ip[data_offset++] = argSortData[i].index - startingIndex;
             }
         }
+
+        private void _ArgSiftDown(ArgSortData[] input, npy_intp root, npy_intp length)
+        {
+            while (true)
+            {
+                npy_intp child = 2 * root + 1;
+                if (child >= length)
+                    return;
+                if (child + 1 < length && CompareTo(input[child + 1].dvalue, input[child].dvalue) > 0)
+                    child++;
+                if (CompareTo(input[root].dvalue, input[child].dvalue) >= 0)
+                    return;
+
+                var tmp = input[root];
+                input[root] = input[child];
+                input[child] = tmp;
+                root = child;
+            }
+        }
         #endregion
 
         #region MergeSort
@@ -0,0 +1,1034 @@
+﻿/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2018-2021
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions and the following disclaimer.
+ *
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions and the following disclaimer in the documentation
+ *    and/or other materials provided with the distribution.
+ *
+ * 3. Neither the name of the copyright holder nor the names of its
+ *    contributors may be used to endorse or promote products derived from
+ *    this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ * DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+using System.Threading.Tasks;
+#if NPY_INTP_64
+using npy_intp = System.Int64;
+#else
+using npy_intp = System.Int32;
+#endif
+
+namespace NumpyLib
+{
+    /// <summary>
+    /// Typed sort and argsort kernels for the primitive dtypes.  Values are mapped to
+    /// order preserving unsigned keys so the sorts never call a comparer:
+    ///   NPY_QUICKSORT  - introsort on the keys
+    ///   NPY_HEAPSORT   - heapsort on the keys
+    ///   NPY_MERGESORT/NPY_STABLESORT - LSD radix sort (stable)
+    /// Large inputs are split with a parallel sample sort first.  NaNs sort to the end
+    /// like NumPy.
+    /// </summary>
+    internal static class NpySortKernels
+    {
+        internal static npy_intp ParallelSortThreshold = 1 << 20;
+
+        private const int RadixBits = 8;
+        private const int RadixBuckets = 1 << RadixBits;
+        private const int SampleOversampling = 32;
+
+        internal static bool IsKernelType(NPY_TYPES type_num)
+        {
+            switch (type_num)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                case NPY_TYPES.NPY_BYTE:
+                case NPY_TYPES.NPY_UBYTE:
+                case NPY_TYPES.NPY_INT16:
+                case NPY_TYPES.NPY_UINT16:
+                case NPY_TYPES.NPY_INT32:
+                case NPY_TYPES.NPY_UINT32:
+                case NPY_TYPES.NPY_INT64:
+                case NPY_TYPES.NPY_UINT64:
+                case NPY_TYPES.NPY_FLOAT:
+                case NPY_TYPES.NPY_DOUBLE:
+                    return true;
+                default:
+                    return false;
+            }
+        }
+
+        #region keys
+
+        private static ulong DoubleKey(double d)
+        {
+            if (double.IsNaN(d))
+                return ulong.MaxValue;
+            if (d == 0)
+                d = 0.0;        // -0.0 and 0.0 compare equal
+
+            ulong bits = (ulong)BitConverter.DoubleToInt64Bits(d);
+            if ((bits & 0x8000000000000000UL) != 0)
+                return ~bits;
+            return bits ^ 0x8000000000000000UL;
+        }
+
+        /// <summary>
+        /// fills keys[0..m) from data and returns the number of significant key bytes.
+        /// </summary>
+        private static int FillKeys(VoidPtr data, npy_intp offset, int m, ulong[] keys)
+        {
+            switch (data.type_num)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                {
+                    var d = data.datap as bool[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = d[offset + i] ? 1UL : 0UL;
+                    return 1;
+                }
+                case NPY_TYPES.NPY_BYTE:
+                {
+                    var d = data.datap as sbyte[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = (ulong)(d[offset + i] - sbyte.MinValue);
+                    return 1;
+                }
+                case NPY_TYPES.NPY_UBYTE:
+                {
+                    var d = data.datap as byte[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = d[offset + i];
+                    return 1;
+                }
+                case NPY_TYPES.NPY_INT16:
+                {
+                    var d = data.datap as Int16[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = (ulong)(d[offset + i] - Int16.MinValue);
+                    return 2;
+                }
+                case NPY_TYPES.NPY_UINT16:
+                {
+                    var d = data.datap as UInt16[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = d[offset + i];
+                    return 2;
+                }
+                case NPY_TYPES.NPY_INT32:
+                {
+                    var d = data.datap as Int32[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = (ulong)((Int64)d[offset + i] - Int32.MinValue);
+                    return 4;
+                }
+                case NPY_TYPES.NPY_UINT32:
+                {
+                    var d = data.datap as UInt32[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = d[offset + i];
+                    return 4;
+                }
+                case NPY_TYPES.NPY_INT64:
+                {
+                    var d = data.datap as Int64[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = (ulong)d[offset + i] ^ 0x8000000000000000UL;
+                    return 8;
+                }
+                case NPY_TYPES.NPY_UINT64:
+                {
+                    var d = data.datap as UInt64[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = d[offset + i];
+                    return 8;
+                }
+                case NPY_TYPES.NPY_FLOAT:
+                {
+                    // float widens to double exactly; the unused low mantissa bytes are
+                    // constant so the radix passes over them are skipped.
+                    var d = data.datap as float[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = DoubleKey(d[offset + i]);
+                    return 8;
+                }
+                case NPY_TYPES.NPY_DOUBLE:
+                {
+                    var d = data.datap as double[];
+                    for (int i = 0; i < m; i++)
+                        keys[i] = DoubleKey(d[offset + i]);
+                    return 8;
+                }
+                default:
+                    throw new Exception("sort kernels do not support this data type");
+            }
+        }
+
+        #endregion
+
+        #region entry points
+
+        /// <summary>
+        /// argsort of m elements starting at sortData (plus startingIndex) into ip.
+        /// Returns false if the data type is not handled here.
+        /// </summary>
+        internal static bool ArgSort(VoidPtr ip, npy_intp m, VoidPtr sortData, npy_intp startingIndex, NPY_SORTKIND kind, int DivSize, int IntpDivSize)
+        {
+            if (m > int.MaxValue)
+                return false;
+
+            npy_intp adjustedIndex = startingIndex + (sortData.data_offset >> DivSize);
+            int length = (int)m;
+            ulong[] keys = new ulong[length];
+            npy_intp[] idx = new npy_intp[length];
+
+            if (sortData.type_num == NPY_TYPES.NPY_COMPLEX)
+            {
+                // lexicographic order: stable sort on the imaginary part, then on the real part.
+                // Both passes must be stable whatever kind was asked for, otherwise ties
+                // on the real part lose the imaginary ordering.
+                var d = sortData.datap as System.Numerics.Complex[];
+                for (int i = 0; i < length; i++)
+                {
+                    keys[i] = DoubleKey(d[adjustedIndex + i].Imaginary);
+                    idx[i] = i;
+                }
+                SortKeys(keys, idx, 8, NPY_SORTKIND.NPY_STABLESORT);
+                for (int i = 0; i < length; i++)
+                {
+                    keys[i] = DoubleKey(d[adjustedIndex + idx[i]].Real);
+                }
+                SortKeys(keys, idx, 8, NPY_SORTKIND.NPY_STABLESORT);
+            }
+            else if (IsKernelType(sortData.type_num))
+            {
+                int keyBytes = FillKeys(sortData, adjustedIndex, length, keys);
+                for (int i = 0; i < length; i++)
+                    idx[i] = i;
+                SortKeys(keys, idx, keyBytes, kind);
+            }
+            else
+            {
+                return false;
+            }
+
+            npy_intp[] _ip = (npy_intp[])ip.datap;
+            npy_intp data_offset = ip.data_offset >> IntpDivSize;
+            for (int i = 0; i < length; i++)
+            {
+                _ip[data_offset++] = idx[i] - startingIndex;
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// in place sort of length elements of data starting at element offset.
+        /// Returns false if the data type is not handled here.
+        /// </summary>
+        internal static bool Sort(VoidPtr data, npy_intp offset, npy_intp length, NPY_SORTKIND kind)
+        {
+            if (!IsKernelType(data.type_num) || length > int.MaxValue)
+                return false;
+
+            if (kind == NPY_SORTKIND.NPY_QUICKSORT && length < ParallelSortThreshold)
+            {
+                SortValues(data, (int)offset, (int)length);
+                return true;
+            }
+
+            ulong[] keys = new ulong[length];
+            npy_intp[] idx = new npy_intp[length];
+
+            int keyBytes = FillKeys(data, offset, (int)length, keys);
+            for (int i = 0; i < length; i++)
+                idx[i] = i;
+            SortKeys(keys, idx, keyBytes, kind);
+
+            switch (data.type_num)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                    Gather(data.datap as bool[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_BYTE:
+                    Gather(data.datap as sbyte[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_UBYTE:
+                    Gather(data.datap as byte[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_INT16:
+                    Gather(data.datap as Int16[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_UINT16:
+                    Gather(data.datap as UInt16[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_INT32:
+                    Gather(data.datap as Int32[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_UINT32:
+                    Gather(data.datap as UInt32[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_INT64:
+                    Gather(data.datap as Int64[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_UINT64:
+                    Gather(data.datap as UInt64[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_FLOAT:
+                    Gather(data.datap as float[], offset, idx);
+                    break;
+                case NPY_TYPES.NPY_DOUBLE:
+                    Gather(data.datap as double[], offset, idx);
+                    break;
+            }
+            return true;
+        }
+
+        private static void Gather<T>(T[] data, npy_intp offset, npy_intp[] idx)
+        {
+            T[] tmp = new T[idx.Length];
+            Array.Copy(data, offset, tmp, 0, idx.Length);
+            for (int i = 0; i < idx.Length; i++)
+            {
+                data[offset + i] = tmp[idx[i]];
+            }
+        }
+
+        private static void SortValues(VoidPtr data, int offset, int length)
+        {
+            switch (data.type_num)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                    Array.Sort(data.datap as bool[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_BYTE:
+                    Array.Sort(data.datap as sbyte[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_UBYTE:
+                    Array.Sort(data.datap as byte[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_INT16:
+                    Array.Sort(data.datap as Int16[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_UINT16:
+                    Array.Sort(data.datap as UInt16[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_INT32:
+                    Array.Sort(data.datap as Int32[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_UINT32:
+                    Array.Sort(data.datap as UInt32[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_INT64:
+                    Array.Sort(data.datap as Int64[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_UINT64:
+                    Array.Sort(data.datap as UInt64[], offset, length);
+                    break;
+                case NPY_TYPES.NPY_FLOAT:
+                {
+                    var d = data.datap as float[];
+                    Array.Sort(d, offset, length);
+                    int nanCount = 0;
+                    while (nanCount < length && float.IsNaN(d[offset + nanCount]))
+                        nanCount++;
+                    MoveLeadingToEnd(d, offset, length, nanCount);
+                    break;
+                }
+                case NPY_TYPES.NPY_DOUBLE:
+                {
+                    var d = data.datap as double[];
+                    Array.Sort(d, offset, length);
+                    int nanCount = 0;
+                    while (nanCount < length && double.IsNaN(d[offset + nanCount]))
+                        nanCount++;
+                    MoveLeadingToEnd(d, offset, length, nanCount);
+                    break;
+                }
+            }
+        }
+
+        /// <summary>
+        /// .NET orders NaN first; NumPy orders it last.
+        /// </summary>
+        private static void MoveLeadingToEnd<T>(T[] d, int offset, int length, int count)
+        {
+            if (count == 0 || count == length)
+                return;
+
+            T[] leading = new T[count];
+            Array.Copy(d, offset, leading, 0, count);
+            Array.Copy(d, offset + count, d, offset, length - count);
+            Array.Copy(leading, 0, d, offset + length - count, count);
+        }
+
+        #endregion
+
+        #region key sorts
+
+        private static void SortKeys(ulong[] keys, npy_intp[] idx, int keyBytes, NPY_SORTKIND kind)
+        {
+            int length = keys.Length;
+
+            if (kind == NPY_SORTKIND.NPY_HEAPSORT)
+            {
+                HeapSort(keys, idx, 0, length);
+                return;
+            }
+
+            ulong[] keyTmp = new ulong[length];
+            npy_intp[] idxTmp = new npy_intp[length];
+
+            if (length >= ParallelSortThreshold && NpyParallelScheduler.MaxDegreeOfParallelism > 1)
+            {
+                SampleSort(keys, idx, keyTmp, idxTmp, keyBytes, kind);
+                return;
+            }
+
+            SortRange(keys, idx, keyTmp, idxTmp, 0, length, keyBytes, kind);
+        }
+
+        private static void SortRange(ulong[] keys, npy_intp[] idx, ulong[] keyTmp, npy_intp[] idxTmp, int start, int length, int keyBytes, NPY_SORTKIND kind)
+        {
+            if (length < 2)
+                return;
+
+            if (kind == NPY_SORTKIND.NPY_QUICKSORT)
+            {
+                Array.Sort(keys, idx, start, length);
+                return;
+            }
+
+            RadixSort(keys, idx, keyTmp, idxTmp, start, length, keyBytes);
+        }
+
+        /// <summary>
+        /// stable LSD radix sort of keys[start..start+length) carrying idx along.
+        /// keyTmp/idxTmp are scratch over the same range.
+        /// </summary>
+        private static void RadixSort(ulong[] keys, npy_intp[] idx, ulong[] keyTmp, npy_intp[] idxTmp, int start, int length, int keyBytes)
+        {
+            int[] counts = new int[RadixBuckets];
+            int end = start + length;
+
+            ulong[] srcK = keys, dstK = keyTmp;
+            npy_intp[] srcI = idx, dstI = idxTmp;
+
+            for (int pass = 0; pass < keyBytes; pass++)
+            {
+                int shift = pass * RadixBits;
+
+                Array.Clear(counts, 0, RadixBuckets);
+                for (int i = start; i < end; i++)
+                {
+                    counts[(int)(srcK[i] >> shift) & (RadixBuckets - 1)]++;
+                }
+
+                // every key has the same digit, nothing to move
+                if (counts[(int)(srcK[start] >> shift) & (RadixBuckets - 1)] == length)
+                    continue;
+
+                int sum = start;
+                for (int b = 0; b < RadixBuckets; b++)
+                {
+                    int c = counts[b];
+                    counts[b] = sum;
+                    sum += c;
+                }
+
+                for (int i = start; i < end; i++)
+                {
+                    int pos = counts[(int)(srcK[i] >> shift) & (RadixBuckets - 1)]++;
+                    dstK[pos] = srcK[i];
+                    dstI[pos] = srcI[i];
+                }
+
+                var tk = srcK; srcK = dstK; dstK = tk;
+                var ti = srcI; srcI = dstI; dstI = ti;
+            }
+
+            if (srcK != keys)
+            {
+                Array.Copy(srcK, start, keys, start, length);
+                Array.Copy(srcI, start, idx, start, length);
+            }
+        }
+
+        private static void HeapSort(ulong[] keys, npy_intp[] idx, int start, int length)
+        {
+            for (int i = length / 2 - 1; i >= 0; i--)
+                SiftDown(keys, idx, start, i, length);
+
+            for (int end = length - 1; end > 0; end--)
+            {
+                Swap(keys, idx, start, start + end);
+                SiftDown(keys, idx, start, 0, end);
+            }
+        }
+
+        private static void SiftDown(ulong[] keys, npy_intp[] idx, int start, int root, int length)
+        {
+            while (true)
+            {
+                int child = 2 * root + 1;
+                if (child >= length)
+                    return;
+                if (child + 1 < length && keys[start + child + 1] > keys[start + child])
+                    child++;
+                if (keys[start + root] >= keys[start + child])
+                    return;
+                Swap(keys, idx, start + root, start + child);
+                root = child;
+            }
+        }
+
+        private static void Swap(ulong[] keys, npy_intp[] idx, int a, int b)
+        {
+            ulong k = keys[a]; keys[a] = keys[b]; keys[b] = k;
+            npy_intp t = idx[a]; idx[a] = idx[b]; idx[b] = t;
+        }
+
+        /// <summary>
+        /// parallel sample sort.  Splitters picked from a regular sample partition the
+        /// keys into buckets; each chunk scatters its keys in order so equal keys keep
+        /// their relative order, then every bucket is sorted independently.
+        /// </summary>
+        private static void SampleSort(ulong[] keys, npy_intp[] idx, ulong[] keyTmp, npy_intp[] idxTmp, int keyBytes, NPY_SORTKIND kind)
+        {
+            int length = keys.Length;
+            int degree = NpyParallelScheduler.MaxDegreeOfParallelism;
+            int bucketCount = Math.Min(degree * 4, RadixBuckets);
+            int chunkCount = degree;
+
+            // pick splitters
+            int sampleCount = bucketCount * SampleOversampling;
+            ulong[] sample = new ulong[sampleCount];
+            long step = length / sampleCount;
+            for (int i = 0; i < sampleCount; i++)
+                sample[i] = keys[i * step];
+            Array.Sort(sample);
+
+            ulong[] splitters = new ulong[bucketCount - 1];
+            for (int i = 0; i < splitters.Length; i++)
+                splitters[i] = sample[(i + 1) * SampleOversampling];
+
+            // count bucket sizes per chunk
+            byte[] bucketOf = new byte[length];
+            int[,] counts = new int[chunkCount, bucketCount];
+            int chunkSize = (length + chunkCount - 1) / chunkCount;
+
+            Parallel.For(0, chunkCount, numpyinternal.parallelOptions, c =>
+            {
+                int cstart = c * chunkSize;
+                int cend = Math.Min(length, cstart + chunkSize);
+                for (int i = cstart; i < cend; i++)
+                {
+                    int b = UpperBound(splitters, keys[i]);
+                    bucketOf[i] = (byte)b;
+                    counts[c, b]++;
+                }
+            });
+
+            int[] bucketStart = new int[bucketCount + 1];
+            int[,] offsets = new int[chunkCount, bucketCount];
+            int sum = 0;
+            for (int b = 0; b < bucketCount; b++)
+            {
+                bucketStart[b] = sum;
+                for (int c = 0; c < chunkCount; c++)
+                {
+                    offsets[c, b] = sum;
+                    sum += counts[c, b];
+                }
+            }
+            bucketStart[bucketCount] = sum;
+
+            // scatter into the scratch arrays
+            Parallel.For(0, chunkCount, numpyinternal.parallelOptions, c =>
+            {
+                int cstart = c * chunkSize;
+                int cend = Math.Min(length, cstart + chunkSize);
+                int[] pos = new int[bucketCount];
+                for (int b = 0; b < bucketCount; b++)
+                    pos[b] = offsets[c, b];
+
+                for (int i = cstart; i < cend; i++)
+                {
+                    int p = pos[bucketOf[i]]++;
+                    keyTmp[p] = keys[i];
+                    idxTmp[p] = idx[i];
+                }
+            });
+
+            // sort each bucket with the original arrays as scratch, then copy back
+            Parallel.For(0, bucketCount, numpyinternal.parallelOptions, b =>
+            {
+                int bstart = bucketStart[b];
+                int blength = bucketStart[b + 1] - bstart;
+
+                SortRange(keyTmp, idxTmp, keys, idx, bstart, blength, keyBytes, kind);
+
+                Array.Copy(keyTmp, bstart, keys, bstart, blength);
+                Array.Copy(idxTmp, bstart, idx, bstart, blength);
+            });
+        }
+
+        private static int UpperBound(ulong[] splitters, ulong key)
+        {
+            int lo = 0, hi = splitters.Length;
+            while (lo < hi)
+            {
+                int mid = (lo + hi) >> 1;
+                if (splitters[mid] <= key)
+                    lo = mid + 1;
+                else
+                    hi = mid;
+            }
+            return lo;
+        }
+
+        #endregion
+
+        #region lexsort
+
+        /// <summary>
+        /// stable indirect sort of one row of several keys into idx; keys[keys.Length - 1] is the
+        /// primary key.  Each key holds its rows contiguously and this row starts at element offset.
+        /// </summary>
+        internal static void LexSort(VoidPtr[] keys, npy_intp offset, int length, npy_intp[] idx)
+        {
+            for (int i = 0; i < length; i++)
+                idx[i] = i;
+
+            if (length < 2)
+                return;
+
+            int totalBytes = 0;
+            foreach (var key in keys)
+            {
+                if (!IsKernelType(key.type_num))
+                {
+                    LexSortCompare(keys, offset, length, idx);
+                    return;
+                }
+                totalBytes += KeyBytes(key.type_num);
+            }
+
+            ulong[] rowKeys = new ulong[length];
+            ulong[] sortKeys = new ulong[length];
+
+            if (totalBytes <= sizeof(ulong))
+            {
+                // the whole tuple fits in one key: pack it with the primary key in the high bytes
+                // and sort once
+                for (int j = keys.Length - 1; j >= 0; j--)
+                {
+                    int keyBytes = FillKeys(keys[j], offset, length, rowKeys);
+                    int shift = keyBytes * 8;
+                    for (int i = 0; i < length; i++)
+                    {
+                        sortKeys[i] = (shift == 64 ? 0 : sortKeys[i] << shift) | rowKeys[i];
+                    }
+                }
+                SortKeys(sortKeys, idx, totalBytes, NPY_SORTKIND.NPY_STABLESORT);
+                return;
+            }
+
+            // least significant key first; every pass is stable so the earlier order breaks ties
+            for (int j = 0; j < keys.Length; j++)
+            {
+                int keyBytes = FillKeys(keys[j], offset, length, rowKeys);
+                for (int i = 0; i < length; i++)
+                {
+                    sortKeys[i] = rowKeys[idx[i]];
+                }
+                SortKeys(sortKeys, idx, keyBytes, NPY_SORTKIND.NPY_STABLESORT);
+            }
+        }
+
+        private static int KeyBytes(NPY_TYPES type_num)
+        {
+            switch (type_num)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                case NPY_TYPES.NPY_BYTE:
+                case NPY_TYPES.NPY_UBYTE:
+                    return 1;
+                case NPY_TYPES.NPY_INT16:
+                case NPY_TYPES.NPY_UINT16:
+                    return 2;
+                case NPY_TYPES.NPY_INT32:
+                case NPY_TYPES.NPY_UINT32:
+                    return 4;
+                default:
+                    return 8;
+            }
+        }
+
+        /// <summary>
+        /// lexsort for rows with a key the key sorts can not handle: one comparison sort over all
+        /// the keys, with ties broken on the original position so it is stable.
+        /// </summary>
+        private static void LexSortCompare(VoidPtr[] keys, npy_intp offset, int length, npy_intp[] idx)
+        {
+            var comparisons = new Comparison<npy_intp>[keys.Length];
+            for (int j = 0; j < keys.Length; j++)
+            {
+                comparisons[keys.Length - 1 - j] = KeyComparison(keys[j], offset);
+            }
+
+            Array.Sort(idx, 0, length, Comparer<npy_intp>.Create((i1, i2) =>
+            {
+                foreach (var compare in comparisons)
+                {
+                    int c = compare(i1, i2);
+                    if (c != 0)
+                        return c;
+                }
+                return i1.CompareTo(i2);
+            }));
+        }
+
+        private static Comparison<npy_intp> KeyComparison(VoidPtr key, npy_intp offset)
+        {
+            switch (key.type_num)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                    return ValueComparison(key.datap as bool[], offset);
+                case NPY_TYPES.NPY_BYTE:
+                    return ValueComparison(key.datap as sbyte[], offset);
+                case NPY_TYPES.NPY_UBYTE:
+                    return ValueComparison(key.datap as byte[], offset);
+                case NPY_TYPES.NPY_INT16:
+                    return ValueComparison(key.datap as Int16[], offset);
+                case NPY_TYPES.NPY_UINT16:
+                    return ValueComparison(key.datap as UInt16[], offset);
+                case NPY_TYPES.NPY_INT32:
+                    return ValueComparison(key.datap as Int32[], offset);
+                case NPY_TYPES.NPY_UINT32:
+                    return ValueComparison(key.datap as UInt32[], offset);
+                case NPY_TYPES.NPY_INT64:
+                    return ValueComparison(key.datap as Int64[], offset);
+                case NPY_TYPES.NPY_UINT64:
+                    return ValueComparison(key.datap as UInt64[], offset);
+                case NPY_TYPES.NPY_FLOAT:
+                {
+                    var d = key.datap as float[];
+                    return (i1, i2) => DoubleKey(d[offset + i1]).CompareTo(DoubleKey(d[offset + i2]));
+                }
+                case NPY_TYPES.NPY_DOUBLE:
+                {
+                    var d = key.datap as double[];
+                    return (i1, i2) => DoubleKey(d[offset + i1]).CompareTo(DoubleKey(d[offset + i2]));
+                }
+                case NPY_TYPES.NPY_DECIMAL:
+                    return ValueComparison(key.datap as decimal[], offset);
+                case NPY_TYPES.NPY_BIGINT:
+                    return ValueComparison(key.datap as System.Numerics.BigInteger[], offset);
+                case NPY_TYPES.NPY_STRING:
+                    return ValueComparison(key.datap as string[], offset);
+                case NPY_TYPES.NPY_COMPLEX:
+                {
+                    var d = key.datap as System.Numerics.Complex[];
+                    return (i1, i2) =>
+                    {
+                        int c = DoubleKey(d[offset + i1].Real).CompareTo(DoubleKey(d[offset + i2].Real));
+                        return c != 0 ? c : DoubleKey(d[offset + i1].Imaginary).CompareTo(DoubleKey(d[offset + i2].Imaginary));
+                    };
+                }
+                default:
+                {
+                    var d = key.datap as object[];
+                    return (i1, i2) => ((dynamic)d[offset + i1]).CompareTo(d[offset + i2]);
+                }
+            }
+        }
+
+        private static Comparison<npy_intp> ValueComparison<T>(T[] d, npy_intp offset) where T : IComparable<T>
+        {
+            return (i1, i2) => d[offset + i1].CompareTo(d[offset + i2]);
+        }
+
+        #endregion
+
+        #region searchsorted
+
+        /// <summary>
+        /// haystacks at least this long are searched through an Eytzinger (breadth first) copy
+        /// when there are enough unsorted keys to pay for building it.
+        /// </summary>
+        internal static npy_intp EytzingerThreshold = 1 << 16;
+
+        private interface ISearchPredicate<T>
+        {
+            /// <summary>
+            /// true if probe goes before key, i.e. key must be inserted after it.
+            /// </summary>
+            bool Before(T probe, T key);
+            bool Less(T a, T b);
+        }
+
+        private interface ISearchLess<T>
+        {
+            bool Less(T a, T b);
+        }
+
+        private struct ComparableLess<T> : ISearchLess<T> where T : IComparable<T>
+        {
+            public bool Less(T a, T b) { return a.CompareTo(b) < 0; }
+        }
+
+        // NaN sorts to the end like NumPy
+        private struct DoubleLess : ISearchLess<double>
+        {
+            public bool Less(double a, double b) { return a < b || (b != b && a == a); }
+        }
+
+        private struct FloatLess : ISearchLess<float>
+        {
+            public bool Less(float a, float b) { return a < b || (b != b && a == a); }
+        }
+
+        private struct ComplexLess : ISearchLess<System.Numerics.Complex>
+        {
+            public bool Less(System.Numerics.Complex a, System.Numerics.Complex b)
+            {
+                return a.Real < b.Real || (a.Real == b.Real && a.Imaginary < b.Imaginary);
+            }
+        }
+
+        private struct SearchLeft<T, TLess> : ISearchPredicate<T> where TLess : struct, ISearchLess<T>
+        {
+            public bool Before(T probe, T key) { return default(TLess).Less(probe, key); }
+            public bool Less(T a, T b) { return default(TLess).Less(a, b); }
+        }
+
+        private struct SearchRight<T, TLess> : ISearchPredicate<T> where TLess : struct, ISearchLess<T>
+        {
+            public bool Before(T probe, T key) { return !default(TLess).Less(key, probe); }
+            public bool Less(T a, T b) { return default(TLess).Less(a, b); }
+        }
+
+        /// <summary>
+        /// typed searchsorted of the contiguous keys in the contiguous sorted haystack arr.
+        /// Returns false if the data type is not handled here.
+        /// </summary>
+        internal static bool SearchSorted(NpyArray arr, NpyArray key, NpyArray ret, NPY_SEARCHSIDE side)
+        {
+            npy_intp nelts = arr.dimensions[arr.nd - 1];
+            if (nelts > int.MaxValue / 2)
+                return false;
+
+            var h = new SearchHaystack()
+            {
+                arr = arr.data,
+                arrOffset = arr.data.data_offset / arr.descr.elsize,
+                nelts = (int)nelts,
+                keys = key.data,
+                keyOffset = key.data.data_offset / key.descr.elsize,
+                nkeys = numpyinternal.NpyArray_SIZE(key),
+                ret = ret.data.datap as npy_intp[],
+                retOffset = ret.data.data_offset / sizeof(npy_intp),
+                itemSize = arr.descr.elsize,
+            };
+            bool right = side == NPY_SEARCHSIDE.NPY_SEARCHRIGHT;
+
+            switch (arr.data.type_num)
+            {
+                case NPY_TYPES.NPY_BOOL:
+                    return SearchSide<bool, ComparableLess<bool>>(h, right);
+                case NPY_TYPES.NPY_BYTE:
+                    return SearchSide<sbyte, ComparableLess<sbyte>>(h, right);
+                case NPY_TYPES.NPY_UBYTE:
+                    return SearchSide<byte, ComparableLess<byte>>(h, right);
+                case NPY_TYPES.NPY_INT16:
+                    return SearchSide<Int16, ComparableLess<Int16>>(h, right);
+                case NPY_TYPES.NPY_UINT16:
+                    return SearchSide<UInt16, ComparableLess<UInt16>>(h, right);
+                case NPY_TYPES.NPY_INT32:
+                    return SearchSide<Int32, ComparableLess<Int32>>(h, right);
+                case NPY_TYPES.NPY_UINT32:
+                    return SearchSide<UInt32, ComparableLess<UInt32>>(h, right);
+                case NPY_TYPES.NPY_INT64:
+                    return SearchSide<Int64, ComparableLess<Int64>>(h, right);
+                case NPY_TYPES.NPY_UINT64:
+                    return SearchSide<UInt64, ComparableLess<UInt64>>(h, right);
+                case NPY_TYPES.NPY_FLOAT:
+                    return SearchSide<float, FloatLess>(h, right);
+                case NPY_TYPES.NPY_DOUBLE:
+                    return SearchSide<double, DoubleLess>(h, right);
+                case NPY_TYPES.NPY_DECIMAL:
+                    return SearchSide<decimal, ComparableLess<decimal>>(h, right);
+                case NPY_TYPES.NPY_COMPLEX:
+                    return SearchSide<System.Numerics.Complex, ComplexLess>(h, right);
+                case NPY_TYPES.NPY_BIGINT:
+                    return SearchSide<System.Numerics.BigInteger, ComparableLess<System.Numerics.BigInteger>>(h, right);
+                default:
+                    return false;
+            }
+        }
+
+        private class SearchHaystack
+        {
+            public VoidPtr arr;
+            public npy_intp arrOffset;
+            public int nelts;
+            public VoidPtr keys;
+            public npy_intp keyOffset;
+            public npy_intp nkeys;
+            public npy_intp[] ret;
+            public npy_intp retOffset;
+            public int itemSize;
+        }
+
+        private static bool SearchSide<T, TLess>(SearchHaystack h, bool right) where TLess : struct, ISearchLess<T>
+        {
+            if (right)
+                Search<T, SearchRight<T, TLess>>(h);
+            else
+                Search<T, SearchLeft<T, TLess>>(h);
+            return true;
+        }
+
+        /// <summary>
+        /// The keys are split into blocks that are searched in parallel.  Within a block a key that is not
+        /// smaller than the previous one gallops forward from the previous result, so sorted keys cost
+        /// O(log distance) each.  Any other key does a branchless bisection of the whole haystack, or walks
+        /// the Eytzinger copy of a large haystack, which keeps the first levels of the search in cache.
+        /// </summary>
+        private static void Search<T, TPred>(SearchHaystack h) where TPred : struct, ISearchPredicate<T>
+        {
+            T[] arr = h.arr.datap as T[];
+            T[] keys = h.keys.datap as T[];
+            int arrOffset = (int)h.arrOffset;
+            int nelts = h.nelts;
+
+            T[] eytzinger = null;
+            int[] eytzingerIndex = null;
+            if (nelts >= EytzingerThreshold && h.nkeys >= nelts / 4)
+            {
+                eytzinger = new T[nelts + 1];
+                eytzingerIndex = new int[nelts + 1];
+                BuildEytzinger(arr, arrOffset, nelts, eytzinger, eytzingerIndex, 0, 1);
+            }
+
+            var segments = numpyinternal.NpyArray_SEGMENT_ParallelSplit(h.nkeys, NpyParallelScheduler.GetGrainSize(NpyParallelOperation.Sort, h.itemSize));
+
+            Parallel.ForEach(segments, numpyinternal.parallelOptions, segment =>
+            {
+                TPred pred = default(TPred);
+                T lastKey = default(T);
+                int last = -1;
+
+                for (npy_intp i = segment.start; i < segment.end; i++)
+                {
+                    T key = keys[h.keyOffset + i];
+                    int pos;
+
+                    if (last >= 0 && !pred.Less(key, lastKey))
+                    {
+                        // gallop forward: everything before the previous result also goes before this key
+                        int lo = last, hi = last, step = 1;
+                        while (hi < nelts && pred.Before(arr[arrOffset + hi], key))
+                        {
+                            lo = hi + 1;
+                            hi = (int)Math.Min((long)hi + step, nelts);
+                            step <<= 1;
+                        }
+                        pos = lo + BranchlessSearch<T, TPred>(arr, arrOffset + lo, hi - lo, key);
+                    }
+                    else if (eytzinger != null)
+                    {
+                        pos = EytzingerSearch<T, TPred>(eytzinger, eytzingerIndex, nelts, key);
+                    }
+                    else
+                    {
+                        pos = BranchlessSearch<T, TPred>(arr, arrOffset, nelts, key);
+                    }
+
+                    h.ret[h.retOffset + i] = pos;
+                    lastKey = key;
+                    last = pos;
+                }
+            });
+        }
+
+        /// <summary>
+        /// number of elements in arr[start..start+length) that go before key.
+        /// The loop body has no data dependent branch so the JIT can use a conditional move.
+        /// </summary>
+        private static int BranchlessSearch<T, TPred>(T[] arr, int start, int length, T key) where TPred : struct, ISearchPredicate<T>
+        {
+            if (length <= 0)
+                return 0;
+
+            TPred pred = default(TPred);
+            int b = start;
+            int n = length;
+            while (n > 1)
+            {
+                int half = n >> 1;
+                b = pred.Before(arr[b + half], key) ? b + half : b;
+                n -= half;
+            }
+            return b - start + (pred.Before(arr[b], key) ? 1 : 0);
+        }
+
+        /// <summary>
+        /// lays the sorted arr out in breadth first order: node k has children 2k and 2k+1.
+        /// </summary>
+        private static int BuildEytzinger<T>(T[] arr, int arrOffset, int n, T[] eytzinger, int[] eytzingerIndex, int i, long k)
+        {
+            if (k <= n)
+            {
+                i = BuildEytzinger(arr, arrOffset, n, eytzinger, eytzingerIndex, i, 2 * k);
+                eytzinger[k] = arr[arrOffset + i];
+                eytzingerIndex[k] = i;
+                i++;
+                i = BuildEytzinger(arr, arrOffset, n, eytzinger, eytzingerIndex, i, 2 * k + 1);
+            }
+            return i;
+        }
+
+        private static int EytzingerSearch<T, TPred>(T[] eytzinger, int[] eytzingerIndex, int n, T key) where TPred : struct, ISearchPredicate<T>
+        {
+            TPred pred = default(TPred);
+            long k = 1;
+            while (k <= n)
+            {
+                k = 2 * k + (pred.Before(eytzinger[k], key) ? 1 : 0);
+            }
+            // the answer is the last node where the search went left
+            while ((k & 1) != 0)
+            {
+                k >>= 1;
+            }
+            k >>= 1;
+            return k == 0 ? n : eytzingerIndex[k];
+        }
+
+        #endregion
+    }
+}
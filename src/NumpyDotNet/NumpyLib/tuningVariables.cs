@@ -31,7 +31,9 @@
  */
 
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
 using System.Text;
 using System.Threading;
@@ -43,15 +45,290 @@ using npy_intp = System.Int32;
 #endif
 namespace NumpyLib
 {
+    /// <summary>
+    /// classes of work that the scheduler keeps separate grain sizes for.
+    /// </summary>
+    internal enum NpyParallelOperation
+    {
+        NumericOp,
+        FlatCopy,
+        CopyField,
+        Sort,
+    }
+
+    /// <summary>
+    /// Decides how finely the parallel loops are split.  Grain sizes are calibrated
+    /// per operation and item size on first use by timing the cost of an empty
+    /// Parallel.For against the cost of a representative serial loop.
+    /// </summary>
+    internal static class NpyParallelScheduler
+    {
+        private const int calibrationLength = 1 << 16;
+        private const int calibrationRuns = 5;
+
+        // parallel overhead is kept to about 1/overheadFactor of the work in a chunk
+        private const int overheadFactor = 4;
+
+        private static readonly npy_intp minimumGrainSize = 1024;
+        private static readonly npy_intp maximumGrainSize = 1 << 22;
+
+        private static int maxDegreeOfParallelism = Environment.ProcessorCount;
+        private static ParallelOptions parallelOptions = new ParallelOptions() { MaxDegreeOfParallelism = maxDegreeOfParallelism };
+        private static bool enableAutoTuning = true;
+
+        private static double? parallelOverheadTicks = null;
+        private static readonly ConcurrentDictionary<(NpyParallelOperation, int), npy_intp> calibratedGrainSizes = new ConcurrentDictionary<(NpyParallelOperation, int), npy_intp>();
+        private static readonly ConcurrentDictionary<NpyParallelOperation, npy_intp> fixedGrainSizes = new ConcurrentDictionary<NpyParallelOperation, npy_intp>();
+
+        internal static int MaxDegreeOfParallelism
+        {
+            get { return maxDegreeOfParallelism; }
+            set
+            {
+                if (value <= 0)
+                    value = Environment.ProcessorCount;
+                maxDegreeOfParallelism = value;
+                parallelOptions = new ParallelOptions() { MaxDegreeOfParallelism = value };
+            }
+        }
+
+        internal static ParallelOptions Options
+        {
+            get { return parallelOptions; }
+        }
+
+        internal static bool EnableAutoTuning
+        {
+            get { return enableAutoTuning; }
+            set { enableAutoTuning = value; }
+        }
+
+        /// <summary>
+        /// default grain sizes used when auto tuning is disabled.
+        /// </summary>
+        internal static npy_intp DefaultGrainSize(NpyParallelOperation op)
+        {
+            switch (op)
+            {
+                case NpyParallelOperation.FlatCopy:
+                    return 10000;
+                default:
+                    return 1000;
+            }
+        }
+
+        internal static npy_intp GetGrainSize(NpyParallelOperation op, int itemSize = sizeof(double))
+        {
+            npy_intp grainSize;
+            if (fixedGrainSizes.TryGetValue(op, out grainSize))
+                return grainSize;
+
+            if (!enableAutoTuning)
+                return DefaultGrainSize(op);
+
+            return calibratedGrainSizes.GetOrAdd((op, NormalizeItemSize(itemSize)), key => Calibrate(key.Item1, key.Item2));
+        }
+
+        /// <summary>
+        /// pins the grain size of an operation.  A value &lt;= 0 removes the override.
+        /// </summary>
+        internal static void SetGrainSize(NpyParallelOperation op, npy_intp grainSize)
+        {
+            if (grainSize <= 0)
+            {
+                fixedGrainSizes.TryRemove(op, out grainSize);
+                return;
+            }
+            fixedGrainSizes[op] = grainSize;
+        }
+
+        internal static void ResetCalibration()
+        {
+            parallelOverheadTicks = null;
+            calibratedGrainSizes.Clear();
+        }
+
+        /// <summary>
+        /// number of chunks to split a loop of TotalSize elements into.  A grain
+        /// size &lt;= 0 means split as widely as the degree of parallelism allows.
+        /// </summary>
+        internal static int GetChunkCount(npy_intp TotalSize, npy_intp grainSize)
+        {
+            if (TotalSize < 2 || maxDegreeOfParallelism == 1)
+                return 1;
+
+            npy_intp chunks = grainSize <= 0 ? TotalSize : (TotalSize + grainSize - 1) / grainSize;
+            if (chunks > maxDegreeOfParallelism)
+                chunks = maxDegreeOfParallelism;
+            if (chunks > TotalSize)
+                chunks = TotalSize;
+
+            return chunks < 1 ? 1 : (int)chunks;
+        }
+
+        private static int NormalizeItemSize(int itemSize)
+        {
+            if (itemSize <= 1)
+                return 1;
+            if (itemSize <= 2)
+                return 2;
+            if (itemSize <= 4)
+                return 4;
+            if (itemSize <= 8)
+                return 8;
+            return 16;
+        }
+
+        private static npy_intp Calibrate(NpyParallelOperation op, int itemSize)
+        {
+            try
+            {
+                if (!parallelOverheadTicks.HasValue)
+                    parallelOverheadTicks = MeasureParallelOverhead();
+
+                double elementTicks = MeasureElementCost(op, itemSize);
+                if (elementTicks <= 0)
+                    return DefaultGrainSize(op);
+
+                double grainSize = overheadFactor * parallelOverheadTicks.Value / elementTicks;
+                if (grainSize < minimumGrainSize)
+                    return minimumGrainSize;
+                if (grainSize > maximumGrainSize)
+                    return maximumGrainSize;
+                return (npy_intp)grainSize;
+            }
+            catch
+            {
+                return DefaultGrainSize(op);
+            }
+        }
+
+        private static double MeasureParallelOverhead()
+        {
+            int degree = maxDegreeOfParallelism;
+            double best = double.MaxValue;
+            Stopwatch sw = new Stopwatch();
+
+            for (int run = 0; run < calibrationRuns; run++)
+            {
+                sw.Restart();
+                Parallel.For(0, degree, parallelOptions, i => { });
+                sw.Stop();
+                best = Math.Min(best, sw.ElapsedTicks);
+            }
+
+            return best;
+        }
+
+        private static double MeasureElementCost(NpyParallelOperation op, int itemSize)
+        {
+            double best = double.MaxValue;
+            Stopwatch sw = new Stopwatch();
+
+            switch (op)
+            {
+                case NpyParallelOperation.FlatCopy:
+                case NpyParallelOperation.CopyField:
+                {
+                    byte[] src = new byte[calibrationLength * itemSize];
+                    byte[] dest = new byte[src.Length];
+
+                    for (int run = 0; run < calibrationRuns; run++)
+                    {
+                        sw.Restart();
+                        if (op == NpyParallelOperation.FlatCopy)
+                        {
+                            Buffer.BlockCopy(src, 0, dest, 0, src.Length);
+                        }
+                        else
+                        {
+                            for (int i = 0; i < src.Length; i += itemSize)
+                                Buffer.BlockCopy(src, i, dest, i, itemSize);
+                        }
+                        sw.Stop();
+                        best = Math.Min(best, sw.ElapsedTicks);
+                    }
+                    break;
+                }
+
+                case NpyParallelOperation.Sort:
+                {
+                    // sorts are per-row, so the grain is measured in rows of 64 elements
+                    Random r = new Random(42);
+                    double[] data = new double[calibrationLength];
+
+                    for (int run = 0; run < calibrationRuns; run++)
+                    {
+                        for (int i = 0; i < data.Length; i++)
+                            data[i] = r.NextDouble();
+
+                        sw.Restart();
+                        for (int i = 0; i < data.Length; i += 64)
+                            Array.Sort(data, i, 64);
+                        sw.Stop();
+                        best = Math.Min(best, sw.ElapsedTicks * 64.0);
+                    }
+                    break;
+                }
+
+                default:
+                {
+                    // a strided double loop approximates the typed kernels; narrower
+                    // types move proportionally less memory per element.
+                    double[] src = new double[calibrationLength];
+                    double[] dest = new double[calibrationLength];
+
+                    for (int run = 0; run < calibrationRuns; run++)
+                    {
+                        sw.Restart();
+                        for (int i = 0; i < src.Length; i++)
+                            dest[i] = src[i] + 1.0;
+                        sw.Stop();
+                        best = Math.Min(best, sw.ElapsedTicks * Math.Max(itemSize, 4) / 8.0);
+                    }
+                    break;
+                }
+            }
+
+            return best / calibrationLength;
+        }
+    }
+
     internal partial class numpyinternal
     {
-        private static npy_intp maxParallelIterators = 8;  // must be 1,2,4,8 or16
-        private static npy_intp flatCopyParallelSize = 10000;
+        internal static int maxParallelIterators
+        {
+            get { return NpyParallelScheduler.MaxDegreeOfParallelism; }
+        }
+        internal static ParallelOptions parallelOptions
+        {
+            get { return NpyParallelScheduler.Options; }
+        }
+
+        private static npy_intp flatCopyParallelSize
+        {
+            get { return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.FlatCopy); }
+        }
         internal static npy_intp maxIterOffsetCacheSize = 1000;
 
-        private static npy_intp maxNumericOpParallelSize = 1000;
-        private static npy_intp maxCopyFieldParallelSize = 1000;
-        private static npy_intp maxSortOperationParallelSize = 1000;
+        private static npy_intp maxNumericOpParallelSize
+        {
+            get { return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp); }
+        }
+        private static npy_intp maxCopyFieldParallelSize
+        {
+            get { return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.CopyField); }
+        }
+        private static npy_intp maxSortOperationParallelSize
+        {
+            get { return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.Sort); }
+        }
+        private static npy_intp gemmMinimumSize = 32 * 32 * 32;
+
+        internal static npy_intp NumericOpParallelSize(NpyArray arr)
+        {
+            return NpyParallelScheduler.GetGrainSize(NpyParallelOperation.NumericOp, arr.ItemSize);
+        }
 
         [ThreadStatic]
         internal static bool ?enableTryCatchOnCalculations = null;
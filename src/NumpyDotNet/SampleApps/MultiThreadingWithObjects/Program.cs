@@ -13,6 +13,15 @@ namespace MultiThreadingWithObjects
 
         static void Main(string[] args)
         {
+            if (args.Length > 0 && args[0] == "stress")
+            {
+                // MultiThreadingWithObjects stress [threads] [seconds]
+                int threads = args.Length > 1 ? int.Parse(args[1]) : Environment.ProcessorCount * 8;
+                int seconds = args.Length > 2 ? int.Parse(args[2]) : 10;
+                new StressBenchmark().Run(threads, TimeSpan.FromSeconds(seconds));
+                return;
+            }
+
             int iNumThreads = 10;
 
 
@@ -0,0 +1,126 @@
+﻿using NumpyDotNet;
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace MultiThreadingWithObjects
+{
+    /// <summary>
+    /// Runs many concurrent workers that each do small, independent array math, the way a web
+    /// service handles many requests at once.  Every result is checked against a value computed
+    /// on a single thread, and a share of the requests fail on purpose to check that an error on
+    /// one thread never leaks into another.
+    /// </summary>
+    class StressBenchmark
+    {
+        private const int RequestKinds = 16;
+
+        private readonly double[] ExpectedResults = new double[RequestKinds];
+
+        private long CompletedRequests;
+        private long ExpectedErrors;
+        private long WrongResults;
+        private long UnexpectedErrors;
+
+        public void Run(int NumThreads, TimeSpan Duration)
+        {
+            // single threaded reference values
+            for (int i = 0; i < RequestKinds; i++)
+            {
+                ExpectedResults[i] = Request(i);
+            }
+
+            Console.WriteLine("Warming up on {0} threads...", NumThreads);
+            RunWorkers(NumThreads, TimeSpan.FromSeconds(1));
+            CompletedRequests = ExpectedErrors = WrongResults = UnexpectedErrors = 0;
+
+            var sw = Stopwatch.StartNew();
+            RunWorkers(NumThreads, Duration);
+            sw.Stop();
+
+            Console.WriteLine("Threads:           {0}", NumThreads);
+            Console.WriteLine("Elapsed:           {0:F2} s", sw.Elapsed.TotalSeconds);
+            Console.WriteLine("Requests:          {0}", CompletedRequests);
+            Console.WriteLine("Requests/sec:      {0:F0}", CompletedRequests / sw.Elapsed.TotalSeconds);
+            Console.WriteLine("Expected errors:   {0}", ExpectedErrors);
+            Console.WriteLine("Wrong results:     {0}", WrongResults);
+            Console.WriteLine("Unexpected errors: {0}", UnexpectedErrors);
+            Console.WriteLine(WrongResults == 0 && UnexpectedErrors == 0 ? "PASSED" : "FAILED");
+        }
+
+        private void RunWorkers(int NumThreads, TimeSpan Duration)
+        {
+            var stopAt = DateTime.UtcNow + Duration;
+
+            var workers = new Task[NumThreads];
+            for (int t = 0; t < NumThreads; t++)
+            {
+                int seed = t;
+                workers[t] = Task.Factory.StartNew(() => Worker(seed, stopAt), TaskCreationOptions.LongRunning);
+            }
+            Task.WaitAll(workers);
+        }
+
+        private void Worker(int seed, DateTime stopAt)
+        {
+            var random = new Random(seed);
+
+            while (DateTime.UtcNow < stopAt)
+            {
+                int kind = random.Next(RequestKinds);
+
+                if (random.Next(10) == 0)
+                {
+                    FailingRequest(kind);
+                }
+                else
+                {
+                    try
+                    {
+                        double result = Request(kind);
+                        if (result != ExpectedResults[kind])
+                        {
+                            Interlocked.Increment(ref WrongResults);
+                        }
+                    }
+                    catch (Exception)
+                    {
+                        Interlocked.Increment(ref UnexpectedErrors);
+                    }
+                }
+
+                Interlocked.Increment(ref CompletedRequests);
+            }
+        }
+
+        /// <summary>
+        /// a small calculation that only touches arrays it creates itself
+        /// </summary>
+        private static double Request(int kind)
+        {
+            var a = np.arange(0, 64, dtype: np.Float64).reshape((8, 8)) * (kind + 1);
+            var b = np.sin(a) + np.cos(a);
+            var c = np.dot(b, b.T);
+            var d = np.where(c > 0, c, -c) as ndarray;
+            return (double)np.sum(d).GetItem(0);
+        }
+
+        private void FailingRequest(int kind)
+        {
+            try
+            {
+                var a = np.arange(0, 64 + kind, dtype: np.Float64);
+                a.reshape((7, 7));
+                Interlocked.Increment(ref UnexpectedErrors);
+            }
+            catch (Exception)
+            {
+                Interlocked.Increment(ref ExpectedErrors);
+            }
+        }
+    }
+}
@@ -1351,6 +1351,90 @@ namespace NumpyDotNetTests
 
         }
 
+        [TestMethod]
+        public void test_ndarray_unique_2()
+        {
+            // more elements than an insertion sort run, so the indexes depend on a stable sort
+            var random = new Random(1234);
+            Int32[] data = new Int32[1000];
+            for (int i = 0; i < data.Length; i++)
+                data[i] = random.Next(-50, 50);
+
+            var result = np.unique(np.array(data), return_index: true);
+
+            Int32[] uvalues = result.data.AsInt32Array();
+            npy_intp[] expectedIndexes = new npy_intp[uvalues.Length];
+            for (int j = 0; j < uvalues.Length; j++)
+            {
+                expectedIndexes[j] = Array.IndexOf(data, uvalues[j]);
+            }
+
+            AssertArray(result.data, data.Distinct().OrderBy(v => v).ToArray());
+            AssertArray(result.indices, expectedIndexes);
+
+            double[] ddata = data.Select(v => v / 2.0).ToArray();
+            result = np.unique(np.array(ddata), return_index: true);
+            double[] dvalues = result.data.AsDoubleArray();
+            for (int j = 0; j < dvalues.Length; j++)
+            {
+                expectedIndexes[j] = Array.IndexOf(ddata, dvalues[j]);
+            }
+            AssertArray(result.indices, expectedIndexes.Take(dvalues.Length).ToArray());
+        }
+
+        [TestMethod]
+        public void test_ndarray_unique_hashed_1()
+        {
+            // large enough for the hash table path
+            int n = 100000;
+            Int64[] data = new Int64[n];
+            for (int i = 0; i < n; i++)
+                data[i] = (i * 7919L) % 1000 - 500;
+
+            var result = np.unique(np.array(data), return_counts: true, return_index: true, return_inverse: true);
+
+            Int64[] expectedValues = new Int64[1000];
+            npy_intp[] expectedIndexes = new npy_intp[1000];
+            for (int j = 0; j < 1000; j++)
+            {
+                expectedValues[j] = j - 500;
+                expectedIndexes[j] = Array.IndexOf(data, expectedValues[j]);
+            }
+
+            AssertArray(result.data, expectedValues);
+            AssertArray(result.indices, expectedIndexes);
+            AssertArray(result.counts, Enumerable.Repeat((npy_intp)100, 1000).ToArray());
+
+            Int64[] inverse = result.inverse.AsInt64Array();
+            for (int i = 0; i < n; i++)
+                Assert.AreEqual(data[i], expectedValues[inverse[i]]);
+
+            var a = np.arange(0, n, dtype: np.Int32);
+            var b = np.arange(n / 2, n + 10, 2, dtype: np.Int64);
+
+            var mask = np.in1d(a, b);
+            Assert.AreEqual(n / 4, (int)np.count_nonzero(mask));
+            Assert.AreEqual(true, mask[n / 2]);
+            Assert.AreEqual(false, mask[n / 2 + 1]);
+
+            mask = np.isin(a.reshape(new shape(100, 1000)), b, invert: true);
+            AssertShape(mask, 100, 1000);
+            Assert.AreEqual(n - n / 4, (int)np.count_nonzero(mask));
+
+            var common = np.intersect1d(a, b);
+            Assert.AreEqual(n / 4, common.size);
+            Assert.AreEqual((Int64)(n / 2), common[0]);
+            Assert.AreEqual((Int64)(n - 2), common[-1]);
+
+            var diff = np.setdiff1d(a, b);
+            Assert.AreEqual(n - n / 4, diff.size);
+            Assert.AreEqual(np.Int32.TypeNum, diff.TypeNum);
+            Assert.AreEqual((Int32)(n - 1), diff[-1]);
+
+            // small inputs take the sorted path and must give the same type
+            Assert.AreEqual(np.Int32.TypeNum, np.setdiff1d(a["0:10"] as ndarray, b["0:10"] as ndarray).TypeNum);
+        }
+
         [TestMethod]
         public void test_ndarray_where_1()
         {
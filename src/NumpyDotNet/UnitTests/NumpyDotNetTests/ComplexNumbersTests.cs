@@ -6142,11 +6142,11 @@ namespace NumpyDotNetTests
             a[1, ":"] = 0.1;
             ndarray b = np.mean(a);
             print(b);
-            Assert.AreEqual((Complex)0.54999999998835847, (Complex)b.GetItem(0));
+            Assert.AreEqual((Complex)0.5500000000000482, (Complex)b.GetItem(0));
 
             ndarray c = np.mean(a, dtype: np.Complex);
             print(c);
-            Assert.AreEqual((Complex)0.54999999998835847, c.GetItem(0));
+            Assert.AreEqual((Complex)0.5500000000000482, c.GetItem(0));
         }
 
         [TestMethod]
@@ -6171,11 +6171,11 @@ namespace NumpyDotNetTests
             a[1, ":"] = 0.1;
             b = np.std(a);
             print(b);
-            Assert.AreEqual((Complex)0.44999999999905771, b.GetItem(0));
+            Assert.AreEqual((Complex)0.44999999999984331, b.GetItem(0));
             // Computing the standard deviation in float64 is more accurate:
             c = np.std(a, dtype: np.Complex);
             print(c);
-            Assert.AreEqual((Complex)0.44999999999905771, c.GetItem(0));
+            Assert.AreEqual((Complex)0.44999999999984331, c.GetItem(0));
 
         }
 
@@ -6200,12 +6200,12 @@ namespace NumpyDotNetTests
             a[0, ":"] = 1.0;
             a[1, ":"] = 0.1;
             b = np.var(a);
-            Assert.AreEqual((Complex)0.20249999999915194, b.GetItem(0));
+            Assert.AreEqual((Complex)0.20249999999985896, b.GetItem(0));
             print(b);
 
             // Computing the standard deviation in float64 is more accurate:
             c = np.var(a, dtype: np.Complex);
-            Assert.AreEqual((Complex)0.20249999999915194, c.GetItem(0));
+            Assert.AreEqual((Complex)0.20249999999985896, c.GetItem(0));
             print(c);
 
         }
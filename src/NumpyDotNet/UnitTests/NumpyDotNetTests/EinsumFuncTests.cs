@@ -12,25 +12,117 @@ namespace NumpyDotNetTests
     public class EinsumFuncTests : TestBaseClass
     {
 
-        [Ignore] // not implemented yet
         [TestMethod]
         public void test_einsumpath_1()
         {
-            //var xx = np.einsum_path();
+            var a = np.arange(0, 4, dtype: np.Float64).reshape(2, 2);
+            var b = np.arange(0, 10, dtype: np.Float64).reshape(2, 5);
+            var c = np.arange(0, 10, dtype: np.Float64).reshape(5, 2);
+
+            var r = np.einsum_path("ij,jk,kl->il", new object[] { a, b, c }, optimize: "greedy");
+            print(r.path);
+            print(r.string_repr);
+            assert_path_equal(r.path, "einsum_path", new int[] { 1, 2 }, new int[] { 0, 1 });
+
+            r = np.einsum_path("ij,jk,kl->il", new object[] { a, b, c }, optimize: "optimal");
+            assert_path_equal(r.path, "einsum_path", new int[] { 1, 2 }, new int[] { 0, 1 });
+
+            var I = np.ones(new shape(10, 10, 10, 10));
+            var C = np.ones(new shape(10, 10));
+            r = np.einsum_path("ea,fb,abcd,gc,hd->efgh", new object[] { C, C, I, C, C }, optimize: "greedy");
+            print(r.path);
+            print(r.string_repr);
+            assert_path_equal(r.path, "einsum_path", new int[] { 0, 2 }, new int[] { 0, 3 }, new int[] { 0, 2 }, new int[] { 0, 1 });
+
             return;
 
         }
 
 
-        [Ignore] // not implemented yet
         [TestMethod]
         public void test_einsum_1()
         {
-            var xx = np.einsum();
+            var a = np.arange(0, 6, dtype: np.Float64).reshape(2, 3);
+            var b = np.arange(0, 12, dtype: np.Float64).reshape(3, 4);
+
+            var xx = np.einsum("ij,jk->ik", a, b);
+            print(xx);
+            AssertArray(xx, new double[,] { { 20, 23, 26, 29 }, { 56, 68, 80, 92 } });
+
+            xx = np.einsum("ij,jk", a, b);
+            Assert.IsTrue(np.array_equal(xx, np.dot(a, b)));
+
+            xx = np.einsum("ji", a);
+            Assert.IsTrue(np.array_equal(xx, np.transpose(a)));
+
+            xx = np.einsum("i,j->ij", np.array(new double[] { 1, 2 }), np.array(new double[] { 3, 4, 5 }));
+            AssertArray(xx, new double[,] { { 3, 4, 5 }, { 6, 8, 10 } });
+
+            xx = np.einsum("ij,ij->i", a, a);
+            AssertArray(xx, new double[] { 5, 50 });
             return;
         }
 
-        [Ignore]
+        [TestMethod]
+        public void test_einsum_trace_diagonal()
+        {
+            var a = np.arange(0, 9, dtype: np.Float64).reshape(3, 3);
+
+            var xx = np.einsum("ii", a);
+            print(xx);
+            Assert.AreEqual(12.0, Convert.ToDouble(xx.GetItem(0)));
+
+            xx = np.einsum("ii->i", a);
+            AssertArray(xx, new double[] { 0, 4, 8 });
+
+            xx = np.einsum("ij->", a);
+            Assert.AreEqual(36.0, Convert.ToDouble(xx.GetItem(0)));
+
+            xx = np.einsum("ij->j", a);
+            AssertArray(xx, new double[] { 9, 12, 15 });
+        }
+
+        [TestMethod]
+        public void test_einsum_batched()
+        {
+            var a = np.arange(0, 24, dtype: np.Int64).reshape(2, 3, 4);
+            var b = np.arange(0, 40, dtype: np.Int64).reshape(2, 4, 5);
+
+            var expected = np.stack(new ndarray[] { np.dot(a[0] as ndarray, b[0] as ndarray), np.dot(a[1] as ndarray, b[1] as ndarray) });
+
+            var xx = np.einsum("bij,bjk->bik", a, b);
+            print(xx);
+            Assert.IsTrue(np.array_equal(xx, expected));
+
+            xx = np.einsum("...ij,...jk->...ik", a, b);
+            Assert.IsTrue(np.array_equal(xx, expected));
+
+            xx = np.einsum("bij,bjk->kib", a, b);
+            Assert.IsTrue(np.array_equal(xx, np.transpose(expected, new int[] { 2, 1, 0 })));
+        }
+
+        [TestMethod]
+        public void test_einsum_optimize()
+        {
+            var a = np.arange(0, 4, dtype: np.Float64).reshape(2, 2);
+            var b = np.arange(0, 10, dtype: np.Float64).reshape(2, 5);
+            var c = np.arange(0, 10, dtype: np.Float64).reshape(5, 2);
+
+            var expected = np.dot(np.dot(a, b), c);
+
+            var greedy = np.einsum("ij,jk,kl->il", a, b, c);
+            var optimal = np.einsum("ij,jk,kl->il", new object[] { a, b, c }, "optimal");
+            var none = np.einsum("ij,jk,kl->il", new object[] { a, b, c }, false);
+            var path = np.einsum("ij,jk,kl->il", new object[] { a, b, c }, new object[] { "einsum_path", new int[] { 0, 1 }, new int[] { 0, 1 } });
+
+            print(greedy);
+
+            Assert.IsTrue(np.array_equal(greedy, expected));
+            Assert.IsTrue(np.array_equal(optimal, expected));
+            Assert.IsTrue(np.array_equal(none, expected));
+            Assert.IsTrue(np.array_equal(path, expected));
+        }
+
         [TestMethod]
         public void test_memory_contraints()
         {
@@ -62,9 +154,16 @@ namespace NumpyDotNetTests
             return;
         }
 
-        private void assert_path_equal(IEnumerable<object> path, string v1, int[] v2)
+        private void assert_path_equal(IEnumerable<object> path, params object[] expected)
         {
-          
+            var actual = path.ToArray();
+            Assert.AreEqual(expected.Length, actual.Length);
+
+            Assert.AreEqual(expected[0], actual[0]);
+            for (int i = 1; i < expected.Length; i++)
+            {
+                CollectionAssert.AreEqual((int[])expected[i], (int[])actual[i]);
+            }
         }
 
         private Dictionary<string, int> global_size_dict = new Dictionary<string, int>()
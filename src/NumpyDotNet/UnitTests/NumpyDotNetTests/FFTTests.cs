@@ -0,0 +1,234 @@
+﻿using System;
+using System.Numerics;
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+using NumpyDotNet;
+using System.Collections.Generic;
+using System.Text;
+using System.Linq;
+using NumpyLib;
+
+namespace NumpyDotNetTests
+{
+    [TestClass]
+    public class FFTTests : TestBaseClass
+    {
+        // direct O(n^2) transform to check against
+        private static Complex[] DFT(Complex[] x, bool inverse = false)
+        {
+            int n = x.Length;
+            var X = new Complex[n];
+            double sign = inverse ? 1 : -1;
+            for (int k = 0; k < n; k++)
+            {
+                for (int j = 0; j < n; j++)
+                {
+                    X[k] += x[j] * Complex.FromPolarCoordinates(1, sign * 2 * Math.PI * (((long)j * k) % n) / n);
+                }
+                if (inverse)
+                    X[k] /= n;
+            }
+            return X;
+        }
+
+        // element-wise comparison on the typed data; np.allclose is too slow for long arrays
+        private static void AssertClose(ndarray a, ndarray b, double atol)
+        {
+            var x = a.AsComplexArray();
+            var y = b.AsComplexArray();
+            Assert.AreEqual(x.Length, y.Length);
+            for (int i = 0; i < x.Length; i++)
+            {
+                Assert.IsTrue(Complex.Abs(x[i] - y[i]) <= atol);
+            }
+        }
+
+        private static Complex[] RandomComplex(int n, int seed)
+        {
+            var rnd = new Random(seed);
+            return Enumerable.Range(0, n).Select(i => new Complex(rnd.NextDouble() - 0.5, rnd.NextDouble() - 0.5)).ToArray();
+        }
+
+        #region fft/ifft
+        [TestMethod]
+        public void test_fft_1()
+        {
+            var a = np.fft.fft(np.arange(8, dtype: np.Float64));
+            AssertArray(a, new Complex[] { 28, new Complex(-4, 9.65685424949238), new Complex(-4, 4), new Complex(-4, 1.65685424949238),
+                                           -4, new Complex(-4, -1.65685424949238), new Complex(-4, -4), new Complex(-4, -9.65685424949238) });
+            print(a);
+
+            var b = np.fft.ifft(a);
+            AssertArray(b, np.arange(8, dtype: np.Float64).AsDoubleArray().Select(d => new Complex(d, 0)).ToArray());
+            print(b);
+        }
+
+        [TestMethod]
+        public void test_fft_mixed_radix_and_bluestein()
+        {
+            // powers of two, small prime factors and lengths with a large prime factor
+            foreach (int n in new int[] { 1, 2, 12, 30, 49, 64, 17, 34, 101, 1000, 1018 })
+            {
+                var x = RandomComplex(n, n);
+
+                var a = np.fft.fft(np.array(x));
+                AssertArray(a, DFT(x));
+
+                var b = np.fft.ifft(np.array(x));
+                AssertArray(b, DFT(x, true));
+            }
+        }
+
+        [TestMethod]
+        public void test_fft_n_axis_norm()
+        {
+            var x = np.arange(6, dtype: np.Float64).reshape(3, 2);
+
+            // zero padded from 3 to 4 along axis 0
+            var a = np.fft.fft(x, n: 4, axis: 0);
+            AssertArray(a, new Complex[,] { { 6, 9 }, { new Complex(-4, -2), new Complex(-4, -3) }, { 2, 3 }, { new Complex(-4, 2), new Complex(-4, 3) } });
+            print(a);
+
+            // cropped to 2
+            a = np.fft.fft(x, n: 2, axis: 0);
+            AssertArray(a, new Complex[,] { { 2, 4 }, { -2, -2 } });
+            print(a);
+
+            var y = RandomComplex(100, 7);
+            var o = np.fft.fft(np.array(y), norm: "ortho");
+            // Parseval: an orthonormal transform keeps the energy
+            double e1 = y.Sum(c => c.Magnitude * c.Magnitude);
+            double e2 = o.AsComplexArray().Sum(c => c.Magnitude * c.Magnitude);
+            Assert.AreEqual(e1, e2, 1e-10);
+            AssertArray(np.fft.ifft(o, norm: "ortho"), y);
+
+            var f = np.fft.fft(np.array(y), norm: "forward");
+            AssertArray(f, DFT(y).Select(c => c / 100).ToArray());
+            AssertArray(np.fft.ifft(f, norm: "forward"), y);
+
+            try
+            {
+                np.fft.fft(np.array(y), norm: "bad");
+                Assert.Fail("This should have thrown an exception");
+            }
+            catch (Exception ex)
+            {
+                print(ex.Message);
+            }
+
+            try
+            {
+                np.fft.fft(np.array(y), n: 0);
+                Assert.Fail("This should have thrown an exception");
+            }
+            catch (Exception ex)
+            {
+                print(ex.Message);
+            }
+        }
+
+        [TestMethod]
+        public void test_fft_batched_large()
+        {
+            // many rows are transformed in parallel, then a single long line is split inside the transform
+            var random = new np.random();
+            random.seed(42);
+
+            var x = random.rand(new shape(64, 4096));
+            var a = np.fft.fft(x);
+            Assert.AreEqual(NPY_TYPES.NPY_COMPLEX, a.TypeNum);
+            var back = np.fft.ifft(a);
+            AssertClose(back, x, 1e-12);
+
+            var row = x.AsDoubleArray().Skip(5 * 4096).Take(4096);
+            AssertArray(a.A(5, ":16"), DFT(row.Select(d => new Complex(d, 0)).ToArray()).Take(16).ToArray());
+
+            var line = random.rand(new shape(1 << 17));
+            var l = np.fft.fft(line);
+            AssertClose(np.fft.ifft(l), line, 1e-12);
+            Assert.AreEqual((double)np.sum(line).GetItem(0), ((Complex)l[0]).Real, 1e-8);
+        }
+        #endregion
+
+        #region rfft/irfft
+        [TestMethod]
+        public void test_rfft_1()
+        {
+            var a = np.fft.rfft(new double[] { 1, 2, 1, 0, -1, -2, 0, 3, 5 });
+            AssertArray(a, new Complex[] { 9, new Complex(9.875981674858291, 3.5559581917583674), new Complex(-3.8413665688320586, 4.281251155374498),
+                                           -3, new Complex(-3.034615106026237, 0.7252929636161332) });
+            print(a);
+
+            foreach (int n in new int[] { 1, 2, 9, 10, 64, 17, 34, 1000 })
+            {
+                var x = RandomComplex(n, n).Select(c => c.Real).ToArray();
+
+                var r = np.fft.rfft(np.array(x));
+                AssertArray(r, DFT(x.Select(d => new Complex(d, 0)).ToArray()).Take(n / 2 + 1).ToArray());
+
+                var back = np.fft.irfft(r, n: n);
+                AssertArray(back, x);
+            }
+        }
+
+        [TestMethod]
+        public void test_irfft_default_length()
+        {
+            var x = np.arange(10, dtype: np.Float64).reshape(2, 5);
+
+            var r = np.fft.rfft(x, axis: 0);
+            Assert.AreEqual(new shape(2, 5), r.shape);
+
+            var back = np.fft.irfft(r, axis: 0);
+            AssertArray(back, new double[,] { { 0, 1, 2, 3, 4 }, { 5, 6, 7, 8, 9 } });
+            print(back);
+
+            // imaginary parts of the zero and nyquist frequencies are ignored
+            var c = np.fft.irfft(np.array(new Complex[] { new Complex(4, 3), 0, new Complex(0, 5) }));
+            AssertArray(c, new double[] { 1, 1, 1, 1 });
+            print(c);
+        }
+        #endregion
+
+        #region fft2/fftn
+        [TestMethod]
+        public void test_fft2_1()
+        {
+            var x = np.arange(6, dtype: np.Float64).reshape(2, 3);
+
+            var a = np.fft.fft2(x);
+            AssertArray(a, new Complex[,] { { 15, new Complex(-3, 1.732050807568875), new Complex(-3, -1.732050807568875) }, { -9, 0, 0 } });
+            print(a);
+
+            var b = np.fft.ifft2(a);
+            AssertArray(b, new Complex[,] { { 0, 1, 2 }, { 3, 4, 5 } });
+            print(b);
+
+            var c = np.fft.fftn(x);
+            AssertArray(c, new Complex[,] { { 15, new Complex(-3, 1.732050807568875), new Complex(-3, -1.732050807568875) }, { -9, 0, 0 } });
+
+            // only the last axis, padded to 4
+            var d = np.fft.fftn(x, s: new int[] { 4 });
+            AssertArray(d, new Complex[,] { { 3, new Complex(-2, -1), 1, new Complex(-2, 1) }, { 12, new Complex(-2, -4), 4, new Complex(-2, 4) } });
+            print(d);
+
+            var e = np.fft.fftn(x, axes: new int[] { 0 });
+            AssertArray(e, new Complex[,] { { 3, 5, 7 }, { -3, -3, -3 } });
+            print(e);
+        }
+
+        [TestMethod]
+        public void test_fftn_3d()
+        {
+            var random = new np.random();
+            random.seed(99);
+            var x = random.rand(new shape(4, 6, 5));
+
+            var a = np.fft.fftn(x);
+            var b = np.fft.fft(np.fft.fft(np.fft.fft(x, axis: 2), axis: 1), axis: 0);
+            Assert.IsTrue(np.allclose(a, b));
+            Assert.IsTrue(np.allclose(np.fft.ifftn(a), x));
+            Assert.AreEqual((double)np.sum(x).GetItem(0), ((Complex)a[0, 0, 0]).Real, 1e-8);
+        }
+        #endregion
+    }
+}
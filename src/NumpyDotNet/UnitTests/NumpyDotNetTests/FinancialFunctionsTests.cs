@@ -711,7 +711,7 @@ namespace NumpyDotNetTests
         public void test_rate_DECIMAL()
         {
             var res = npf.rate(10m, 0m, -3500, 10000);
-            AssertArray(res, new decimal[] { 0.1106908537142690373121121834m });
+            AssertArray(res, new decimal[] { 0.1106908537142690317839424111m });
             print(res);
         }
 
@@ -730,11 +730,11 @@ namespace NumpyDotNetTests
         public void test_rate_begin_DECIMAL()
         {
             var res = npf.rate(10m, 0m, -3500, 10000, 1);
-            AssertArray(res, new decimal[] { 0.1106908537142690373121121834m });
+            AssertArray(res, new decimal[] { 0.1106908537142690317839424111m });
             print(res);
 
             res = npf.rate(10m, 0m, -3500, 10000, "begin");
-            AssertArray(res, new decimal[] { 0.1106908537142690373121121834m });
+            AssertArray(res, new decimal[] { 0.1106908537142690317839424111m });
             print(res);
         }
 
@@ -753,11 +753,11 @@ namespace NumpyDotNetTests
         public void test_rate_end_DECIMAL()
         {
             var res = npf.rate(10m, 0m, -3500, 10000, 0);
-            AssertArray(res, new decimal[] { 0.1106908537142690373121121834m });
+            AssertArray(res, new decimal[] { 0.1106908537142690317839424111m });
             print(res);
 
             res = npf.rate(10m, 0m, -3500, 10000, "end");
-            AssertArray(res, new decimal[] { 0.1106908537142690373121121834m });
+            AssertArray(res, new decimal[] { 0.1106908537142690317839424111m });
             print(res);
 
         }
@@ -783,6 +783,35 @@ namespace NumpyDotNetTests
 
    
         }
+        [TestMethod]
+        public void test_rate_batch_DOUBLE()
+        {
+            // every element converges on its own; an infeasible one is NaN without spoiling the others
+            var res = npf.rate(new double[] { 10, 12, 10 }, new double[] { 0, 400, 0 }, new double[] { -3500, 10000, -3500 }, new double[] { 10000, 5000, 10000 }, new int[] { 0, 0, 1 });
+            AssertArray(res, new double[] { 0.11069085371426901, double.NaN, 0.11069085371426901 });
+            print(res);
+
+            int count = 100000;
+            var nper = np.arange(12, 12 + count, dtype: np.Float64) % 360 + 12;
+            var r = npf.rate(nper, -100.0, 10000.0, 0.0);
+            Assert.AreEqual(count, r.size);
+
+            var rates = r.AsDoubleArray();
+            var periods = nper.AsDoubleArray();
+            for (int i = 0; i < count; i += 9973)
+            {
+                Assert.AreEqual((double)npf.rate(periods[i], -100.0, 10000.0, 0.0), rates[i]);
+            }
+        }
+
+        [TestMethod]
+        public void test_rate_batch_DECIMAL()
+        {
+            var res = npf.rate(new decimal[] { 10, 10 }, new decimal[] { 0, 0 }, -3500, 10000, new int[] { 0, 1 });
+            AssertArray(res, new decimal[] { 0.1106908537142690317839424111m, 0.1106908537142690317839424111m });
+            print(res);
+        }
+
         [TestMethod]
         public void test_rate_infeasable_solution_DECIMAL()
         {
@@ -928,13 +957,25 @@ namespace NumpyDotNetTests
         [TestMethod]
         public void test_irr_2dim()
         {
-            var cashflows = np.array(new double[] { -150000, 15000, 25000, 35000, 45000, 60000, -150000, 15000, 25000, 35000, 45000, 60000 }).reshape(2,-1);
+            // one cash flow series per row
+            var cashflows = np.array(new double[] { -150000, 15000, 25000, 35000, 45000, 60000, -5, 10.5, 1, -8, 1, 0, -1, -2, -3, 0, 0, 0 }).reshape(3, -1);
+            var res = npf.irr(cashflows);
+            AssertShape(res, 3);
+            Assert.AreEqual(0.052432888859684834, (double)res[0]);
+            Assert.AreEqual(0.088598338524376138, (double)res[1]);
+            Assert.AreEqual(double.NaN, (double)res[2]);
+            print(res);
+
+            var dcashflows = np.array(new decimal[] { -150000, 15000, 25000, 35000, 45000, 60000, -5, 10.5m, 1, -8, 1, 0 }).reshape(2, -1);
+            var dres = npf.irr(dcashflows);
+            AssertArray(dres, new decimal[] { 0.0524328888596848960853398738m, 0.0885983385243761645016418267m });
+            print(dres);
 
             try
             {
-                var res = npf.irr(cashflows);
-                Assert.Fail("This should have thrown rank-1 exception");
-                print(res);
+                var res3 = npf.irr(cashflows.reshape(3, 2, 3));
+                Assert.Fail("This should have thrown rank exception");
+                print(res3);
             }
             catch
             {
@@ -943,6 +984,32 @@ namespace NumpyDotNetTests
  
         }
 
+        [TestMethod]
+        public void test_irr_batch_large()
+        {
+            // every row is solved on its own, so the batch must agree with the one series results
+            var random = new np.random();
+            random.seed(12);
+
+            int rows = 20000, cols = 24;
+            var flows = (random.rand(new shape(rows, cols)) * 100 + 50).AsDoubleArray();
+            for (int r = 0; r < rows; r++)
+            {
+                flows[r * cols] = -1000 - r % 500;
+            }
+            var cashflows = np.array(flows).reshape(rows, cols);
+
+            var res = npf.irr(cashflows).AsDoubleArray();
+            Assert.AreEqual(rows, res.Length);
+            Assert.IsFalse(res.Any(double.IsNaN));
+
+            for (int r = 0; r < rows; r += 997)
+            {
+                var single = npf.irr(flows.Skip(r * cols).Take(cols).ToArray());
+                Assert.AreEqual((double)single, res[r]);
+            }
+        }
+
         [TestMethod]
         public void test_irr_gh_6744()
         {
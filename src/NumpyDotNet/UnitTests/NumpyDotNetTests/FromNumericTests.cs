@@ -1083,6 +1083,106 @@ namespace NumpyDotNetTests
 
         }
 
+        [TestMethod]
+        public void test_sort_kinds_1()
+        {
+            var a = np.array(new Int32[] { 3, -1, 2, 3, -7, 2, 0, 3, -1 });
+
+            foreach (var kind in new string[] { "quicksort", "mergesort", "heapsort", "stable" })
+            {
+                var b = np.sort(a, -1, kind);
+                print(b);
+                AssertArray(b, new Int32[] { -7, -1, -1, 0, 2, 2, 3, 3, 3 });
+            }
+
+            // stable kinds keep equal keys in their original order
+            var c = np.argsort(a, -1, "stable");
+            print(c);
+            AssertArray(c, new npy_intp[] { 4, 1, 8, 6, 2, 5, 0, 3, 7 });
+
+            var d = np.argsort(a, kind: NPY_SORTKIND.NPY_MERGESORT);
+            AssertArray(d, new npy_intp[] { 4, 1, 8, 6, 2, 5, 0, 3, 7 });
+
+            var e = np.argsort(a, -1, "heapsort");
+            AssertArray(a[e] as ndarray, new Int32[] { -7, -1, -1, 0, 2, 2, 3, 3, 3 });
+
+            try
+            {
+                np.sort(a, -1, "bogus");
+                Assert.Fail("Should have caught the exception");
+            }
+            catch (Exception)
+            {
+            }
+        }
+
+        [TestMethod]
+        public void test_sort_nan_1()
+        {
+            var a = np.array(new double[] { 2.5, double.NaN, -1.0, 0.0, double.NaN, -3.5 });
+
+            var b = np.sort(a);
+            print(b);
+            AssertArray(b, new double[] { -3.5, -1.0, 0.0, 2.5, double.NaN, double.NaN });
+
+            var c = np.argsort(a, -1, "stable");
+            print(c);
+            AssertArray(c, new npy_intp[] { 5, 2, 3, 0, 1, 4 });
+
+            var d = np.sort(a.astype(np.Float32), -1, "mergesort");
+            print(d);
+            AssertArray(d, new float[] { -3.5f, -1.0f, 0.0f, 2.5f, float.NaN, float.NaN });
+        }
+
+        [TestMethod]
+        public void test_sort_complex_heapsort_1()
+        {
+            // tied real parts must still be ordered by the imaginary part
+            var a = np.array(new System.Numerics.Complex[]
+                { new System.Numerics.Complex(3, 5), new System.Numerics.Complex(1, 2), new System.Numerics.Complex(3, -3),
+                  new System.Numerics.Complex(3, -2), new System.Numerics.Complex(1, -4), new System.Numerics.Complex(3, 0) });
+
+            var b = np.argsort(a, -1, "heapsort");
+            print(b);
+            AssertArray(b, new npy_intp[] { 4, 1, 2, 3, 5, 0 });
+
+            var c = np.sort(a, -1, "heapsort");
+            print(c);
+            AssertArray(c, new System.Numerics.Complex[]
+                { new System.Numerics.Complex(1, -4), new System.Numerics.Complex(1, 2), new System.Numerics.Complex(3, -3),
+                  new System.Numerics.Complex(3, -2), new System.Numerics.Complex(3, 0), new System.Numerics.Complex(3, 5) });
+        }
+
+        [TestMethod]
+        public void test_sort_large_1()
+        {
+            // large enough to take the parallel sample sort path
+            int length = (1 << 21) + 5;
+            var data = new Int32[length];
+            for (int i = 0; i < length; i++)
+            {
+                data[i] = (int)((i * 7919L) % 1001) - 500;
+            }
+            var a = np.array(data);
+
+            foreach (var kind in new string[] { "quicksort", "stable" })
+            {
+                var sorted = np.sort(a, -1, kind).AsInt32Array();
+                for (int i = 1; i < length; i++)
+                {
+                    Assert.IsTrue(sorted[i - 1] <= sorted[i]);
+                }
+            }
+
+            var perm = np.argsort(a, -1, "stable").AsInt64Array();
+            for (int i = 1; i < length; i++)
+            {
+                var prev = data[perm[i - 1]];
+                var cur = data[perm[i]];
+                Assert.IsTrue(prev < cur || (prev == cur && perm[i - 1] < perm[i]));
+            }
+        }
+
         [TestMethod]
         public void test_msort_1()
         {
@@ -1233,6 +1333,92 @@ namespace NumpyDotNetTests
 
         }
 
+        [TestMethod]
+        public void test_searchsorted_2()
+        {
+            // long enough haystack for the Eytzinger layout, sorted keys for galloping, reversed keys for full searches
+            ndarray arr = np.arange(0, 200000, 2, dtype: np.Int64);
+            ndarray keys = np.arange(-1, 200001, dtype: np.Int64);
+
+            var expectedLeft = new Int64[keys.size];
+            var expectedRight = new Int64[keys.size];
+            for (int i = 0; i < keys.size; i++)
+            {
+                long k = i - 1;
+                expectedLeft[i] = Math.Min(Math.Max((k + 1) / 2, 0), 100000);
+                expectedRight[i] = k < 0 ? 0 : Math.Min(k / 2 + 1, 100000);
+            }
+
+            // compare the typed data directly, element wise AssertArray is far too slow at this size
+            CollectionAssert.AreEqual(expectedLeft, np.searchsorted(arr, keys).AsInt64Array());
+            CollectionAssert.AreEqual(expectedRight, np.searchsorted(arr, keys, side: NPY_SEARCHSIDE.NPY_SEARCHRIGHT).AsInt64Array());
+
+            ndarray reversed = np.searchsorted(arr, keys["::-1"] as ndarray);
+            Assert.AreEqual((npy_intp)100000, reversed.GetItem(0));
+            Assert.AreEqual((npy_intp)0, reversed.GetItem(keys.size - 1));
+            CollectionAssert.AreEqual(expectedLeft, (reversed["::-1"] as ndarray).AsInt64Array());
+
+            // NaN sorts to the end
+            ndarray f = np.array(new double[] { 1.0, 2.0, double.NaN });
+            AssertArray(np.searchsorted(f, np.array(new double[] { double.NaN, 2.0, 5.0 })), new npy_intp[] { 2, 1, 2 });
+            AssertArray(np.searchsorted(f, np.array(new double[] { double.NaN, 2.0, 5.0 }), side: NPY_SEARCHSIDE.NPY_SEARCHRIGHT), new npy_intp[] { 3, 2, 2 });
+
+            // timestamps beyond 2^53 must not be rounded to doubles
+            var bins = np.array(new Int64[] { 1600000000000000000, 1600000000000000001, 1600000000000000002 });
+            var inds = np.digitize(np.array(new Int64[] { 1600000000000000001, 1600000000000000003 }), bins);
+            AssertArray(inds, new npy_intp[] { 2, 3 });
+        }
+
+        [TestMethod]
+        public void test_lexsort_1()
+        {
+            var a = np.array(new Int32[] { 1, 5, 1, 4, 3, 4, 4 });
+            var b = np.array(new Int32[] { 9, 4, 0, 4, 0, 2, 1 });
+
+            // packed into one key
+            var ind = np.lexsort(new ndarray[] { b, a });
+            print(ind);
+            AssertArray(ind, new npy_intp[] { 2, 0, 4, 6, 5, 3, 1 });
+
+            // one radix pass per key
+            ind = np.lexsort(new ndarray[] { b.astype(np.Float64), a.astype(np.Int64) });
+            AssertArray(ind, new npy_intp[] { 2, 0, 4, 6, 5, 3, 1 });
+
+            // comparison sort
+            ind = np.lexsort(new ndarray[] { b.astype(np.Decimal), a });
+            AssertArray(ind, new npy_intp[] { 2, 0, 4, 6, 5, 3, 1 });
+
+            var surnames = np.array(new string[] { "Hertz", "Galilei", "Hertz" });
+            var first_names = np.array(new string[] { "Heinrich", "Galileo", "Gustav" });
+            ind = np.lexsort(new ndarray[] { first_names, surnames });
+            AssertArray(ind, new npy_intp[] { 1, 2, 0 });
+
+            // each row of a 2D array is a key
+            ind = np.lexsort(np.array(new Int32[,] { { 9, 4, 0, 4, 0, 2, 1 }, { 1, 5, 1, 4, 3, 4, 4 } }));
+            AssertArray(ind, new npy_intp[] { 2, 0, 4, 6, 5, 3, 1 });
+
+            // ties keep their original order, NaN sorts last
+            var c = np.array(new double[] { double.NaN, 1.0, 1.0, 0.0 });
+            var d = np.array(new Int16[] { 0, 0, 0, 0 });
+            ind = np.lexsort(new ndarray[] { c, d });
+            AssertArray(ind, new npy_intp[] { 3, 1, 2, 0 });
+        }
+
+        [TestMethod]
+        public void test_lexsort_2()
+        {
+            var a = np.array(new Int32[,] { { 3, 1, 2 }, { 1, 1, 0 } });
+            var b = np.array(new Int32[,] { { 0, 1, 0 }, { 2, 1, 0 } });
+
+            var ind = np.lexsort(new ndarray[] { b, a }, axis: 0);
+            print(ind);
+            AssertArray(ind, new npy_intp[,] { { 1, 0, 1 }, { 0, 1, 0 } });
+
+            ind = np.lexsort(new ndarray[] { b, a }, axis: 1);
+            print(ind);
+            AssertArray(ind, new npy_intp[,] { { 1, 2, 0 }, { 2, 1, 0 } });
+        }
+
         [TestMethod]
         public void test_resize_1()
         {
@@ -175,6 +175,45 @@ namespace NumpyDotNetTests
             }
 
         }
+
+        [TestMethod]
+        public void test_bincount_int32_counts()
+        {
+            var x = np.array(new int[] { 0, 1, 1, 3, 2, 1, 7 });
+            var a = np.bincount(x, int32_counts: true);
+            Assert.AreEqual(NPY_TYPES.NPY_INT32, a.TypeNum);
+            AssertArray(a, new Int32[] { 1, 3, 1, 1, 0, 0, 0, 1 });
+            print(a);
+
+            x = np.array(new Int16[] { 0, 1, 1, 3, 2, 1, 7 }, dtype: np.Int16);
+            a = np.bincount(x, minlength: 10, int32_counts: true);
+            Assert.AreEqual(NPY_TYPES.NPY_INT32, a.TypeNum);
+            AssertArray(a, new Int32[] { 1, 3, 1, 1, 0, 0, 0, 1, 0, 0 });
+            print(a);
+        }
+
+        [TestMethod]
+        public void test_bincount_large()
+        {
+            // large enough to be counted in parallel
+            var x = np.arange(1000000) % 10;
+
+            var a = np.bincount(x, minlength: 12);
+            AssertArray(a, new npy_intp[] { 100000, 100000, 100000, 100000, 100000, 100000, 100000, 100000, 100000, 100000, 0, 0 });
+
+            a = np.bincount(x.astype(np.Int64), weights: np.ones(new shape(1000000)) * 0.5);
+            AssertArray(a, new double[] { 50000, 50000, 50000, 50000, 50000, 50000, 50000, 50000, 50000, 50000 });
+
+            try
+            {
+                a = np.bincount(x - 1);
+                Assert.Fail("This should have thrown an exception");
+            }
+            catch (Exception ex)
+            {
+                print(ex.Message);
+            }
+        }
         #endregion
 
         #region digitize
@@ -396,6 +435,25 @@ namespace NumpyDotNetTests
         }
 
 
+
+        [TestMethod]
+        public void test_histogram_uniform_large()
+        {
+            var a = np.arange(1000000) % 100;
+
+            var x = np.histogram(a, bins: 7);
+            AssertArray(x.hist, new npy_intp[] { 150000, 140000, 140000, 140000, 140000, 140000, 150000 });
+            print(x);
+
+            x = np.histogram(a, bins: 7, weights: a * 0.5);
+            AssertArray(x.hist, new double[] { 525000, 1505000, 2485000, 3465000, 4445000, 5425000, 6900000 });
+            print(x);
+
+            // values outside the range are not counted
+            x = np.histogram(a, bins: 4, range: (10.0f, 50.0f));
+            AssertArray(x.hist, new npy_intp[] { 100000, 100000, 100000, 110000 });
+            print(x);
+        }
         #endregion
 
         #region histogramdd
@@ -805,6 +863,17 @@ namespace NumpyDotNetTests
             print(result.yedges);
         }
 
+        [TestMethod]
+        public void test_histogram2d_large()
+        {
+            var a = np.arange(1000000);
+
+            var result = np.histogram2d(a % 100, a % 7, bins: 2);
+            AssertArray(result.H, new double[,] { { 214286, 285714 }, { 214286, 285714 } });
+            AssertArray(result.xedges, new double[] { 0, 49.5, 99 });
+            AssertArray(result.yedges, new double[] { 0, 3, 6 });
+            print(result.H);
+        }
 
         #endregion
 
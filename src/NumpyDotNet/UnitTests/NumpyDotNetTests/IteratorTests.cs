@@ -40,6 +40,185 @@ namespace NumpyDotNetTests
 
         }
  
+        [TestMethod]
+        public void test_nditer_typed_external_loop()
+        {
+            var a = np.arange(24, dtype: np.Float64).reshape((2, 3, 4));
+            var b = np.arange(4, dtype: np.Float64);
+
+            var it = new nditer<double>(new ndarray[] { a, b, null }, NPY_ITER_FLAGS.NPY_ITER_EXTERNAL_LOOP,
+                new NPY_ITER_OPFLAGS[] { NPY_ITER_OPFLAGS.NPY_ITER_READONLY, NPY_ITER_OPFLAGS.NPY_ITER_READONLY,
+                                         NPY_ITER_OPFLAGS.NPY_ITER_WRITEONLY | NPY_ITER_OPFLAGS.NPY_ITER_ALLOCATE });
+
+            Assert.AreEqual(24, it.itersize);
+            int chunks = 0;
+            while (it.MoveNext())
+            {
+                Assert.AreEqual(4, it.Count);
+                Assert.AreEqual(1, it.Stride(0));
+                Assert.AreEqual(1, it.Stride(1));
+                for (int i = 0; i < it.Count; i++)
+                {
+                    it[2, i] = it[0, i] * 10 + it[1, i];
+                }
+                chunks++;
+            }
+            Assert.AreEqual(6, chunks);
+
+            var c = it.operands[2];
+            AssertShape(c, 2, 3, 4);
+            CollectionAssert.AreEqual(Enumerable.Range(0, 24).Select(v => v * 10.0 + v % 4).ToArray(), c.AsDoubleArray());
+            print(c);
+
+            // one element at a time
+            double total = 0;
+            var it2 = new nditer<double>(a.T);
+            while (it2.MoveNext())
+            {
+                Assert.AreEqual(1, it2.Count);
+                total += it2[0, 0];
+            }
+            Assert.AreEqual(276.0, total);
+        }
+
+        [TestMethod]
+        public void test_nditer_typed_buffered()
+        {
+            var a = np.arange(30, dtype: np.Int32).reshape((5, 6));
+            var b = np.arange(60, dtype: np.Float64).reshape((5, 12)).A(":", "::2");
+            var c = np.zeros((6, 5), dtype: np.Float64);
+
+            // a is cast, b and c.T are strided, and the 4 element buffers span rows
+            using (var it = new nditer<double>(new ndarray[] { a, b, c.T }, NPY_ITER_FLAGS.NPY_ITER_EXTERNAL_LOOP | NPY_ITER_FLAGS.NPY_ITER_BUFFERED,
+                new NPY_ITER_OPFLAGS[] { NPY_ITER_OPFLAGS.NPY_ITER_READONLY, NPY_ITER_OPFLAGS.NPY_ITER_READONLY, NPY_ITER_OPFLAGS.NPY_ITER_READWRITE }, 4))
+            {
+                npy_intp seen = 0;
+                while (it.MoveNext())
+                {
+                    Assert.AreEqual(seen, it.iterindex);
+                    var x = it.Chunk(0);
+                    var y = it.Chunk(1);
+                    var z = it.Chunk(2);
+                    for (int i = 0; i < it.Count; i++)
+                    {
+                        z.Array[z.Offset + i] += x.Array[x.Offset + i] + y.Array[y.Offset + i];
+                    }
+                    seen += it.Count;
+                }
+                Assert.AreEqual(30, seen);
+            }
+
+            double[] cd = c.AsDoubleArray();
+            for (int r = 0; r < 5; r++)
+            {
+                for (int k = 0; k < 6; k++)
+                {
+                    Assert.AreEqual(r * 6 + k + r * 12 + k * 2, cd[k * 5 + r]);
+                }
+            }
+
+            // a writeable operand of another type is cast back when the iteration finishes
+            var d = np.zeros((5, 6), dtype: np.Int32);
+            var it2 = new nditer<double>(new ndarray[] { a, d }, NPY_ITER_FLAGS.NPY_ITER_EXTERNAL_LOOP | NPY_ITER_FLAGS.NPY_ITER_BUFFERED,
+                new NPY_ITER_OPFLAGS[] { NPY_ITER_OPFLAGS.NPY_ITER_READONLY, NPY_ITER_OPFLAGS.NPY_ITER_WRITEONLY });
+            while (it2.MoveNext())
+            {
+                for (int i = 0; i < it2.Count; i++)
+                {
+                    it2[1, i] = it2[0, i] * 3;
+                }
+            }
+            Assert.AreSame(d, it2.operands[1]);
+            CollectionAssert.AreEqual(Enumerable.Range(0, 30).Select(v => v * 3).ToArray(), d.AsInt32Array());
+        }
+
+        [TestMethod]
+        public void test_nditer_typed_errors()
+        {
+            var a = np.arange(6, dtype: np.Int32).reshape((2, 3));
+
+            try
+            {
+                var it = new nditer<double>(a);
+                Assert.Fail("should have thrown an exception");
+            }
+            catch (Exception)
+            {
+            }
+
+            try
+            {
+                var it = new nditer<Int32>(new ndarray[] { a, np.zeros(3, dtype: np.Int32) }, NPY_ITER_FLAGS.NPY_ITER_EXTERNAL_LOOP,
+                    new NPY_ITER_OPFLAGS[] { NPY_ITER_OPFLAGS.NPY_ITER_READONLY, NPY_ITER_OPFLAGS.NPY_ITER_WRITEONLY });
+                Assert.Fail("should have thrown an exception");
+            }
+            catch (Exception)
+            {
+            }
+
+            try
+            {
+                var it = new nditer<Int32>(new ndarray[] { a, np.zeros(4, dtype: np.Int32) }, NPY_ITER_FLAGS.NPY_ITER_EXTERNAL_LOOP, null);
+                Assert.Fail("should have thrown an exception");
+            }
+            catch (Exception)
+            {
+            }
+        }
+
+        [TestMethod]
+        public void test_nditer_typed_large()
+        {
+            var random = new np.random();
+            random.seed(321);
+            var a = random.rand(new shape(1000, 1000));
+            var b = random.rand(new shape(1000));
+            var out1 = np.empty((1000, 1000), dtype: np.Float64);
+            var out2 = np.empty((1000, 1000), dtype: np.Float64);
+
+            var op_flags = new NPY_ITER_OPFLAGS[] { NPY_ITER_OPFLAGS.NPY_ITER_READONLY, NPY_ITER_OPFLAGS.NPY_ITER_READONLY, NPY_ITER_OPFLAGS.NPY_ITER_WRITEONLY };
+
+            var it = new nditer<double>(new ndarray[] { a.T, b, out1 }, NPY_ITER_FLAGS.NPY_ITER_EXTERNAL_LOOP, op_flags);
+            while (it.MoveNext())
+            {
+                double[] x = it.Data(0), y = it.Data(1), z = it.Data(2);
+                npy_intp xo = it.Offset(0), yo = it.Offset(1), zo = it.Offset(2);
+                npy_intp xs = it.Stride(0), ys = it.Stride(1), zs = it.Stride(2);
+                for (npy_intp i = 0; i < it.Count; i++)
+                {
+                    z[zo + i * zs] = x[xo + i * xs] * y[yo + i * ys];
+                }
+            }
+
+            using (var bit = new nditer<double>(new ndarray[] { a.T, b, out2 }, NPY_ITER_FLAGS.NPY_ITER_EXTERNAL_LOOP | NPY_ITER_FLAGS.NPY_ITER_BUFFERED, op_flags))
+            {
+                while (bit.MoveNext())
+                {
+                    var x = bit.Chunk(0);
+                    var y = bit.Chunk(1);
+                    var z = bit.Chunk(2);
+                    for (int i = 0; i < bit.Count; i++)
+                    {
+                        z.Array[z.Offset + i] = x.Array[x.Offset + i] * y.Array[y.Offset + i];
+                    }
+                }
+            }
+
+            double[] ad = a.AsDoubleArray();
+            double[] bd = b.AsDoubleArray();
+            double[] expected = new double[1000 * 1000];
+            for (int r = 0; r < 1000; r++)
+            {
+                for (int k = 0; k < 1000; k++)
+                {
+                    expected[r * 1000 + k] = ad[k * 1000 + r] * bd[k];
+                }
+            }
+
+            CollectionAssert.AreEqual(expected, out1.AsDoubleArray());
+            CollectionAssert.AreEqual(expected, out2.AsDoubleArray());
+        }
+
         [TestMethod]
         public void test_ndindex_1()
         {
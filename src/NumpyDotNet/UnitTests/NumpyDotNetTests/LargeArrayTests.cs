@@ -32,8 +32,10 @@
 
 using Microsoft.VisualStudio.TestTools.UnitTesting;
 using NumpyDotNet;
+using NumpyLib;
 using System;
 #if NPY_INTP_64
+using npy_intp = System.Int64;
 #else
 using npy_intp = System.Int32;
 #endif
@@ -430,7 +432,7 @@ namespace NumpyDotNetTests
             var c = np.sum(b);
             print(c);
 
-            Assert.AreEqual(13463535.75598323, c.GetItem(0));
+            Assert.AreEqual(13463535.756926347, c.GetItem(0));
         }
 
         [TestMethod]
@@ -555,7 +557,7 @@ namespace NumpyDotNetTests
             Console.WriteLine(sw.ElapsedMilliseconds.ToString());
 
             var sum = np.sum(c);
-            Assert.AreEqual((double)(4.0006266001036175E+18), (double)sum);
+            Assert.AreEqual((double)(4.0006266001E+18), (double)sum);
 
 
         }
@@ -583,12 +585,118 @@ namespace NumpyDotNetTests
             Console.WriteLine(sw.ElapsedMilliseconds.ToString());
 
             var sum = np.sum(c);
-            Assert.AreEqual((double)(3.9999603333936118E+18), (double)sum);
+            Assert.AreEqual((double)(3.9999603334E+18), (double)sum);
             
 
 
         }
 
+        [TestMethod]
+        public void test_largearray_reductions_axis_Float64()
+        {
+            var a = np.arange(0, 4000 * 250, dtype: np.Float64).reshape(4000, 250);
+
+            var b = np.sum(a, axis: 0);
+            Assert.AreEqual(1999500000.0, b.GetItem(0));
+            Assert.AreEqual(2000496000.0, b.GetItem(249));
+            Assert.AreEqual(499999500000.0, np.sum(b).GetItem(0));
+
+            b = np.sum(a, axis: 1);
+            Assert.AreEqual(31125.0, b.GetItem(0));
+            Assert.AreEqual(249968625.0, b.GetItem(3999));
+            Assert.AreEqual(499999500000.0, np.sum(b).GetItem(0));
+
+            b = np.mean(a, axis: 0);
+            Assert.AreEqual(499875.0, b.GetItem(0));
+            Assert.AreEqual(500124.0, b.GetItem(249));
+
+            b = np.mean(a, axis: 1);
+            Assert.AreEqual(124.5, b.GetItem(0));
+            Assert.AreEqual(999874.5, b.GetItem(3999));
+
+            b = np.amax(a, axis: 0) as ndarray;
+            Assert.AreEqual(999750.0, b.GetItem(0));
+            Assert.AreEqual(999999.0, b.GetItem(249));
+
+            b = np.amax(a, axis: 1) as ndarray;
+            Assert.AreEqual(249.0, b.GetItem(0));
+            Assert.AreEqual(999999.0, b.GetItem(3999));
+
+            b = np.amin(a, axis: 0) as ndarray;
+            Assert.AreEqual(0.0, b.GetItem(0));
+            Assert.AreEqual(249.0, b.GetItem(249));
+
+            b = np.amin(a, axis: 1) as ndarray;
+            Assert.AreEqual(0.0, b.GetItem(0));
+            Assert.AreEqual(999750.0, b.GetItem(3999));
+
+            var c = np.ones(new shape(4000, 250), dtype: np.Float64);
+            c[0] = 2.0;
+
+            b = np.prod(c, axis: 0);
+            Assert.AreEqual(2.0, b.GetItem(0));
+            Assert.AreEqual(500.0, np.sum(b).GetItem(0));
+
+            b = np.prod(c, axis: 1);
+            Assert.AreEqual(Math.Pow(2, 250), b.GetItem(0));
+            Assert.AreEqual(1.0, b.GetItem(3999));
+
+            var d = a % 7 == 0;
+            Assert.AreEqual(true, np.all(np.any(d, axis: 0)).GetItem(0));
+            Assert.AreEqual(true, np.all(np.any(d, axis: 1)).GetItem(0));
+            Assert.AreEqual(false, np.any(np.all(d, axis: 0)).GetItem(0));
+            Assert.AreEqual(false, np.any(np.all(d, axis: 1)).GetItem(0));
+            Assert.AreEqual(true, np.all(np.all(a >= 0, axis: 1)).GetItem(0));
+
+            b = np.cumsum(a, axis: 1);
+            Assert.AreEqual(31125.0, b.GetItem(249));
+            Assert.AreEqual(249968625.0, b.GetItem(999999));
+
+            b = np.ufunc.reduceat(UFuncOperation.add, a, new npy_intp[] { 0, 125 }, axis: 1);
+            Assert.AreEqual(7750.0, b.GetItem(0));
+            Assert.AreEqual(23375.0, b.GetItem(1));
+            Assert.AreEqual(499999500000.0, np.sum(b).GetItem(0));
+        }
+
+        [TestMethod]
+        public void test_largearray_sum_accuracy_Float32()
+        {
+            // adding 0.1f ten million times one after another drifts by more than 8%
+            var a = np.full(10000000, 0.1f, dtype: np.Float32);
+
+            // pairwise summation keeps the error within a few float32 ulps of the exact total
+            double expected = 10000000 * (double)0.1f;
+            var b = Convert.ToDouble(np.sum(a).GetItem(0));
+            Assert.AreEqual(expected, b, expected * 1e-6);
+        }
+
+
+        [TestMethod]
+        public void test_largearray_memmap_beyond_2GB()
+        {
+            // more elements than a single .NET array can hold, kept in native memory
+            long rows = 1 << 16;
+            int cols = (1 << 15) + 1;
+
+            using (var m = new np.memmap(new shape(rows, cols), dtype: np.UInt8))
+            {
+                Assert.IsTrue(m.size > int.MaxValue);
+
+                m.write(0, np.full(cols, 1, dtype: np.UInt8));
+                m.write(rows - 1, np.full(cols, 3, dtype: np.UInt8));
+
+                long total = 0;
+                foreach (var chunk in m.chunks())
+                {
+                    total += Convert.ToInt64(np.sum(chunk, dtype: np.Int64).GetItem(0));
+                }
+                Assert.AreEqual(4L * cols, total);
+
+                var last = m.read(-1, rows);
+                Assert.AreEqual((byte)3, last.GetItem(cols - 1));
+            }
+        }
+
 #endif
 
     }
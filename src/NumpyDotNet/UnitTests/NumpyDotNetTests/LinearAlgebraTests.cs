@@ -0,0 +1,286 @@
+﻿using System;
+using System.Numerics;
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+using NumpyDotNet;
+using System.Collections.Generic;
+using System.Text;
+using System.Linq;
+using NumpyLib;
+
+namespace NumpyDotNetTests
+{
+    [TestClass]
+    public class LinearAlgebraTests : TestBaseClass
+    {
+        private static double MaxAbs(ndarray a)
+        {
+            var max = np.max(np.absolute(a)).GetItem(0);
+            return max is Complex ? ((Complex)max).Real : Convert.ToDouble(max);
+        }
+
+        // checked on the typed data; np.triu/np.tril go element by element
+        private static void AssertTriangular(ndarray a, bool upper)
+        {
+            int rows = (int)a.Dim(0), cols = (int)a.Dim(1);
+            var data = a.AsDoubleArray();
+            for (int i = 0; i < rows; i++)
+            {
+                for (int j = 0; j < cols; j++)
+                {
+                    if (upper ? j < i : j > i)
+                        Assert.AreEqual(0.0, data[i * cols + j]);
+                }
+            }
+        }
+
+        #region solve/inv/det
+        [TestMethod]
+        public void test_solve_1()
+        {
+            var a = np.array(new double[] { 3, 1, 1, 2 }).reshape(2, 2);
+            var b = np.array(new double[] { 9, 8 });
+
+            var x = np.linalg.solve(a, b);
+            AssertArray(x, new double[] { 2, 3 });
+            print(x);
+
+            var X = np.linalg.solve(a, np.array(new double[] { 9, 1, 8, 2 }).reshape(2, 2));
+            AssertArray(X, new double[,] { { 2, 0 }, { 3, 1 } });
+            print(X);
+
+            try
+            {
+                np.linalg.solve(np.zeros(new shape(3, 3)), np.ones(new shape(3)));
+                Assert.Fail("This should have thrown an exception");
+            }
+            catch (Exception ex)
+            {
+                print(ex.Message);
+            }
+        }
+
+        [TestMethod]
+        public void test_inv_1()
+        {
+            var a = np.array(new double[] { 1, 2, 3, 4 }).reshape(2, 2);
+
+            var ainv = np.linalg.inv(a);
+            AssertArray(ainv, new double[,] { { -2, 1 }, { 1.5, -0.5 } });
+            print(ainv);
+
+            AssertArray(np.dot(a, ainv), new double[,] { { 1, 0 }, { 0, 1 } });
+
+            try
+            {
+                np.linalg.inv(np.arange(6).reshape(2, 3));
+                Assert.Fail("This should have thrown an exception");
+            }
+            catch (Exception ex)
+            {
+                print(ex.Message);
+            }
+        }
+
+        [TestMethod]
+        public void test_det_1()
+        {
+            var a = np.array(new double[] { 1, 2, 3, 4 }).reshape(2, 2);
+
+            var d = np.linalg.det(a);
+            Assert.AreEqual(-2.0, (double)d.GetItem(0), 1e-12);
+            print(d);
+
+            var (sign, logdet) = np.linalg.slogdet(a);
+            Assert.AreEqual(-1.0, (double)sign.GetItem(0));
+            Assert.AreEqual(Math.Log(2), (double)logdet.GetItem(0), 1e-12);
+
+            // a single matrix gives 0-d results
+            Assert.AreEqual(0, d.ndim);
+            Assert.AreEqual(0, sign.ndim);
+            Assert.AreEqual(0, logdet.ndim);
+
+            var stack = np.array(new double[] { 1, 2, 3, 4, 1, 2, 2, 1, 1, 3, 3, 1 }).reshape(3, 2, 2);
+            AssertArray(np.linalg.det(stack), new double[] { -2, -3, -8 });
+            AssertShape(np.linalg.det(stack), 3);
+
+            Assert.AreEqual(0.0, (double)np.linalg.det(np.ones(new shape(3, 3))).GetItem(0));
+        }
+
+        [TestMethod]
+        public void test_solve_inv_large()
+        {
+            // large enough for the blocked factorization to update through the GEMM engine
+            var random = new np.random();
+            random.seed(8);
+
+            var a = random.rand(new shape(300, 300));
+            var b = random.rand(new shape(300, 3));
+
+            var x = np.linalg.solve(a, b);
+            Assert.IsTrue(MaxAbs(np.dot(a, x) - b) < 1e-10);
+
+            var ainv = np.linalg.inv(a);
+            Assert.IsTrue(MaxAbs(np.dot(a, ainv) - np.eye(300)) < 1e-10);
+        }
+
+        [TestMethod]
+        public void test_solve_stacked()
+        {
+            var random = new np.random();
+            random.seed(9);
+
+            var a = random.rand(new shape(10, 4, 4));
+            var b = random.rand(new shape(10, 4));
+
+            var x = np.linalg.solve(a, b);
+            Assert.AreEqual(2, x.ndim);
+            Assert.AreEqual(10, x.Dim(0));
+            Assert.AreEqual(4, x.Dim(1));
+            for (int i = 0; i < 10; i++)
+            {
+                AssertArray(x.A(i), np.linalg.solve(a.A(i), b.A(i)).AsDoubleArray());
+            }
+
+            // the same right hand side matrix is broadcast to every matrix of the stack
+            var X = np.linalg.solve(a, random.rand(new shape(1, 4, 2)));
+            Assert.AreEqual(3, X.ndim);
+            Assert.AreEqual(10, X.Dim(0));
+
+            var ainv = np.linalg.inv(a);
+            Assert.IsTrue(MaxAbs(np.matmul(a, ainv) - np.eye(4)) < 1e-10);
+        }
+        #endregion
+
+        #region cholesky/qr
+        [TestMethod]
+        public void test_cholesky_1()
+        {
+            var a = np.array(new double[] { 4, 12, -16, 12, 37, -43, -16, -43, 98 }).reshape(3, 3);
+
+            var L = np.linalg.cholesky(a);
+            AssertArray(L, new double[,] { { 2, 0, 0 }, { 6, 1, 0 }, { -8, 5, 3 } });
+            print(L);
+
+            try
+            {
+                np.linalg.cholesky(np.array(new double[] { 1, 2, 2, 1 }).reshape(2, 2));
+                Assert.Fail("This should have thrown an exception");
+            }
+            catch (Exception ex)
+            {
+                print(ex.Message);
+            }
+        }
+
+        [TestMethod]
+        public void test_cholesky_large()
+        {
+            var random = new np.random();
+            random.seed(10);
+
+            var r = random.rand(new shape(300, 300));
+            var a = np.dot(r, r.T) + np.eye(300) * 300;
+
+            var L = np.linalg.cholesky(a);
+            AssertTriangular(L, upper: false);
+            Assert.IsTrue(MaxAbs(np.dot(L, L.T) - a) < 1e-10);
+        }
+
+        [TestMethod]
+        public void test_qr_1()
+        {
+            var a = np.array(new double[] { 12, -51, 4, 6, 167, -68, -4, 24, -41 }).reshape(3, 3);
+
+            var (q, r) = np.linalg.qr(a);
+            AssertArray(r, new double[,] { { -14, -21, 14 }, { 0, -175, 70 }, { 0, 0, -35 } });
+            AssertArray(q, new double[,] { { -6.0 / 7, 69.0 / 175, 58.0 / 175 }, { -3.0 / 7, -158.0 / 175, -6.0 / 175 }, { 2.0 / 7, -6.0 / 35, 33.0 / 35 } });
+            print(q);
+            print(r);
+
+            var (qr, rr) = np.linalg.qr(a, mode: "r");
+            Assert.IsNull(qr);
+            AssertArray(rr, new double[,] { { -14, -21, 14 }, { 0, -175, 70 }, { 0, 0, -35 } });
+        }
+
+        [TestMethod]
+        public void test_qr_modes_large()
+        {
+            var random = new np.random();
+            random.seed(11);
+
+            var a = random.rand(new shape(307, 300));
+
+            var (q, r) = np.linalg.qr(a);
+            Assert.AreEqual(300, q.Dim(1));
+            Assert.AreEqual(300, r.Dim(0));
+            Assert.IsTrue(MaxAbs(np.dot(q, r) - a) < 1e-10);
+            Assert.IsTrue(MaxAbs(np.dot(q.T, q) - np.eye(300)) < 1e-10);
+            AssertTriangular(r, upper: true);
+
+            var (Q, R) = np.linalg.qr(a, mode: "complete");
+            Assert.AreEqual(307, Q.Dim(1));
+            Assert.AreEqual(307, R.Dim(0));
+            Assert.IsTrue(MaxAbs(np.dot(Q, R) - a) < 1e-10);
+            Assert.IsTrue(MaxAbs(np.dot(Q.T, Q) - np.eye(307)) < 1e-10);
+        }
+        #endregion
+
+        #region eig/eigh
+        [TestMethod]
+        public void test_eigh_1()
+        {
+            var a = np.array(new double[] { 2, -1, 0, -1, 2, -1, 0, -1, 2 }).reshape(3, 3);
+
+            var (w, v) = np.linalg.eigh(a);
+            AssertArray(w, new double[] { 2 - Math.Sqrt(2), 2, 2 + Math.Sqrt(2) });
+            Assert.IsTrue(MaxAbs(np.dot(a, v) - v * w) < 1e-12);
+            AssertArray(np.dot(v.T, v), new double[,] { { 1, 0, 0 }, { 0, 1, 0 }, { 0, 0, 1 } });
+            print(w);
+            print(v);
+
+            AssertArray(np.linalg.eigvalsh(a), new double[] { 2 - Math.Sqrt(2), 2, 2 + Math.Sqrt(2) });
+
+            // only the selected triangle is read
+            var upper = np.array(new double[] { 2, -1, 0, 99, 2, -1, 99, 99, 2 }).reshape(3, 3);
+            AssertArray(np.linalg.eigvalsh(upper, UPLO: "U"), new double[] { 2 - Math.Sqrt(2), 2, 2 + Math.Sqrt(2) });
+        }
+
+        [TestMethod]
+        public void test_eig_1()
+        {
+            var (w, v) = np.linalg.eig(np.array(new double[] { 0, -1, 1, 0 }).reshape(2, 2));
+            AssertArray(w, new Complex[] { new Complex(0, 1), new Complex(0, -1) });
+            AssertArray(v, new Complex[,] { { new Complex(Math.Sqrt(0.5), 0), new Complex(Math.Sqrt(0.5), 0) },
+                                            { new Complex(0, -Math.Sqrt(0.5)), new Complex(0, Math.Sqrt(0.5)) } });
+            print(w);
+            print(v);
+
+            var e = np.linalg.eigvals(np.array(new double[] { 1, 2, 3, 4, 5, 6, 7, 8, 10 }).reshape(3, 3));
+            AssertArray(e, new double[] { 16.707493316124744, -0.9057401795217597, 0.19824686339700953 });
+            print(e);
+        }
+
+        [TestMethod]
+        public void test_eig_large()
+        {
+            var random = new np.random();
+            random.seed(12);
+
+            var a = random.rand(new shape(100, 100));
+            var (w, v) = np.linalg.eig(a);
+            var ac = np.array(a, dtype: np.Complex);
+            Assert.IsTrue(MaxAbs(np.dot(ac, v) - v * w) < 1e-10);
+            Assert.IsTrue(MaxAbs(np.linalg.eigvals(a) - w) < 1e-10);
+
+            var s = a + a.T;
+            var (ws, vs) = np.linalg.eigh(s);
+            Assert.IsTrue(MaxAbs(np.dot(s, vs) - vs * ws) < 1e-10);
+            Assert.IsTrue(MaxAbs(np.dot(vs.T, vs) - np.eye(100)) < 1e-10);
+
+            var stack = np.stack(new object[] { s, s * 2 });
+            var wstack = np.linalg.eigvalsh(stack);
+            AssertArray(wstack.A(1), (ws * 2).AsDoubleArray());
+        }
+        #endregion
+    }
+}
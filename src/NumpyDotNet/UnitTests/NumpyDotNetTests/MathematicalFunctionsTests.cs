@@ -103,6 +103,98 @@ namespace NumpyDotNetTests
             print(c);
        
         }
+        [TestMethod]
+        public void test_sin_out_1()
+        {
+            // strided input written straight into a preallocated output
+            var a = np.arange(0, 20, dtype: np.Float64).reshape((4, 5));
+            var view = a["::2", "1::2"] as ndarray;
+
+            var result = np.zeros(new shape(2, 2), dtype: np.Float64);
+            var b = np.sin(view, @out: result);
+            Assert.AreSame(result, b);
+            AssertArray(b, new double[,] { { 0.841470984807897, 0.141120008059867 }, { -0.9999902065507035, 0.4201670368266409 } });
+
+            // in place
+            var c = np.arange(0, 5, dtype: np.Float64);
+            np.exp(c, @out: c);
+            AssertArray(c, new double[] { 1.0, 2.71828182845905, 7.38905609893065, 20.0855369231877, 54.5981500331442 });
+
+            // broadcast binary function into an output of another type
+            var f = np.zeros(new shape(2, 3), dtype: np.Float32);
+            np.hypot(np.full(new shape(2, 3), 3.0), np.array(new double[] { 4, 4, 4 }), @out: f);
+            AssertArray(f, new float[,] { { 5, 5, 5 }, { 5, 5, 5 } });
+
+            try
+            {
+                np.sin(a, @out: np.zeros(new shape(5, 4)));
+                Assert.Fail("This should have caused an exception");
+            }
+            catch (Exception ex)
+            {
+                print(ex.Message);
+            }
+        }
+
+        [TestMethod]
+        public void test_sin_where_out_1()
+        {
+            var a = np.arange(0, 6, dtype: np.Float64).reshape((2, 3));
+            var where = np.array(new bool[] { true, false, true });
+
+            // masked out elements keep the values already in out
+            var result = np.full(new shape(2, 3), -1.0, dtype: np.Float64);
+            var b = np.sin(a, where: where, @out: result);
+            Assert.AreSame(result, b);
+            AssertArray(b, new double[,] { { 0.0, -1.0, 0.909297426825682 }, { 0.141120008059867, -1.0, -0.958924274663138 } });
+
+            // same through a converting copy
+            var f = np.full(new shape(2, 3), -1.0, dtype: np.Float32);
+            np.sin(a, where: where, @out: f);
+            AssertArray(f, new float[,] { { 0.0f, -1.0f, 0.9092974f }, { 0.14112f, -1.0f, -0.9589243f } });
+
+            // without out they are NaN
+            var c = np.sin(a, where: where);
+            AssertArray(c, new double[,] { { 0.0, double.NaN, 0.909297426825682 }, { 0.141120008059867, double.NaN, -0.958924274663138 } });
+
+            // functions that compute every element still honor out and where
+            var g = np.full(new shape(3), 7, dtype: np.Int64);
+            np.gcd(np.array(new long[] { 12, 20, 9 }), np.array(new long[] { 8, 15, 6 }), where: where, @out: g);
+            AssertArray(g, new long[] { 4, 7, 3 });
+
+            var s = np.full(new shape(3), 9.0, dtype: np.Float64);
+            np.sign(np.array(new double[] { -2.0, 0.0, 5.0 }), where: where, @out: s);
+            AssertArray(s, new double[] { -1.0, 9.0, 1.0 });
+        }
+
+        [TestMethod]
+        public void test_rounding_arithmetic_where_out_1()
+        {
+            var a = np.array(new double[] { -2.5, 1.75, 4.0 });
+            var where = np.array(new bool[] { true, false, true });
+
+            var o = np.full(new shape(3), 9.0, dtype: np.Float64);
+            var b = np.fix(a, where: where, @out: o);
+            Assert.AreSame(o, b);
+            AssertArray(o, new double[] { -2.0, 9.0, 4.0 });
+
+            np.trunc(a, where: where, @out: o);
+            AssertArray(o, new double[] { -2.0, 9.0, 4.0 });
+
+            np.reciprocal(a, where: where, @out: o);
+            AssertArray(o, new double[] { -0.4, 9.0, 0.25 });
+
+            np.positive(a, @out: o);
+            AssertArray(o, new double[] { -2.5, 1.75, 4.0 });
+
+            var c = np.trunc(a, where: where);
+            AssertArray(c, new double[] { -2.0, double.NaN, 4.0 });
+
+            var m = np.full(new shape(3), 7, dtype: np.Int32);
+            np.mod(np.array(new int[] { 5, 6, 7 }), 4, @out: m, where: where);
+            AssertArray(m, new int[] { 1, 7, 3 });
+        }
+
         [TestMethod]
         public void test_cos_1()
         {
@@ -348,6 +440,16 @@ namespace NumpyDotNetTests
             print(b);
             AssertArray(b, new double[,] { { 5, 5, 5 }, { 5, 5, 5 }, { 5, 5, 5 } });
 
+            var c = np.hypot(new double[] { double.PositiveInfinity, double.NaN, double.NegativeInfinity, double.NaN },
+                             new double[] { double.NaN, double.PositiveInfinity, double.NaN, 1.0 });
+            print(c);
+            AssertArray(c, new double[] { double.PositiveInfinity, double.PositiveInfinity, double.PositiveInfinity, double.NaN });
+
+            var d = np.hypot(np.array(new float[] { 3, 5 }), np.array(new float[] { 4, 12 }));
+            print(d);
+            Assert.AreEqual(NPY_TYPES.NPY_FLOAT, d.TypeNum);
+            AssertArray(d, new float[] { 5, 13 });
+
         }
 
         [TestMethod]
@@ -2416,6 +2518,82 @@ namespace NumpyDotNetTests
             return;
         }
 
+        [TestMethod]
+        public void test_convolve_fft_1()
+        {
+            // long enough to be computed with FFT overlap-add
+            int n1 = 20000;
+            int n2 = 1000;
+            var a = np.ones(new shape(n1));
+            var v = np.ones(new shape(n2));
+
+            var full = np.convolve(a, v);
+            var expected = new double[n1 + n2 - 1];
+            for (int k = 0; k < expected.Length; k++)
+            {
+                expected[k] = Math.Min(Math.Min(k + 1, n2), n1 + n2 - 1 - k);
+            }
+            AssertArray(full, expected);
+
+            var same = np.convolve(a, v, mode: NPY_CONVOLE_MODE.NPY_CONVOLVE_SAME);
+            AssertArray(same, expected.Skip((n2 - 1) / 2).Take(n1).ToArray());
+
+            var valid = np.convolve(a, v, mode: NPY_CONVOLE_MODE.NPY_CONVOLVE_VALID);
+            AssertArray(valid, expected.Skip(n2 - 1).Take(n1 - n2 + 1).ToArray());
+        }
+
+        [TestMethod]
+        public void test_correlate_fft_2()
+        {
+            var random = new np.random();
+            random.seed(1234);
+
+            int n1 = 5000;
+            int n2 = 300;
+            double[] a = (double[])random.rand(new shape(n1)).ToArray();
+            double[] v = (double[])random.rand(new shape(n2)).ToArray();
+
+            foreach (var mode in new NPY_CONVOLE_MODE[] { NPY_CONVOLE_MODE.NPY_CONVOLVE_VALID, NPY_CONVOLE_MODE.NPY_CONVOLVE_SAME, NPY_CONVOLE_MODE.NPY_CONVOLVE_FULL })
+            {
+                int n_left = mode == NPY_CONVOLE_MODE.NPY_CONVOLVE_VALID ? 0 : mode == NPY_CONVOLE_MODE.NPY_CONVOLVE_SAME ? n2 / 2 : n2 - 1;
+                int length = mode == NPY_CONVOLE_MODE.NPY_CONVOLVE_VALID ? n1 - n2 + 1 : mode == NPY_CONVOLE_MODE.NPY_CONVOLVE_SAME ? n1 : n1 + n2 - 1;
+
+                // direct sums
+                var expected = new double[length];
+                var cexpected = new Complex[length];
+                for (int i = 0; i < length; i++)
+                {
+                    for (int j = 0; j < n2; j++)
+                    {
+                        int k = i - n_left + j;
+                        if (k >= 0 && k < n1)
+                        {
+                            expected[i] += a[k] * v[j];
+                            cexpected[i] += new Complex(a[k], v[k % n2]) * new Complex(v[j], -a[j]);
+                        }
+                    }
+                }
+
+                var c = np.correlate(np.array(a), np.array(v), mode);
+                AssertArray(c, expected);
+
+                var ca = a.Select((x, k) => new Complex(x, v[k % n2])).ToArray();
+                var cv = v.Select((x, j) => new Complex(x, -a[j])).ToArray();
+                c = np.correlate(np.array(ca), np.array(cv), mode);
+                AssertArray(c, cexpected);
+            }
+
+            // strided input
+            var s = np.correlate(np.array(a)["::2"], np.array(v)["::-1"], NPY_CONVOLE_MODE.NPY_CONVOLVE_VALID);
+            Assert.AreEqual(n1 / 2 - n2 + 1, s.size);
+            double s0 = 0;
+            for (int j = 0; j < n2; j++)
+            {
+                s0 += a[2 * j] * v[n2 - 1 - j];
+            }
+            Assert.AreEqual(s0, (double)s[0], 1e-8);
+        }
+
         [TestMethod]
         public void test_clip_1()
         {
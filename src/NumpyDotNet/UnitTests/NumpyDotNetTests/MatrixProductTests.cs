@@ -163,5 +163,71 @@ namespace NumpyDotNetTests
 
         }
 
+        #region GEMM engine tests
+
+        private static double[,] NaiveMatrixProduct(double[] a, int m, int k, double[] b, int n)
+        {
+            var c = new double[m, n];
+            for (int i = 0; i < m; i++)
+            {
+                for (int j = 0; j < n; j++)
+                {
+                    double sum = 0;
+                    for (int p = 0; p < k; p++)
+                    {
+                        sum += a[i * k + p] * b[p * n + j];
+                    }
+                    c[i, j] = sum;
+                }
+            }
+            return c;
+        }
+
+        [TestMethod]
+        public void test_dot_blocked_DOUBLE()
+        {
+            // sizes are deliberately not multiples of the micro-kernel tile sizes
+            int m = 67, k = 301, n = 53;
+
+            var a = np.arange(m * k, dtype: np.Float64).reshape(m, k) / 1000.0;
+            var b = np.arange(k * n, dtype: np.Float64).reshape(k, n) / 1000.0;
+
+            var ret = np.dot(a, b);
+
+            var expected = NaiveMatrixProduct(a.AsDoubleArray(), m, k, b.AsDoubleArray(), n);
+            AssertArray(ret, expected);
+        }
+
+        [TestMethod]
+        public void test_matmul_blocked_transposed_DOUBLE()
+        {
+            int m = 45, k = 70, n = 39;
+
+            var at = np.arange(m * k, dtype: np.Float64).reshape(k, m) / 100.0;
+            var b = np.arange(k * n, dtype: np.Float64).reshape(k, n) / 100.0;
+
+            // a is a non-contiguous view
+            var a = at.T;
+            var ret = np.matmul(a, b);
+
+            var expected = NaiveMatrixProduct(np.ascontiguousarray(a).AsDoubleArray(), m, k, b.AsDoubleArray(), n);
+            AssertArray(ret, expected);
+        }
+
+        [TestMethod]
+        public void test_inner_blocked_INT64()
+        {
+            var a = np.arange(40 * 50, dtype: np.Int64).reshape(40, 50);
+            var b = np.arange(30 * 50, dtype: np.Int64).reshape(30, 50);
+
+            var ret = np.inner(a, b);
+            var expected = np.dot(a, b.T);
+
+            AssertShape(ret, 40, 30);
+            Assert.IsTrue(np.array_equal(ret, expected));
+            Assert.AreEqual((Int64)1816675, (Int64)ret[0, 29]);
+        }
+
+        #endregion
     }
 }
@@ -78,6 +78,48 @@ namespace NumpyDotNetTests
 
         }
 
+        [TestMethod]
+        public void MultiThreaded_IndependentArraysAndErrors_1()
+        {
+            var expected = (double)np.sum(np.sin(np.arange(0, 100, dtype: np.Float64))).GetItem(0);
+
+            var failures = new ConcurrentQueue<string>();
+
+            Parallel.For(0, 2000, index =>
+            {
+                if (index % 3 == 0)
+                {
+                    // an error on this thread must surface here and nowhere else
+                    try
+                    {
+                        np.arange(0, 10 + index % 7).reshape((3, 3));
+                        failures.Enqueue("reshape did not throw");
+                    }
+                    catch (Exception)
+                    {
+                    }
+                }
+                else
+                {
+                    try
+                    {
+                        var a = np.arange(0, 100, dtype: np.Float64);
+                        var result = (double)np.sum(np.sin(a)).GetItem(0);
+                        if (result != expected)
+                        {
+                            failures.Enqueue(string.Format("got {0}, expected {1}", result, expected));
+                        }
+                    }
+                    catch (Exception ex)
+                    {
+                        failures.Enqueue(ex.Message);
+                    }
+                }
+            });
+
+            Assert.AreEqual(0, failures.Count, failures.FirstOrDefault());
+        }
+
         private MethodInfoData[] GetArrayOfUnitTests()
         {
             List<MethodInfoData> MethodInfo = new List<MethodInfoData>();
@@ -116,6 +158,8 @@ namespace NumpyDotNetTests
             MethodInfo.AddRange(GetArrayOfUnitTests<RandomUserDefinedTests>());
             MethodInfo.AddRange(GetArrayOfUnitTests<HistogramTests>());
             MethodInfo.AddRange(GetArrayOfUnitTests<FinancialFunctionsTests>());
+            MethodInfo.AddRange(GetArrayOfUnitTests<FFTTests>());
+            MethodInfo.AddRange(GetArrayOfUnitTests<LinearAlgebraTests>());
             return MethodInfo.ToArray();
         }
 
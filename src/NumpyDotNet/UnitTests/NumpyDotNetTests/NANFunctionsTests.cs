@@ -372,7 +372,7 @@ namespace NumpyDotNetTests
             print(b);
 
             b = np.nanvar(a);
-            Assert.AreEqual((double)1.5555555555555554, b.GetItem(0));
+            Assert.AreEqual((double)1.5555555555555556, b.GetItem(0));
             print(b);
 
             var c = np.nanvar(a, axis: 0);
@@ -384,6 +384,101 @@ namespace NumpyDotNetTests
             print(d);
         }
 
+        [TestMethod]
+        public void test_nanvar_ddof_keepdims()
+        {
+            var a = np.array(new double[,] { { 1, double.NaN }, { 3, double.NaN }, { 8, 2 } });
+
+            var b = np.nanvar(a, axis: 0, ddof: 1);
+            AssertArray(b, new double[] { 13, double.NaN });
+            print(b);
+
+            var c = np.nanstd(a, axis: -1, keepdims: true);
+            AssertArray(c, new double[,] { { 0 }, { 0 }, { 3 } });
+            print(c);
+
+            var d = np.nanmean(a, keepdims: true);
+            AssertArray(d, new double[,] { { 3.5 } });
+            print(d);
+
+            var e = np.nansum(a, axis: 1, keepdims: true);
+            AssertArray(e, new double[,] { { 1 }, { 3 }, { 10 } });
+            print(e);
+
+            var f = np.nanmax(a, axis: 0, keepdims: true);
+            AssertArray(f, new double[,] { { 8, 2 } });
+            print(f);
+        }
+
+        [TestMethod]
+        public void test_nan_reductions_large()
+        {
+            // expected values are computed on the typed data; np.where and np.allclose are too slow at this size
+            int rows = 3000, cols = 200;
+            var data = new double[rows * cols];
+            for (int i = 0; i < data.Length; i++)
+            {
+                data[i] = i % 7 == 0 ? double.NaN : i / 1000.0;
+            }
+            var a = np.array(data).reshape(rows, cols);
+
+            var colSum = new double[cols]; var colCnt = new double[cols]; var colMin = new double[cols];
+            var rowSum = new double[rows]; var rowMax = new double[rows];
+            for (int j = 0; j < cols; j++) colMin[j] = double.PositiveInfinity;
+            for (int r = 0; r < rows; r++) rowMax[r] = double.NegativeInfinity;
+            for (int r = 0; r < rows; r++)
+            {
+                for (int j = 0; j < cols; j++)
+                {
+                    double v = data[r * cols + j];
+                    if (double.IsNaN(v))
+                        continue;
+                    colSum[j] += v; colCnt[j]++; colMin[j] = Math.Min(colMin[j], v);
+                    rowSum[r] += v; rowMax[r] = Math.Max(rowMax[r], v);
+                }
+            }
+            var colMean = colSum.Select((v, j) => v / colCnt[j]).ToArray();
+            var colDev = new double[cols];
+            for (int i = 0; i < data.Length; i++)
+            {
+                if (!double.IsNaN(data[i]))
+                    colDev[i % cols] += (data[i] - colMean[i % cols]) * (data[i] - colMean[i % cols]);
+            }
+
+            AssertClose(np.nansum(a, axis: 0), colSum, 1e-8);
+            AssertClose(np.nansum(a, axis: 1), rowSum, 1e-8);
+            AssertClose(np.nanmean(a, axis: 0), colMean, 1e-10);
+            AssertClose(np.nanvar(a, axis: 0), colDev.Select((v, j) => v / colCnt[j]).ToArray(), 1e-8);
+            AssertClose(np.nanstd(a, axis: 0, ddof: 1), colDev.Select((v, j) => Math.Sqrt(v / (colCnt[j] - 1))).ToArray(), 1e-8);
+            AssertClose(np.nanmin(a, axis: 0), colMin, 0);
+            AssertClose(np.nanmax(a, axis: 1), rowMax, 0);
+
+            // a single long slice is split along the reduced axis and merged
+            var clean = data.Where(v => !double.IsNaN(v)).ToArray();
+            double mean = clean.Average();
+            Assert.AreEqual(clean.Sum(), (double)np.nansum(a).GetItem(0), 1e-6);
+            Assert.AreEqual(mean, (double)np.nanmean(a).GetItem(0), 1e-9);
+            Assert.AreEqual(clean.Sum(v => (v - mean) * (v - mean)) / clean.Length, (double)np.nanvar(a).GetItem(0), 1e-7);
+            Assert.AreEqual(0.001, (double)np.nanmin(a).GetItem(0));
+            Assert.AreEqual(599.999, (double)np.nanmax(a).GetItem(0));
+
+            // axis=None reduces to a 0-d array
+            Assert.AreEqual(0, np.nansum(a).ndim);
+            Assert.AreEqual(0, np.nanmean(a).ndim);
+            Assert.AreEqual(0, np.nanstd(a).ndim);
+            Assert.AreEqual(0, np.nanmax(a.astype(np.Float32)).ndim);
+        }
+
+        private static void AssertClose(ndarray a, double[] expected, double atol)
+        {
+            var x = a.AsDoubleArray();
+            Assert.AreEqual(expected.Length, x.Length);
+            for (int i = 0; i < x.Length; i++)
+            {
+                Assert.AreEqual(expected[i], x[i], atol);
+            }
+        }
+
         [TestMethod]
         public void test_nanmin_1()
         {
@@ -1,21 +0,0 @@
-﻿using System;
-using System.Numerics;
-using Microsoft.VisualStudio.TestTools.UnitTesting;
-using NumpyDotNet;
-using System.Collections.Generic;
-using System.Text;
-using System.Linq;
-using NumpyLib;
-
-namespace NumpyDotNetTests
-{
-    [TestClass]
-    public class FFTTests : TestBaseClass
-    {
-        [Ignore]
-        [TestMethod]
-        public void xxx_Test_FFT_Placeholder()
-        {
-        }
-    }
-}
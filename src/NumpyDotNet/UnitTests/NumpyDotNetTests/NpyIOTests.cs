@@ -31,6 +31,8 @@
  */
 
 using System;
+using System.Collections.Generic;
+using System.IO;
 using System.Numerics;
 using Microsoft.VisualStudio.TestTools.UnitTesting;
 using NumpyDotNet;
@@ -39,7 +41,7 @@ using MathNet.Numerics;
 namespace NumpyDotNetTests
 {
     [TestClass]
-    public class NpyIOTests
+    public class NpyIOTests : TestBaseClass
     {
         [Ignore]
         [TestMethod]
@@ -48,6 +50,384 @@ namespace NumpyDotNetTests
             ndarray x = np.load("c:/temp/t3.npy");
         }
 
+        private static string TempFileName(string ext)
+        {
+            return Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString("N") + ext);
+        }
+
+        [TestMethod]
+        public void test_save_load_DOUBLE()
+        {
+            string path = TempFileName(".npy");
+
+            try
+            {
+                ndarray a = np.arange(0, 12, dtype: np.Float64).reshape(3, 4) * 1.5;
+                np.save(path, a);
+
+                ndarray b = np.load(path);
+                print(b);
+
+                Assert.AreEqual(np.Float64.TypeNum, b.Dtype.TypeNum);
+                AssertShape(b, 3, 4);
+                AssertArray(b, new double[,] { { 0.0, 1.5, 3.0, 4.5 }, { 6.0, 7.5, 9.0, 10.5 }, { 12.0, 13.5, 15.0, 16.5 } });
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        [TestMethod]
+        public void test_save_load_dtypes()
+        {
+            var arrays = new ndarray[]
+            {
+                np.array(new bool[] { true, false, true }),
+                np.array(new sbyte[] { -1, 2, -3 }),
+                np.array(new byte[] { 1, 2, 255 }),
+                np.array(new Int16[] { -1, 2, -3 }),
+                np.array(new UInt16[] { 1, 2, 65535 }),
+                np.array(new Int32[] { -1, 2, -3 }),
+                np.array(new UInt32[] { 1, 2, 3 }),
+                np.array(new Int64[] { -1, 2, Int64.MaxValue }),
+                np.array(new UInt64[] { 1, 2, UInt64.MaxValue }),
+                np.array(new float[] { -1.5f, 2.25f, 3.0f }),
+                np.array(new Complex[] { new Complex(1, 2), new Complex(-3, 4), new Complex(5, -6) }),
+            };
+
+            foreach (var a in arrays)
+            {
+                string path = TempFileName(".npy");
+                try
+                {
+                    np.save(path, a);
+                    ndarray b = np.load(path);
+
+                    Assert.AreEqual(a.Dtype.TypeNum, b.Dtype.TypeNum);
+                    AssertShape(b, 3);
+                    Assert.IsTrue(np.array_equal(a, b));
+                }
+                finally
+                {
+                    File.Delete(path);
+                }
+            }
+        }
+
+        [TestMethod]
+        public void test_save_load_noncontiguous_INT32()
+        {
+            string path = TempFileName(".npy");
+
+            try
+            {
+                ndarray a = np.arange(0, 24, dtype: np.Int32).reshape(4, 6);
+                ndarray view = a["1:", "::2"] as ndarray;
+                np.save(path, view);
+
+                ndarray b = np.load(path);
+                print(b);
+
+                AssertArray(b, new Int32[,] { { 6, 8, 10 }, { 12, 14, 16 }, { 18, 20, 22 } });
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        [TestMethod]
+        public void test_save_load_fortran_order_INT64()
+        {
+            string path = TempFileName(".npy");
+
+            try
+            {
+                ndarray a = np.asfortranarray(np.arange(0, 6, dtype: np.Int64).reshape(2, 3));
+                np.save(path, a);
+
+                ndarray b = np.load(path);
+                print(b);
+
+                Assert.IsTrue(b.flags.f_contiguous);
+                AssertArray(b, new Int64[,] { { 0, 1, 2 }, { 3, 4, 5 } });
+
+                ndarray m = np.load(path, mmap_mode: "r");
+                AssertArray(m, new Int64[,] { { 0, 1, 2 }, { 3, 4, 5 } });
+
+                ndarray c = np.arange(0, 24, dtype: np.Int64).reshape(2, 3, 4).T;
+                np.save(path, c);
+
+                ndarray d = np.load(path);
+                AssertShape(d, 4, 3, 2);
+                CollectionAssert.AreEqual(np.ascontiguousarray(c).AsInt64Array(), np.ascontiguousarray(d).AsInt64Array());
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        [TestMethod]
+        public void test_save_appends_extension()
+        {
+            string path = TempFileName("");
+
+            try
+            {
+                np.save(path, np.arange(5));
+                Assert.IsTrue(File.Exists(path + ".npy"));
+
+                ndarray b = np.load(path + ".npy");
+                AssertArray(b, new Int32[] { 0, 1, 2, 3, 4 });
+            }
+            finally
+            {
+                File.Delete(path + ".npy");
+            }
+        }
+
+        [TestMethod]
+        public void test_load_mmap_DOUBLE()
+        {
+            string path = TempFileName(".npy");
+
+            try
+            {
+                double retstep = 0;
+                ndarray a = np.linspace(0.0, 1.0, ref retstep, 11);
+                np.save(path, a);
+
+                ndarray b = np.load(path, mmap_mode: "r");
+                print(b);
+
+                Assert.IsTrue(np.array_equal(a, b));
+
+                try
+                {
+                    np.load(path, mmap_mode: "r+");
+                    Assert.Fail("Should have thrown an exception");
+                }
+                catch (NotSupportedException)
+                {
+                }
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        [TestMethod]
+        public void test_open_memmap_npy()
+        {
+            string path = TempFileName(".npy");
+
+            try
+            {
+                ndarray a = np.arange(0, 12, dtype: np.Int32).reshape(4, 3);
+                np.save(path, a);
+
+                using (var m = np.open_memmap(path, mode: "r"))
+                {
+                    Assert.AreEqual(np.Int32.TypeNum, m.Dtype.TypeNum);
+                    AssertShape(m.shape, 4, 3);
+                    AssertArray(m.read(1, 3), new Int32[,] { { 3, 4, 5 }, { 6, 7, 8 } });
+                }
+
+                // r+ writes go straight to the file
+                using (var m = np.open_memmap(path))
+                {
+                    m.write(0, 100);
+                }
+                AssertArray(np.load(path), new Int32[,] { { 100, 100, 100 }, { 3, 4, 5 }, { 6, 7, 8 }, { 9, 10, 11 } });
+
+                // w+ creates a new .npy file that np.load can read back
+                using (var m = np.open_memmap(path, mode: "w+", dtype: np.Float64, shape: new shape(2, 2)))
+                {
+                    m.write(1, np.array(new double[] { 1.5, 2.5 }));
+                }
+                AssertArray(np.load(path), new double[,] { { 0, 0 }, { 1.5, 2.5 } });
+
+                np.save(path, np.asfortranarray(a));
+                try
+                {
+                    np.open_memmap(path, mode: "r");
+                    Assert.Fail("Should have thrown an exception");
+                }
+                catch (Exception ex)
+                {
+                    Assert.IsTrue(ex.Message.Contains("fortran ordered"));
+                }
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        [TestMethod]
+        public void test_savez_load_npz()
+        {
+            string path = TempFileName(".npz");
+
+            try
+            {
+                ndarray a = np.arange(0, 10, dtype: np.Float64);
+                ndarray b = np.arange(0, 6, dtype: np.Int32).reshape(2, 3);
+                np.savez(path, a, b);
+
+                using (var npz = np.load_npz(path))
+                {
+                    CollectionAssert.AreEquivalent(new string[] { "arr_0", "arr_1" }, npz.files);
+                    Assert.IsTrue(np.array_equal(a, npz["arr_0"]));
+                    AssertArray(npz["arr_1"], new Int32[,] { { 0, 1, 2 }, { 3, 4, 5 } });
+                }
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        [TestMethod]
+        public void test_savez_compressed_named()
+        {
+            string path = TempFileName(".npz");
+
+            try
+            {
+                var arrays = new Dictionary<string, object>()
+                {
+                    { "x", np.arange(0, 1000, dtype: np.Int64) },
+                    { "y", np.ones(new shape(10, 10)) },
+                };
+                np.savez_compressed(path, arrays);
+
+                using (var npz = np.load_npz(path))
+                {
+                    Assert.IsTrue(np.array_equal(arrays["x"], npz["x"]));
+                    Assert.IsTrue(np.array_equal(arrays["y"], npz["y"]));
+                }
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+
+        [TestMethod]
+        public void test_memmap_file_modes()
+        {
+            string path = TempFileName(".dat");
+
+            try
+            {
+                using (var m = new np.memmap(path, dtype: np.Float64, mode: "w+", shape: new shape(4, 3)))
+                {
+                    Assert.AreEqual(12, m.size);
+                    Assert.AreEqual(96, m.nbytes);
+                    AssertArray(m.read(), new double[,] { { 0, 0, 0 }, { 0, 0, 0 }, { 0, 0, 0 }, { 0, 0, 0 } });
+
+                    m.write(0, np.arange(6, dtype: np.Float64).reshape(2, 3));
+                    m.write(-1, 9.0);
+                    m.flush();
+
+                    var b = m.read(1, 4);
+                    AssertArray(b, new double[,] { { 3, 4, 5 }, { 0, 0, 0 }, { 9, 9, 9 } });
+                    print(b);
+                }
+
+                Assert.AreEqual(96, new FileInfo(path).Length);
+
+                // no shape means a 1-D array of whatever the file holds after the offset
+                using (var m = new np.memmap(path, dtype: np.Float64, mode: "r", offset: 8 * 3))
+                {
+                    AssertArray(m.read(), new double[] { 3, 4, 5, 0, 0, 0, 9, 9, 9 });
+
+                    try
+                    {
+                        m.write(0, 1.0);
+                        Assert.Fail("Should have thrown an exception");
+                    }
+                    catch (Exception ex)
+                    {
+                        print(ex.Message);
+                    }
+                }
+
+                // copy-on-write changes are visible through the map but never reach the file
+                using (var m = new np.memmap(path, dtype: np.Float64, mode: "c", shape: new shape(4, 3)))
+                {
+                    m.update(x => x * 2);
+                    AssertArray(m.read(0, 2), new double[,] { { 0, 2, 4 }, { 6, 8, 10 } });
+                }
+
+                using (var m = new np.memmap(path, dtype: np.Float64, mode: "r+", shape: new shape(4, 3)))
+                {
+                    AssertArray(m.read(0, 2), new double[,] { { 0, 1, 2 }, { 3, 4, 5 } });
+                    m.update(x => x + 1, rows_per_chunk: 1);
+                }
+
+                using (var m = new np.memmap(path, dtype: np.Float64, mode: "r"))
+                {
+                    AssertArray(m.read(), new double[] { 1, 2, 3, 4, 5, 6, 1, 1, 1, 10, 10, 10 });
+                }
+
+                try
+                {
+                    new np.memmap(path, dtype: np.Float64, mode: "r", shape: new shape(100));
+                    Assert.Fail("Should have thrown an exception");
+                }
+                catch (Exception ex)
+                {
+                    print(ex.Message);
+                }
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        [TestMethod]
+        public void test_memmap_native_memory()
+        {
+            var m = new np.memmap(new shape(10, 2), dtype: np.Int32);
+
+            m.write(0, np.arange(20, dtype: np.Int32).reshape(10, 2));
+
+            long total = 0;
+            foreach (var chunk in m.chunks(rows_per_chunk: 3))
+            {
+                Assert.IsTrue(chunk.Dim(0) <= 3);
+                total += Convert.ToInt64(np.sum(chunk).GetItem(0));
+            }
+            Assert.AreEqual(190, total);
+
+            var c = m.read(8, 10);
+            AssertArray(c, new Int32[,] { { 16, 17 }, { 18, 19 } });
+            print(c);
+
+            m.Dispose();
+
+            try
+            {
+                m.read();
+                Assert.Fail("Should have thrown an exception");
+            }
+            catch (ObjectDisposedException)
+            {
+            }
+
+            var z = new np.memmap(new shape(3), dtype: np.Complex);
+            z.write(1, new System.Numerics.Complex(1, 2));
+            AssertArray(z.read(), new System.Numerics.Complex[] { 0, new System.Numerics.Complex(1, 2), 0 });
+            z.Dispose();
+        }
+
 
     }
 }
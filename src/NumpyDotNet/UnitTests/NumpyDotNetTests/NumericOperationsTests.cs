@@ -1500,6 +1500,40 @@ namespace NumpyDotNetTests
             print(c);
         }
 
+        [TestMethod]
+        public void test_mixed_type_arithmetic_1()
+        {
+            var a = np.arange(0, 12, dtype: np.Int32).reshape(3, 4);
+            var b = np.arange(0, 4, dtype: np.Float64) + 0.5;
+
+            var c = a + b;
+            Assert.AreEqual(np.Float64.TypeNum, c.Dtype.TypeNum);
+            AssertArray(c, new double[,] { { 0.5, 2.5, 4.5, 6.5 }, { 4.5, 6.5, 8.5, 10.5 }, { 8.5, 10.5, 12.5, 14.5 } });
+            print(c);
+
+            var d = np.arange(1, 5, dtype: np.Int16);
+            var e = (a["::-1", ":"] as ndarray) * d;
+            Assert.AreEqual(np.Int32.TypeNum, e.Dtype.TypeNum);
+            AssertArray(e, new int[,] { { 8, 18, 30, 44 }, { 4, 10, 18, 28 }, { 0, 2, 6, 12 } });
+            print(e);
+
+            var f = np.maximum(a, np.array(new double[] { 5.5 }));
+            AssertArray(f, new double[,] { { 5.5, 5.5, 5.5, 5.5 }, { 5.5, 5.5, 6, 7 }, { 8, 9, 10, 11 } });
+            print(f);
+        }
+
+        [TestMethod]
+        public void test_mixed_type_comparison_1()
+        {
+            var a = np.array(new float[] { 1.5f, 2.0f, -3.0f, 4.0f });
+            var b = np.array(new Int16[] { 1, 2, 3, 4 });
+
+            AssertArray(np.less(a, b), new bool[] { false, false, true, false });
+            AssertArray(np.greater_equal(a, b), new bool[] { true, true, false, true });
+            AssertArray(np.equal(a, b), new bool[] { false, true, false, true });
+            AssertArray(np.not_equal(a, (Int16)2), new bool[] { true, false, true, true });
+        }
+
         [TestMethod]
         public void test_copyto_1()
         {
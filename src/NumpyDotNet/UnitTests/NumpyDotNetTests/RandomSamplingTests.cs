@@ -43,7 +43,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.49987999522694609, avg.GetItem(0));
+            Assert.AreEqual(0.49987999522688986, avg.GetItem(0));
         }
 
         [TestMethod]
@@ -75,7 +75,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(-0.00028345468151361842, avg.GetItem(0));
+            Assert.AreEqual(-0.00028345468151363292, avg.GetItem(0));
         }
 
         [TestMethod]
@@ -627,7 +627,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(313.32691732965679, avg.GetItem(0));
+            Assert.AreEqual(313.3269173296563, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -690,7 +690,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.33333333333333354, avg.GetItem(0));
+            Assert.AreEqual(0.3333333333333333, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -779,7 +779,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(1.7531454665721702, avg.GetItem(0));
+            Assert.AreEqual(1.7531454665721762, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -824,7 +824,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(1.0515442503540988, avg.GetItem(0));
+            Assert.AreEqual(1.0515442503540995, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -849,7 +849,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.9827519798898189, avg.GetItem(0));
+            Assert.AreEqual(0.982751979889819, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -872,7 +872,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(1.0363937363959668, avg.GetItem(0));
+            Assert.AreEqual(1.0363937363959828, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -950,7 +950,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(92.505472695434207, avg.GetItem(0));
+            Assert.AreEqual(92.50547269543303, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1081,7 +1081,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(3.319780095180179, avg.GetItem(0));
+            Assert.AreEqual(3.3197800951801795, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1104,7 +1104,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(1.0376445397766865, avg.GetItem(0));
+            Assert.AreEqual(1.0376445397766882, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1231,7 +1231,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(-1.6171201483154878, avg.GetItem(0));
+            Assert.AreEqual(-1.6171201483154876, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1254,7 +1254,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.75284129642070252, avg.GetItem(0));
+            Assert.AreEqual(0.7528412964206944, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1307,7 +1307,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(-2.5541489883857613, avg.GetItem(0));
+            Assert.AreEqual(-2.5541489883857618, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1330,7 +1330,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.75353194203189111, avg.GetItem(0));
+            Assert.AreEqual(0.7535319420319129, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1603,7 +1603,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(22.999416481542255, avg.GetItem(0));
+            Assert.AreEqual(22.999416481541964, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1624,7 +1624,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(938.60218769525386, avg.GetItem(0));
+            Assert.AreEqual(938.6021876952542, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1653,7 +1653,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(54.230679084788719, avg.GetItem(0));
+            Assert.AreEqual(54.23067908478865, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1701,7 +1701,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(90.217557446706948, avg.GetItem(0));
+            Assert.AreEqual(90.21755744670715, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1733,7 +1733,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(1.3384280414551479, avg.GetItem(0));
+            Assert.AreEqual(1.3384280414551475, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1781,7 +1781,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(1.6568977790583879, avg.GetItem(0));
+            Assert.AreEqual(1.656897779058399, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1813,7 +1813,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.477574229815943, avg.GetItem(0));
+            Assert.AreEqual(0.4775742298159429, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1861,7 +1861,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(1.3040180422148346, avg.GetItem(0));
+            Assert.AreEqual(1.3040180422148604, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -1968,7 +1968,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.736198803204049, avg.GetItem(0));
+            Assert.AreEqual(0.7361988032040487, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2016,7 +2016,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.63524484726740371, avg.GetItem(0));
+            Assert.AreEqual(0.635244847267408, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2047,7 +2047,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(3.7877220061900312, avg.GetItem(0));
+            Assert.AreEqual(3.7877220061900352, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2095,7 +2095,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(2.1895198415066424, avg.GetItem(0));
+            Assert.AreEqual(2.189519841506611, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2126,7 +2126,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(-2.3636040352933994, avg.GetItem(0));
+            Assert.AreEqual(-2.3636040352934, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2151,7 +2151,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(-0.082440258910342012, avg.GetItem(0));
+            Assert.AreEqual(-0.08244025891034248, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             //print(first10);
@@ -2175,7 +2175,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(-1.1522703389124869, avg.GetItem(0));
+            Assert.AreEqual(-1.1522703389124884, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2207,7 +2207,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.95747448591944373, avg.GetItem(0));
+            Assert.AreEqual(0.95747448591944563, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2232,7 +2232,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(1.0005051554345421, avg.GetItem(0));
+            Assert.AreEqual(1.0005051554345457, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             //print(first10);
@@ -2256,7 +2256,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.99718696494509074, avg.GetItem(0));
+            Assert.AreEqual(0.9971869649450851, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2287,7 +2287,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(2.0664892234714194, avg.GetItem(0));
+            Assert.AreEqual(2.0664892234714176, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2312,7 +2312,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(3.9903202322714604, avg.GetItem(0));
+            Assert.AreEqual(3.990320232271464, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             //print(first10);
@@ -2336,7 +2336,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.25077723866032581, avg.GetItem(0));
+            Assert.AreEqual(0.2507772386603312, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2376,6 +2376,50 @@ namespace NumpyDotNetTests
         }
 
 
+        [TestMethod]
+        public void test_rand_ziggurat_1()
+        {
+            var random = new np.random();
+            Assert.IsTrue(random.legacy);
+            random.legacy = false;
+            random.seed(8877);
+
+            ndarray arr = random.standard_normal(new shape(5000000));
+            Assert.AreEqual(0.0, (double)np.average(arr), 0.005);
+            Assert.AreEqual(1.0, (double)np.std(arr), 0.005);
+
+            // tails beyond the base layer of the ziggurat must still be produced
+            Assert.IsTrue((double)np.amax(arr) > 4.0);
+            Assert.IsTrue((double)np.amin(arr) < -4.0);
+
+            arr = random.standard_exponential(new shape(5000000));
+            Assert.AreEqual(1.0, (double)np.average(arr), 0.005);
+            Assert.AreEqual(1.0, (double)np.std(arr), 0.005);
+            Assert.IsTrue((double)np.amin(arr) >= 0.0);
+            Assert.IsTrue((double)np.amax(arr) > 8.0);
+
+            double[] gamma = new double[1000000];
+            random.standard_gamma(2.5, gamma);
+            Assert.AreEqual(2.5, gamma.Average(), 0.01);
+
+            arr = random.standard_t(10, new shape(1000000));
+            Assert.AreEqual(0.0, (double)np.average(arr), 0.01);
+
+            // same seed, same sampler, same numbers
+            random.seed(1234);
+            ndarray a1 = random.randn(new shape(100));
+            random.seed(1234);
+            ndarray a2 = random.randn(new shape(100));
+            AssertArray(a2, a1.AsDoubleArray());
+
+            // the legacy stream is still reproducible
+            random.legacy = true;
+            random.seed(8877);
+            var first10 = random.standard_normal(new shape(10));
+            AssertArray(first10, new double[] { 0.345140531263051, 0.38484191742645, 1.08309197380133, 0.586824429286654,
+                -1.10076748173233, 1.2922798767235, -0.604010755236405, -0.191509685425675, 0.539265713947259, 2.01982669933162 });
+        }
+
         [TestMethod]
         public void test_rand_standard_t_1()
         {
@@ -2395,7 +2439,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.008243788245885007, avg.GetItem(0));
+            Assert.AreEqual(0.008243788245885012, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2420,7 +2464,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(-0.0013889376393183856, avg.GetItem(0));
+            Assert.AreEqual(-0.00138893763931839, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             //print(first10);
@@ -2476,7 +2520,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(22.84033382253185, avg.GetItem(0));
+            Assert.AreEqual(22.84033382253186, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2524,7 +2568,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(19.270976111586553, avg.GetItem(0));
+            Assert.AreEqual(19.27097611158689, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2556,7 +2600,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(6.643562403733275E-05, avg.GetItem(0));
+            Assert.AreEqual(6.643562403731923E-05, avg.GetItem(0));
 
 
             var first10 = arr["0:10:1"] as ndarray;
@@ -2667,7 +2711,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(3.0025012751386755, avg.GetItem(0));
+            Assert.AreEqual(3.0025012751386924, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2688,7 +2732,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(309.35420489337906, avg.GetItem(0));
+            Assert.AreEqual(309.35420489337923, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2717,7 +2761,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.91828955683190416, avg.GetItem(0));
+            Assert.AreEqual(0.9182895568318936, avg.GetItem(0));
 
             var first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -2738,7 +2782,7 @@ namespace NumpyDotNetTests
 
             avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.99456850758012483, avg.GetItem(0));
+            Assert.AreEqual(0.9945685075801263, avg.GetItem(0));
 
             first10 = arr["0:10:1"] as ndarray;
             print(first10);
@@ -80,7 +80,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(0.50011801294498859, (double)avg);
+            Assert.AreEqual(0.500118012945035, (double)avg);
         }
 
         [TestMethod]
@@ -112,7 +112,7 @@ namespace NumpyDotNetTests
 
             var avg = np.average(arr);
             print(avg);
-            Assert.AreEqual(-0.00044428007674556522, (double)avg);
+            Assert.AreEqual(-0.000444280076745582462, (double)avg);
         }
 
         [TestMethod]
@@ -193,5 +193,102 @@ namespace NumpyDotNetTests
             print(first10);
             AssertArray(first10, new sbyte[] { -2, -2, 0, -1, -2, -2, -2, -2, -2, -2 });
          }
+
+        [TestMethod]
+        public void test_stream_generators_reproducible_1()
+        {
+            foreach (Func<NumpyDotNet.RandomAPI.IRandomGenerator> create in new Func<NumpyDotNet.RandomAPI.IRandomGenerator>[]
+                { () => new NumpyDotNet.RandomAPI.PCG64(), () => new NumpyDotNet.RandomAPI.Philox() })
+            {
+                var random1 = new np.random(create());
+                var random2 = new np.random(create());
+                random1.seed(1234);
+                random2.seed(1234);
+
+                // large enough to be filled from several spawned streams in parallel
+                ndarray a1 = random1.rand(new shape(500000));
+                ndarray a2 = random2.rand(new shape(500000));
+                Assert.IsTrue((bool)np.array_equal(a1, a2));
+
+                double avg = (double)np.average(a1);
+                print(avg);
+                Assert.AreEqual(0.5, avg, 0.01);
+                Assert.IsTrue((double)np.amin(a1) >= 0.0);
+                Assert.IsTrue((double)np.amax(a1) < 1.0);
+
+                a1 = random1.randn(new shape(500000));
+                a2 = random2.randn(new shape(500000));
+                Assert.IsTrue((bool)np.array_equal(a1, a2));
+                Assert.AreEqual(0.0, (double)np.average(a1), 0.01);
+                Assert.AreEqual(1.0, (double)np.std(a1), 0.01);
+
+                a1 = random1.randint(-2, 3, new shape(500000), dtype: np.Int64);
+                a2 = random2.randint(-2, 3, new shape(500000), dtype: np.Int64);
+                Assert.IsTrue((bool)np.array_equal(a1, a2));
+                Assert.AreEqual((Int64)(-2), (Int64)np.amin(a1));
+                Assert.AreEqual((Int64)2, (Int64)np.amax(a1));
+
+                random2.seed(4321);
+                a2 = random2.rand(new shape(10));
+                Assert.IsFalse((bool)np.array_equal(random1.rand(new shape(10)), a2));
+            }
+        }
+
+        [TestMethod]
+        public void test_stream_generators_serialization_1()
+        {
+            foreach (Func<NumpyDotNet.RandomAPI.IRandomGenerator> create in new Func<NumpyDotNet.RandomAPI.IRandomGenerator>[]
+                { () => new NumpyDotNet.RandomAPI.PCG64(), () => new NumpyDotNet.RandomAPI.Philox() })
+            {
+                var random = new np.random(create());
+                random.seed(8765);
+                random.rand(new shape(7));
+
+                var state = random.ToSerialization();
+                ndarray a1 = random.randint(0, 1000, new shape(100), dtype: np.Int32);
+
+                random.FromSerialization(state);
+                ndarray a2 = random.randint(0, 1000, new shape(100), dtype: np.Int32);
+
+                AssertArray(a2, a1.AsInt32Array());
+            }
+        }
+
+        [TestMethod]
+        public void test_stream_generators_advance_1()
+        {
+            var g1 = new NumpyDotNet.RandomAPI.PCG64();
+            var g2 = new NumpyDotNet.RandomAPI.PCG64();
+            var s1 = new rk_state(g1);
+            var s2 = new rk_state(g2);
+            g1.Seed(42, s1);
+            g2.Seed(42, s2);
+
+            for (int i = 0; i < 1000; i++)
+                g1.getNextDouble(s1);
+            g2.Advance(1000);
+            Assert.AreEqual(g1.getNextDouble(s1), g2.getNextDouble(s2));
+
+            // Philox advances in blocks of four 64 bit values
+            var p1 = new NumpyDotNet.RandomAPI.Philox();
+            var p2 = new NumpyDotNet.RandomAPI.Philox();
+            s1 = new rk_state(p1);
+            s2 = new rk_state(p2);
+            p1.Seed(42, s1);
+            p2.Seed(42, s2);
+
+            for (int i = 0; i < 4000; i++)
+                p1.getNextDouble(s1);
+            p2.Advance(1000);
+            Assert.AreEqual(p1.getNextDouble(s1), p2.getNextDouble(s2));
+
+            // spawned streams differ from the parent and from each other
+            var c1 = p2.SpawnStream();
+            var c2 = p2.SpawnStream();
+            double d1 = c1.getNextDouble(null);
+            double d2 = c2.getNextDouble(null);
+            Assert.AreNotEqual(d1, d2);
+            Assert.AreNotEqual(d1, p2.getNextDouble(s2));
+        }
     }
 }
@@ -741,6 +741,106 @@ namespace NumpyDotNetTests
             print(c);
         }
 
+        [TestMethod]
+        public void test_apply_along_axis_4()
+        {
+            object laneSum(ndarray a, params object[] args)
+            {
+                return a.AsInt32Array().Sum();
+            }
+
+            object laneScale(ndarray a, params object[] args)
+            {
+                return np.multiply(a, (int)args[0]);
+            }
+
+            var b = np.arange(24, dtype: np.Int32).reshape((2, 3, 4));
+
+            var c = np.apply_along_axis(laneSum, 0, b);
+            AssertArray(c, new int[,] { { 12, 14, 16, 18 }, { 20, 22, 24, 26 }, { 28, 30, 32, 34 } });
+            print(c);
+
+            c = np.apply_along_axis(laneSum, 1, b);
+            AssertArray(c, new int[,] { { 12, 15, 18, 21 }, { 48, 51, 54, 57 } });
+            print(c);
+
+            c = np.apply_along_axis(laneSum, -1, b);
+            AssertArray(c, new int[,] { { 6, 22, 38 }, { 54, 70, 86 } });
+            print(c);
+
+            for (int axis = 0; axis < 3; axis++)
+            {
+                c = np.apply_along_axis(laneScale, axis, b, 10);
+                AssertShape(c, 2, 3, 4);
+                CollectionAssert.AreEqual(b.AsInt32Array().Select(v => v * 10).ToArray(), c.AsInt32Array());
+            }
+        }
+
+        [TestMethod]
+        public void test_apply_along_axis_parallel_large()
+        {
+            object laneScore(ndarray a, params object[] args)
+            {
+                double[] v = a.AsDoubleArray();
+                double score = 0;
+                for (int i = 0; i < v.Length; i++)
+                {
+                    score += v[i] * v[i] - i;
+                }
+                return score;
+            }
+
+            int rows = 100000;
+            int cols = 12;
+
+            var random = new np.random();
+            random.seed(1234);
+            var x = random.rand(new shape(rows, cols));
+            double[] xd = x.AsDoubleArray();
+
+            double[] expected = new double[rows];
+            for (int r = 0; r < rows; r++)
+            {
+                double score = 0;
+                for (int i = 0; i < cols; i++)
+                {
+                    score += xd[r * cols + i] * xd[r * cols + i] - i;
+                }
+                expected[r] = score;
+            }
+
+            var serial = np.apply_along_axis(laneScore, 1, x);
+            AssertShape(serial, rows);
+            CollectionAssert.AreEqual(expected, serial.AsDoubleArray());
+
+            var parallel = np.apply_along_axis_parallel(laneScore, 1, x);
+            AssertShape(parallel, rows);
+            CollectionAssert.AreEqual(expected, parallel.AsDoubleArray());
+
+            // strided lanes, one per column
+            var columns = np.apply_along_axis_parallel(laneScore, 0, x.A(":1000"));
+            AssertShape(columns, cols);
+            for (int i = 0; i < cols; i++)
+            {
+                double score = 0;
+                for (int r = 0; r < 1000; r++)
+                {
+                    score += xd[r * cols + i] * xd[r * cols + i] - r;
+                }
+                Assert.AreEqual(score, (double)columns[i], 1e-9);
+            }
+
+            try
+            {
+                np.apply_along_axis_parallel((a, args) => { throw new InvalidOperationException("bad lane"); }, 1, x);
+                Assert.Fail("should have thrown an exception");
+            }
+            catch (InvalidOperationException ex)
+            {
+                Assert.AreEqual("bad lane", ex.Message);
+            }
+        }
+
         [TestMethod]
         public void test_apply_over_axes_1()
         {
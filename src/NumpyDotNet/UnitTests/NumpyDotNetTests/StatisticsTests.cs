@@ -583,7 +583,7 @@ namespace NumpyDotNetTests
             a[1, ":"] = 0.1;
             ndarray b = np.mean(a);
             print(b);
-            Assert.AreEqual(0.546875f, (float)b.GetItem(0), 0.0000001);
+            Assert.AreEqual(0.5499999523162842f, (float)b.GetItem(0), 0.0000001);
 
             ndarray c = np.mean(a, dtype: np.Float64);
             print(c);
@@ -628,7 +628,7 @@ namespace NumpyDotNetTests
             a[1, ":"] = 0.1;
             b = np.std(a);
             print(b);
-            Assert.AreEqual(0.451729476, (float)b.GetItem(0), 0.0000001);
+            Assert.AreEqual(0.44999998807907104, (float)b.GetItem(0), 0.0000001);
             // Computing the standard deviation in float64 is more accurate:
             c = np.std(a, dtype: np.Float64);
             print(c);
@@ -657,7 +657,7 @@ namespace NumpyDotNetTests
             a[0, ":"] = 1.0;
             a[1, ":"] = 0.1;
             b = np.var(a);
-            Assert.AreEqual((double)0.20405951142311096, Convert.ToDouble(b.GetItem(0)), 0.00000001);
+            Assert.AreEqual((double)0.20249998569488525, Convert.ToDouble(b.GetItem(0)), 0.00000001);
             print(b);
 
             // Computing the standard deviation in float64 is more accurate:
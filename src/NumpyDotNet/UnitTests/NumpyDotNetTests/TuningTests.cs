@@ -54,6 +54,95 @@ namespace NumpyDotNetTests
 
         }
 
+        [TestMethod]
+        public void test_EnableTryCatch_3()
+        {
+            // contiguous array/array operations: only the overflowing element is cleared
+            var a = np.array(new decimal[] { decimal.MaxValue, 1m, 2m });
+            var b = np.array(new decimal[] { 2m, 3m, 4m });
+
+            try
+            {
+                np.tuning.EnableTryCatchOnCalculations = true;
+                var c = np.multiply(a, b);
+                AssertArray(c, new decimal[] { 0m, 3m, 8m });
+
+                np.tuning.EnableTryCatchOnCalculations = false;
+                try
+                {
+                    c = np.multiply(a, b);
+                    Assert.Fail("This should have thrown an exception");
+                }
+                catch (AssertFailedException)
+                {
+                    throw;
+                }
+                catch (Exception ex)
+                {
+                    print(ex.Message);
+                }
+            }
+            finally
+            {
+                np.tuning.EnableTryCatchOnCalculations = true;
+            }
+        }
+
+        [TestMethod]
+        public void test_ParallelScheduler_1()
+        {
+            Assert.AreEqual(Environment.ProcessorCount, np.tuning.MaxDegreeOfParallelism);
+            Assert.IsTrue(np.tuning.NumericOpGrainSize > 0);
+            Assert.IsTrue(np.tuning.FlatCopyGrainSize > 0);
+
+            try
+            {
+                np.tuning.MaxDegreeOfParallelism = 2;
+                np.tuning.NumericOpGrainSize = 16;
+                Assert.AreEqual(2, np.tuning.MaxDegreeOfParallelism);
+                Assert.AreEqual((npy_intp)16, np.tuning.NumericOpGrainSize);
+
+                var a = np.arange(0, 10000, dtype: np.Int64);
+                var b = a * 3 + 1;
+                Assert.AreEqual((Int64)(9999 * 3 + 1), (Int64)b[9999]);
+                Assert.AreEqual((Int64)149995000, (Int64)np.sum(b).GetItem(0));
+            }
+            finally
+            {
+                np.tuning.MaxDegreeOfParallelism = 0;
+                np.tuning.NumericOpGrainSize = 0;
+            }
+
+            Assert.AreEqual(Environment.ProcessorCount, np.tuning.MaxDegreeOfParallelism);
+
+            np.tuning.EnableAutoTuning = false;
+            Assert.AreEqual((npy_intp)1000, np.tuning.NumericOpGrainSize);
+            Assert.AreEqual((npy_intp)10000, np.tuning.FlatCopyGrainSize);
+            np.tuning.EnableAutoTuning = true;
+            np.tuning.ResetCalibration();
+        }
+
+        [TestMethod]
+        public void test_ParallelScheduler_broadcast_copy_DOP1()
+        {
+            try
+            {
+                // a single chunk walks every row of a broadcast copy, so the source must advance with the destination
+                np.tuning.MaxDegreeOfParallelism = 1;
+
+                var a = np.zeros((4, 3), dtype: np.Int32);
+                a[":", ":"] = np.array(new int[,] { { 1 }, { 2 }, { 3 }, { 5 } });
+                AssertArray(a, new int[,] { { 1, 1, 1 }, { 2, 2, 2 }, { 3, 3, 3 }, { 5, 5, 5 } });
+
+                var y = np.vander(np.array(new int[] { 1, 2, 3, 5 }), 3);
+                AssertArray(y, new int[,] { { 1, 1, 1 }, { 4, 2, 1 }, { 9, 3, 1 }, { 25, 5, 1 } });
+            }
+            finally
+            {
+                np.tuning.MaxDegreeOfParallelism = 0;
+            }
+        }
+
         [TestMethod]
         public void test_largearray_matmul_INT64_1_tuning()
         {
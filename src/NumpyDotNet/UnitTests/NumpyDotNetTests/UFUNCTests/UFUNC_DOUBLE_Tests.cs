@@ -2400,6 +2400,56 @@ namespace NumpyDotNetTests
         }
         #endregion
 
+        #region SIMD tests
+        [TestMethod]
+        public void test_SIMD_ArrayArray_DOUBLE()
+        {
+            // odd length so that both the vector and the scalar tail code are exercised
+            var a1 = np.arange(0, 19, dtype: np.Float64);
+            var a2 = np.arange(0, 19, dtype: np.Float64) * 2;
+
+            var b = a1 + a2;
+            AssertArray(b, new double[] { 0, 3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36, 39, 42, 45, 48, 51, 54 });
+
+            b = a2 - a1;
+            AssertArray(b, new double[] { 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 });
+
+            b = a1 * a2;
+            AssertArray(b, new double[] { 0, 2, 8, 18, 32, 50, 72, 98, 128, 162, 200, 242, 288, 338, 392, 450, 512, 578, 648 });
+
+            b = a2 / a1;
+            AssertArray(b, new double[] { double.PositiveInfinity, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2 });
+        }
+
+        [TestMethod]
+        public void test_SIMD_ArrayScalar_DOUBLE()
+        {
+            var a1 = np.arange(-9, 10, dtype: np.Float64);
+
+            var b = a1 + 1.5;
+            AssertArray(b, new double[] { -7.5, -6.5, -5.5, -4.5, -3.5, -2.5, -1.5, -0.5, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5 });
+
+            b = np.maximum(a1, 0.0);
+            AssertArray(b, new double[] { 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9 });
+
+            b = a1 / 0.0;
+            Assert.IsTrue((bool)np.all(b == double.PositiveInfinity));
+        }
+
+        [TestMethod]
+        public void test_SIMD_MaximumMinimum_NAN_DOUBLE()
+        {
+            var a1 = np.array(new double[] { 1, double.NaN, 3, 4, 5, 6, 7, double.NaN, 9 });
+            var a2 = np.array(new double[] { 9, 8, double.NaN, 6, 5, 4, 3, 2, 1 });
+
+            var b = np.maximum(a1, a2);
+            AssertArrayNAN(b, new double[] { 9, double.NaN, double.NaN, 6, 5, 6, 7, double.NaN, 9 });
+
+            b = np.minimum(a1, a2);
+            AssertArrayNAN(b, new double[] { 1, double.NaN, double.NaN, 4, 5, 4, 3, double.NaN, 1 });
+        }
+        #endregion
+
         #endregion
     }
 }
@@ -2388,6 +2388,25 @@ namespace NumpyDotNetTests
         }
         #endregion
 
+        #region SIMD tests
+        [TestMethod]
+        public void test_SIMD_ArrayArray_INT32()
+        {
+            // odd length so that both the vector and the scalar tail code are exercised
+            var a1 = np.arange(0, 19, dtype: np.Int32);
+            var a2 = np.arange(0, 19, dtype: np.Int32) * 2;
+
+            var b = a1 + a2;
+            AssertArray(b, new Int32[] { 0, 3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36, 39, 42, 45, 48, 51, 54 });
+
+            b = a1 * a2;
+            AssertArray(b, new Int32[] { 0, 2, 8, 18, 32, 50, 72, 98, 128, 162, 200, 242, 288, 338, 392, 450, 512, 578, 648 });
+
+            b = np.minimum(a1, 9 - a1);
+            AssertArray(b, new Int32[] { 0, 1, 2, 3, 4, 4, 3, 2, 1, 0, -1, -2, -3, -4, -5, -6, -7, -8, -9 });
+        }
+        #endregion
+
         #endregion
     }
 }